@@ -58,11 +58,14 @@ client_configs_to_display = ["autofill_import",
                              "gateway_api_host",
                              "gateway_api_port",
                              "rate_oracle_source",
+                             "rate_oracle_streaming",
                              "extra_tokens",
                              "global_token",
                              "global_token_name",
                              "global_token_symbol",
                              "rate_limits_share_pct",
+                             "rate_limits_sharing",
+                             "order_book_workers",
                              "commands_timeout",
                              "create_command_timeout",
                              "other_commands_timeout",
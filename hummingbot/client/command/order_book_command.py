@@ -47,10 +47,9 @@ class OrderBookCommand:
             trading_pair, order_book = next(iter(market_connector.order_books.items()))
 
         def get_order_book(lines):
-            bids = order_book.snapshot[0][['price', 'amount']].head(lines)
-            bids.rename(columns={'price': 'bid_price', 'amount': 'bid_volume'}, inplace=True)
-            asks = order_book.snapshot[1][['price', 'amount']].head(lines)
-            asks.rename(columns={'price': 'ask_price', 'amount': 'ask_volume'}, inplace=True)
+            bids_levels, asks_levels = order_book.to_numpy(depth=lines)
+            bids = pd.DataFrame({'bid_price': bids_levels['price'], 'bid_volume': bids_levels['amount']})
+            asks = pd.DataFrame({'ask_price': asks_levels['price'], 'ask_volume': asks_levels['amount']})
             joined_df = pd.concat([bids, asks], axis=1)
             text_lines = [
                 "    " + line
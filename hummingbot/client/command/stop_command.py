@@ -47,6 +47,7 @@ class StopCommand:
         if self.strategy_task is not None and not self.strategy_task.cancelled():
             self.strategy_task.cancel()
 
+        RateOracle.get_instance().remove_connectors()
         if RateOracle.get_instance().started:
             RateOracle.get_instance().stop()
 
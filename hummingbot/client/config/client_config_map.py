@@ -13,7 +13,7 @@ from tabulate import tabulate_formats
 
 from hummingbot.client.config.config_data_types import BaseClientModel, ClientConfigEnum, ClientFieldData
 from hummingbot.client.config.config_methods import using_exchange as using_exchange_pointer
-from hummingbot.client.config.config_validators import validate_bool, validate_float
+from hummingbot.client.config.config_validators import validate_bool, validate_float, validate_int
 from hummingbot.client.settings import DEFAULT_LOG_FILE_PATH, PMM_SCRIPTS_PATH, AllConnectorSettings
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.connector_metrics_collector import (
@@ -822,6 +822,16 @@ class ClientConfigMap(BaseClientModel):
             ),
         ),
     )
+    rate_oracle_streaming: bool = Field(
+        default=False,
+        description=("Derive rate oracle prices from the order books of the running connectors, polling the rate"
+                     " oracle source only for the pairs they do not stream."),
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Do you want rate oracle to use the order books of the running connectors? (Yes/No)"
+            ),
+        ),
+    )
     global_token: GlobalTokenConfigMap = Field(
         default=GlobalTokenConfigMap(),
         description="A universal token which to display tokens values in, e.g. USD,EUR,BTC"
@@ -840,6 +850,29 @@ class ClientConfigMap(BaseClientModel):
             ),
         ),
     )
+    rate_limits_sharing: bool = Field(
+        default=False,
+        description=("Share the API rate limits of each exchange with the other bot instances running on this host."
+                     "\nTakes effect on restart."),
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Do you want to share API rate limits with the other bot instances on this host? (Yes/No)"
+            ),
+        ),
+    )
+    order_book_workers: int = Field(
+        default=0,
+        ge=0,
+        description=("Number of worker processes maintaining the order books of each exchange, 0 to maintain them in"
+                     " the main process.\nWorth it when tracking many trading pairs. The order books are then"
+                     " truncated to their top 200 levels of each side. Takes effect on restart."),
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "How many worker processes do you want to maintain the order books of each exchange in?"
+                " (Enter 0 to maintain them in the main process)"
+            ),
+        ),
+    )
     commands_timeout: CommandsTimeoutConfigMap = Field(default=CommandsTimeoutConfigMap())
     tables_format: ClientConfigEnum(
         value="TabulateFormats",  # noqa: F821
@@ -903,7 +936,7 @@ class ClientConfigMap(BaseClientModel):
             sub_model = TELEGRAM_MODES[v].construct()
         return sub_model
 
-    @validator("send_error_logs", pre=True)
+    @validator("send_error_logs", "rate_limits_sharing", "rate_oracle_streaming", pre=True)
     def validate_bool(cls, v: str):
         """Used for client-friendly error output."""
         if isinstance(v, str):
@@ -976,6 +1009,14 @@ class ClientConfigMap(BaseClientModel):
         """Used for client-friendly error output."""
         return super().validate_decimal(v, field)
 
+    @validator("order_book_workers", pre=True)
+    def validate_order_book_workers(cls, v: int):
+        """Used for client-friendly error output."""
+        ret = validate_int(v, min_value=0)
+        if ret is not None:
+            raise ValueError(ret)
+        return v
+
     @validator("tick_size", pre=True)
     def validate_tick_size(cls, v: float):
         """Used for client-friendly error output."""
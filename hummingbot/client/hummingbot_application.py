@@ -30,8 +30,12 @@ from hummingbot.client.ui.parser import ThrowingArgumentParser, load_parser
 from hummingbot.connector.exchange.paper_trade import create_paper_trade_market
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.shared_rate_limit_scheduler import SHARED_RATE_LIMITS_DIR
 from hummingbot.core.clock import Clock
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.gateway.gateway_status_monitor import GatewayStatusMonitor
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.kill_switch import KillSwitch
 from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
 from hummingbot.data_feed.data_feed_base import DataFeedBase
@@ -74,6 +78,10 @@ class HummingbotApplication(*commands):
         self.ssl_config_map: SSLConfigMap = (  # type-hint enables IDE auto-complete
             load_ssl_config_map_from_file()
         )
+        AsyncThrottlerBase.share_rate_limits(
+            SHARED_RATE_LIMITS_DIR if self.client_config_map.rate_limits_sharing else None
+        )
+        OrderBookTracker.process_order_books_in_workers(self.client_config_map.order_book_workers)
         # This is to start fetching trading pairs for auto-complete
         TradingPairFetcher.get_instance(self.client_config_map)
         self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
@@ -298,6 +306,8 @@ class HummingbotApplication(*commands):
                 read_only_config = ReadOnlyClientConfigAdapter.lock_config(self.client_config_map)
                 connector = connector_class(read_only_config, **init_params)
             self.markets[connector_name] = connector
+            if self.client_config_map.rate_oracle_streaming:
+                RateOracle.get_instance().add_connector(connector)
 
         self.markets_recorder = MarketsRecorder(
             self.trade_fill_db,
@@ -1,8 +1,9 @@
 import asyncio
 import logging
-from collections import defaultdict
+from collections import ChainMap, defaultdict
 from decimal import Decimal
-from typing import Callable, Dict, Optional
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Optional
 
 from cachetools import TTLCache
 
@@ -55,44 +56,62 @@ class ClientOrderTracker:
         self._cached_orders: TTLCache = TTLCache(maxsize=self.MAX_CACHE_SIZE, ttl=self.CACHED_ORDER_TTL)
         self._lost_orders: Dict[str, InFlightOrder] = {}
 
+        # Secondary indexes, updated by the orders themselves on every change of state or exchange order id
+        self._orders_by_exchange_order_id: Dict[str, InFlightOrder] = {}
+        self._active_orders_by_trading_pair: Dict[str, Dict[str, InFlightOrder]] = {}
+        self._active_orders_by_state: Dict[OrderState, Dict[str, InFlightOrder]] = {}
+        self._indexed_states: Dict[str, OrderState] = {}
+
+        # Read-only views of the stores, the first store of a chain takes precedence over the next ones
+        self._active_orders_view: Mapping[str, InFlightOrder] = MappingProxyType(self._in_flight_orders)
+        self._cached_orders_view: Mapping[str, InFlightOrder] = MappingProxyType(self._cached_orders)
+        self._lost_orders_view: Mapping[str, InFlightOrder] = MappingProxyType(self._lost_orders)
+        self._all_orders_view: Mapping[str, InFlightOrder] = MappingProxyType(
+            ChainMap(self._cached_orders, self._in_flight_orders))
+        self._all_fillable_orders_view: Mapping[str, InFlightOrder] = MappingProxyType(
+            ChainMap(self._lost_orders, self._cached_orders, self._in_flight_orders))
+        self._all_updatable_orders_view: Mapping[str, InFlightOrder] = MappingProxyType(
+            ChainMap(self._lost_orders, self._in_flight_orders))
+
         self._order_tracking_task: Optional[asyncio.Task] = None
         self._last_poll_timestamp: int = -1
         self._order_not_found_records: Dict[str, int] = defaultdict(lambda: 0)
 
     @property
-    def active_orders(self) -> Dict[str, InFlightOrder]:
+    def active_orders(self) -> Mapping[str, InFlightOrder]:
         """
-        Returns orders that are actively tracked
+        Returns a read-only view of the orders that are actively tracked
         """
-        return self._in_flight_orders
+        return self._active_orders_view
 
     @property
-    def cached_orders(self) -> Dict[str, InFlightOrder]:
+    def cached_orders(self) -> Mapping[str, InFlightOrder]:
         """
-        Returns orders that are no longer actively tracked.
+        Returns a read-only view of the orders that are no longer actively tracked.
         """
-        return {client_order_id: order for client_order_id, order in self._cached_orders.items()}
+        return self._cached_orders_view
 
     @property
-    def all_orders(self) -> Dict[str, InFlightOrder]:
+    def all_orders(self) -> Mapping[str, InFlightOrder]:
         """
-        Returns both active and cached order.
+        Returns a read-only view of both active and cached order.
         """
-        return {**self.active_orders, **self.cached_orders}
+        return self._all_orders_view
 
     @property
-    def all_fillable_orders(self) -> Dict[str, InFlightOrder]:
+    def all_fillable_orders(self) -> Mapping[str, InFlightOrder]:
         """
-        Returns all orders that could still be impacted by trades: active orders, cached orders and lost orders
+        Returns a read-only view of all orders that could still be impacted by trades: active orders, cached orders
+        and lost orders
         """
-        return {**self.active_orders, **self.cached_orders, **self.lost_orders}
+        return self._all_fillable_orders_view
 
     @property
-    def all_updatable_orders(self) -> Dict[str, InFlightOrder]:
+    def all_updatable_orders(self) -> Mapping[str, InFlightOrder]:
         """
-        Returns all orders that could receive status updates
+        Returns a read-only view of all orders that could receive status updates
         """
-        return {**self.active_orders, **self.lost_orders}
+        return self._all_updatable_orders_view
 
     @property
     def current_timestamp(self) -> int:
@@ -102,19 +121,41 @@ class ClientOrderTracker:
         return self._connector.current_timestamp
 
     @property
-    def lost_orders(self) -> Dict[str, InFlightOrder]:
+    def lost_orders(self) -> Mapping[str, InFlightOrder]:
+        """
+        Returns a read-only view of all orders marked as failed after not being found more times than the configured
+        limit
+        """
+        return self._lost_orders_view
+
+    def active_orders_for_trading_pair(self, trading_pair: str) -> Mapping[str, InFlightOrder]:
+        """
+        Returns a read-only view of the orders of a trading pair that are actively tracked
         """
-        Returns a dictionary of all orders marked as failed after not being found more times than the configured limit
+        return MappingProxyType(self._active_orders_by_trading_pair.setdefault(trading_pair, {}))
+
+    def active_orders_in_state(self, state: OrderState) -> Mapping[str, InFlightOrder]:
+        """
+        Returns a read-only view of the orders in a given state that are actively tracked
         """
-        return {client_order_id: order for client_order_id, order in self._lost_orders.items()}
+        return MappingProxyType(self._active_orders_by_state.setdefault(state, {}))
 
     def start_tracking_order(self, order: InFlightOrder):
-        self._in_flight_orders[order.client_order_id] = order
+        client_order_id = order.client_order_id
+        self._remove_from_active_indexes(client_order_id)
+        self._in_flight_orders[client_order_id] = order
+        self._active_orders_by_trading_pair.setdefault(order.trading_pair, {})[client_order_id] = order
+        self._active_orders_by_state.setdefault(order.current_state, {})[client_order_id] = order
+        self._indexed_states[client_order_id] = order.current_state
+        order.set_update_listener(self._update_indexes)
+        self._update_indexes(order)
 
     def stop_tracking_order(self, client_order_id: str):
         if client_order_id in self._in_flight_orders:
             self._cached_orders[client_order_id] = self._in_flight_orders[client_order_id]
             del self._in_flight_orders[client_order_id]
+            self._remove_from_active_indexes(client_order_id)
+            self._prune_exchange_order_ids()
 
     def restore_tracking_states(self, tracking_states: Dict[str, any]):
         """
@@ -135,14 +176,13 @@ class ClientOrderTracker:
     def fetch_order(
         self, client_order_id: Optional[str] = None, exchange_order_id: Optional[str] = None
     ) -> Optional[InFlightOrder]:
-        found_order = None
+        found_order = self._all_orders_view.get(client_order_id) if client_order_id is not None else None
 
-        if client_order_id in self.all_orders:
-            found_order = self.all_orders[client_order_id]
-        elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self.all_orders.values() if order.exchange_order_id == exchange_order_id),
-                None)
+        if found_order is None and exchange_order_id is not None:
+            indexed_order = self._orders_by_exchange_order_id.get(exchange_order_id)
+            # the index outlives the orders expired from the cache
+            if indexed_order is not None and self._all_orders_view.get(indexed_order.client_order_id) is indexed_order:
+                found_order = indexed_order
 
         return found_order
 
@@ -229,6 +269,36 @@ class ClientOrderTracker:
         else:
             self.logger().debug(f"Order is not/no longer being tracked ({order_update})")
 
+    def _update_indexes(self, order: InFlightOrder):
+        if order.exchange_order_id is not None:
+            self._orders_by_exchange_order_id[order.exchange_order_id] = order
+        client_order_id = order.client_order_id
+        indexed_state = self._indexed_states.get(client_order_id)
+        if (indexed_state is not None
+                and indexed_state != order.current_state
+                and self._in_flight_orders.get(client_order_id) is order):
+            del self._active_orders_by_state[indexed_state][client_order_id]
+            self._active_orders_by_state.setdefault(order.current_state, {})[client_order_id] = order
+            self._indexed_states[client_order_id] = order.current_state
+
+    def _remove_from_active_indexes(self, client_order_id: str):
+        indexed_state = self._indexed_states.pop(client_order_id, None)
+        if indexed_state is not None:
+            order = self._active_orders_by_state[indexed_state].pop(client_order_id)
+            self._active_orders_by_trading_pair[order.trading_pair].pop(client_order_id, None)
+
+    def _prune_exchange_order_ids(self):
+        """
+        Drops the exchange order ids of the orders expired from the cache, once they outnumber the tracked ones.
+        """
+        tracked_count = len(self._in_flight_orders) + len(self._cached_orders) + len(self._lost_orders)
+        if len(self._orders_by_exchange_order_id) > 2 * (tracked_count + self.MAX_CACHE_SIZE):
+            self._orders_by_exchange_order_id = {
+                order.exchange_order_id: order
+                for order in self._all_fillable_orders_view.values()
+                if order.exchange_order_id is not None
+            }
+
     def _trigger_created_event(self, order: InFlightOrder):
         event_tag = MarketEvent.BuyOrderCreated if order.trade_type is TradeType.BUY else MarketEvent.SellOrderCreated
         event_class: Callable = BuyOrderCreatedEvent if order.trade_type is TradeType.BUY else SellOrderCreatedEvent
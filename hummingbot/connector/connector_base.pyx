@@ -1,7 +1,7 @@
 import asyncio
 import time
 from decimal import Decimal
-from typing import Dict, List, Set, Tuple, TYPE_CHECKING, Union
+from typing import Any, Dict, List, Set, Tuple, TYPE_CHECKING, Union
 
 from hummingbot.client.config.trade_fee_schema_loader import TradeFeeSchemaLoader
 from hummingbot.connector.in_flight_order_base import InFlightOrderBase
@@ -9,7 +9,7 @@ from hummingbot.connector.utils import split_hb_trading_pair, TradeFillOrderDeta
 from hummingbot.connector.constants import s_decimal_NaN, s_decimal_0
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.data_type.cancellation_result import CancellationResult
-from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
 from hummingbot.core.network_iterator import NetworkIterator
@@ -19,6 +19,8 @@ from hummingbot.core.utils.estimate_fee import estimate_fee
 if TYPE_CHECKING:
     from hummingbot.client.config.client_config_map import ClientConfigMap
     from hummingbot.client.config.config_helpers import ClientConfigAdapter
+    from hummingbot.core.data_type.limit_order import LimitOrder
+    from hummingbot.core.data_type.order_candidate import OrderCandidate
 
 
 cdef class ConnectorBase(NetworkIterator):
@@ -279,6 +281,43 @@ cdef class ConnectorBase(NetworkIterator):
         """
         raise NotImplementedError
 
+    def batch_order_create(self, orders_to_create: List["OrderCandidate"], **kwargs) -> List[str]:
+        """
+        Creates a list of orders, e.g. the whole proposal of a strategy in a tick. The default implementation places
+        the orders one by one, connectors of exchanges with a batch order endpoint send them in batches.
+        :param orders_to_create: The orders to create
+        :param kwargs: The arguments passed to the creation of every order (e.g. the position action)
+        :returns The ids of the created orders, in the order of orders_to_create
+        """
+        order_ids = []
+        for order in orders_to_create:
+            trade = self.buy if order.order_side == TradeType.BUY else self.sell
+            order_ids.append(trade(order.trading_pair,
+                                   order.amount,
+                                   order.order_type,
+                                   order.price,
+                                   **self.batch_order_kwargs(order, kwargs)))
+        return order_ids
+
+    def batch_order_cancel(self, orders_to_cancel: List["LimitOrder"]):
+        """
+        Cancels a list of orders. The default implementation cancels the orders one by one, connectors of exchanges
+        with a batch cancel endpoint send them in batches.
+        :param orders_to_cancel: The orders to cancel
+        """
+        for order in orders_to_cancel:
+            self.cancel(order.trading_pair, order.client_order_id)
+
+    @staticmethod
+    def batch_order_kwargs(order: "OrderCandidate", kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Returns the creation arguments of an order of a batch, closing positions for the perpetual order candidates
+        that close one.
+        """
+        if getattr(order, "position_close", False):
+            return {**kwargs, "position_action": PositionAction.CLOSE}
+        return kwargs
+
     cdef c_stop_tracking_order(self, str order_id):
         raise NotImplementedError
 
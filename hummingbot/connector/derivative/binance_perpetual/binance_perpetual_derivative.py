@@ -1,10 +1,11 @@
 import asyncio
+import json
 import logging
 import time
 import warnings
 from collections import defaultdict
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterable, Dict, List, Optional, Tuple
 
 from async_timeout import timeout
 
@@ -37,6 +38,7 @@ from hummingbot.core.data_type.funding_info import FundingInfo
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_candidate import OrderCandidate
 from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeBase
 from hummingbot.core.data_type.user_stream_tracker import UserStreamTracker
 from hummingbot.core.event.events import (
@@ -382,6 +384,57 @@ class BinancePerpetualDerivative(ExchangeBase, PerpetualTrading):
         safe_ensure_future(self._execute_cancel(trading_pair, client_order_id))
         return client_order_id
 
+    def batch_order_create(self, orders_to_create: List[OrderCandidate], **kwargs) -> List[str]:
+        """
+        Creates a list of orders, e.g. the whole proposal of a strategy in a tick. The orders are grouped per
+        trading pair and sent to the batch orders endpoint in requests of up to BATCH_ORDER_MAX_SIZE orders.
+
+        Parameters
+        ----------
+        orders_to_create:
+            The orders to create
+        kwargs:
+            The arguments of every order, the position_action (OPEN or CLOSE) being required
+        """
+        order_ids = []
+        orders_per_trading_pair: Dict[str, List[Tuple[str, OrderCandidate]]] = defaultdict(list)
+        for order in orders_to_create:
+            order_id: str = get_new_client_order_id(
+                is_buy=order.order_side == TradeType.BUY,
+                trading_pair=order.trading_pair,
+                hbot_order_id_prefix=CONSTANTS.BROKER_ID,
+                max_id_len=CONSTANTS.MAX_ORDER_ID_LEN,
+            )
+            order_ids.append(order_id)
+            orders_per_trading_pair[order.trading_pair].append((order_id, order))
+
+        for trading_pair_orders in orders_per_trading_pair.values():
+            for i in range(0, len(trading_pair_orders), CONSTANTS.BATCH_ORDER_MAX_SIZE):
+                safe_ensure_future(self._execute_batch_order_create(
+                    orders=trading_pair_orders[i:i + CONSTANTS.BATCH_ORDER_MAX_SIZE],
+                    **kwargs))
+        return order_ids
+
+    def batch_order_cancel(self, orders_to_cancel: List[LimitOrder]):
+        """
+        Cancels a list of orders. The orders are grouped per trading pair and sent to the batch orders endpoint in
+        requests of up to BATCH_CANCEL_MAX_SIZE orders.
+
+        Parameters
+        ----------
+        orders_to_cancel:
+            The orders to cancel
+        """
+        client_order_ids_per_trading_pair: Dict[str, List[str]] = defaultdict(list)
+        for order in orders_to_cancel:
+            client_order_ids_per_trading_pair[order.trading_pair].append(order.client_order_id)
+
+        for trading_pair, client_order_ids in client_order_ids_per_trading_pair.items():
+            for i in range(0, len(client_order_ids), CONSTANTS.BATCH_CANCEL_MAX_SIZE):
+                safe_ensure_future(self._execute_batch_order_cancel(
+                    trading_pair=trading_pair,
+                    client_order_ids=client_order_ids[i:i + CONSTANTS.BATCH_CANCEL_MAX_SIZE]))
+
     def quantize_order_amount(self, trading_pair: str, amount: object, price: object = Decimal(0)):
         quantized_amount = ExchangeBase.quantize_order_amount(self, trading_pair, amount)
         return quantized_amount
@@ -1215,8 +1268,52 @@ class BinancePerpetualDerivative(ExchangeBase, PerpetualTrading):
         price:
             Price for a limit order
         """
+        api_params = await self._start_tracking_valid_order(trade_type=trade_type,
+                                                            order_id=order_id,
+                                                            trading_pair=trading_pair,
+                                                            amount=amount,
+                                                            order_type=order_type,
+                                                            position_action=position_action,
+                                                            price=price)
+        if api_params is None:
+            return
+
+        try:
+            order_result = await self._api_request(
+                path=CONSTANTS.ORDER_URL,
+                data=api_params,
+                method=RESTMethod.POST,
+                is_auth_required=True,
+            )
+            self._update_order_after_creation(order_id=order_id, trading_pair=trading_pair, order_result=order_result)
 
-        order_result = None
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger().network(
+                f"Error submitting order to Binance Perpetuals for {api_params['quantity']} {trading_pair} "
+                f"{api_params.get('price', '')}.",
+                exc_info=True,
+                app_warning_msg=str(e),
+            )
+            # This should call stop_tracking_order
+            self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
+
+    async def _start_tracking_valid_order(
+            self,
+            trade_type: TradeType,
+            order_id: str,
+            trading_pair: str,
+            amount: Decimal,
+            order_type: OrderType,
+            position_action: PositionAction,
+            price: Optional[Decimal] = Decimal("NaN"),
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Quantizes and starts tracking an order, failing it if it can't be placed on the exchange.
+
+        Returns the parameters of the order for the order endpoints, or None if the order failed.
+        """
         trading_rule: TradingRule = self._trading_rules[trading_pair]
 
         if order_type in [OrderType.LIMIT, OrderType.LIMIT_MAKER]:
@@ -1239,25 +1336,25 @@ class BinancePerpetualDerivative(ExchangeBase, PerpetualTrading):
         if position_action not in [PositionAction.OPEN, PositionAction.CLOSE]:
             self.logger().error("Specify either OPEN_POSITION or CLOSE_POSITION position_action.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
+            return None
 
         if order_type not in self.supported_order_types():
             self.logger().error(f"{order_type} is not in the list of supported order types")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
+            return None
 
         if amount < trading_rule.min_order_size:
             self.logger().warning(f"{trade_type.name.title()} order amount {amount} is lower than the minimum order"
                                   f" size {trading_rule.min_order_size}. The order will not be created.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
+            return None
 
         if price is not None and amount * price < trading_rule.min_notional_size:
             self.logger().warning(f"{trade_type.name.title()} order notional {amount * price} is lower than the "
                                   f"minimum notional size {trading_rule.min_notional_size}. "
                                   "The order will not be created.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
+            return None
 
         api_params = {
             "symbol": await BinancePerpetualAPIOrderBookDataSource.convert_to_exchange_trading_pair(
@@ -1280,43 +1377,19 @@ class BinancePerpetualDerivative(ExchangeBase, PerpetualTrading):
                 api_params["positionSide"] = "LONG" if trade_type is TradeType.BUY else "SHORT"
             else:
                 api_params["positionSide"] = "SHORT" if trade_type is TradeType.BUY else "LONG"
+        return api_params
 
-        try:
-            order_result = await self._api_request(
-                path=CONSTANTS.ORDER_URL,
-                data=api_params,
-                method=RESTMethod.POST,
-                is_auth_required=True,
-            )
-
-            order_update: OrderUpdate = OrderUpdate(
-                trading_pair=trading_pair,
-                update_timestamp=order_result["updateTime"] * 1e-3,
-                new_state=CONSTANTS.ORDER_STATE[order_result["status"]],
-                client_order_id=order_id,
-                exchange_order_id=str(order_result["orderId"]),
-            )
-            # Since POST /order endpoint is synchrounous, we can update exchange_order_id and
-            # last_state of tracked order.
-            self._client_order_tracker.process_order_update(order_update)
-
-        except asyncio.CancelledError:
-            raise
-        except Exception as e:
-            self.logger().network(
-                f"Error submitting order to Binance Perpetuals for {amount} {trading_pair} "
-                f"{'' if order_type is OrderType.MARKET else price}.",
-                exc_info=True,
-                app_warning_msg=str(e),
-            )
-            order_update: OrderUpdate = OrderUpdate(
-                trading_pair=trading_pair,
-                update_timestamp=self.current_timestamp,
-                new_state=OrderState.FAILED,
-                client_order_id=order_id,
-            )
-            # This should call stop_tracking_order
-            self._client_order_tracker.process_order_update(order_update)
+    def _update_order_after_creation(self, order_id: str, trading_pair: str, order_result: Dict[str, Any]):
+        order_update: OrderUpdate = OrderUpdate(
+            trading_pair=trading_pair,
+            update_timestamp=order_result["updateTime"] * 1e-3,
+            new_state=CONSTANTS.ORDER_STATE[order_result["status"]],
+            client_order_id=order_id,
+            exchange_order_id=str(order_result["orderId"]),
+        )
+        # Since the order endpoints are synchronous, we can update exchange_order_id and
+        # last_state of tracked order.
+        self._client_order_tracker.process_order_update(order_update)
 
     def _update_order_after_failure(self, order_id: str, trading_pair: str):
         order_update: OrderUpdate = OrderUpdate(
@@ -1380,6 +1453,126 @@ class BinancePerpetualDerivative(ExchangeBase, PerpetualTrading):
         except Exception as e:
             self.logger().error(f"Could not cancel order {client_order_id} on Binance Perp. {str(e)}")
 
+    async def _execute_batch_order_create(self, orders: List[Tuple[str, OrderCandidate]], **kwargs):
+        """
+        Places a batch of orders of a trading pair with a single request to the batch orders endpoint.
+
+        Parameters
+        ----------
+        orders:
+            The client order IDs and the orders to create
+        """
+        tracked_orders = []
+        for order_id, order in orders:
+            position_action = self.batch_order_kwargs(order, kwargs).get("position_action", PositionAction.NIL)
+            api_params = await self._start_tracking_valid_order(trade_type=order.order_side,
+                                                                order_id=order_id,
+                                                                trading_pair=order.trading_pair,
+                                                                amount=order.amount,
+                                                                order_type=order.order_type,
+                                                                position_action=position_action,
+                                                                price=order.price)
+            if api_params is not None:
+                tracked_orders.append((order_id, order.trading_pair, api_params))
+        if len(tracked_orders) == 0:
+            return
+
+        try:
+            order_results = await self._api_request(
+                path=CONSTANTS.BATCH_ORDERS_URL,
+                data={"batchOrders": json.dumps([api_params for _, _, api_params in tracked_orders],
+                                                separators=(",", ":"))},
+                method=RESTMethod.POST,
+                is_auth_required=True,
+                limit_id=CONSTANTS.POST_BATCH_ORDERS_LIMIT_ID,
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            order_results = [e] * len(tracked_orders)
+
+        # the results are in the order of the batch, an error replacing each order rejected
+        for (order_id, trading_pair, api_params), order_result in zip(tracked_orders, order_results):
+            if isinstance(order_result, Exception) or "orderId" not in order_result:
+                self.logger().network(
+                    f"Error submitting order to Binance Perpetuals for {api_params['quantity']} {trading_pair} "
+                    f"{api_params.get('price', '')}.",
+                    exc_info=order_result if isinstance(order_result, Exception) else None,
+                    app_warning_msg=str(order_result),
+                )
+                self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
+            else:
+                self._update_order_after_creation(order_id=order_id,
+                                                  trading_pair=trading_pair,
+                                                  order_result=order_result)
+
+    async def _execute_batch_order_cancel(self, trading_pair: str, client_order_ids: List[str]) -> List[str]:
+        """
+        Cancels a batch of in-flight orders of a trading pair with a single request to the batch orders endpoint and
+        returns the client order IDs of the orders cancelled.
+
+        Parameters
+        ----------
+        trading_pair:
+            The pair that is being traded
+        client_order_ids:
+            Client order IDs
+        """
+        # Orders not being tracked or waiting for created confirmation are ignored, as in _execute_cancel
+        tracked_orders = [self._client_order_tracker.fetch_tracked_order(client_order_id)
+                          for client_order_id in client_order_ids]
+        client_order_ids = [order.client_order_id for order in tracked_orders
+                            if order is not None and not order.is_pending_create]
+        if len(client_order_ids) == 0:
+            return []
+
+        try:
+            params = {
+                "origClientOrderIdList": json.dumps(client_order_ids, separators=(",", ":")),
+                "symbol": await BinancePerpetualAPIOrderBookDataSource.convert_to_exchange_trading_pair(
+                    hb_trading_pair=trading_pair,
+                    domain=self._domain,
+                    throttler=self._throttler,
+                    api_factory=self._api_factory,
+                    time_synchronizer=self._binance_time_synchronizer
+                )
+            }
+            response = await self._api_request(
+                path=CONSTANTS.BATCH_ORDERS_URL,
+                params=params,
+                method=RESTMethod.DELETE,
+                is_auth_required=True,
+                limit_id=CONSTANTS.DELETE_BATCH_ORDERS_LIMIT_ID,
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger().error(f"Could not cancel orders {', '.join(client_order_ids)} on Binance Perp. {str(e)}")
+            return []
+
+        cancelled_order_ids = []
+        for client_order_id, cancel_result in zip(client_order_ids, response):
+            if cancel_result.get("code") == -2011 and "Unknown order sent." == cancel_result.get("msg", ""):
+                self.logger().debug(f"The order {client_order_id} does not exist on Binance Perpetuals. "
+                                    f"No cancelation needed.")
+                await self._client_order_tracker.process_order_not_found(client_order_id)
+                continue
+            if "code" in cancel_result:
+                self.logger().error(f"Could not cancel order {client_order_id} on Binance Perp. "
+                                    f"{cancel_result.get('msg', cancel_result)}")
+                continue
+            if cancel_result.get("status") == "CANCELED":
+                order_update: OrderUpdate = OrderUpdate(
+                    trading_pair=trading_pair,
+                    update_timestamp=cancel_result["updateTime"] * 1e-3,
+                    new_state=CONSTANTS.ORDER_STATE[cancel_result["status"]],
+                    client_order_id=client_order_id,
+                    exchange_order_id=str(cancel_result["orderId"]),
+                )
+                self._client_order_tracker.process_order_update(order_update)
+            cancelled_order_ids.append(client_order_id)
+        return cancelled_order_ids
+
     async def _api_request(self,
                            path: str,
                            params: Optional[Dict[str, Any]] = None,
@@ -38,9 +38,16 @@ ACCOUNT_TRADE_LIST_URL = "/userTrades"
 SET_LEVERAGE_URL = "/leverage"
 GET_INCOME_HISTORY_URL = "/income"
 CHANGE_POSITION_MODE_URL = "/positionSide/dual"
+BATCH_ORDERS_URL = "/batchOrders"
 
 POST_POSITION_MODE_LIMIT_ID = f"POST{CHANGE_POSITION_MODE_URL}"
 GET_POSITION_MODE_LIMIT_ID = f"GET{CHANGE_POSITION_MODE_URL}"
+POST_BATCH_ORDERS_LIMIT_ID = f"POST{BATCH_ORDERS_URL}"
+DELETE_BATCH_ORDERS_LIMIT_ID = f"DELETE{BATCH_ORDERS_URL}"
+
+# Maximum number of orders created and cancelled in one batch orders request
+BATCH_ORDER_MAX_SIZE = 5
+BATCH_CANCEL_MAX_SIZE = 10
 
 # Private API v2 Endpoints
 ACCOUNT_INFO_URL = "/account"
@@ -106,6 +113,13 @@ RATE_LIMITS = [
               linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=1),
                              LinkedLimitWeightPair(ORDERS_1MIN, weight=1),
                              LinkedLimitWeightPair(ORDERS_1SEC, weight=1)]),
+    # every order of a batch counts in the order limits
+    RateLimit(limit_id=POST_BATCH_ORDERS_LIMIT_ID, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
+              linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=5),
+                             LinkedLimitWeightPair(ORDERS_1MIN, weight=BATCH_ORDER_MAX_SIZE),
+                             LinkedLimitWeightPair(ORDERS_1SEC, weight=BATCH_ORDER_MAX_SIZE)]),
+    RateLimit(limit_id=DELETE_BATCH_ORDERS_LIMIT_ID, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
+              linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=1)]),
     RateLimit(limit_id=CANCEL_ALL_OPEN_ORDERS_URL, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
               linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=1)]),
     RateLimit(limit_id=ACCOUNT_TRADE_LIST_URL, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
@@ -24,6 +24,9 @@ if TYPE_CHECKING:
 
 
 class GateIoPerpetualAPIOrderBookDataSource(PerpetualAPIOrderBookDataSource):
+    CONTIGUOUS_DIFF_UPDATE_IDS = True
+    RESYNC_CROSSED_ORDER_BOOKS = True
+
     def __init__(
             self,
             trading_pairs: List[str],
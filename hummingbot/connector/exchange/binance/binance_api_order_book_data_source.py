@@ -20,6 +20,8 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
     TRADE_STREAM_ID = 1
     DIFF_STREAM_ID = 2
     ONE_HOUR = 60 * 60
+    CONTIGUOUS_DIFF_UPDATE_IDS = True
+    RESYNC_CROSSED_ORDER_BOOKS = True
 
     _logger: Optional[HummingbotLogger] = None
 
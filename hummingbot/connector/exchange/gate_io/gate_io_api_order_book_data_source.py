@@ -17,6 +17,8 @@ if TYPE_CHECKING:
 
 
 class GateIoAPIOrderBookDataSource(OrderBookTrackerDataSource):
+    CONTIGUOUS_DIFF_UPDATE_IDS = True
+    RESYNC_CROSSED_ORDER_BOOKS = True
 
     _logger: Optional[HummingbotLogger] = None
 
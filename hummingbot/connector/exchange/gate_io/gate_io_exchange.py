@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from bidict import bidict
 
@@ -17,6 +17,7 @@ from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState,
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 
@@ -29,6 +30,7 @@ class GateIoExchange(ExchangePyBase):
 
     # Using 120 seconds here as Gate.io websocket is quiet
     TICK_INTERVAL_LIMIT = 120.0
+    BATCH_ORDER_MAX_SIZE = CONSTANTS.BATCH_ORDER_MAX_SIZE
 
     web_utils = web_utils
 
@@ -180,17 +182,7 @@ class GateIoExchange(ExchangePyBase):
                            order_type: OrderType,
                            price: Decimal,
                            **kwargs) -> Tuple[str, float]:
-        order_type_str = order_type.name.lower().split("_")[0]
-        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
-
-        data = {
-            "text": order_id,
-            "currency_pair": symbol,
-            "side": trade_type.name.lower(),
-            "type": order_type_str,
-            "price": f"{price:f}",
-            "amount": f"{amount:f}",
-        }
+        data = await self._order_data(order_id, trading_pair, amount, trade_type, order_type, price)
         # RESTRequest does not support json, and if we pass a dict
         # the underlying aiohttp will encode it to params
         data = data
@@ -206,6 +198,88 @@ class GateIoExchange(ExchangePyBase):
         exchange_order_id = str(order_result["id"])
         return exchange_order_id, self.current_timestamp
 
+    async def _order_data(self,
+                          order_id: str,
+                          trading_pair: str,
+                          amount: Decimal,
+                          trade_type: TradeType,
+                          order_type: OrderType,
+                          price: Decimal) -> Dict[str, Any]:
+        order_type_str = order_type.name.lower().split("_")[0]
+        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+
+        return {
+            "text": order_id,
+            "currency_pair": symbol,
+            "side": trade_type.name.lower(),
+            "type": order_type_str,
+            "price": f"{price:f}",
+            "amount": f"{amount:f}",
+        }
+
+    async def _place_batch_order(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        data = [
+            await self._order_data(order.client_order_id,
+                                   order.trading_pair,
+                                   order.amount,
+                                   order.trade_type,
+                                   order.order_type,
+                                   order.price)
+            for order in orders
+        ]
+        order_results = await self._api_post(
+            path_url=CONSTANTS.BATCH_ORDER_CREATE_PATH_URL,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.BATCH_ORDER_CREATE_PATH_URL,
+        )
+        order_results = {order_result.get("text"): order_result for order_result in order_results}
+
+        results = []
+        for order in orders:
+            order_result = order_results.get(order.client_order_id)
+            if order_result is None or not order_result.get("succeeded", False):
+                results.append(IOError(f"Error submitting order {order.client_order_id}: {order_result}"))
+            elif order_result.get("status") in {"cancelled"}:
+                results.append(IOError({"label": "ORDER_REJECTED", "message": "Order rejected."}))
+            else:
+                results.append((str(order_result["id"]), self.current_timestamp))
+        return results
+
+    async def _place_batch_cancel(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        exchange_order_ids = await safe_gather(*[order.get_exchange_order_id() for order in orders],
+                                               return_exceptions=True)
+        data = [
+            {
+                "currency_pair": await self.exchange_symbol_associated_to_pair(trading_pair=order.trading_pair),
+                "id": exchange_order_id,
+            }
+            for order, exchange_order_id in zip(orders, exchange_order_ids)
+            if not isinstance(exchange_order_id, Exception)
+        ]
+        cancel_results = []
+        if len(data) > 0:
+            cancel_results = await self._api_post(
+                path_url=CONSTANTS.BATCH_ORDER_CANCEL_PATH_URL,
+                data=data,
+                is_auth_required=True,
+                limit_id=CONSTANTS.BATCH_ORDER_CANCEL_PATH_URL,
+            )
+        cancel_results = {str(cancel_result.get("id")): cancel_result for cancel_result in cancel_results}
+
+        results = []
+        for order, exchange_order_id in zip(orders, exchange_order_ids):
+            if isinstance(exchange_order_id, Exception):
+                # the order has no exchange order id yet, as when cancelling it alone
+                results.append(exchange_order_id)
+                continue
+            cancel_result = cancel_results.get(exchange_order_id)
+            if cancel_result is not None and cancel_result.get("succeeded", False):
+                results.append(True)
+            else:
+                results.append(IOError(f"Error cancelling order {order.client_order_id}: {cancel_result}"))
+        return results
+
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         """
         This implementation-specific method is called by _cancel
@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 
 
 class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
+    CONTIGUOUS_DIFF_UPDATE_IDS = True
+    RESYNC_CROSSED_ORDER_BOOKS = True
 
     _logger: Optional[HummingbotLogger] = None
 
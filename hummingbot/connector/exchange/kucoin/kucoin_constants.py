@@ -21,6 +21,7 @@ ACCOUNTS_PATH_URL = "/api/v1/accounts"
 SERVER_TIME_PATH_URL = "/api/v1/timestamp"
 SYMBOLS_PATH_URL = "/api/v1/symbols"
 ORDERS_PATH_URL = "/api/v1/orders"
+BATCH_ORDERS_PATH_URL = "/api/v1/orders/multi"
 FEE_PATH_URL = "/api/v1/trade-fees"
 ALL_TICKERS_PATH_URL = "/api/v1/market/allTickers"
 FILLS_PATH_URL = "/api/v1/fills"
@@ -36,6 +37,9 @@ POST_ORDER_LIMIT_ID = "PostOrder"
 DELETE_ORDER_LIMIT_ID = "DeleteOrder"
 WS_PING_HEARTBEAT = 10
 
+# Maximum number of orders in one batch orders request, only limit orders can be batched
+BATCH_ORDER_MAX_SIZE = 5
+
 DIFF_EVENT_TYPE = "trade.l2update"
 TRADE_EVENT_TYPE = "trade.l3match"
 ORDER_CHANGE_EVENT_TYPE = "orderChange"
@@ -59,6 +63,7 @@ RATE_LIMITS = [
     RateLimit(limit_id=LIMIT_FILLS_PATH_URL, limit=NO_LIMIT, time_interval=1),
     RateLimit(limit_id=ORDER_CLIENT_ORDER_PATH_URL, limit=NO_LIMIT, time_interval=1),
     RateLimit(limit_id=POST_ORDER_LIMIT_ID, limit=45, time_interval=3),
+    RateLimit(limit_id=BATCH_ORDERS_PATH_URL, limit=45, time_interval=3),
     RateLimit(limit_id=DELETE_ORDER_LIMIT_ID, limit=60, time_interval=3),
     RateLimit(limit_id=ORDERS_PATH_URL, limit=45, time_interval=3),
     RateLimit(limit_id=FILLS_PATH_URL, limit=9, time_interval=3),
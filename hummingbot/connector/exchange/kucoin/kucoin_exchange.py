@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from bidict import bidict
 
@@ -21,6 +21,7 @@ from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState,
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.utils.estimate_fee import build_trade_fee
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
@@ -31,6 +32,7 @@ if TYPE_CHECKING:
 
 class KucoinExchange(ExchangePyBase):
     web_utils = web_utils
+    BATCH_ORDER_MAX_SIZE = CONSTANTS.BATCH_ORDER_MAX_SIZE
 
     def __init__(self,
                  client_config_map: "ClientConfigAdapter",
@@ -180,13 +182,28 @@ class KucoinExchange(ExchangePyBase):
                            price: Decimal,
                            **kwargs) -> Tuple[str, float]:
         path_url = CONSTANTS.ORDERS_PATH_URL
+        data = self._order_data(order_id, amount, trade_type, order_type, price)
+        data["symbol"] = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+        exchange_order_id = await self._api_post(
+            path_url=path_url,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.POST_ORDER_LIMIT_ID,
+        )
+        return str(exchange_order_id["data"]["orderId"]), self.current_timestamp
+
+    @staticmethod
+    def _order_data(order_id: str,
+                    amount: Decimal,
+                    trade_type: TradeType,
+                    order_type: OrderType,
+                    price: Decimal) -> Dict[str, Any]:
         side = trade_type.name.lower()
         order_type_str = "market" if order_type == OrderType.MARKET else "limit"
         data = {
             "size": str(amount),
             "clientOid": order_id,
             "side": side,
-            "symbol": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair),
             "type": order_type_str,
         }
         if order_type is OrderType.LIMIT:
@@ -194,13 +211,59 @@ class KucoinExchange(ExchangePyBase):
         elif order_type is OrderType.LIMIT_MAKER:
             data["price"] = str(price)
             data["postOnly"] = True
-        exchange_order_id = await self._api_post(
-            path_url=path_url,
-            data=data,
-            is_auth_required=True,
-            limit_id=CONSTANTS.POST_ORDER_LIMIT_ID,
-        )
-        return str(exchange_order_id["data"]["orderId"]), self.current_timestamp
+        return data
+
+    async def _place_batch_order(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        # The batch endpoint only takes limit orders, the market orders are placed one by one
+        market_orders = [order for order in orders if order.order_type == OrderType.MARKET]
+        market_order_results = await safe_gather(
+            *[self._place_order(order_id=order.client_order_id,
+                                trading_pair=order.trading_pair,
+                                amount=order.amount,
+                                trade_type=order.trade_type,
+                                order_type=order.order_type,
+                                price=order.price)
+              for order in market_orders],
+            return_exceptions=True)
+        order_results = {order.client_order_id: result for order, result in zip(market_orders, market_order_results)}
+
+        limit_orders = [order for order in orders if order.order_type != OrderType.MARKET]
+        if len(limit_orders) > 0:
+            data = {
+                "symbol": await self.exchange_symbol_associated_to_pair(trading_pair=limit_orders[0].trading_pair),
+                "orderList": [
+                    self._order_data(order.client_order_id, order.amount, order.trade_type, order.order_type, order.price)
+                    for order in limit_orders
+                ],
+            }
+            try:
+                response = await self._api_post(
+                    path_url=CONSTANTS.BATCH_ORDERS_PATH_URL,
+                    data=data,
+                    is_auth_required=True,
+                    limit_id=CONSTANTS.BATCH_ORDERS_PATH_URL,
+                )
+                for order_result in response["data"]["data"]:
+                    if order_result.get("status") == "success":
+                        order_results[order_result["clientOid"]] = (str(order_result["id"]), self.current_timestamp)
+                    else:
+                        order_results[order_result["clientOid"]] = IOError(
+                            f"Error submitting order {order_result['clientOid']}: {order_result.get('failMsg')}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as exception:
+                # the market orders of the batch were placed, only the limit orders failed
+                order_results.update({order.client_order_id: exception for order in limit_orders})
+
+        return [
+            order_results.get(order.client_order_id, IOError(f"Error submitting order {order.client_order_id}"))
+            for order in orders
+        ]
+
+    async def _place_batch_cancel(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        # There is no endpoint cancelling a list of orders, they are cancelled one by one
+        return await safe_gather(*[self._submit_cancel(order.client_order_id, order) for order in orders],
+                                 return_exceptions=True)
 
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         """
@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from bidict import bidict
 
@@ -28,6 +28,7 @@ if TYPE_CHECKING:
 class OkxExchange(ExchangePyBase):
 
     web_utils = web_utils
+    BATCH_ORDER_MAX_SIZE = CONSTANTS.BATCH_ORDER_MAX_SIZE
 
     def __init__(self,
                  client_config_map: "ClientConfigAdapter",
@@ -218,6 +219,66 @@ class OkxExchange(ExchangePyBase):
 
         return final_result
 
+    async def _place_batch_order(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        data = [
+            {
+                "clOrdId": order.client_order_id,
+                "tdMode": "cash",
+                "ordType": "limit",
+                "side": order.trade_type.name.lower(),
+                "instId": await self.exchange_symbol_associated_to_pair(trading_pair=order.trading_pair),
+                "sz": str(order.amount),
+                "px": str(order.price)
+            }
+            for order in orders
+        ]
+
+        response = await self._api_request(
+            path_url=CONSTANTS.OKX_BATCH_ORDERS_PATH,
+            method=RESTMethod.POST,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.OKX_BATCH_ORDERS_PATH,
+        )
+        order_results = {order_result["clOrdId"]: order_result for order_result in response["data"]}
+
+        results = []
+        for order in orders:
+            order_result = order_results.get(order.client_order_id)
+            if order_result is None:
+                results.append(IOError(f"Error submitting order {order.client_order_id}: {response}"))
+            elif order_result["sCode"] != "0":
+                results.append(IOError(f"Error submitting order {order.client_order_id}: {order_result['sMsg']}"))
+            else:
+                results.append((str(order_result["ordId"]), self.current_timestamp))
+        return results
+
+    async def _place_batch_cancel(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        params = [
+            {
+                "clOrdId": order.client_order_id,
+                "instId": await self.exchange_symbol_associated_to_pair(trading_pair=order.trading_pair)
+            }
+            for order in orders
+        ]
+        cancel_result = await self._api_post(
+            path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH,
+            data=params,
+            is_auth_required=True,
+        )
+        order_results = {order_result["clOrdId"]: order_result for order_result in cancel_result["data"]}
+
+        results = []
+        for order in orders:
+            order_result = order_results.get(order.client_order_id)
+            # 51400 and 51401 mean that the order does not exist or has already been cancelled
+            if order_result is not None and order_result["sCode"] in ("0", "51400", "51401"):
+                results.append(True)
+            else:
+                results.append(
+                    IOError(f"Error cancelling order {order.client_order_id}: {order_result or cancel_result}"))
+        return results
+
     async def _get_last_traded_price(self, trading_pair: str) -> float:
         params = {"instId": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)}
 
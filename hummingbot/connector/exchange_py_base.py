@@ -2,8 +2,9 @@ import asyncio
 import copy
 import logging
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterable, Dict, List, Optional, Tuple, Union
 
 from async_timeout import timeout
 
@@ -13,6 +14,7 @@ from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
+from hummingbot.connector.ws_order_entry import WSOrderEntry, WSRequestNotSentError, WSResponseLostError
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.api_throttler.data_types import RateLimit
 from hummingbot.core.data_type.cancellation_result import CancellationResult
@@ -22,13 +24,14 @@ from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.order_candidate import OrderCandidate
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.core.data_type.user_stream_tracker import UserStreamTracker
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.web_assistant.auth import AuthBase
-from hummingbot.core.web_assistant.connections.data_types import RESTMethod
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod, WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.logger import HummingbotLogger
 
@@ -44,6 +47,8 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    # Maximum number of orders sent in one batch order request, 1 for exchanges without a batch order endpoint
+    BATCH_ORDER_MAX_SIZE = 1
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
@@ -59,6 +64,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._trading_rules_polling_task: Optional[asyncio.Task] = None
         self._trading_fees_polling_task: Optional[asyncio.Task] = None
         self._lost_orders_update_task: Optional[asyncio.Task] = None
+        self._ws_order_entry: Optional[WSOrderEntry] = None
 
         self._time_synchronizer = TimeSynchronizer()
         self._throttler = AsyncThrottler(
@@ -150,6 +156,14 @@ class ExchangePyBase(ExchangeBase, ABC):
     def is_trading_required(self) -> bool:
         raise NotImplementedError
 
+    @property
+    def ws_order_entry_url(self) -> Optional[str]:
+        """
+        Returns the url of the websocket used to create and cancel orders, None (the default) to create and cancel them
+        with REST requests only. Connectors returning an url implement the _ws_* order entry methods.
+        """
+        return None
+
     @property
     def order_books(self) -> Dict[str, OrderBook]:
         return self.order_book_tracker.order_books
@@ -391,27 +405,23 @@ class ExchangePyBase(ExchangeBase, ABC):
 
     async def cancel_all(self, timeout_seconds: float) -> List[CancellationResult]:
         """
-        Cancels all currently active orders. The cancellations are performed in parallel tasks.
+        Cancels all currently active orders. The cancellations are sent in batches, or in parallel tasks for exchanges
+        without a batch cancel endpoint.
 
         :param timeout_seconds: the maximum time (in seconds) the cancel logic should run
 
         :return: a list of CancellationResult instances, one for each of the orders to be cancelled
         """
         incomplete_orders = [o for o in self.in_flight_orders.values() if not o.is_done]
-        tasks = [self._execute_cancel(o.trading_pair, o.client_order_id) for o in incomplete_orders]
         order_id_set = set([o.client_order_id for o in incomplete_orders])
         successful_cancellations = []
 
         try:
             async with timeout(timeout_seconds):
-                cancellation_results = await safe_gather(*tasks, return_exceptions=True)
-                for cr in cancellation_results:
-                    if isinstance(cr, Exception):
-                        continue
-                    client_order_id = cr
-                    if client_order_id is not None:
-                        order_id_set.remove(client_order_id)
-                        successful_cancellations.append(CancellationResult(client_order_id, True))
+                cancelled_order_ids = await self._execute_batch_order_cancel(incomplete_orders)
+                for client_order_id in cancelled_order_ids:
+                    order_id_set.remove(client_order_id)
+                    successful_cancellations.append(CancellationResult(client_order_id, True))
         except Exception:
             self.logger().network(
                 "Unexpected error cancelling orders.",
@@ -421,6 +431,51 @@ class ExchangePyBase(ExchangeBase, ABC):
         failed_cancellations = [CancellationResult(oid, False) for oid in order_id_set]
         return successful_cancellations + failed_cancellations
 
+    def batch_order_create(self, orders_to_create: List[OrderCandidate], **kwargs) -> List[str]:
+        """
+        Creates a promise to create a list of orders, e.g. the whole proposal of a strategy in a tick. The orders are
+        grouped per trading pair and each group is sent in requests of up to BATCH_ORDER_MAX_SIZE orders, each one
+        throttled as a single request of the batch order endpoint. The orders are created one by one if the exchange
+        has no batch order endpoint.
+
+        :param orders_to_create: the orders to create
+        :param kwargs: the arguments passed to the creation of every order (e.g. the position action)
+
+        :return: the ids assigned by the connector to the orders (the client ids), in the order of orders_to_create
+        """
+        if self.BATCH_ORDER_MAX_SIZE <= 1:
+            return super().batch_order_create(orders_to_create, **kwargs)
+
+        order_ids = []
+        orders_per_trading_pair: Dict[str, List[Tuple[str, OrderCandidate]]] = defaultdict(list)
+        for order in orders_to_create:
+            order_id = get_new_client_order_id(
+                is_buy=order.order_side == TradeType.BUY,
+                trading_pair=order.trading_pair,
+                hbot_order_id_prefix=self.client_order_id_prefix,
+                max_id_len=self.client_order_id_max_length
+            )
+            order_ids.append(order_id)
+            orders_per_trading_pair[order.trading_pair].append((order_id, order))
+
+        for trading_pair_orders in orders_per_trading_pair.values():
+            for i in range(0, len(trading_pair_orders), self.BATCH_ORDER_MAX_SIZE):
+                safe_ensure_future(self._execute_batch_order_create(
+                    orders=trading_pair_orders[i:i + self.BATCH_ORDER_MAX_SIZE],
+                    **kwargs))
+        return order_ids
+
+    def batch_order_cancel(self, orders_to_cancel: List[LimitOrder]):
+        """
+        Creates a promise to cancel a list of orders in the exchange. The orders are grouped per trading pair and each
+        group is sent in requests of up to BATCH_ORDER_MAX_SIZE orders. The orders are cancelled one by one if the
+        exchange has no batch cancel endpoint.
+
+        :param orders_to_cancel: the orders to cancel
+        """
+        tracked_orders = [self._order_tracker.fetch_tracked_order(order.client_order_id) for order in orders_to_cancel]
+        safe_ensure_future(self._execute_batch_order_cancel([order for order in tracked_orders if order is not None]))
+
     async def _create_order(self,
                             trade_type: TradeType,
                             order_id: str,
@@ -440,45 +495,21 @@ class ExchangePyBase(ExchangeBase, ABC):
         :param price: the order price
         """
         exchange_order_id = ""
-        trading_rule = self._trading_rules[trading_pair]
-
-        if order_type in [OrderType.LIMIT, OrderType.LIMIT_MAKER]:
-            price = self.quantize_order_price(trading_pair, price)
-            quantize_amount_price = Decimal("0") if price.is_nan() else price
-            amount = self.quantize_order_amount(trading_pair=trading_pair, amount=amount, price=quantize_amount_price)
-        else:
-            amount = self.quantize_order_amount(trading_pair=trading_pair, amount=amount)
-
-        self.start_tracking_order(
+        order = self._start_tracking_valid_order(
+            trade_type=trade_type,
             order_id=order_id,
-            exchange_order_id=None,
             trading_pair=trading_pair,
+            amount=amount,
             order_type=order_type,
-            trade_type=trade_type,
             price=price,
-            amount=amount,
             **kwargs,
         )
-
-        if order_type not in self.supported_order_types():
-            self.logger().error(f"{order_type} is not in the list of supported order types")
-            self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
-
-        if amount < trading_rule.min_order_size:
-            self.logger().warning(f"{trade_type.name.title()} order amount {amount} is lower than the minimum order"
-                                  f" size {trading_rule.min_order_size}. The order will not be created.")
-            self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
-        if price is not None and amount * price < trading_rule.min_notional_size:
-            self.logger().warning(f"{trade_type.name.title()} order notional {amount * price} is lower than the "
-                                  f"minimum notional size {trading_rule.min_notional_size}. "
-                                  "The order will not be created.")
-            self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
+        if order is None:
             return
+        amount, price = order.amount, order.price
 
         try:
-            exchange_order_id, update_timestamp = await self._place_order(
+            exchange_order_id, update_timestamp = await self._submit_order(
                 order_id=order_id,
                 trading_pair=trading_pair,
                 amount=amount,
@@ -499,6 +530,10 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         except asyncio.CancelledError:
             raise
+        except WSResponseLostError:
+            # The order stays pending creation until the user stream or the order status update reports it
+            self.logger().warning(f"No response from the order entry websocket for the order {order_id}. "
+                                  f"Waiting for the exchange to report it.")
         except Exception:
             self.logger().network(
                 f"Error submitting {trade_type.name.lower()} {order_type.name.upper()} order to {self.name_cap} for "
@@ -509,6 +544,110 @@ class ExchangePyBase(ExchangeBase, ABC):
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
         return order_id, exchange_order_id
 
+    async def _execute_batch_order_create(self, orders: List[Tuple[str, OrderCandidate]], **kwargs):
+        """
+        Creates a batch of orders of a trading pair in the exchange with a single request
+
+        :param orders: the ids that should be assigned to the orders (the client ids) and the orders to create
+        """
+        tracked_orders = []
+        for order_id, order in orders:
+            tracked_order = self._start_tracking_valid_order(
+                trade_type=order.order_side,
+                order_id=order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                order_type=order.order_type,
+                price=order.price,
+                **self.batch_order_kwargs(order, kwargs),
+            )
+            if tracked_order is not None:
+                tracked_orders.append(tracked_order)
+        if len(tracked_orders) == 0:
+            return
+
+        try:
+            results = await self._place_batch_order(orders=tracked_orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exception:
+            results = [exception] * len(tracked_orders)
+
+        for tracked_order, result in zip(tracked_orders, results):
+            if isinstance(result, Exception):
+                self.logger().network(
+                    f"Error submitting {tracked_order.trade_type.name.lower()} {tracked_order.order_type.name.upper()} "
+                    f"order to {self.name_cap} for {tracked_order.amount} {tracked_order.trading_pair} "
+                    f"{tracked_order.price}.",
+                    exc_info=result,
+                    app_warning_msg=f"Failed to submit batch order to {self.name_cap}. "
+                                    f"Check API key and network connection."
+                )
+                self._update_order_after_failure(order_id=tracked_order.client_order_id,
+                                                 trading_pair=tracked_order.trading_pair)
+                continue
+            exchange_order_id, update_timestamp = result
+            order_update: OrderUpdate = OrderUpdate(
+                client_order_id=tracked_order.client_order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=tracked_order.trading_pair,
+                update_timestamp=update_timestamp,
+                new_state=OrderState.OPEN,
+            )
+            self._order_tracker.process_order_update(order_update)
+
+    def _start_tracking_valid_order(self,
+                                    trade_type: TradeType,
+                                    order_id: str,
+                                    trading_pair: str,
+                                    amount: Decimal,
+                                    order_type: OrderType,
+                                    price: Optional[Decimal] = None,
+                                    **kwargs) -> Optional[InFlightOrder]:
+        """
+        Quantizes the order to the trading rules and starts tracking it, failing it if the exchange would not accept it
+
+        :return: the tracked order, None if it failed
+        """
+        trading_rule = self._trading_rules[trading_pair]
+
+        if order_type in [OrderType.LIMIT, OrderType.LIMIT_MAKER]:
+            price = self.quantize_order_price(trading_pair, price)
+            quantize_amount_price = Decimal("0") if price.is_nan() else price
+            amount = self.quantize_order_amount(trading_pair=trading_pair, amount=amount, price=quantize_amount_price)
+        else:
+            amount = self.quantize_order_amount(trading_pair=trading_pair, amount=amount)
+
+        self.start_tracking_order(
+            order_id=order_id,
+            exchange_order_id=None,
+            trading_pair=trading_pair,
+            order_type=order_type,
+            trade_type=trade_type,
+            price=price,
+            amount=amount,
+            **kwargs,
+        )
+
+        if order_type not in self.supported_order_types():
+            self.logger().error(f"{order_type} is not in the list of supported order types")
+            self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
+            return None
+
+        if amount < trading_rule.min_order_size:
+            self.logger().warning(f"{trade_type.name.title()} order amount {amount} is lower than the minimum order"
+                                  f" size {trading_rule.min_order_size}. The order will not be created.")
+            self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
+            return None
+        if price is not None and amount * price < trading_rule.min_notional_size:
+            self.logger().warning(f"{trade_type.name.title()} order notional {amount * price} is lower than the "
+                                  f"minimum notional size {trading_rule.min_notional_size}. "
+                                  "The order will not be created.")
+            self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
+            return None
+
+        return self._order_tracker.fetch_tracked_order(order_id)
+
     def _update_order_after_failure(self, order_id: str, trading_pair: str):
         order_update: OrderUpdate = OrderUpdate(
             client_order_id=order_id,
@@ -520,17 +659,9 @@ class ExchangePyBase(ExchangeBase, ABC):
 
     async def _execute_order_cancel(self, order: InFlightOrder) -> str:
         try:
-            cancelled = await self._place_cancel(order.client_order_id, order)
+            cancelled = await self._submit_cancel(order.client_order_id, order)
             if cancelled:
-                order_update: OrderUpdate = OrderUpdate(
-                    client_order_id=order.client_order_id,
-                    trading_pair=order.trading_pair,
-                    update_timestamp=self.current_timestamp,
-                    new_state=(OrderState.CANCELED
-                               if self.is_cancel_request_in_exchange_synchronous
-                               else OrderState.PENDING_CANCEL),
-                )
-                self._order_tracker.process_order_update(order_update)
+                self._update_order_after_cancel(order)
                 return order.client_order_id
         except asyncio.CancelledError:
             raise
@@ -544,6 +675,138 @@ class ExchangePyBase(ExchangeBase, ABC):
             self.logger().error(
                 f"Failed to cancel order {order.client_order_id}", exc_info=True)
 
+    async def _execute_batch_order_cancel(self, orders: List[InFlightOrder]) -> List[str]:
+        """
+        Requests the exchange to cancel active orders, in batches per trading pair if the exchange supports them
+
+        :param orders: the tracked orders to cancel
+
+        :return: the client ids of the orders cancelled
+        """
+        if self.BATCH_ORDER_MAX_SIZE <= 1:
+            tasks = [self._execute_order_cancel(order=order) for order in orders]
+        else:
+            orders_per_trading_pair: Dict[str, List[InFlightOrder]] = defaultdict(list)
+            for order in orders:
+                orders_per_trading_pair[order.trading_pair].append(order)
+            tasks = [
+                self._execute_orders_cancel(orders=trading_pair_orders[i:i + self.BATCH_ORDER_MAX_SIZE])
+                for trading_pair_orders in orders_per_trading_pair.values()
+                for i in range(0, len(trading_pair_orders), self.BATCH_ORDER_MAX_SIZE)
+            ]
+        results = await safe_gather(*tasks, return_exceptions=True)
+
+        cancelled_order_ids = []
+        for result in results:
+            if isinstance(result, Exception) or result is None:
+                continue
+            if isinstance(result, list):
+                cancelled_order_ids.extend(result)
+            else:
+                cancelled_order_ids.append(result)
+        return cancelled_order_ids
+
+    async def _execute_orders_cancel(self, orders: List[InFlightOrder]) -> List[str]:
+        """
+        Requests the exchange to cancel a batch of orders of a trading pair with a single request
+
+        :param orders: the tracked orders to cancel
+
+        :return: the client ids of the orders cancelled
+        """
+        try:
+            results = await self._place_batch_cancel(orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exception:
+            results = [exception] * len(orders)
+
+        cancelled_order_ids = []
+        for order, result in zip(orders, results):
+            if isinstance(result, asyncio.TimeoutError):
+                self.logger().warning(f"Failed to cancel the order {order.client_order_id} because it does not have "
+                                      f"an exchange order id yet")
+                await self._order_tracker.process_order_not_found(order.client_order_id)
+            elif isinstance(result, Exception):
+                self.logger().error(f"Failed to cancel order {order.client_order_id}", exc_info=result)
+            elif result:
+                self._update_order_after_cancel(order)
+                cancelled_order_ids.append(order.client_order_id)
+        return cancelled_order_ids
+
+    def _update_order_after_cancel(self, order: InFlightOrder):
+        order_update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            trading_pair=order.trading_pair,
+            update_timestamp=self.current_timestamp,
+            new_state=(OrderState.CANCELED
+                       if self.is_cancel_request_in_exchange_synchronous
+                       else OrderState.PENDING_CANCEL),
+        )
+        self._order_tracker.process_order_update(order_update)
+
+    async def _submit_order(self,
+                            order_id: str,
+                            trading_pair: str,
+                            amount: Decimal,
+                            trade_type: TradeType,
+                            order_type: OrderType,
+                            price: Decimal,
+                            **kwargs) -> Tuple[str, float]:
+        """
+        Places an order through the order entry websocket while it is connected, and with the REST request of
+        _place_order otherwise or when the websocket request could not be sent.
+
+        :raises WSResponseLostError: if the websocket request was sent but got no response, the order possibly being
+        created in the exchange
+
+        :return: the exchange order id and the creation timestamp of the order
+        """
+        tracked_order = self._order_tracker.fetch_tracked_order(order_id)
+        if self._ws_order_entry is not None and self._ws_order_entry.ready and tracked_order is not None:
+            request_id = self._ws_order_entry.new_request_id()
+            try:
+                response = await self._ws_order_entry.request(
+                    request_id, self._ws_place_order_request(request_id, tracked_order, **kwargs))
+                return self._ws_place_order_response(tracked_order, response)
+            except WSRequestNotSentError:
+                self.logger().warning(f"The order {order_id} could not be sent through the order entry websocket. "
+                                      f"Placing it with a REST request.")
+            except (ConnectionError, asyncio.TimeoutError) as exception:
+                raise WSResponseLostError(f"No response for the order {order_id}.") from exception
+        return await self._place_order(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+            **kwargs,
+        )
+
+    async def _submit_cancel(self, order_id: str, tracked_order: InFlightOrder) -> bool:
+        """
+        Cancels an order through the order entry websocket while it is connected, and with the REST request of
+        _place_cancel otherwise or when the websocket request could not be sent.
+
+        :return: True if the order was cancelled, False if it was not or if the websocket request was sent but got no
+        response (the user stream or the order status update then report whether it was cancelled)
+        """
+        if self._ws_order_entry is not None and self._ws_order_entry.ready:
+            request_id = self._ws_order_entry.new_request_id()
+            try:
+                response = await self._ws_order_entry.request(
+                    request_id, self._ws_cancel_order_request(request_id, tracked_order))
+                return self._ws_cancel_order_response(tracked_order, response)
+            except WSRequestNotSentError:
+                self.logger().warning(f"The cancel of {order_id} could not be sent through the order entry websocket. "
+                                      f"Cancelling it with a REST request.")
+            except (ConnectionError, asyncio.TimeoutError):
+                self.logger().warning(f"No response from the order entry websocket for the cancel of {order_id}. "
+                                      f"Waiting for the exchange to report the order.")
+                return False
+        return await self._place_cancel(order_id, tracked_order)
+
     async def _execute_cancel(self, trading_pair: str, order_id: str) -> str:
         """
         Requests the exchange to cancel an active order
@@ -631,6 +894,69 @@ class ExchangePyBase(ExchangeBase, ABC):
                            ) -> Tuple[str, float]:
         raise NotImplementedError
 
+    async def _place_batch_order(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        """
+        Sends a batch of orders of a trading pair to the batch order endpoint of the exchange, as a single request
+        throttled with the rate limit of the endpoint. Implemented by the connectors setting BATCH_ORDER_MAX_SIZE.
+
+        :param orders: the tracked orders to create
+
+        :return: the exchange order id and creation timestamp of each order, or the exception of the orders rejected
+        """
+        raise NotImplementedError
+
+    async def _place_batch_cancel(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        """
+        Sends a batch of order cancellations of a trading pair to the batch cancel endpoint of the exchange, as a single
+        request throttled with the rate limit of the endpoint. Implemented by the connectors setting
+        BATCH_ORDER_MAX_SIZE.
+
+        :param orders: the tracked orders to cancel
+
+        :return: whether each order was cancelled, or the exception of the cancellations rejected
+        """
+        raise NotImplementedError
+
+    def _ws_order_entry_request_id(self, message: Any) -> Optional[str]:
+        """
+        Returns the id of the request a message of the order entry websocket responds to, None if it is not a response
+        """
+        raise NotImplementedError
+
+    def _ws_place_order_request(self, request_id: str, order: InFlightOrder, **kwargs) -> WSJSONRequest:
+        """
+        Formats the order entry websocket request placing an order, carrying the request id
+
+        :param request_id: the id of the request
+        :param order: the tracked order to place
+        """
+        raise NotImplementedError
+
+    def _ws_place_order_response(self, order: InFlightOrder, response: Any) -> Tuple[str, float]:
+        """
+        Parses the response to a websocket order placement, raising an exception if the order was rejected
+
+        :return: the exchange order id and the creation timestamp of the order
+        """
+        raise NotImplementedError
+
+    def _ws_cancel_order_request(self, request_id: str, order: InFlightOrder) -> WSJSONRequest:
+        """
+        Formats the order entry websocket request cancelling an order, carrying the request id
+
+        :param request_id: the id of the request
+        :param order: the tracked order to cancel
+        """
+        raise NotImplementedError
+
+    def _ws_cancel_order_response(self, order: InFlightOrder, response: Any) -> bool:
+        """
+        Parses the response to a websocket order cancellation
+
+        :return: True if the order was cancelled
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def _get_fee(self,
                  base_currency: str,
@@ -655,6 +981,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         - The polling loops to update the trading rules and trading fees
         - The polling loop to update order status and balance status using REST API (backup for main update process)
         - The background task to process the events received through the user stream tracker (websocket connection)
+        - The order entry websocket connection, for the connectors creating and cancelling orders through a websocket
         """
         self._stop_network()
         self.order_book_tracker.start()
@@ -665,6 +992,13 @@ class ExchangePyBase(ExchangeBase, ABC):
             self._user_stream_tracker_task = safe_ensure_future(self._user_stream_tracker.start())
             self._user_stream_event_listener_task = safe_ensure_future(self._user_stream_event_listener())
             self._lost_orders_update_task = safe_ensure_future(self._lost_orders_update_polling_loop())
+            if self.ws_order_entry_url is not None:
+                self._ws_order_entry = WSOrderEntry(
+                    ws_url=self.ws_order_entry_url,
+                    ws_assistant_factory=self._web_assistants_factory.get_ws_assistant,
+                    response_request_id=self._ws_order_entry_request_id,
+                    throttler=self._throttler)
+                self._ws_order_entry.start()
 
     async def stop_network(self):
         """
@@ -710,6 +1044,9 @@ class ExchangePyBase(ExchangeBase, ABC):
         if self._lost_orders_update_task is not None:
             self._lost_orders_update_task.cancel()
             self._lost_orders_update_task = None
+        if self._ws_order_entry is not None:
+            self._ws_order_entry.stop()
+            self._ws_order_entry = None
 
     # === loops and sync related methods ===
     #
@@ -978,7 +1315,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         await self._update_lost_orders()
 
     async def _cancel_lost_orders(self):
-        for _, lost_order in self._order_tracker.lost_orders.items():
+        for lost_order in list(self._order_tracker.lost_orders.values()):
             await self._execute_order_cancel(order=lost_order)
 
     # Methods tied to specific API data formats
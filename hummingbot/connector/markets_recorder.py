@@ -1,10 +1,12 @@
 import asyncio
+import logging
 import os.path
 import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from decimal import Decimal
 from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from sqlalchemy.orm import Query, Session
@@ -30,6 +32,8 @@ from hummingbot.core.event.events import (
     SellOrderCompletedEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
 from hummingbot.model.funding_payment import FundingPayment
 from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
@@ -40,11 +44,58 @@ from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
 
 
+class RecorderBatch:
+    """
+    Records queued by the MarketsRecorder event handlers, written together in one transaction.
+    """
+
+    def __init__(self):
+        # rows added as they are
+        self.records: List[Any] = []
+        # status rows added only if their order is recorded
+        self.order_statuses: List[OrderStatus] = []
+        # last status and update timestamp by order id: only the latest update of an order is written
+        self.order_updates: Dict[str, Tuple[str, int]] = {}
+        # payments added only if no payment was recorded at the same timestamp
+        self.funding_payments: List[FundingPayment] = []
+        # fills to append to the trades csv
+        self.trade_fills: List[TradeFill] = []
+        # markets by display name: the state of each market is saved once per batch
+        self.markets: Dict[str, ConnectorBase] = {}
+        # tracking states by market display name, taken when the batch is handed to the writer
+        self.market_states: Dict[str, Tuple[ConnectorBase, Dict[str, Any]]] = {}
+
+    @property
+    def size(self) -> int:
+        return len(self.records) + len(self.order_statuses) + len(self.funding_payments)
+
+    @property
+    def empty(self) -> bool:
+        return self.size == 0 and len(self.order_updates) == 0 and len(self.markets) == 0
+
+
 class MarketsRecorder:
+    """
+    Records the orders, fills, funding payments and range positions of the markets, along with their tracking states.
+    Once started, records are queued by the event handlers on the event loop and written behind by a dedicated writer
+    thread, in one transaction per batch, every flush_interval seconds or as soon as flush_size records are queued.
+    Order status updates and market state saves are coalesced within a batch. Stopping the recorder writes whatever is
+    still queued. Until it is started, every event is written right away.
+    """
     market_event_tag_map: Dict[int, MarketEvent] = {
         event_obj.value: event_obj
         for event_obj in MarketEvent.__members__.values()
     }
+    flush_interval: float = 1.0
+    flush_size: int = 100
+
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
 
     def __init__(self,
                  sql: SQLConnectionManager,
@@ -59,6 +110,9 @@ class MarketsRecorder:
         self._markets: List[ConnectorBase] = markets
         self._config_file_path: str = config_file_path
         self._strategy_name: str = strategy_name
+        self._batch: RecorderBatch = RecorderBatch()
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._flush_task: Optional[asyncio.Task] = None
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -114,15 +168,109 @@ class MarketsRecorder:
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def pending_records(self) -> int:
+        return self._batch.size
+
     def start(self):
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="markets_recorder")
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = safe_ensure_future(self._flush_loop(), loop=self._ev_loop)
 
     def stop(self):
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.remove_listener(event_pair[0], event_pair[1])
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        if self._writer is not None:
+            # the writer runs batches in order: once this one is written, everything queued before it is too
+            self.flush().result()
+            self._writer.shutdown(wait=True)
+            self._writer = None
+
+    def flush(self) -> Future:
+        """
+        Hand the queued records over to the writer thread.
+        :return: A future done once they are written, and so are all the batches queued before them.
+        """
+        batch = self._take_batch()
+        if self._writer is None:
+            future = Future()
+            self._write_batch(batch)
+            future.set_result(None)
+            return future
+        return self._writer.submit(self._write_batch_safely, batch)
+
+    async def _flush_loop(self):
+        while True:
+            try:
+                await asyncio.sleep(self.flush_interval)
+                self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error queuing trade records.", exc_info=True)
+
+    def _take_batch(self) -> RecorderBatch:
+        batch, self._batch = self._batch, RecorderBatch()
+        # tracking states are read here, on the event loop, where the markets update them
+        batch.market_states = {name: (market, market.tracking_states) for name, market in batch.markets.items()}
+        return batch
+
+    def _queued(self, market: Optional[ConnectorBase] = None):
+        """
+        Called by the event handlers once their records are added to the batch.
+        :param market: The market whose state is to be saved with the batch.
+        """
+        if market is not None:
+            self._batch.markets[market.display_name] = market
+        if self._writer is None or self._batch.size >= self.flush_size:
+            self.flush()
+
+    def _write_batch_safely(self, batch: RecorderBatch):
+        try:
+            self._write_batch(batch)
+        except Exception:
+            self.logger().error(f"Unexpected error writing {batch.size} trade records.", exc_info=True)
+
+    def _write_batch(self, batch: RecorderBatch):
+        """
+        Writer thread: write a batch in a single transaction.
+        """
+        if batch.empty:
+            return
+        with self._sql_manager.get_new_session() as session:
+            with session.begin():
+                session.add_all(batch.records)
+                order_ids = set(batch.order_updates.keys()) | {status.order_id for status in batch.order_statuses}
+                if len(order_ids) > 0:
+                    orders: Dict[str, Order] = {
+                        order.id: order for order in session.query(Order).filter(Order.id.in_(order_ids))
+                    }
+                    for order_id, (status, timestamp) in batch.order_updates.items():
+                        order_record: Optional[Order] = orders.get(order_id)
+                        if order_record is not None:
+                            order_record.last_status = status
+                            order_record.last_update_timestamp = timestamp
+                    session.add_all([status for status in batch.order_statuses if status.order_id in orders])
+                for payment in batch.funding_payments:
+                    # Try to find the funding payment has been recorded already.
+                    payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
+                        FundingPayment.timestamp == payment.timestamp).one_or_none()
+                    if payment_record is None:
+                        session.add(payment)
+                for market, tracking_states in batch.market_states.values():
+                    self.save_market_states(self._config_file_path, market, session=session,
+                                            tracking_states=tracking_states)
+                if len(batch.trade_fills) > 0:
+                    session.flush()
+                    self.append_trades_to_csv(batch.trade_fills)
 
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
@@ -152,18 +300,21 @@ class MarketsRecorder:
             else:
                 return query.limit(number_of_rows).all()
 
-    def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
+    def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session,
+                           tracking_states: Optional[Dict[str, Any]] = None):
         market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
         timestamp: int = self.db_timestamp
+        if tracking_states is None:
+            tracking_states = market.tracking_states
 
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = tracking_states
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(config_file_path=config_file_path,
                                         market=market.display_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state=tracking_states)
             session.add(market_states)
 
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
@@ -196,31 +347,28 @@ class MarketsRecorder:
         timestamp = int(evt.creation_timestamp * 1e3)
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Order = Order(id=evt.order_id,
-                                            config_file_path=self._config_file_path,
-                                            strategy=self._strategy_name,
-                                            market=market.display_name,
-                                            symbol=evt.trading_pair,
-                                            base_asset=base_asset,
-                                            quote_asset=quote_asset,
-                                            creation_timestamp=timestamp,
-                                            order_type=evt.type.name,
-                                            amount=Decimal(evt.amount),
-                                            leverage=evt.leverage if evt.leverage else 1,
-                                            price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
-                                            position=evt.position if evt.position else PositionAction.NIL.value,
-                                            last_status=event_type.name,
-                                            last_update_timestamp=timestamp,
-                                            exchange_order_id=evt.exchange_order_id)
-                order_status: OrderStatus = OrderStatus(order=order_record,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                session.add(order_record)
-                session.add(order_status)
-                market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+        order_record: Order = Order(id=evt.order_id,
+                                    config_file_path=self._config_file_path,
+                                    strategy=self._strategy_name,
+                                    market=market.display_name,
+                                    symbol=evt.trading_pair,
+                                    base_asset=base_asset,
+                                    quote_asset=quote_asset,
+                                    creation_timestamp=timestamp,
+                                    order_type=evt.type.name,
+                                    amount=Decimal(evt.amount),
+                                    leverage=evt.leverage if evt.leverage else 1,
+                                    price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
+                                    position=evt.position if evt.position else PositionAction.NIL.value,
+                                    last_status=event_type.name,
+                                    last_update_timestamp=timestamp,
+                                    exchange_order_id=evt.exchange_order_id)
+        order_status: OrderStatus = OrderStatus(order=order_record,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+        self._batch.records.extend([order_record, order_status])
+        market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
+        self._queued(market)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -235,47 +383,41 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the order record, and update it if necessary.
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-
-                # Order status and trade fill record should be added even if the order record is not found, because it's
-                # possible for fill event to come in before the order created event for market orders.
-                order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-
-                trade_fill_record: TradeFill = TradeFill(
-                    config_file_path=self.config_file_path,
-                    strategy=self.strategy_name,
-                    market=market.display_name,
-                    symbol=evt.trading_pair,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    timestamp=timestamp,
-                    order_id=order_id,
-                    trade_type=evt.trade_type.name,
-                    order_type=evt.order_type.name,
-                    price=Decimal(
-                        evt.price) if evt.price == evt.price else Decimal(0),
-                    amount=Decimal(evt.amount),
-                    leverage=evt.leverage if evt.leverage else 1,
-                    trade_fee=evt.trade_fee.to_json(),
-                    exchange_trade_id=evt.exchange_trade_id,
-                    position=evt.position if evt.position else PositionAction.NIL.value,
-                )
-                session.add(order_status)
-                session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
-
-                market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
-                                                                                   trade_fill_record.exchange_trade_id,
-                                                                                   trade_fill_record.symbol)})
-                self.append_to_csv(trade_fill_record)
+        # The order record is updated if it is found when the batch is written.
+        self._batch.order_updates[order_id] = (event_type.name, timestamp)
+
+        # Order status and trade fill record should be added even if the order record is not found, because it's
+        # possible for fill event to come in before the order created event for market orders.
+        order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+
+        trade_fill_record: TradeFill = TradeFill(
+            config_file_path=self.config_file_path,
+            strategy=self.strategy_name,
+            market=market.display_name,
+            symbol=evt.trading_pair,
+            base_asset=base_asset,
+            quote_asset=quote_asset,
+            timestamp=timestamp,
+            order_id=order_id,
+            trade_type=evt.trade_type.name,
+            order_type=evt.order_type.name,
+            price=Decimal(
+                evt.price) if evt.price == evt.price else Decimal(0),
+            amount=Decimal(evt.amount),
+            leverage=evt.leverage if evt.leverage else 1,
+            trade_fee=evt.trade_fee.to_json(),
+            exchange_trade_id=evt.exchange_trade_id,
+            position=evt.position if evt.position else PositionAction.NIL.value,
+        )
+        self._batch.records.extend([order_status, trade_fill_record])
+        self._batch.trade_fills.append(trade_fill_record)
+
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
+                                                                           trade_fill_record.exchange_trade_id,
+                                                                           trade_fill_record.symbol)})
+        self._queued(market)
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -287,19 +429,14 @@ class MarketsRecorder:
 
         timestamp: float = evt.timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the funding payment has been recorded already.
-                payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
-                    FundingPayment.timestamp == timestamp).one_or_none()
-                if payment_record is None:
-                    funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                            config_file_path=self.config_file_path,
-                                                                            market=market.display_name,
-                                                                            rate=evt.funding_rate,
-                                                                            symbol=evt.trading_pair,
-                                                                            amount=float(evt.amount))
-                    session.add(funding_payment_record)
+        funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
+                                                                config_file_path=self.config_file_path,
+                                                                market=market.display_name,
+                                                                rate=evt.funding_rate,
+                                                                symbol=evt.trading_pair,
+                                                                amount=float(evt.amount))
+        self._batch.funding_payments.append(funding_payment_record)
+        self._queued()
 
     @staticmethod
     def _csv_matches_header(file_path: str, header: tuple) -> bool:
@@ -307,27 +444,35 @@ class MarketsRecorder:
         return tuple(df.iloc[0].values) == header
 
     def append_to_csv(self, trade: TradeFill):
-        csv_filename = "trades_" + trade.config_file_path[:-4] + ".csv"
-        csv_path = os.path.join(data_path(), csv_filename)
-
-        field_names = tuple(trade.attribute_names_for_file_export())
-        field_data = tuple(getattr(trade, attr) for attr in field_names)
-
-        # adding extra field "age"
-        # // indicates order is a paper order so 'n/a'. For real orders, calculate age.
-        age = pd.Timestamp(int((trade.timestamp * 1e-3) - (trade.order.creation_timestamp * 1e-3)), unit='s').strftime(
-            '%H:%M:%S') if (trade.order is not None and "//" not in trade.order_id) else "n/a"
-        field_names += ("age",)
-        field_data += (age,)
-
-        if (os.path.exists(csv_path) and (not self._csv_matches_header(csv_path, field_names))):
-            move(csv_path, csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
-
-        if not os.path.exists(csv_path):
-            df_header = pd.DataFrame([field_names])
-            df_header.to_csv(csv_path, mode='a', header=False, index=False)
-        df = pd.DataFrame([field_data])
-        df.to_csv(csv_path, mode='a', header=False, index=False)
+        self.append_trades_to_csv([trade])
+
+    def append_trades_to_csv(self, trades: List[TradeFill]):
+        """
+        Append fills to the trades csv of their config file, opening each csv once.
+        """
+        rows_by_path: Dict[str, List[tuple]] = {}
+        field_names = tuple(TradeFill.attribute_names_for_file_export()) + ("age",)
+        for trade in trades:
+            csv_filename = "trades_" + trade.config_file_path[:-4] + ".csv"
+            csv_path = os.path.join(data_path(), csv_filename)
+
+            field_data = tuple(getattr(trade, attr) for attr in field_names[:-1])
+
+            # adding extra field "age"
+            # // indicates order is a paper order so 'n/a'. For real orders, calculate age.
+            age = pd.Timestamp(int((trade.timestamp * 1e-3) - (trade.order.creation_timestamp * 1e-3)), unit='s').strftime(
+                '%H:%M:%S') if (trade.order is not None and "//" not in trade.order_id) else "n/a"
+            rows_by_path.setdefault(csv_path, []).append(field_data + (age,))
+
+        for csv_path, rows in rows_by_path.items():
+            if (os.path.exists(csv_path) and (not self._csv_matches_header(csv_path, field_names))):
+                move(csv_path, csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
+
+            if not os.path.exists(csv_path):
+                df_header = pd.DataFrame([field_names])
+                df_header.to_csv(csv_path, mode='a', header=False, index=False)
+            df = pd.DataFrame(rows)
+            df.to_csv(csv_path, mode='a', header=False, index=False)
 
     def _update_order_status(self,
                              event_tag: int,
@@ -345,18 +490,12 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-                    order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                            timestamp=timestamp,
-                                                            status=event_type.name)
-                    session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+        # Only recorded orders are updated, when the batch is written.
+        self._batch.order_updates[order_id] = (event_type.name, timestamp)
+        self._batch.order_statuses.append(OrderStatus(order_id=order_id,
+                                                      timestamp=timestamp,
+                                                      status=event_type.name))
+        self._queued(market)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -392,15 +531,13 @@ class MarketsRecorder:
 
         timestamp: int = self.db_timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
-                                                                     timestamp=timestamp,
-                                                                     tx_hash=evt.exchange_order_id,
-                                                                     token_id=evt.token_id,
-                                                                     trade_fee=evt.trade_fee.to_json())
-                session.add(rp_update)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
+                                                             timestamp=timestamp,
+                                                             tx_hash=evt.exchange_order_id,
+                                                             token_id=evt.token_id,
+                                                             trade_fee=evt.trade_fee.to_json())
+        self._batch.records.append(rp_update)
+        self._queued(connector)
 
     def _did_close_position(self,
                             event_tag: int,
@@ -410,14 +547,12 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_close_position, event_tag, connector, evt)
             return
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
-                                                                                 strategy=self._strategy_name,
-                                                                                 token_id=evt.token_id,
-                                                                                 token_0=evt.token_0,
-                                                                                 token_1=evt.token_1,
-                                                                                 claimed_fee_0=Decimal(evt.claimed_fee_0),
-                                                                                 claimed_fee_1=Decimal(evt.claimed_fee_1))
-                session.add(rp_fees)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
+                                                                         strategy=self._strategy_name,
+                                                                         token_id=evt.token_id,
+                                                                         token_0=evt.token_0,
+                                                                         token_1=evt.token_1,
+                                                                         claimed_fee_0=Decimal(evt.claimed_fee_0),
+                                                                         claimed_fee_1=Decimal(evt.claimed_fee_1))
+        self._batch.records.append(rp_fees)
+        self._queued(connector)
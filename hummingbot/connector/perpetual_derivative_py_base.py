@@ -11,6 +11,7 @@ from hummingbot.connector.perpetual_trading import PerpetualTrading
 from hummingbot.core.data_type.common import OrderType, PositionAction, PositionMode, TradeType
 from hummingbot.core.data_type.funding_info import FundingInfo
 from hummingbot.core.data_type.in_flight_order import PerpetualDerivativeInFlightOrder
+from hummingbot.core.data_type.order_candidate import OrderCandidate
 from hummingbot.core.data_type.perpetual_api_order_book_data_source import PerpetualAPIOrderBookDataSource
 from hummingbot.core.data_type.trade_fee import TradeFeeBase
 from hummingbot.core.event.events import (
@@ -211,6 +212,27 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
         self._last_funding_fee_payment_ts.clear()
         super()._stop_network()
 
+    def batch_order_create(
+        self,
+        orders_to_create: List[OrderCandidate],
+        position_action: PositionAction = PositionAction.NIL,
+        **kwargs,
+    ) -> List[str]:
+        """
+        Creates a promise to create a list of orders, see ExchangePyBase.batch_order_create
+
+        :param orders_to_create: the orders to create
+        :param position_action: is the order opening or closing a position, orders closing a position if they are
+            perpetual order candidates closing one
+
+        :return: the ids assigned by the connector to the orders (the client ids), in the order of orders_to_create
+        """
+        if position_action not in self.VALID_POSITION_ACTIONS:
+            raise ValueError(
+                f"Invalid position action {position_action}. Must be one of {self.VALID_POSITION_ACTIONS}"
+            )
+        return super().batch_order_create(orders_to_create, position_action=position_action, **kwargs)
+
     async def _create_order(
         self,
         trade_type: TradeType,
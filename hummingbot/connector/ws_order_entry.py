@@ -0,0 +1,160 @@
+import asyncio
+import itertools
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.logger import HummingbotLogger
+
+
+class WSRequestNotSentError(ConnectionError):
+    """
+    Raised when a request could not be written to the order entry websocket: the exchange did not receive it, so it
+    can safely be sent again by other means.
+    """
+
+
+class WSResponseLostError(Exception):
+    """
+    Raised when the response of a request sent through the order entry websocket was lost: the exchange may have
+    processed the request, its outcome is only known once the exchange reports the state of the order.
+    """
+
+
+class WSOrderEntry:
+    """
+    Sends order entry requests (order creations and cancellations) through a websocket connection of the exchange and
+    correlates each request with its response by the request id both carry.
+
+    The connection is kept open (and reopened when it drops) by a background task. Requests that could not be sent
+    fail with a WSRequestNotSentError. Requests sent and waiting for a response fail with a ConnectionError when the
+    connection drops, or with an asyncio.TimeoutError after REQUEST_TIMEOUT: the exchange may have processed them.
+    """
+    _logger = None
+
+    REQUEST_TIMEOUT = 10.0
+    RECONNECT_DELAY = 5.0
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(HummingbotLogger.logger_name_for_class(cls))
+        return cls._logger
+
+    def __init__(self,
+                 ws_url: str,
+                 ws_assistant_factory: Callable[[], Awaitable[WSAssistant]],
+                 response_request_id: Callable[[Any], Optional[str]],
+                 throttler: Optional[AsyncThrottlerBase] = None,
+                 request_timeout: float = REQUEST_TIMEOUT):
+        """
+        :param ws_url: the url of the order entry websocket of the exchange
+        :param ws_assistant_factory: creates the (authenticated) websocket assistants of the connections
+        :param response_request_id: extracts the request id of a received message, None if it is not a response
+        :param throttler: the throttler the requests with a throttler_limit_id are throttled with
+        :param request_timeout: the maximum time (in seconds) to wait for the response of a request
+        """
+        self._ws_url = ws_url
+        self._ws_assistant_factory = ws_assistant_factory
+        self._response_request_id = response_request_id
+        self._throttler = throttler
+        self._request_timeout = request_timeout
+
+        self._ws_assistant: Optional[WSAssistant] = None
+        self._connected = asyncio.Event()
+        self._pending_responses: Dict[str, asyncio.Future] = {}
+        self._request_ids = itertools.count(1)
+        self._listen_task: Optional[asyncio.Task] = None
+
+    @property
+    def ready(self) -> bool:
+        """
+        True if requests can be sent, False while the connection is not established.
+        """
+        return self._connected.is_set()
+
+    def start(self):
+        self.stop()
+        self._listen_task = safe_ensure_future(self._listen_loop())
+
+    def stop(self):
+        if self._listen_task is not None:
+            self._listen_task.cancel()
+            self._listen_task = None
+        self._connected.clear()
+        self._fail_pending_responses()
+
+    def new_request_id(self) -> str:
+        return str(next(self._request_ids))
+
+    async def request(self, request_id: str, request: WSJSONRequest) -> Any:
+        """
+        Sends a request and waits for its response.
+
+        :param request_id: the id of the request, carried by its payload and by its response
+        :param request: the request to send
+
+        :return: the data of the response
+        """
+        if not self.ready:
+            raise WSRequestNotSentError("The order entry websocket is not connected.")
+        response_future = asyncio.get_event_loop().create_future()
+        self._pending_responses[request_id] = response_future
+        try:
+            if self._throttler is not None and request.throttler_limit_id is not None:
+                async with self._throttler.execute_task(limit_id=request.throttler_limit_id):
+                    await self._send(request, response_future)
+            else:
+                await self._send(request, response_future)
+            return await asyncio.wait_for(response_future, timeout=self._request_timeout)
+        finally:
+            self._pending_responses.pop(request_id, None)
+
+    async def _send(self, request: WSJSONRequest, response_future: asyncio.Future):
+        # The connection may have dropped while the request was throttled
+        if self._ws_assistant is None or response_future.done():
+            raise WSRequestNotSentError("The order entry websocket connection was closed.")
+        try:
+            await self._ws_assistant.send(request)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exception:
+            raise WSRequestNotSentError(f"The order entry request could not be sent ({exception}).") from exception
+
+    async def _listen_loop(self):
+        while True:
+            try:
+                self._ws_assistant = await self._ws_assistant_factory()
+                await self._ws_assistant.connect(ws_url=self._ws_url)
+                self._connected.set()
+                async for ws_response in self._ws_assistant.iter_messages():
+                    self._process_message(ws_response.data)
+            except asyncio.CancelledError:
+                raise
+            except ConnectionError as connection_exception:
+                self.logger().warning(f"The order entry websocket connection was closed ({connection_exception})")
+            except Exception:
+                self.logger().exception("Unexpected error in the order entry websocket connection.")
+            finally:
+                ws_assistant, self._ws_assistant = self._ws_assistant, None
+                self._connected.clear()
+                self._fail_pending_responses()
+                ws_assistant and await ws_assistant.disconnect()
+            await self._sleep(self.RECONNECT_DELAY)
+
+    def _process_message(self, message: Any):
+        request_id = self._response_request_id(message)
+        response_future = self._pending_responses.get(request_id) if request_id is not None else None
+        if response_future is not None and not response_future.done():
+            response_future.set_result(message)
+
+    def _fail_pending_responses(self):
+        for response_future in self._pending_responses.values():
+            if not response_future.done():
+                response_future.set_exception(ConnectionError("The order entry websocket connection was closed."))
+
+    async def _sleep(self, delay: float):
+        await asyncio.sleep(delay)
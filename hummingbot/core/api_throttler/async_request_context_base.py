@@ -1,11 +1,10 @@
-import asyncio
 import logging
 import time
 from abc import ABC, abstractmethod
-from decimal import Decimal
 from typing import List, Tuple
 
-from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.rate_limit_scheduler import RateLimitScheduler
 from hummingbot.logger.logger import HummingbotLogger
 
 arc_logger = None
@@ -15,7 +14,8 @@ MAX_CAPACITY_REACHED_WARNING_INTERVAL = 30.0
 class AsyncRequestContextBase(ABC):
     """
     An async context class ('async with' syntax) that checks for rate limit and waits for the capacity to be freed.
-    It uses an async lock to prevent multiple instances of this class from accessing the `acquire()` function.
+    Tasks that cannot go right away wait in the throttler's RateLimitScheduler, which wakes them up in arrival order as
+    soon as their capacity is freed.
     """
 
     _last_max_cap_warning_ts: float = 0.0
@@ -28,64 +28,51 @@ class AsyncRequestContextBase(ABC):
         return arc_logger
 
     def __init__(self,
-                 task_logs: List[TaskLog],
+                 scheduler: RateLimitScheduler,
                  rate_limit: RateLimit,
                  related_limits: List[Tuple[RateLimit, int]],
-                 lock: asyncio.Lock,
-                 safety_margin_pct: float,
-                 retry_interval: float = 0.1,
                  ):
         """
         Asynchronous context associated with each API request.
-        :param task_logs: Shared task logs associated with this API request
+        :param scheduler: Shared rate limit windows and waiting tasks associated with this API request
         :param rate_limit: The RateLimit associated with this API Request
         :param related_limits: List of linked rate limits with its corresponding weight associated with this API Request
-        :param lock: A shared asyncio.Lock used between all instances of APIRequestContextBase
-        :param retry_interval: Time between each limit check
         """
-        self._task_logs: List[TaskLog] = task_logs
+        self._scheduler: RateLimitScheduler = scheduler
         self._rate_limit: RateLimit = rate_limit
         self._related_limits: List[Tuple[RateLimit, int]] = related_limits
-        self._lock: asyncio.Lock = lock
-        self._safety_margin_pct: float = safety_margin_pct
-        self._retry_interval: float = retry_interval
+
+    @property
+    def limits(self) -> List[Tuple[RateLimit, int]]:
+        """
+        Rate limits the task uses capacity on, with the corresponding weights.
+        Each related limit is represented as it own individual TaskLog.
+        """
+        if self._rate_limit is None:
+            return []
+        return [(self._rate_limit, self._rate_limit.weight)] + self._related_limits
 
     def flush(self):
         """
         Remove task logs that have passed rate limit periods
         :return:
         """
-        now: Decimal = Decimal(str(time.time()))
-        for task in self._task_logs:
-            task_limit: RateLimit = task.rate_limit
-            elapsed: Decimal = now - Decimal(str(task.timestamp))
-            if elapsed > Decimal(str(task_limit.time_interval * (1 + self._safety_margin_pct))):
-                self._task_logs.remove(task)
+        self._scheduler.flush(self.limits, time.time())
 
     @abstractmethod
     def within_capacity(self) -> bool:
         raise NotImplementedError
 
     async def acquire(self):
-        while True:
-            async with self._lock:
-                self.flush()
-
-                if self.within_capacity():
-                    break
-            await asyncio.sleep(self._retry_interval)
-        async with self._lock:
+        limits = self.limits
+        if not self._scheduler.has_waiters(limits) and self.within_capacity():
+            # Log the acquired rate limit and its related limits into the tasks log, unless the capacity was taken
+            # meanwhile by a throttler sharing the limits
             now = time.time()
-            # Each related limit is represented as it own individual TaskLog
-
-            # Log the acquired rate limit into the tasks log
-            self._task_logs.append(TaskLog(timestamp=now,
-                                           rate_limit=self._rate_limit,
-                                           weight=self._rate_limit.weight))
-
-            # Log its related limits into the tasks log as individual tasks
-            for limit, weight in self._related_limits:
-                self._task_logs.append(TaskLog(timestamp=now, rate_limit=limit, weight=weight))
+            if self._scheduler.log_if_available(limits, now) <= now:
+                self._scheduler.record_wait(limits, 0)
+                return
+        await self._scheduler.wait(limits)
 
     async def __aenter__(self):
         await self.acquire()
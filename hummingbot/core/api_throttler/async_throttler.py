@@ -1,19 +1,16 @@
 import time
-from decimal import Decimal
-from typing import List, Tuple
 
 from hummingbot.core.api_throttler.async_request_context_base import (
     MAX_CAPACITY_REACHED_WARNING_INTERVAL,
     AsyncRequestContextBase,
 )
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
-from hummingbot.core.api_throttler.data_types import RateLimit
 
 
 class AsyncRequestContext(AsyncRequestContextBase):
     """
     An async context class ('async with' syntax) that checks for rate limit and wait for the capacity if needed.
-    It uses async lock to prevent other instances of this class from running acquire fn before it finishes with it.
+    Tasks waiting for capacity are woken up by the throttler's scheduler once their capacity is freed.
     """
 
     def within_capacity(self) -> bool:
@@ -22,25 +19,17 @@ class AsyncRequestContext(AsyncRequestContextBase):
         Note: A task can be associated to one or more RateLimit.
         :return: True if it is within capacity to add a new task
         """
-        if self._rate_limit is not None:
-            list_of_limits: List[Tuple[RateLimit, int]] = [(self._rate_limit,
-                                                            self._rate_limit.weight)] + self._related_limits
-            now: float = self._time()
-            for rate_limit, weight in list_of_limits:
-                capacity_used: int = sum([task.weight
-                                          for task in self._task_logs
-                                          if rate_limit.limit_id == task.rate_limit.limit_id and
-                                          Decimal(str(now)) - Decimal(str(task.timestamp)) - Decimal(str(task.rate_limit.time_interval * self._safety_margin_pct)) <= task.rate_limit.time_interval])
-
-                if capacity_used + weight > rate_limit.limit:
-                    if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
-                        msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
-                              f"{rate_limit.time_interval}s) has almost reached. Limits used " \
-                              f"is {capacity_used} in the last " \
-                              f"{rate_limit.time_interval} seconds"
-                        self.logger().notify(msg)
-                        AsyncRequestContextBase._last_max_cap_warning_ts = now
-                    return False
+        now: float = self._time()
+        for rate_limit, weight in self.limits:
+            if self._scheduler.available_at([(rate_limit, weight)], now) > now:
+                if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+                    msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
+                          f"{rate_limit.time_interval}s) has almost reached. Limits used " \
+                          f"is {self._scheduler.used(rate_limit, now)} in the last " \
+                          f"{rate_limit.time_interval} seconds"
+                    self.logger().notify(msg)
+                    AsyncRequestContextBase._last_max_cap_warning_ts = now
+                return False
         return True
 
     def _time(self):
@@ -68,10 +57,7 @@ class AsyncThrottler(AsyncThrottlerBase):
         """
         rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
         return AsyncRequestContext(
-            task_logs=self._task_logs,
+            scheduler=self._scheduler,
             rate_limit=rate_limit,
             related_limits=related_rate_limits,
-            lock=self._lock,
-            safety_margin_pct=self._safety_margin_pct,
-            retry_interval=self._retry_interval,
         )
@@ -1,4 +1,3 @@
-import asyncio
 import copy
 import logging
 import math
@@ -7,7 +6,9 @@ from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 
 from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
-from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import RateLimit, RateLimitTelemetry
+from hummingbot.core.api_throttler.rate_limit_scheduler import RateLimitScheduler
+from hummingbot.core.api_throttler.shared_rate_limit_scheduler import SharedRateLimitScheduler
 from hummingbot.logger.logger import HummingbotLogger
 
 
@@ -18,6 +19,8 @@ class AsyncThrottlerBase(ABC):
     """
 
     _logger = None
+    # Directory of the task logs shared by the throttlers of the host, None if they are not shared
+    _shared_dir: Optional[str] = None
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -25,6 +28,15 @@ class AsyncThrottlerBase(ABC):
             cls._logger = logging.getLogger(__name__)
         return cls._logger
 
+    @classmethod
+    def share_rate_limits(cls, shared_dir: Optional[str]):
+        """
+        Share the task logs of the throttlers created from now on with the other throttlers of the host using the same
+        rate limits, in this process and in the processes sharing the same directory.
+        :param shared_dir: The directory of the shared task logs, None to stop sharing them.
+        """
+        cls._shared_dir = shared_dir
+
     def __init__(self,
                  rate_limits: List[RateLimit],
                  retry_interval: float = 0.1,
@@ -33,7 +45,8 @@ class AsyncThrottlerBase(ABC):
                  ):
         """
         :param rate_limits: List of RateLimit(s).
-        :param retry_interval: Time between every capacity check.
+        :param retry_interval: Ignored, kept for compatibility: waiting tasks are woken up as soon as capacity frees
+            up instead of checking it every retry_interval.
         :param safety_margin_pct: Percentage of limit to be added as a safety margin when calculating capacity to ensure
             calls are within the limit.
         :param limits_share_percentage: Percentage of the limits to be used by this instance (important when multiple
@@ -45,15 +58,13 @@ class AsyncThrottlerBase(ABC):
 
         self.set_rate_limits(rate_limits)
 
-        # List of TaskLog used to determine the API requests within a set time window.
-        self._task_logs: List[TaskLog] = []
-
         # Throttler Parameters
         self._retry_interval: float = retry_interval
         self._safety_margin_pct: float = safety_margin_pct
 
-        # Shared asyncio.Lock instance to prevent multiple async ContextManager from accessing the _task_logs variable
-        self._lock = asyncio.Lock()
+        # Sliding windows of the TaskLogs of each rate limit, and tasks waiting for capacity, shared by all the
+        # async ContextManagers of the throttler
+        self._scheduler: RateLimitScheduler = self._create_scheduler()
 
     def set_rate_limits(self, rate_limits: List[RateLimit]):
         # Rate Limit Definitions
@@ -65,6 +76,21 @@ class AsyncThrottlerBase(ABC):
         # Dictionary of path_url to RateLimit
         self._id_to_limit_map: Dict[str, RateLimit] = {limit.limit_id: limit for limit in self._rate_limits}
 
+    def _create_scheduler(self) -> RateLimitScheduler:
+        if self._shared_dir is None:
+            return RateLimitScheduler(self._safety_margin_pct)
+        try:
+            return SharedRateLimitScheduler.for_rate_limits(self._shared_dir, self._rate_limits, self._safety_margin_pct)
+        except OSError:
+            self.logger().warning("Rate limits can't be shared with the other bots on this host.", exc_info=True)
+            return RateLimitScheduler(self._safety_margin_pct)
+
+    def telemetry(self) -> List[RateLimitTelemetry]:
+        """
+        Utilisation, waiting tasks and wait times of each rate limit.
+        """
+        return self._scheduler.telemetry(self._rate_limits)
+
     def _client_config_map(self):
         from hummingbot.client.hummingbot_application import HummingbotApplication  # avoids circular import
 
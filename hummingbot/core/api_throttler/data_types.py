@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from typing import (
+    Dict,
     List,
     Optional,
 )
@@ -54,3 +55,17 @@ class TaskLog:
     timestamp: float
     rate_limit: RateLimit
     weight: int
+
+
+@dataclass
+class RateLimitTelemetry:
+    limit_id: str
+    limit: int
+    time_interval: float
+    # weight logged within the time interval
+    used: int
+    utilisation: float
+    # tasks waiting for capacity on the limit
+    waiting: int
+    # number of tasks by upper bound of their wait time, in seconds
+    wait_time_histogram: Dict[float, int]
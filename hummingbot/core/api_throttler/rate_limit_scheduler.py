@@ -0,0 +1,220 @@
+import asyncio
+import time
+from bisect import bisect_left
+from collections import deque
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+from hummingbot.core.api_throttler.data_types import RateLimit, RateLimitTelemetry, TaskLog
+
+# Epoch timestamps as floats are precise to a fraction of a microsecond: a task log is flushed once its period is over
+# by more than that
+TIMESTAMP_PRECISION = 1e-6
+# Waiters are woken this long after their capacity frees up
+WAKEUP_MARGIN = 0.001
+# Upper bounds, in seconds, of the buckets of the wait time histograms
+WAIT_TIME_BUCKETS = (0.001, 0.01, 0.1, 1.0, 10.0, float("inf"))
+
+
+class RateLimitWindow:
+    """
+    Sliding window of the capacity used on one RateLimit: the task logs within its time interval (plus the safety
+    margin), oldest first, and their total weight.
+    """
+
+    def __init__(self, rate_limit: RateLimit, safety_margin_pct: float):
+        self.rate_limit: RateLimit = rate_limit
+        self.safety_margin_pct: float = safety_margin_pct
+        self.task_logs: Deque[TaskLog] = deque()
+        self.used: int = 0
+
+    @property
+    def period(self) -> float:
+        return self.rate_limit.time_interval * (1 + self.safety_margin_pct)
+
+    def expiry(self, task_log: TaskLog) -> float:
+        """
+        :return: The time after which the task log is flushed.
+        """
+        return task_log.timestamp + self.period + TIMESTAMP_PRECISION
+
+    def log(self, task_log: TaskLog):
+        self.task_logs.append(task_log)
+        self.used += task_log.weight
+
+    def flush(self, now: float):
+        """
+        Remove task logs that have passed the rate limit period
+        """
+        while len(self.task_logs) > 0 and now > self.expiry(self.task_logs[0]):
+            self.used -= self.task_logs.popleft().weight
+
+    def available_at(self, weight: int, now: float) -> float:
+        """
+        :return: The time from which a task of the given weight is within capacity, now if it already is.
+        """
+        self.flush(now)
+        excess = self.used + weight - self.rate_limit.limit
+        # a task heavier than the limit itself goes alone, once the window is empty
+        if excess <= 0 or len(self.task_logs) == 0:
+            return now
+        freed = 0
+        for task_log in self.task_logs:
+            freed += task_log.weight
+            if freed >= excess:
+                return self.expiry(task_log)
+        return self.expiry(self.task_logs[-1])
+
+
+class RateLimitScheduler:
+    """
+    Sliding windows of the rate limits of a throttler, and the tasks waiting for capacity on them.
+    A waiting task is granted capacity after the tasks that arrived before it on any of its rate limits (FIFO), and is
+    woken up by a timer set to the time its capacity frees up, rather than by polling.
+    The windows are kept in memory: subclasses override used, available_at, log_if_available, flush and task_logs to
+    keep them elsewhere.
+    """
+
+    def __init__(self, safety_margin_pct: float):
+        self._safety_margin_pct: float = safety_margin_pct
+        self._windows: Dict[str, RateLimitWindow] = {}
+        self._waiters: List[Tuple[List[Tuple[RateLimit, int]], asyncio.Future]] = []
+        # number of waiters by limit id
+        self._waiting: Dict[str, int] = {}
+        self._wakeup: Optional[asyncio.TimerHandle] = None
+        self._wakeup_at: float = float("inf")
+        # number of waits by wait time bucket, by limit id
+        self._wait_counts: Dict[str, List[int]] = {}
+
+    @property
+    def task_logs(self) -> List[TaskLog]:
+        return [task_log for window in self._windows.values() for task_log in window.task_logs]
+
+    @property
+    def waiting_tasks(self) -> int:
+        return len(self._waiters)
+
+    def window(self, rate_limit: RateLimit) -> RateLimitWindow:
+        window = self._windows.get(rate_limit.limit_id)
+        if window is None:
+            window = RateLimitWindow(rate_limit, self._safety_margin_pct)
+            self._windows[rate_limit.limit_id] = window
+        else:
+            # the throttler may have replaced its rate limits
+            window.rate_limit = rate_limit
+        return window
+
+    def log(self, limits: List[Tuple[RateLimit, int]], now: float):
+        for rate_limit, weight in limits:
+            self.window(rate_limit).log(TaskLog(timestamp=now, rate_limit=rate_limit, weight=weight))
+
+    def flush(self, limits: List[Tuple[RateLimit, int]], now: float):
+        for rate_limit, _ in limits:
+            self.window(rate_limit).flush(now)
+
+    def available_at(self, limits: List[Tuple[RateLimit, int]], now: float) -> float:
+        return max((self.window(rate_limit).available_at(weight, now) for rate_limit, weight in limits), default=now)
+
+    def used(self, rate_limit: RateLimit, now: float) -> int:
+        window = self.window(rate_limit)
+        window.flush(now)
+        return window.used
+
+    def log_if_available(self, limits: List[Tuple[RateLimit, int]], now: float) -> float:
+        """
+        Log the task if it is within capacity on all its limits.
+        :return: now if the task was logged, else the time from which it is within capacity.
+        """
+        available_at = self.available_at(limits, now)
+        if available_at <= now:
+            self.log(limits, now)
+        return available_at
+
+    def record_wait(self, limits: List[Tuple[RateLimit, int]], wait_time: float):
+        bucket = bisect_left(WAIT_TIME_BUCKETS, wait_time)
+        for rate_limit, _ in limits:
+            counts = self._wait_counts.setdefault(rate_limit.limit_id, [0] * len(WAIT_TIME_BUCKETS))
+            counts[bucket] += 1
+
+    def telemetry(self, rate_limits: List[RateLimit]) -> List[RateLimitTelemetry]:
+        now = time.time()
+        telemetry = []
+        for rate_limit in rate_limits:
+            used = self.used(rate_limit, now)
+            counts = self._wait_counts.get(rate_limit.limit_id, [0] * len(WAIT_TIME_BUCKETS))
+            telemetry.append(RateLimitTelemetry(
+                limit_id=rate_limit.limit_id,
+                limit=rate_limit.limit,
+                time_interval=rate_limit.time_interval,
+                used=used,
+                utilisation=used / rate_limit.limit,
+                waiting=self._waiting.get(rate_limit.limit_id, 0),
+                wait_time_histogram=dict(zip(WAIT_TIME_BUCKETS, counts)),
+            ))
+        return telemetry
+
+    def has_waiters(self, limits: List[Tuple[RateLimit, int]]) -> bool:
+        return any(self._waiting.get(rate_limit.limit_id, 0) > 0 for rate_limit, _ in limits)
+
+    async def wait(self, limits: List[Tuple[RateLimit, int]]):
+        """
+        Wait until the task is granted capacity on all its limits, which logs it.
+        """
+        start = time.time()
+        waiter = (limits, asyncio.get_event_loop().create_future())
+        self._waiters.append(waiter)
+        for rate_limit, _ in limits:
+            self._waiting[rate_limit.limit_id] = self._waiting.get(rate_limit.limit_id, 0) + 1
+        self._process()
+        try:
+            await waiter[1]
+            self.record_wait(limits, time.time() - start)
+        except asyncio.CancelledError:
+            if waiter in self._waiters:
+                self._remove(waiter)
+                # the tasks behind it may go now
+                self._process()
+            raise
+
+    def _remove(self, waiter: Tuple[List[Tuple[RateLimit, int]], asyncio.Future]):
+        self._waiters.remove(waiter)
+        for rate_limit, _ in waiter[0]:
+            self._waiting[rate_limit.limit_id] -= 1
+
+    def _process(self):
+        """
+        Grant capacity to the waiters that can go, in arrival order, and set the timer to the earliest time one of
+        the others can.
+        """
+        now = time.time()
+        blocked: Set[str] = set()
+        next_wakeup = float("inf")
+        for waiter in list(self._waiters):
+            limits, future = waiter
+            limit_ids = {rate_limit.limit_id for rate_limit, _ in limits}
+            if future.done():
+                self._remove(waiter)
+                continue
+            if not blocked.isdisjoint(limit_ids):
+                blocked.update(limit_ids)
+                continue
+            available_at = self.log_if_available(limits, now)
+            if available_at <= now:
+                self._remove(waiter)
+                future.set_result(None)
+            else:
+                blocked.update(limit_ids)
+                next_wakeup = min(next_wakeup, available_at)
+        self._schedule_wakeup(next_wakeup, now)
+
+    def _on_wakeup(self):
+        self._wakeup = None
+        self._wakeup_at = float("inf")
+        self._process()
+
+    def _schedule_wakeup(self, wakeup_at: float, now: float):
+        if wakeup_at >= self._wakeup_at:
+            return
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+        self._wakeup_at = wakeup_at
+        self._wakeup = asyncio.get_event_loop().call_later(wakeup_at - now + WAKEUP_MARGIN, self._on_wakeup)
@@ -0,0 +1,220 @@
+import hashlib
+import logging
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Dict, List, Set, Tuple
+
+import numpy as np
+
+from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.rate_limit_scheduler import TIMESTAMP_PRECISION, RateLimitScheduler
+from hummingbot.logger.logger import HummingbotLogger
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
+# Default directory of the shared task logs, common to the bots of a host
+SHARED_RATE_LIMITS_DIR = os.path.join(tempfile.gettempdir(), "hummingbot_rate_limits")
+LOG_SUFFIX = ".hbrl"
+# Max number of task logs of a rate limit: a limit of N is fully tracked by a ring of N task logs, as every task log
+# weighs at least 1 within its time interval, and the rings of higher limits are capped
+MAX_LOG_CAPACITY = 1 << 20
+LOG_DTYPE = np.dtype([
+    ("timestamp", "<f8"),
+    ("weight", "<i8"),
+])
+# position of the oldest task log in the ring of a limit, number of task logs in its period and their total weight
+HEADER_DTYPE = np.dtype([("position", "<i8"), ("size", "<i8"), ("used", "<i8")])
+
+
+def log_capacity(rate_limit: RateLimit) -> int:
+    return max(1, min(int(rate_limit.limit), MAX_LOG_CAPACITY))
+
+
+def rate_limits_key(rate_limits: List[RateLimit], safety_margin_pct: float) -> str:
+    """
+    Key of a set of rate limits: throttlers built from the same rate limit rules, i.e. connectors of the same
+    exchange, with the same limits share percentage and safety margin share their task logs.
+    """
+    definition = ",".join(sorted(
+        f"{rate_limit.limit_id}:{rate_limit.limit}:{rate_limit.time_interval}" for rate_limit in rate_limits
+    ))
+    return hashlib.sha1(f"{definition};{safety_margin_pct}".encode()).hexdigest()
+
+
+class SharedRateLimitScheduler(RateLimitScheduler):
+    """
+    A RateLimitScheduler whose task logs are shared with the other throttlers of the host using the same rate limits:
+    one scheduler per set of rate limits in a process, and a ring of task logs per rate limit in a memory-mapped file,
+    locked while it is read and written, across processes.
+    Within a process, waiting tasks are granted capacity in arrival order as with RateLimitScheduler. Across
+    processes, they go as soon as their timer finds capacity available.
+    The ring of a limit is sized from the limit itself, and a warning is logged if task logs still within their period
+    are overwritten, which only happens for limits over MAX_LOG_CAPACITY.
+    """
+
+    _logger = None
+    _instances: Dict[str, "SharedRateLimitScheduler"] = {}
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    @classmethod
+    def for_rate_limits(cls,
+                        shared_dir: str,
+                        rate_limits: List[RateLimit],
+                        safety_margin_pct: float) -> "SharedRateLimitScheduler":
+        path = os.path.join(shared_dir, rate_limits_key(rate_limits, safety_margin_pct) + LOG_SUFFIX)
+        instance = cls._instances.get(path)
+        if instance is None:
+            instance = cls(path, rate_limits, safety_margin_pct)
+            cls._instances[path] = instance
+        return instance
+
+    def __init__(self, path: str, rate_limits: List[RateLimit], safety_margin_pct: float):
+        if fcntl is None:
+            raise OSError("Sharing rate limits across processes requires fcntl file locks.")
+        super().__init__(safety_margin_pct)
+        self._path = path
+        # the layout of the file only depends on the rate limits, which are part of its name
+        self._limit_ids: List[str] = sorted({rate_limit.limit_id for rate_limit in rate_limits})
+        self._limits: Dict[str, RateLimit] = {rate_limit.limit_id: rate_limit for rate_limit in rate_limits}
+        self._index: Dict[str, int] = {limit_id: index for index, limit_id in enumerate(self._limit_ids)}
+        capacities = [log_capacity(self._limits[limit_id]) for limit_id in self._limit_ids]
+        self._capacities: np.ndarray = np.array(capacities, dtype=np.int64)
+        self._offsets: np.ndarray = np.concatenate(([0], np.cumsum(self._capacities)[:-1])).astype(np.int64)
+        self._overwritten: Set[str] = set()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        headers_size = len(self._limit_ids) * HEADER_DTYPE.itemsize
+        size = headers_size + int(self._capacities.sum()) * LOG_DTYPE.itemsize
+        with self._locked():
+            if os.fstat(self._fd).st_size < size:
+                os.ftruncate(self._fd, size)
+        self._headers = np.memmap(path, dtype=HEADER_DTYPE, mode="r+", shape=(len(self._limit_ids),))
+        self._logs = np.memmap(path, dtype=LOG_DTYPE, mode="r+", offset=headers_size,
+                               shape=(int(self._capacities.sum()),))
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def task_logs(self) -> List[TaskLog]:
+        task_logs = []
+        with self._locked():
+            for limit_id in self._limit_ids:
+                logs = self._window_logs(self._index[limit_id])
+                task_logs.extend(TaskLog(timestamp=float(log["timestamp"]), rate_limit=self._limits[limit_id],
+                                         weight=int(log["weight"]))
+                                 for log in logs)
+        return sorted(task_logs, key=lambda task_log: task_log.timestamp)
+
+    @contextmanager
+    def _locked(self):
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _period(self, rate_limit: RateLimit) -> float:
+        return rate_limit.time_interval * (1 + self._safety_margin_pct) + TIMESTAMP_PRECISION
+
+    def _window_logs(self, index: int) -> np.ndarray:
+        """
+        Task logs of a limit within its period as of its last flush, oldest first.
+        """
+        position, size = int(self._headers[index]["position"]), int(self._headers[index]["size"])
+        capacity, offset = int(self._capacities[index]), int(self._offsets[index])
+        ring = self._logs[offset:offset + capacity]
+        if position + size <= capacity:
+            return ring[position:position + size]
+        return np.concatenate((ring[position:], ring[:position + size - capacity]))
+
+    def _flush(self, rate_limit: RateLimit, now: float) -> int:
+        """
+        Remove the task logs of a limit that have passed its period.
+        :return: The index of the limit.
+        """
+        index = self._index[rate_limit.limit_id]
+        header = self._headers[index]
+        position, size, used = int(header["position"]), int(header["size"]), int(header["used"])
+        capacity, offset = int(self._capacities[index]), int(self._offsets[index])
+        period = self._period(rate_limit)
+        flushed = 0
+        while flushed < size:
+            log = self._logs[offset + (position + flushed) % capacity]
+            if now - float(log["timestamp"]) <= period:
+                break
+            used -= int(log["weight"])
+            flushed += 1
+        if flushed > 0:
+            self._headers[index] = ((position + flushed) % capacity, size - flushed, used)
+        return index
+
+    def _available_at(self, limits: List[Tuple[RateLimit, int]], now: float) -> float:
+        available_at = now
+        for rate_limit, weight in limits:
+            index = self._flush(rate_limit, now)
+            excess = int(self._headers[index]["used"]) + weight - rate_limit.limit
+            # a task heavier than the limit itself goes alone, once the window is empty
+            if excess <= 0 or int(self._headers[index]["size"]) == 0:
+                continue
+            logs = self._window_logs(index)
+            position = min(int(np.searchsorted(np.cumsum(logs["weight"]), excess)), len(logs) - 1)
+            available_at = max(available_at, float(logs["timestamp"][position]) + self._period(rate_limit))
+        return available_at
+
+    def available_at(self, limits: List[Tuple[RateLimit, int]], now: float) -> float:
+        with self._locked():
+            return self._available_at(limits, now)
+
+    def used(self, rate_limit: RateLimit, now: float) -> int:
+        with self._locked():
+            return int(self._headers[self._flush(rate_limit, now)]["used"])
+
+    def log(self, limits: List[Tuple[RateLimit, int]], now: float):
+        with self._locked():
+            self._log(limits, now)
+
+    def _log(self, limits: List[Tuple[RateLimit, int]], now: float):
+        for rate_limit, weight in limits:
+            if weight <= 0:
+                continue
+            index = self._flush(rate_limit, now)
+            header = self._headers[index]
+            position, size, used = int(header["position"]), int(header["size"]), int(header["used"])
+            capacity, offset = int(self._capacities[index]), int(self._offsets[index])
+            if size == capacity:
+                # the oldest task log is still within its period, the limit is under-counted from now on
+                used -= int(self._logs[offset + position]["weight"])
+                position, size = (position + 1) % capacity, size - 1
+                self._warn_overwritten(rate_limit)
+            self._logs[offset + (position + size) % capacity] = (now, weight)
+            self._headers[index] = (position, size + 1, used + weight)
+
+    def _warn_overwritten(self, rate_limit: RateLimit):
+        if rate_limit.limit_id not in self._overwritten:
+            self._overwritten.add(rate_limit.limit_id)
+            self.logger().warning(
+                f"The shared task logs of the rate limit {rate_limit.limit_id} are full: its usage is under-counted "
+                f"above {MAX_LOG_CAPACITY} task logs per {rate_limit.time_interval} seconds.")
+
+    def log_if_available(self, limits: List[Tuple[RateLimit, int]], now: float) -> float:
+        with self._locked():
+            available_at = self._available_at(limits, now)
+            if available_at <= now:
+                self._log(limits, now)
+        return available_at
+
+    def flush(self, limits: List[Tuple[RateLimit, int]], now: float):
+        with self._locked():
+            for rate_limit, _ in limits:
+                self._flush(rate_limit, now)
@@ -1,13 +1,15 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
-from typing import Iterator
+from typing import Iterator, Optional, Tuple
 
 from cython.operator cimport address as ref, dereference as deref, postincrement as inc
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
 from libcpp.set cimport set
 from libcpp.vector cimport vector
 
+import numpy as np
+
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
@@ -15,10 +17,12 @@ cdef class CompositeOrderBook(OrderBook):
     """
     Record orders that are bought during back testing and used to simulate order book consumption without modifying
     the actual order book.
-    Override the order book bid_entries, ask_entries methods to return the composite order book entries
+    Override the order book bid_entries, ask_entries methods to return the composite order book entries, the volume and
+    price queries iterate over them instead of using the depth index of the original order book
     """
     def __init__(self, order_book: OrderBook = None):
         super().__init__()
+        self._depth_index_enabled = False
         self._traded_order_book = OrderBook()
 
     @property
@@ -28,6 +32,8 @@ cdef class CompositeOrderBook(OrderBook):
     def clear_traded_order_book(self):
         self._traded_order_book._bid_book.clear()
         self._traded_order_book._ask_book.clear()
+        self._traded_order_book._bid_depth_index.c_invalidate()
+        self._traded_order_book._ask_depth_index.c_invalidate()
 
     def record_filled_order(self, order_fill_event):
         cdef:
@@ -72,6 +78,14 @@ cdef class CompositeOrderBook(OrderBook):
 
         self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, timestamp)
 
+    def to_numpy(self,
+                 depth: Optional[int] = None,
+                 bucket_size: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        # The composite entries are not stored in the order book sets, export them through an order book of their own
+        composite_order_book = OrderBook()
+        composite_order_book.apply_snapshot(list(self.bid_entries()), list(self.ask_entries()), self._snapshot_uid)
+        return composite_order_book.to_numpy(depth, bucket_size)
+
     def original_bid_entries(self) -> Iterator[OrderBookRow]:
         return super().bid_entries()
 
@@ -4,7 +4,7 @@ import math
 import typing
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Dict, NamedTuple, Optional, Tuple
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
 
 from async_timeout import timeout
 
@@ -86,6 +86,9 @@ class TradeUpdate(NamedTuple):
 
 
 class InFlightOrder:
+    # Called with the order whenever its state or exchange order id changes, see set_update_listener
+    _update_listener: Optional[Callable[["InFlightOrder"], None]] = None
+
     def __init__(
             self,
             client_order_id: str,
@@ -124,6 +127,26 @@ class InFlightOrder:
             self.exchange_order_id_update_event.set()
         self.completely_filled_event = asyncio.Event()
 
+    @property
+    def current_state(self) -> OrderState:
+        return self._current_state
+
+    @current_state.setter
+    def current_state(self, current_state: OrderState):
+        self._current_state = current_state
+        if self._update_listener is not None:
+            self._update_listener(self)
+
+    @property
+    def exchange_order_id(self) -> Optional[str]:
+        return self._exchange_order_id
+
+    @exchange_order_id.setter
+    def exchange_order_id(self, exchange_order_id: Optional[str]):
+        self._exchange_order_id = exchange_order_id
+        if self._update_listener is not None:
+            self._update_listener(self)
+
     @property
     def attributes(self) -> Tuple[Any]:
         return copy.deepcopy(
@@ -278,6 +301,13 @@ class InFlightOrder:
             creation_timestamp=int(self.creation_timestamp * 1e6)
         )
 
+    def set_update_listener(self, listener: Optional[Callable[["InFlightOrder"], None]]):
+        """
+        Sets the callback notified of the changes of state and exchange order id of the order, whoever makes them.
+        Used by the ClientOrderTracker tracking the order to keep its indexes up to date.
+        """
+        self._update_listener = listener
+
     def update_exchange_order_id(self, exchange_order_id: str):
         self.exchange_order_id = exchange_order_id
         self.exchange_order_id_update_event.set()
@@ -0,0 +1,146 @@
+"""
+On-disk layout of recorded order book market data:
+
+    <data_dir>/<trading_pair>/<segment number, 8 digits>.hbmd
+    <data_dir>/<trading_pair>/index.hbix
+
+Each segment is a 16 bytes header followed by fixed-width little endian records, one per order book row or trade.
+Rows of one snapshot or diff message share its kind, timestamp and update_id and are written contiguously, so a
+message never spans two segments. Records are memory-mapped as a numpy structured array: every field is available
+as a column (records["timestamp"], records["price"], ...) without parsing or copying.
+The index holds one fixed-width entry per closed segment: its number, first and last timestamps and record count.
+"""
+
+import os
+import struct
+from typing import List
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_message import OrderBookMessageType
+
+SEGMENT_MAGIC = b"HBMD"
+SEGMENT_VERSION = 1
+SEGMENT_SUFFIX = ".hbmd"
+SEGMENT_HEADER = struct.Struct("<4sHHQ")
+
+RECORD_DTYPE = np.dtype([
+    ("timestamp", "<f8"),
+    ("update_id", "<i8"),
+    ("price", "<f8"),
+    ("amount", "<f8"),
+    # OrderBookMessageType value
+    ("kind", "u1"),
+    # TradeType value: BUY for bids and buy trades, SELL for asks and sell trades
+    ("side", "u1"),
+])
+
+INDEX_FILE = "index.hbix"
+INDEX_DTYPE = np.dtype([
+    ("segment", "<i8"),
+    ("first_timestamp", "<f8"),
+    ("last_timestamp", "<f8"),
+    ("records", "<i8"),
+])
+
+SNAPSHOT = OrderBookMessageType.SNAPSHOT.value
+DIFF = OrderBookMessageType.DIFF.value
+TRADE = OrderBookMessageType.TRADE.value
+BUY = TradeType.BUY.value
+SELL = TradeType.SELL.value
+
+
+def pair_directory(data_dir: str, trading_pair: str) -> str:
+    return os.path.join(data_dir, trading_pair)
+
+
+def segment_path(data_dir: str, trading_pair: str, segment_number: int) -> str:
+    return os.path.join(pair_directory(data_dir, trading_pair), f"{segment_number:08d}{SEGMENT_SUFFIX}")
+
+
+def segment_paths(data_dir: str, trading_pair: str) -> List[str]:
+    """
+    Segment files of a trading pair, in recording order.
+    """
+    directory = pair_directory(data_dir, trading_pair)
+    if not os.path.isdir(directory):
+        return []
+    return [os.path.join(directory, name) for name in sorted(os.listdir(directory)) if name.endswith(SEGMENT_SUFFIX)]
+
+
+def index_path(data_dir: str, trading_pair: str) -> str:
+    return os.path.join(pair_directory(data_dir, trading_pair), INDEX_FILE)
+
+
+def read_index(data_dir: str, trading_pair: str) -> np.ndarray:
+    """
+    Index entries of the closed segments of a trading pair, empty if none was closed yet.
+    """
+    path = index_path(data_dir, trading_pair)
+    if not os.path.exists(path):
+        return np.empty(0, dtype=INDEX_DTYPE)
+    count = os.path.getsize(path) // INDEX_DTYPE.itemsize
+    return np.fromfile(path, dtype=INDEX_DTYPE, count=count)
+
+
+def recorded_trading_pairs(data_dir: str) -> List[str]:
+    if not os.path.isdir(data_dir):
+        return []
+    return sorted(name for name in os.listdir(data_dir) if len(segment_paths(data_dir, name)) > 0)
+
+
+def segment_header() -> bytes:
+    return SEGMENT_HEADER.pack(SEGMENT_MAGIC, SEGMENT_VERSION, RECORD_DTYPE.itemsize, 0)
+
+
+def read_segment(path: str) -> np.ndarray:
+    """
+    Memory-map the records of a segment. A record partially written at the end of a segment being recorded is
+    left out.
+    """
+    with open(path, "rb") as f:
+        magic, version, record_size, _ = SEGMENT_HEADER.unpack(f.read(SEGMENT_HEADER.size))
+    if magic != SEGMENT_MAGIC or version != SEGMENT_VERSION or record_size != RECORD_DTYPE.itemsize:
+        raise ValueError(f"{path} is not a version {SEGMENT_VERSION} market data segment.")
+    count = (os.path.getsize(path) - SEGMENT_HEADER.size) // RECORD_DTYPE.itemsize
+    if count == 0:
+        return np.empty(0, dtype=RECORD_DTYPE)
+    return np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=SEGMENT_HEADER.size, shape=(count,))
+
+
+def write_segment(path: str, records: np.ndarray) -> None:
+    """
+    Write a whole segment at once.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(segment_header())
+        f.write(np.ascontiguousarray(records, dtype=RECORD_DTYPE).tobytes())
+
+
+def to_records(kind: int, timestamp: float, update_id: int, bids: np.ndarray, asks: np.ndarray) -> np.ndarray:
+    """
+    Records of a snapshot or diff message.
+    :param bids: [price, amount] rows.
+    :param asks: [price, amount] rows.
+    """
+    bids = np.asarray(bids, dtype=np.float64).reshape(-1, 2)
+    asks = np.asarray(asks, dtype=np.float64).reshape(-1, 2)
+    records = np.empty(len(bids) + len(asks), dtype=RECORD_DTYPE)
+    records["timestamp"] = timestamp
+    records["update_id"] = update_id
+    records["kind"] = kind
+    records["price"][:len(bids)] = bids[:, 0]
+    records["amount"][:len(bids)] = bids[:, 1]
+    records["side"][:len(bids)] = BUY
+    records["price"][len(bids):] = asks[:, 0]
+    records["amount"][len(bids):] = asks[:, 1]
+    records["side"][len(bids):] = SELL
+    return records
+
+
+def trade_record(timestamp: float, trade_id: int, trade_type: int, price: float, amount: float) -> np.ndarray:
+    records = np.empty(1, dtype=RECORD_DTYPE)
+    records[0] = (timestamp, trade_id, price, amount, TRADE, trade_type)
+    return records
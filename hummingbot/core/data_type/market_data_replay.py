@@ -0,0 +1,209 @@
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.market_data_format import (
+    BUY,
+    DIFF,
+    SELL,
+    SNAPSHOT,
+    TRADE,
+    read_segment,
+    recorded_trading_pairs,
+    segment_paths,
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.core.py_time_iterator import PyTimeIterator
+from hummingbot.logger import HummingbotLogger
+
+s_logger = None
+
+
+class ReplayCursor:
+    """
+    Position of the replay in the recorded segments of one trading pair.
+    """
+
+    def __init__(self, trading_pair: str, order_book: OrderBook, paths: List[str]):
+        self.trading_pair = trading_pair
+        self.order_book = order_book
+        self.paths = paths
+        self.segment_index = -1
+        self.records: Optional[np.ndarray] = None
+        self.position = 0
+        self.applied = 0
+
+    @property
+    def exhausted(self) -> bool:
+        return self.records is not None and self.position >= len(self.records) and \
+            self.segment_index >= len(self.paths) - 1
+
+    def open_segment(self, segment_index: int, position: int = 0) -> None:
+        self.segment_index = segment_index
+        self.records = read_segment(self.paths[segment_index])
+        self.position = position
+
+    def seek(self, timestamp: float) -> None:
+        """
+        Position the cursor on the last snapshot recorded at or before timestamp, or on the first record if there is
+        none, so that replaying up to timestamp rebuilds the order book as it was then.
+        """
+        for segment_index in range(len(self.paths) - 1, -1, -1):
+            records = read_segment(self.paths[segment_index])
+            if len(records) == 0 or records["timestamp"][0] > timestamp:
+                continue
+            snapshot_rows = np.flatnonzero((records["kind"] == SNAPSHOT) & (records["timestamp"] <= timestamp))
+            if len(snapshot_rows) == 0:
+                continue
+            # rows of the last snapshot: the last contiguous run of snapshot rows sharing an update_id
+            update_ids = records["update_id"][snapshot_rows]
+            breaks = np.flatnonzero((np.diff(snapshot_rows) != 1) | (np.diff(update_ids) != 0))
+            start = snapshot_rows[breaks[-1] + 1] if len(breaks) > 0 else snapshot_rows[0]
+            self.open_segment(segment_index, int(start))
+            return
+        if len(self.paths) > 0:
+            self.open_segment(0)
+
+    def advance(self, timestamp: float) -> None:
+        """
+        Apply every record up to timestamp included, moving on to the next segments as needed.
+        """
+        while self.records is not None:
+            timestamps = self.records["timestamp"][self.position:]
+            end = self.position + int(np.searchsorted(timestamps, timestamp, side="right"))
+            if end > self.position:
+                self.apply(self.records[self.position:end])
+                self.position = end
+            if end < len(self.records) or self.segment_index >= len(self.paths) - 1:
+                return
+            self.open_segment(self.segment_index + 1)
+
+    def apply(self, records: np.ndarray) -> None:
+        """
+        Apply records to the order book: one apply_numpy_snapshot per snapshot, one apply_numpy_diffs per run of
+        consecutive diffs, and one apply_trade per trade so that the paper trade connector matches its orders.
+        """
+        kinds = records["kind"]
+        update_ids = records["update_id"]
+        new_run = np.ones(len(records), dtype=bool)
+        new_run[1:] = (kinds[1:] != kinds[:-1]) | (kinds[1:] == TRADE) | \
+            ((kinds[1:] == SNAPSHOT) & (update_ids[1:] != update_ids[:-1]))
+        starts = np.flatnonzero(new_run)
+        ends = np.append(starts[1:], len(records))
+        for start, end in zip(starts, ends):
+            kind = kinds[start]
+            if kind == TRADE:
+                record = records[start]
+                self.order_book.apply_trade(OrderBookTradeEvent(
+                    trading_pair=self.trading_pair,
+                    timestamp=float(record["timestamp"]),
+                    price=float(record["price"]),
+                    amount=float(record["amount"]),
+                    type=TradeType.SELL if record["side"] == SELL else TradeType.BUY
+                ))
+                continue
+            run = records[start:end]
+            rows = np.column_stack((run["price"], run["amount"], run["update_id"].astype(np.float64)))
+            is_bid = run["side"] == BUY
+            if kind == SNAPSHOT:
+                self.order_book.apply_numpy_snapshot(rows[is_bid], rows[~is_bid])
+            elif kind == DIFF:
+                self.order_book.apply_numpy_diffs(rows[is_bid], rows[~is_bid])
+        self.applied += len(records)
+
+
+class MarketDataReplay(PyTimeIterator):
+    """
+    Replays recorded order book snapshots, diffs and trades (see market_data_format) into order books, in lockstep
+    with the clock: on each tick, every record up to the tick timestamp is applied.
+    Add it to the clock before the markets and strategies, so that they see the order books as of the tick.
+    In backtest mode, the clock is stopped once all the recorded data has been replayed.
+    """
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global s_logger
+        if s_logger is None:
+            s_logger = logging.getLogger(__name__)
+        return s_logger
+
+    def __init__(self, data_dir: str, order_books: Dict[str, OrderBook], stop_at_end: bool = True):
+        """
+        :param data_dir: The directory the market data was recorded to.
+        :param order_books: The order books to replay into, by trading pair.
+        :param stop_at_end: Whether to stop the backtest once all the recorded data has been replayed.
+        """
+        super().__init__()
+        self._data_dir = data_dir
+        self._stop_at_end = stop_at_end
+        self._cursors: Dict[str, ReplayCursor] = {
+            trading_pair: ReplayCursor(trading_pair, order_book, segment_paths(data_dir, trading_pair))
+            for trading_pair, order_book in order_books.items()
+        }
+        self._started = False
+        for trading_pair, cursor in self._cursors.items():
+            if len(cursor.paths) == 0:
+                self.logger().warning(f"No market data recorded for {trading_pair} in {data_dir}.")
+
+    @classmethod
+    def from_market(cls, data_dir: str, market, trading_pairs: Optional[List[str]] = None, **kwargs) -> "MarketDataReplay":
+        """
+        Replay into the order books of a paper trade connector, creating them if needed, so that its limit orders
+        are filled against the recorded trades.
+        :param market: The paper trade connector.
+        :param trading_pairs: The trading pairs to replay, all the recorded ones by default.
+        """
+        tracker = market.order_book_tracker
+        order_books = {}
+        for trading_pair in trading_pairs or recorded_trading_pairs(data_dir):
+            if trading_pair not in tracker.order_books:
+                tracker._order_books[trading_pair] = CompositeOrderBook()
+            order_books[trading_pair] = tracker.order_books[trading_pair]
+        # nothing to wait for: the order books are ready as soon as the replay starts
+        order_books_initialized = getattr(tracker, "_order_books_initialized", None)
+        if order_books_initialized is not None:
+            order_books_initialized.set()
+        return cls(data_dir, order_books, **kwargs)
+
+    @property
+    def order_books(self) -> Dict[str, OrderBook]:
+        return {trading_pair: cursor.order_book for trading_pair, cursor in self._cursors.items()}
+
+    @property
+    def records_applied(self) -> int:
+        return sum(cursor.applied for cursor in self._cursors.values())
+
+    @property
+    def exhausted(self) -> bool:
+        return all(cursor.exhausted or len(cursor.paths) == 0 for cursor in self._cursors.values())
+
+    def time_range(self) -> Tuple[float, float]:
+        """
+        First and last recorded timestamps over all trading pairs, to set up the backtest clock.
+        """
+        firsts, lasts = [], []
+        for cursor in self._cursors.values():
+            if len(cursor.paths) == 0:
+                continue
+            first_records = read_segment(cursor.paths[0])
+            last_records = read_segment(cursor.paths[-1])
+            if len(first_records) > 0:
+                firsts.append(float(first_records["timestamp"][0]))
+            if len(last_records) > 0:
+                lasts.append(float(last_records["timestamp"][-1]))
+        return min(firsts, default=float("nan")), max(lasts, default=float("nan"))
+
+    def tick(self, timestamp: float):
+        if self._stop_at_end and self._started and self.exhausted:
+            # the markets and strategies were ticked once with the last records applied
+            raise StopIteration
+        if not self._started:
+            for cursor in self._cursors.values():
+                cursor.seek(timestamp)
+            self._started = True
+        for cursor in self._cursors.values():
+            cursor.advance(timestamp)
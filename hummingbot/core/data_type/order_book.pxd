@@ -4,11 +4,18 @@ from libc.stdint cimport int64_t
 from libcpp.set cimport set
 from libcpp.vector cimport vector
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.order_book_depth_index cimport OrderBookDepthIndex
 from hummingbot.core.pubsub cimport PubSub
 from .order_book_query_result cimport OrderBookQueryResult
 cimport numpy as np
 
 
+cdef struct OrderBookLevel:
+    double price
+    double amount
+    int64_t update_id
+
+
 cdef class OrderBook(PubSub):
     cdef set[OrderBookEntry] _bid_book
     cdef set[OrderBookEntry] _ask_book
@@ -20,17 +27,26 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef bint _last_diff_crossed
+    cdef bint _depth_index_enabled
+    cdef OrderBookDepthIndex _bid_depth_index
+    cdef OrderBookDepthIndex _ask_depth_index
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array)
+                             np.ndarray[np.float64_t, ndim=2] asks_array,
+                             int64_t update_id=*)
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
-                                np.ndarray[np.float64_t, ndim=2] asks_array)
+                                np.ndarray[np.float64_t, ndim=2] asks_array,
+                                int64_t update_id=*)
+    cdef np.ndarray c_side_to_numpy(self, bint is_bid, size_t depth, double bucket_size)
     cdef double c_get_price(self, bint is_buy) except? -1
+    cdef OrderBookDepthIndex c_depth_index(self, bint is_buy)
+    cdef set[OrderBookEntry] *c_book(self, bint is_buy)
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price)
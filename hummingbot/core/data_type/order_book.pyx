@@ -20,7 +20,9 @@ from cython.operator cimport(
     dereference as deref,
     postincrement as inc,
 )
+from libc.math cimport ceil, floor
 
+from hummingbot.core.data_type.order_book_depth_index cimport OrderBookDepthIndex
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.core.data_type.order_book_row import OrderBookRow
@@ -36,6 +38,42 @@ cimport numpy as np
 ob_logger = None
 NaN = float("nan")
 
+# The levels exported by OrderBook.to_numpy(), laid out as the OrderBookLevel struct
+ORDER_BOOK_LEVEL_DTYPE = np.dtype([("price", np.float64), ("amount", np.float64), ("update_id", np.int64)],
+                                  align=True)
+
+
+cdef inline bint c_add_level(OrderBookLevel *levels,
+                             size_t *level_count,
+                             size_t max_levels,
+                             const OrderBookEntry &entry,
+                             double bucket_size,
+                             bint is_bid):
+    """
+    Appends an order book entry to the levels, or adds it to the last level if both are in the same price bucket.
+
+    :return: False if the entry needs a new level and there are already max_levels levels
+    """
+    cdef:
+        double price = entry.getPrice()
+        OrderBookLevel *level
+
+    if bucket_size > 0:
+        price = (floor(price / bucket_size) if is_bid else ceil(price / bucket_size)) * bucket_size
+        if level_count[0] > 0 and levels[level_count[0] - 1].price == price:
+            level = &levels[level_count[0] - 1]
+            level.amount += entry.getAmount()
+            level.update_id = max(level.update_id, entry.getUpdateId())
+            return True
+    if level_count[0] == max_levels:
+        return False
+    level = &levels[level_count[0]]
+    level.price = price
+    level.amount = entry.getAmount()
+    level.update_id = entry.getUpdateId()
+    level_count[0] += 1
+    return True
+
 
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
@@ -56,6 +94,10 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._last_diff_crossed = False
+        self._depth_index_enabled = True
+        self._bid_depth_index = OrderBookDepthIndex(is_bid=True)
+        self._ask_depth_index = OrderBookDepthIndex(is_bid=False)
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -66,6 +108,8 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            size_t bid_book_size
+            size_t ask_book_size
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
@@ -74,15 +118,27 @@ cdef class OrderBook(PubSub):
                 self._bid_book.erase(result)
             if bid.getAmount() > 0:
                 self._bid_book.insert(bid)
+            self._bid_depth_index.c_invalidate_from_price(bid.getPrice())
         for ask in asks:
             result = self._ask_book.find(ask)
             if result != ask_book_end:
                 self._ask_book.erase(result)
             if ask.getAmount() > 0:
                 self._ask_book.insert(ask)
+            self._ask_depth_index.c_invalidate_from_price(ask.getPrice())
 
         # If any overlapping entries between the bid and ask books, centralised: newer entries win, dex: see OrderBookEntry.cpp
+        bid_book_size = self._bid_book.size()
+        ask_book_size = self._ask_book.size()
         truncateOverlapEntries(self._bid_book, self._ask_book, self._dex)
+        # The overlapping entries are removed from the top of the books
+        self._last_diff_crossed = False
+        if self._bid_book.size() != bid_book_size:
+            self._bid_depth_index.c_invalidate()
+            self._last_diff_crossed = True
+        if self._ask_book.size() != ask_book_size:
+            self._ask_depth_index.c_invalidate()
+            self._last_diff_crossed = True
 
         # Record the current best prices, for faster c_get_price() calls.
         bid_iterator = self._bid_book.rbegin()
@@ -109,6 +165,9 @@ cdef class OrderBook(PubSub):
         # Start with an empty order book, and then insert all entries.
         self._bid_book.clear()
         self._ask_book.clear()
+        self._bid_depth_index.c_invalidate()
+        self._ask_depth_index.c_invalidate()
+        self._last_diff_crossed = False
         for bid in bids:
             self._bid_book.insert(bid)
             if not (bid.getPrice() <= best_bid_price):
@@ -162,6 +221,20 @@ cdef class OrderBook(PubSub):
     def last_trade_price_rest_updated(self, value: float):
         self._last_trade_price_rest_updated = value
 
+    @property
+    def depth_index_enabled(self) -> bool:
+        """
+        True if the volume and price queries are answered with the cumulative depth index of the book sides instead of
+        iterating over the book entries.
+        """
+        return self._depth_index_enabled
+
+    @depth_index_enabled.setter
+    def depth_index_enabled(self, value: bool):
+        self._depth_index_enabled = value
+        self._bid_depth_index.c_invalidate()
+        self._ask_depth_index.c_invalidate()
+
     @property
     def snapshot_uid(self) -> int:
         return self._snapshot_uid
@@ -170,14 +243,62 @@ cdef class OrderBook(PubSub):
     def last_diff_uid(self) -> int:
         return self._last_diff_uid
 
+    @property
+    def last_diff_crossed(self) -> bool:
+        """
+        True if the last diffs applied crossed the book, their overlapping entries having been truncated. The diffs of a
+        consistent stream never cross the book, so the order book most likely missed updates.
+        """
+        return self._last_diff_crossed
+
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
+        bids_levels, asks_levels = self.to_numpy()
+        bids_df = pd.DataFrame(data=bids_levels, columns=OrderBookRow._fields, dtype="float64")
+        asks_df = pd.DataFrame(data=asks_levels, columns=OrderBookRow._fields, dtype="float64")
         return bids_df, asks_df
 
+    def to_numpy(self,
+                 depth: Optional[int] = None,
+                 bucket_size: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Exports the bid and ask levels, from the top of the book down, to structured arrays of ORDER_BOOK_LEVEL_DTYPE
+        (price, amount, update_id).
+
+        :param depth: the maximum number of levels of each side, all the levels if None
+        :param bucket_size: if set, the levels are aggregated into price buckets of that size, the bid prices being
+        rounded down and the ask prices rounded up to a multiple of it
+        """
+        cdef:
+            size_t max_depth = max(self._bid_book.size(), self._ask_book.size()) if depth is None else depth
+            double bucket = 0 if bucket_size is None else bucket_size
+        return self.c_side_to_numpy(True, max_depth, bucket), self.c_side_to_numpy(False, max_depth, bucket)
+
+    cdef np.ndarray c_side_to_numpy(self, bint is_bid, size_t depth, double bucket_size):
+        cdef:
+            size_t max_levels = min(depth, self._bid_book.size() if is_bid else self._ask_book.size())
+            np.ndarray levels_array = np.empty(max_levels, dtype=ORDER_BOOK_LEVEL_DTYPE)
+            OrderBookLevel[:] levels_view = levels_array
+            OrderBookLevel *levels
+            size_t level_count = 0
+            set[OrderBookEntry].reverse_iterator bid_iterator = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_iterator = self._ask_book.begin()
+
+        if max_levels == 0:
+            return levels_array
+        levels = &levels_view[0]
+        if is_bid:
+            while bid_iterator != self._bid_book.rend():
+                if not c_add_level(levels, &level_count, max_levels, deref(bid_iterator), bucket_size, True):
+                    break
+                inc(bid_iterator)
+        else:
+            while ask_iterator != self._ask_book.end():
+                if not c_add_level(levels, &level_count, max_levels, deref(ask_iterator), bucket_size, False):
+                    break
+                inc(ask_iterator)
+        return levels_array[:level_count]
+
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -209,16 +330,18 @@ cdef class OrderBook(PubSub):
         """
         self.apply_numpy_diffs(bids_df.values, asks_df.values)
 
-    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: int = 0):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+        The last diff update ID of the book becomes the highest of update_id and the update IDs of the rows.
         """
-        self.c_apply_numpy_diffs(bids_array, asks_array)
+        self.c_apply_numpy_diffs(bids_array, asks_array, update_id)
 
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array):
+                             np.ndarray[np.float64_t, ndim=2] asks_array,
+                             int64_t update_id=0):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
@@ -226,26 +349,31 @@ cdef class OrderBook(PubSub):
         cdef:
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
-            int64_t last_update_id = 0
-
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+            int64_t last_update_id = update_id
+            Py_ssize_t i
+
+        cpp_bids.reserve(bids_array.shape[0])
+        cpp_asks.reserve(asks_array.shape[0])
+        for i in range(bids_array.shape[0]):
+            cpp_bids.push_back(OrderBookEntry(bids_array[i, 0], bids_array[i, 1], <int64_t>bids_array[i, 2]))
+            last_update_id = max(last_update_id, <int64_t>bids_array[i, 2])
+        for i in range(asks_array.shape[0]):
+            cpp_asks.push_back(OrderBookEntry(asks_array[i, 0], asks_array[i, 1], <int64_t>asks_array[i, 2]))
+            last_update_id = max(last_update_id, <int64_t>asks_array[i, 2])
         self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
 
-    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: int = 0):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+        The snapshot update ID of the book becomes the highest of update_id and the update IDs of the rows.
         """
-        self.c_apply_numpy_snapshot(bids_array, asks_array)
+        self.c_apply_numpy_snapshot(bids_array, asks_array, update_id)
 
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
-                                np.ndarray[np.float64_t, ndim=2] asks_array):
+                                np.ndarray[np.float64_t, ndim=2] asks_array,
+                                int64_t update_id=0):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
@@ -253,14 +381,17 @@ cdef class OrderBook(PubSub):
         cdef:
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
-            int64_t last_update_id = 0
-
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+            int64_t last_update_id = update_id
+            Py_ssize_t i
+
+        cpp_bids.reserve(bids_array.shape[0])
+        cpp_asks.reserve(asks_array.shape[0])
+        for i in range(bids_array.shape[0]):
+            cpp_bids.push_back(OrderBookEntry(bids_array[i, 0], bids_array[i, 1], <int64_t>bids_array[i, 2]))
+            last_update_id = max(last_update_id, <int64_t>bids_array[i, 2])
+        for i in range(asks_array.shape[0]):
+            cpp_asks.push_back(OrderBookEntry(asks_array[i, 0], asks_array[i, 1], <int64_t>asks_array[i, 2]))
+            last_update_id = max(last_update_id, <int64_t>asks_array[i, 2])
         self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
@@ -319,12 +450,28 @@ cdef class OrderBook(PubSub):
     def get_price(self, is_buy: bool) -> float:
         return self.c_get_price(is_buy)
 
+    cdef OrderBookDepthIndex c_depth_index(self, bint is_buy):
+        return self._ask_depth_index if is_buy else self._bid_depth_index
+
+    cdef set[OrderBookEntry] *c_book(self, bint is_buy):
+        return ref(self._ask_book) if is_buy else ref(self._bid_book)
+
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
-
-        if is_buy:
+            OrderBookDepthIndex depth_index
+            size_t level
+
+        if self._depth_index_enabled:
+            depth_index = self.c_depth_index(is_buy)
+            level = depth_index.c_first_level_with_base_volume(self.c_book(is_buy), volume)
+            if level < depth_index.prices.size():
+                result_price = depth_index.prices[level]
+                cumulative_volume = depth_index.cumulative_base[level]
+            elif level > 0:
+                cumulative_volume = depth_index.cumulative_base[level - 1]
+        elif is_buy:
             for order_book_row in self.ask_entries():
                 cumulative_volume += order_book_row.amount
                 if cumulative_volume >= volume:
@@ -344,7 +491,21 @@ cdef class OrderBook(PubSub):
             double total_cost = 0
             double total_volume = 0
             double result_vwap = NaN
-        if is_buy:
+            OrderBookDepthIndex depth_index
+            size_t level
+
+        if self._depth_index_enabled:
+            depth_index = self.c_depth_index(is_buy)
+            level = depth_index.c_first_level_with_base_volume(self.c_book(is_buy), volume)
+            if level > 0:
+                total_cost = depth_index.cumulative_quote[level - 1]
+                total_volume = depth_index.cumulative_base[level - 1]
+            if level < depth_index.prices.size():
+                incremental_amount = volume - total_volume
+                total_cost += incremental_amount * depth_index.prices[level]
+                total_volume += incremental_amount
+                result_vwap = total_cost / total_volume
+        elif is_buy:
             for order_book_row in self.ask_entries():
                 total_cost += order_book_row.amount * order_book_row.price
                 total_volume += order_book_row.amount
@@ -375,8 +536,18 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
-
-        if is_buy:
+            OrderBookDepthIndex depth_index
+            size_t level
+
+        if self._depth_index_enabled:
+            depth_index = self.c_depth_index(is_buy)
+            level = depth_index.c_first_level_with_quote_volume(self.c_book(is_buy), quote_volume)
+            if level < depth_index.prices.size():
+                result_price = depth_index.prices[level]
+                cumulative_volume = depth_index.cumulative_quote[level]
+            elif level > 0:
+                cumulative_volume = depth_index.cumulative_quote[level - 1]
+        elif is_buy:
             for order_book_row in self.ask_entries():
                 cumulative_volume += order_book_row.amount * order_book_row.price
                 if cumulative_volume >= quote_volume:
@@ -396,8 +567,18 @@ cdef class OrderBook(PubSub):
             double cumulative_volume = 0
             double cumulative_base_amount = 0
             double row_amount = 0
-
-        if is_buy:
+            OrderBookDepthIndex depth_index
+            size_t level
+
+        if self._depth_index_enabled:
+            depth_index = self.c_depth_index(is_buy)
+            level = depth_index.c_first_level_with_base_volume(self.c_book(is_buy), base_amount)
+            if level > 0:
+                cumulative_volume = depth_index.cumulative_quote[level - 1]
+                cumulative_base_amount = depth_index.cumulative_base[level - 1]
+            if level < depth_index.prices.size():
+                cumulative_volume += (base_amount - cumulative_base_amount) * depth_index.prices[level]
+        elif is_buy:
             for order_book_row in self.ask_entries():
                 row_amount = order_book_row.amount
                 if row_amount + cumulative_base_amount >= base_amount:
@@ -422,8 +603,16 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
-
-        if is_buy:
+            OrderBookDepthIndex depth_index
+            size_t level
+
+        if self._depth_index_enabled:
+            depth_index = self.c_depth_index(is_buy)
+            level = depth_index.c_first_level_worse_than(self.c_book(is_buy), price)
+            if level > 0:
+                result_price = depth_index.prices[level - 1]
+                cumulative_volume = depth_index.cumulative_base[level - 1]
+        elif is_buy:
             for order_book_row in self.ask_entries():
                 if order_book_row.price > price:
                     break
@@ -442,8 +631,16 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
-
-        if is_buy:
+            OrderBookDepthIndex depth_index
+            size_t level
+
+        if self._depth_index_enabled:
+            depth_index = self.c_depth_index(is_buy)
+            level = depth_index.c_first_level_worse_than(self.c_book(is_buy), price)
+            if level > 0:
+                result_price = depth_index.prices[level - 1]
+                cumulative_volume = depth_index.cumulative_quote[level - 1]
+        elif is_buy:
             for order_book_row in self.ask_entries():
                 if order_book_row.price > price:
                     break
@@ -476,6 +673,18 @@ cdef class OrderBook(PubSub):
     def get_quote_volume_for_price(self, is_buy: bool, price: float) -> OrderBookQueryResult:
         return self.c_get_quote_volume_for_price(is_buy, price)
 
+    def get_prices_for_volumes(self, is_buy: bool, volumes: List[float]) -> List[OrderBookQueryResult]:
+        return [self.c_get_price_for_volume(is_buy, volume) for volume in volumes]
+
+    def get_vwaps_for_volumes(self, is_buy: bool, volumes: List[float]) -> List[OrderBookQueryResult]:
+        return [self.c_get_vwap_for_volume(is_buy, volume) for volume in volumes]
+
+    def get_prices_for_quote_volumes(self, is_buy: bool, quote_volumes: List[float]) -> List[OrderBookQueryResult]:
+        return [self.c_get_price_for_quote_volume(is_buy, quote_volume) for quote_volume in quote_volumes]
+
+    def get_volumes_for_prices(self, is_buy: bool, prices: List[float]) -> List[OrderBookQueryResult]:
+        return [self.c_get_volume_for_price(is_buy, price) for price in prices]
+
     @classmethod
     def snapshot_message_from_kafka(cls, record: ConsumerRecord, metadata: Optional[Dict] = None) -> OrderBookMessage:
         pass
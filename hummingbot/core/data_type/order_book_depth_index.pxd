@@ -0,0 +1,22 @@
+# distutils: language=c++
+
+from libcpp.set cimport set
+from libcpp.vector cimport vector
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+
+
+cdef class OrderBookDepthIndex:
+    cdef:
+        bint _is_bid
+        vector[double] prices
+        vector[double] cumulative_base
+        vector[double] cumulative_quote
+
+    cdef c_invalidate(self)
+    cdef c_invalidate_from_price(self, double price)
+    cdef size_t c_first_level_with_base_volume(self, set[OrderBookEntry] *book, double volume)
+    cdef size_t c_first_level_with_quote_volume(self, set[OrderBookEntry] *book, double quote_volume)
+    cdef size_t c_first_level_worse_than(self, set[OrderBookEntry] *book, double price)
+    cdef size_t c_first_matching_level(self, set[OrderBookEntry] *book, int criterion, double value)
+    cdef bint c_level_matches(self, size_t level, int criterion, double value)
+    cdef c_append_level(self, double price, double amount)
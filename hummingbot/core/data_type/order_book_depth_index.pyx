@@ -0,0 +1,131 @@
+# distutils: language=c++
+# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+
+from cython.operator cimport dereference as deref, predecrement as dec, preincrement as inc
+
+cdef int BASE_VOLUME_CRITERION = 0
+cdef int QUOTE_VOLUME_CRITERION = 1
+cdef int WORSE_PRICE_CRITERION = 2
+
+
+cdef class OrderBookDepthIndex:
+    """
+    Cumulative base and quote depth of one side of an order book, from the top of the book down.
+
+    The index is built lazily: only the levels a query needs are indexed, and a change in the book only invalidates
+    the levels from the changed price down, so that the levels above it do not need to be indexed again. Queries
+    binary search the indexed levels.
+    """
+    def __init__(self, is_bid: bool):
+        self._is_bid = is_bid
+
+    @property
+    def indexed_levels(self) -> int:
+        return self.prices.size()
+
+    cdef c_invalidate(self):
+        self.prices.clear()
+        self.cumulative_base.clear()
+        self.cumulative_quote.clear()
+
+    cdef c_invalidate_from_price(self, double price):
+        cdef:
+            size_t low = 0
+            size_t high = self.prices.size()
+            size_t middle
+
+        # First indexed level at or below the changed price
+        while low < high:
+            middle = (low + high) // 2
+            if (self.prices[middle] <= price) if self._is_bid else (self.prices[middle] >= price):
+                high = middle
+            else:
+                low = middle + 1
+        if low < self.prices.size():
+            self.prices.resize(low)
+            self.cumulative_base.resize(low)
+            self.cumulative_quote.resize(low)
+
+    cdef size_t c_first_level_with_base_volume(self, set[OrderBookEntry] *book, double volume):
+        """
+        :return: the first level where the cumulative base volume reaches volume, the number of levels if none does
+        """
+        return self.c_first_matching_level(book, BASE_VOLUME_CRITERION, volume)
+
+    cdef size_t c_first_level_with_quote_volume(self, set[OrderBookEntry] *book, double quote_volume):
+        """
+        :return: the first level where the cumulative quote volume reaches quote_volume, the number of levels if none
+        does
+        """
+        return self.c_first_matching_level(book, QUOTE_VOLUME_CRITERION, quote_volume)
+
+    cdef size_t c_first_level_worse_than(self, set[OrderBookEntry] *book, double price):
+        """
+        :return: the first level with a price worse than price (higher for asks, lower for bids), the number of levels
+        if none is
+        """
+        return self.c_first_matching_level(book, WORSE_PRICE_CRITERION, price)
+
+    cdef size_t c_first_matching_level(self, set[OrderBookEntry] *book, int criterion, double value):
+        cdef:
+            size_t low = 0
+            size_t high = self.prices.size()
+            size_t middle
+            set[OrderBookEntry].iterator it
+            OrderBookEntry entry
+
+        while low < high:
+            middle = (low + high) // 2
+            if self.c_level_matches(middle, criterion, value):
+                high = middle
+            else:
+                low = middle + 1
+        if low < self.prices.size():
+            return low
+
+        # None of the indexed levels match, index the following levels until one does
+        if self._is_bid:
+            if self.prices.empty():
+                it = deref(book).end()
+            else:
+                it = deref(book).lower_bound(OrderBookEntry(self.prices.back(), 0, 0))
+            while it != deref(book).begin():
+                dec(it)
+                entry = deref(it)
+                self.c_append_level(entry.getPrice(), entry.getAmount())
+                if self.c_level_matches(self.prices.size() - 1, criterion, value):
+                    return self.prices.size() - 1
+        else:
+            if self.prices.empty():
+                it = deref(book).begin()
+            else:
+                it = deref(book).upper_bound(OrderBookEntry(self.prices.back(), 0, 0))
+            while it != deref(book).end():
+                entry = deref(it)
+                self.c_append_level(entry.getPrice(), entry.getAmount())
+                if self.c_level_matches(self.prices.size() - 1, criterion, value):
+                    return self.prices.size() - 1
+                inc(it)
+        return self.prices.size()
+
+    cdef bint c_level_matches(self, size_t level, int criterion, double value):
+        if criterion == BASE_VOLUME_CRITERION:
+            return self.cumulative_base[level] >= value
+        elif criterion == QUOTE_VOLUME_CRITERION:
+            return self.cumulative_quote[level] >= value
+        elif self._is_bid:
+            return self.prices[level] < value
+        else:
+            return self.prices[level] > value
+
+    cdef c_append_level(self, double price, double amount):
+        cdef:
+            double cumulative_base = 0
+            double cumulative_quote = 0
+
+        if not self.prices.empty():
+            cumulative_base = self.cumulative_base.back()
+            cumulative_quote = self.cumulative_quote.back()
+        self.prices.push_back(price)
+        self.cumulative_base.push_back(cumulative_base + amount)
+        self.cumulative_quote.push_back(cumulative_quote + amount * price)
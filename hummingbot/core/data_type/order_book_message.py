@@ -1,7 +1,7 @@
 from collections import namedtuple
 from enum import Enum
-from functools import total_ordering
-from typing import Dict, List, Optional
+from functools import cached_property, total_ordering
+from typing import Any, Dict, List, Optional
 
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
@@ -52,16 +52,23 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
     def trading_pair(self) -> str:
         return self.content["trading_pair"]
 
-    @property
+    @cached_property
     def asks(self) -> List[OrderBookRow]:
-        return [
-            OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["asks"]
-        ]
+        return self._order_book_rows(self.content["asks"])
 
-    @property
+    @cached_property
     def bids(self) -> List[OrderBookRow]:
+        return self._order_book_rows(self.content["bids"])
+
+    def _order_book_rows(self, entries: List[Any]) -> List[OrderBookRow]:
+        """
+        Converts the [price, amount, ...] entries of the content to OrderBookRow, once per message. Data sources can
+        store OrderBookRow entries in the content to skip the conversion.
+        """
+        update_id = self.update_id
         return [
-            OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
+            entry if isinstance(entry, OrderBookRow) else OrderBookRow(float(entry[0]), float(entry[1]), update_id)
+            for entry in entries
         ]
 
     @property
@@ -0,0 +1,240 @@
+import asyncio
+import logging
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.market_data_format import (
+    DIFF,
+    INDEX_DTYPE,
+    SNAPSHOT,
+    index_path,
+    segment_header,
+    segment_path,
+    segment_paths,
+    to_records,
+    trade_record,
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+s_logger = None
+
+
+class PairSegment:
+    """
+    Segment being recorded for a trading pair, as seen from the event loop.
+    """
+
+    def __init__(self, number: int, start: float):
+        self.number = number
+        self.start = start
+        self.records = 0
+        # no snapshot recorded in the segment yet: the next message is preceded by one
+        self.needs_snapshot = True
+
+
+class SegmentFile:
+    """
+    Open segment file of a trading pair, as seen from the writer thread.
+    """
+
+    def __init__(self, number: int, path: str):
+        self.number = number
+        self.file = open(path, "ab")
+        if self.file.tell() == 0:
+            self.file.write(segment_header())
+        self.first_timestamp = float("nan")
+        self.last_timestamp = float("nan")
+        self.records = 0
+
+
+class OrderBookRecorder:
+    """
+    Records the diff, snapshot and trade messages of an OrderBookTracker in the market_data_format segments read by
+    MarketDataReplay.
+    Messages are converted to fixed-width records on the event loop, buffered, and written in batches every
+    flush_interval seconds by a writer running in the default executor.
+    A segment is rotated once it holds segment_max_records records or is segment_max_age seconds old, and every
+    segment starts with a snapshot of the order book, so that a replay can start from any segment. Closed segments are
+    appended to the index.
+    If more than max_buffered_records records are waiting to be written, new messages are dropped and the trading pair
+    is marked so that recording resumes with a fresh snapshot.
+    """
+    flush_interval = 1.0
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global s_logger
+        if s_logger is None:
+            s_logger = logging.getLogger(__name__)
+        return s_logger
+
+    def __init__(self,
+                 tracker: OrderBookTracker,
+                 data_dir: str,
+                 segment_max_records: int = 1000000,
+                 segment_max_age: float = 3600,
+                 max_buffered_records: int = 1000000):
+        self._tracker = tracker
+        self._data_dir = data_dir
+        self._segment_max_records = segment_max_records
+        self._segment_max_age = segment_max_age
+        self._max_buffered_records = max_buffered_records
+        self._segments: Dict[str, PairSegment] = {}
+        self._files: Dict[str, SegmentFile] = {}
+        self._pending: List[Tuple[str, int, np.ndarray]] = []
+        self._pending_records = 0
+        self._dropped_messages = 0
+        self._flush_task: Optional[asyncio.Task] = None
+        self._write_future: Optional[asyncio.Future] = None
+
+    @property
+    def data_dir(self) -> str:
+        return self._data_dir
+
+    @property
+    def pending_records(self) -> int:
+        return self._pending_records
+
+    @property
+    def dropped_messages(self) -> int:
+        return self._dropped_messages
+
+    def start(self):
+        self._tracker.add_message_listener(self.record_message)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = safe_ensure_future(self._flush_loop())
+
+    async def stop(self):
+        """
+        Stop recording, write everything buffered and close the segments.
+        """
+        self._tracker.remove_message_listener(self.record_message)
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush()
+        await asyncio.get_event_loop().run_in_executor(None, self._close_all)
+
+    def next_segment_number(self, trading_pair: str) -> int:
+        paths = segment_paths(self._data_dir, trading_pair)
+        if len(paths) == 0:
+            return 0
+        return int(os.path.basename(paths[-1]).split(".")[0]) + 1
+
+    def order_book_records(self, order_book: OrderBook, timestamp: float) -> np.ndarray:
+        bids = np.array([[row.price, row.amount] for row in order_book.bid_entries()], dtype=np.float64)
+        asks = np.array([[row.price, row.amount] for row in order_book.ask_entries()], dtype=np.float64)
+        update_id = max(order_book.snapshot_uid, order_book.last_diff_uid)
+        return to_records(SNAPSHOT, timestamp, update_id, bids, asks)
+
+    @staticmethod
+    def message_records(message: OrderBookMessage) -> np.ndarray:
+        if message.type is OrderBookMessageType.TRADE:
+            try:
+                trade_id = int(message.trade_id)
+            except (TypeError, ValueError):
+                trade_id = 0
+            trade_type = TradeType.SELL.value if float(message.content["trade_type"]) == float(TradeType.SELL.value) \
+                else TradeType.BUY.value
+            return trade_record(message.timestamp, trade_id, trade_type,
+                                float(message.content["price"]), float(message.content["amount"]))
+        kind = SNAPSHOT if message.type is OrderBookMessageType.SNAPSHOT else DIFF
+        bids = [[row.price, row.amount] for row in message.bids]
+        asks = [[row.price, row.amount] for row in message.asks]
+        return to_records(kind, message.timestamp, message.update_id, bids, asks)
+
+    def record_message(self, message: OrderBookMessage):
+        """
+        Tracker listener: convert the message to records and queue them to the segment of its trading pair.
+        """
+        trading_pair = message.trading_pair
+        order_book = self._tracker.order_books.get(trading_pair)
+        segment = self._segments.get(trading_pair)
+        if segment is None:
+            segment = PairSegment(self.next_segment_number(trading_pair), time.time())
+            self._segments[trading_pair] = segment
+        elif segment.records >= self._segment_max_records or time.time() - segment.start >= self._segment_max_age:
+            segment = PairSegment(segment.number + 1, time.time())
+            self._segments[trading_pair] = segment
+        if self._pending_records >= self._max_buffered_records:
+            self._dropped_messages += 1
+            segment.needs_snapshot = True
+            return
+        records = self.message_records(message)
+        if segment.needs_snapshot and message.type is not OrderBookMessageType.SNAPSHOT:
+            if order_book is None:
+                return
+            # the book already includes the message, which is harmless to replay again after the snapshot
+            records = np.concatenate([self.order_book_records(order_book, message.timestamp), records])
+        segment.needs_snapshot = False
+        segment.records += len(records)
+        self._pending.append((trading_pair, segment.number, records))
+        self._pending_records += len(records)
+
+    async def _flush_loop(self):
+        while True:
+            try:
+                await asyncio.sleep(self.flush_interval)
+                await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error writing order book records.", exc_info=True)
+
+    async def flush(self):
+        """
+        Write the buffered records, from the default executor.
+        """
+        # shielded: cancelling the flush loop must not lose track of a batch the writer thread is writing
+        if self._write_future is not None and not self._write_future.done():
+            await asyncio.shield(self._write_future)
+        if len(self._pending) == 0:
+            return
+        batch, self._pending, self._pending_records = self._pending, [], 0
+        self._write_future = asyncio.get_event_loop().run_in_executor(None, self._write, batch)
+        await asyncio.shield(self._write_future)
+
+    def _write(self, batch: List[Tuple[str, int, np.ndarray]]):
+        """
+        Writer thread: append records to their segment, rotating the segment files as needed.
+        """
+        chunks: Dict[Tuple[str, int], List[np.ndarray]] = {}
+        for trading_pair, number, records in batch:
+            chunks.setdefault((trading_pair, number), []).append(records)
+        for (trading_pair, number), records_list in chunks.items():
+            segment_file = self._files.get(trading_pair)
+            if segment_file is not None and segment_file.number != number:
+                self._close(trading_pair)
+                segment_file = None
+            if segment_file is None:
+                path = segment_path(self._data_dir, trading_pair, number)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                segment_file = SegmentFile(number, path)
+                self._files[trading_pair] = segment_file
+            records = np.concatenate(records_list)
+            segment_file.file.write(records.tobytes())
+            segment_file.file.flush()
+            if segment_file.records == 0:
+                segment_file.first_timestamp = float(records["timestamp"][0])
+            segment_file.last_timestamp = float(records["timestamp"][-1])
+            segment_file.records += len(records)
+
+    def _close(self, trading_pair: str):
+        segment_file = self._files.pop(trading_pair)
+        segment_file.file.close()
+        entry = np.array([(segment_file.number, segment_file.first_timestamp,
+                           segment_file.last_timestamp, segment_file.records)], dtype=INDEX_DTYPE)
+        with open(index_path(self._data_dir, trading_pair), "ab") as f:
+            f.write(entry.tobytes())
+
+    def _close_all(self):
+        for trading_pair in list(self._files.keys()):
+            self._close(trading_pair)
@@ -3,18 +3,24 @@ import logging
 import time
 from collections import defaultdict, deque
 from enum import Enum
-from typing import Deque, Dict, List, Optional, Tuple
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.order_book_tracker_worker import OrderBookTrackerWorker
 from hummingbot.core.event.events import OrderBookTradeEvent
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 
+# Counters of OrderBookTracker.resync_stats
+RESYNC_STAT_KEYS = ("gaps", "crossed_books", "resyncs", "resyncs_completed", "snapshot_failures", "replayed_diffs")
+
 
 class OrderBookTrackerDataSourceType(Enum):
     REMOTE_API = 2
@@ -23,7 +29,17 @@ class OrderBookTrackerDataSourceType(Enum):
 
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
+    # Number of levels of each side of the order books maintained in worker processes mirrored in this process: the
+    # order books of the tracker are truncated to these levels, queries walking deeper see no more liquidity
+    WORKER_ORDER_BOOK_DEPTH: int = 200
+    WORKER_ORDER_BOOK_SYNC_INTERVAL: float = 0.05
+    # Minimum number of seconds between two snapshot requests resynchronizing the order book of a trading pair
+    RESYNC_MIN_INTERVAL: float = 5.0
+    # Maximum number of diffs of a trading pair buffered while its order book is resynchronized
+    RESYNC_BUFFER_SIZE: int = 1000
     _obt_logger: Optional[HummingbotLogger] = None
+    # Number of worker processes the trackers started from now on maintain their order books in, 0 for none
+    _worker_processes: int = 0
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -31,6 +47,18 @@ class OrderBookTracker:
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
+    @classmethod
+    def process_order_books_in_workers(cls, worker_processes: int):
+        """
+        Maintain the order books of the trackers started from now on in worker processes, each worker process taking
+        care of a group of trading pairs of the tracker. The order books of the tracker then mirror the top
+        WORKER_ORDER_BOOK_DEPTH levels of each side of the order books maintained by the workers.
+        Only the trackers using the base _track_single_book maintain their order books in worker processes.
+        :param worker_processes: The number of worker processes of each tracker, 0 to maintain the order books in the
+        main process.
+        """
+        cls._worker_processes = worker_processes
+
     def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
         self._domain: Optional[str] = domain
         self._data_source: OrderBookTrackerDataSource = data_source
@@ -45,6 +73,14 @@ class OrderBookTracker:
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._message_listeners: List[Callable[[OrderBookMessage], None]] = []
+        self._workers: List[OrderBookTrackerWorker] = []
+        self._order_book_workers: Dict[str, OrderBookTrackerWorker] = {}
+        self._last_update_ids: Dict[str, int] = {}
+        self._resync_buffers: Dict[str, Deque[OrderBookMessage]] = {}
+        self._resync_tasks: Dict[str, asyncio.Task] = {}
+        self._last_resync_timestamps: Dict[str, float] = {}
+        self._resync_stats: Dict[str, Dict[str, int]] = defaultdict(lambda: dict.fromkeys(RESYNC_STAT_KEYS, 0))
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -55,6 +91,7 @@ class OrderBookTracker:
         self._order_book_snapshot_router_task: Optional[asyncio.Task] = None
         self._update_last_trade_prices_task: Optional[asyncio.Task] = None
         self._order_book_stream_listener_task: Optional[asyncio.Task] = None
+        self._sync_worker_order_books_task: Optional[asyncio.Task] = None
 
     @property
     def data_source(self) -> OrderBookTrackerDataSource:
@@ -75,8 +112,36 @@ class OrderBookTracker:
             for trading_pair, order_book in self._order_books.items()
         }
 
+    @property
+    def resync_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        The resynchronization counters of each trading pair: the gaps in the diff update ids and the crossed books
+        detected, the resynchronizations started and completed, the failed snapshot requests, and the diffs buffered
+        during the resynchronizations then replayed.
+        """
+        return {trading_pair: dict(stats) for trading_pair, stats in self._resync_stats.items()}
+
+    def add_message_listener(self, listener: Callable[[OrderBookMessage], None]):
+        """
+        Register a callback called with every diff and snapshot message once applied to its order book, and every
+        trade message once emitted as a trade event.
+        """
+        self._message_listeners.append(listener)
+
+    def remove_message_listener(self, listener: Callable[[OrderBookMessage], None]):
+        if listener in self._message_listeners:
+            self._message_listeners.remove(listener)
+
+    def _notify_message_listeners(self, message: OrderBookMessage):
+        for listener in self._message_listeners:
+            try:
+                listener(message)
+            except Exception:
+                self.logger().error(f"Unexpected error in order book message listener {listener}.", exc_info=True)
+
     def start(self):
         self.stop()
+        self._start_workers()
         self._init_order_books_task = safe_ensure_future(
             self._init_order_books()
         )
@@ -137,8 +202,32 @@ class OrderBookTracker:
             for _, task in self._tracking_tasks.items():
                 task.cancel()
             self._tracking_tasks.clear()
+        for task in self._resync_tasks.values():
+            task.cancel()
+        self._resync_tasks.clear()
+        self._resync_buffers.clear()
+        self._stop_workers()
         self._order_books_initialized.clear()
 
+    def _start_workers(self):
+        if self._worker_processes <= 0 or type(self)._track_single_book is not OrderBookTracker._track_single_book:
+            return
+        self._workers = [
+            OrderBookTrackerWorker(name=f"{type(self).__name__}-{index}") for index in range(self._worker_processes)
+        ]
+        for worker in self._workers:
+            worker.start()
+        self._sync_worker_order_books_task = safe_ensure_future(self._sync_worker_order_books_loop())
+
+    def _stop_workers(self):
+        if self._sync_worker_order_books_task is not None:
+            self._sync_worker_order_books_task.cancel()
+            self._sync_worker_order_books_task = None
+        for worker in self._workers:
+            worker.stop()
+        self._workers = []
+        self._order_book_workers.clear()
+
     async def _update_last_trade_prices_loop(self):
         '''
         Updates last trade price for all order books through REST API, it is to initiate last_trade_price and as
@@ -176,6 +265,11 @@ class OrderBookTracker:
         for index, trading_pair in enumerate(self._trading_pairs):
             self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
             self._tracking_message_queues[trading_pair] = asyncio.Queue()
+            self._last_update_ids[trading_pair] = self._order_books[trading_pair].snapshot_uid
+            if len(self._workers) > 0:
+                worker = self._workers[index % len(self._workers)]
+                worker.add_order_book(trading_pair, self._order_books[trading_pair], self.WORKER_ORDER_BOOK_DEPTH)
+                self._order_book_workers[trading_pair] = worker
             self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
             self.logger().info(f"Initialized order book for {trading_pair}. "
                                f"{index + 1}/{len(self._trading_pairs)} completed.")
@@ -250,28 +344,189 @@ class OrderBookTracker:
                 self.logger().error("Unknown error. Retrying after 5 seconds.", exc_info=True)
                 await asyncio.sleep(5.0)
 
+    def _next_queued_message(self, trading_pair: str) -> Optional[OrderBookMessage]:
+        """
+        Returns the next message of the trading pair without waiting, the saved ones first, None if there are none.
+        """
+        saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
+        if len(saved_messages) > 0:
+            return saved_messages.popleft()
+        message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
+        return None if message_queue.empty() else message_queue.get_nowait()
+
+    @staticmethod
+    def _coalesce_diff_rows(rows: List[OrderBookRow]) -> np.ndarray:
+        """
+        Converts the rows of consecutive diffs to a [price, amount, update_id] array with one row per price level, the
+        last row of each price level winning.
+        """
+        if len(rows) == 0:
+            return np.empty((0, 3), dtype=np.float64)
+        rows_array = np.array(rows, dtype=np.float64)[::-1]
+        _, last_rows = np.unique(rows_array[:, 0], return_index=True)
+        return rows_array[last_rows]
+
+    def _apply_diff_messages(self, order_book: OrderBook, diff_messages: List[OrderBookMessage]):
+        """
+        Applies consecutive diff messages to the order book at once.
+        """
+        if len(diff_messages) == 1:
+            message = diff_messages[0]
+            order_book.apply_diffs(message.bids, message.asks, message.update_id)
+            return
+        bids = self._coalesce_diff_rows([row for message in diff_messages for row in message.bids])
+        asks = self._coalesce_diff_rows([row for message in diff_messages for row in message.asks])
+        order_book.apply_numpy_diffs(bids, asks, diff_messages[-1].update_id)
+
+    def _sequenced_diff_messages(self, trading_pair: str,
+                                 diff_messages: List[OrderBookMessage]) -> List[OrderBookMessage]:
+        """
+        Returns the diff messages to apply to the order book of the trading pair: the ones before the first gap in
+        their update ids, if the data source sends contiguous ones. The diffs after a gap, and all the diffs received
+        while the order book is resynchronized, are buffered until the snapshot resynchronizing it.
+        """
+        resync_buffer: Optional[Deque[OrderBookMessage]] = self._resync_buffers.get(trading_pair)
+        if resync_buffer is not None:
+            resync_buffer.extend(diff_messages)
+            return []
+        if not self._data_source.CONTIGUOUS_DIFF_UPDATE_IDS:
+            return diff_messages
+        last_update_id: Optional[int] = self._last_update_ids.get(trading_pair)
+        for index, message in enumerate(diff_messages):
+            if last_update_id is not None and message.first_update_id > last_update_id + 1:
+                self._resync_stats[trading_pair]["gaps"] += 1
+                self.logger().warning(f"Missed the order book diffs of {trading_pair} after update id "
+                                      f"{last_update_id}, resynchronizing it.")
+                self._start_resync(trading_pair)
+                self._resync_buffers[trading_pair].extend(diff_messages[index:])
+                diff_messages = diff_messages[:index]
+                break
+            last_update_id = message.update_id if last_update_id is None else max(last_update_id, message.update_id)
+        if last_update_id is not None:
+            self._last_update_ids[trading_pair] = last_update_id
+        return diff_messages
+
+    def _apply_sequenced_diff_messages(self, trading_pair: str, order_book: OrderBook,
+                                       diff_messages: List[OrderBookMessage]) -> int:
+        """
+        Applies the consecutive diff messages of the trading pair that can be applied to its order book, and
+        resynchronizes the order book if they crossed it.
+
+        :return: the number of diff messages applied
+        """
+        diff_messages = self._sequenced_diff_messages(trading_pair, diff_messages)
+        if len(diff_messages) == 0:
+            return 0
+        self._apply_diff_messages(order_book, diff_messages)
+        self._past_diffs_windows[trading_pair].extend(diff_messages)
+        for diff_message in diff_messages:
+            self._notify_message_listeners(diff_message)
+        if self._data_source.RESYNC_CROSSED_ORDER_BOOKS and order_book.last_diff_crossed:
+            self._resync_stats[trading_pair]["crossed_books"] += 1
+            self.logger().warning(f"The order book diffs of {trading_pair} crossed the book, resynchronizing it.")
+            self._start_resync(trading_pair)
+        return len(diff_messages)
+
+    def _start_resync(self, trading_pair: str):
+        """
+        Starts buffering the diffs of the trading pair and requests a new snapshot of its order book, unless it is
+        already resynchronized.
+        """
+        if trading_pair in self._resync_buffers:
+            return
+        self._resync_buffers[trading_pair] = deque(maxlen=self.RESYNC_BUFFER_SIZE)
+        self._resync_stats[trading_pair]["resyncs"] += 1
+        self._resync_tasks[trading_pair] = safe_ensure_future(self._resync_order_book(trading_pair))
+
+    def _end_resync(self, trading_pair: str, snapshot: OrderBookMessage) -> Optional[List[OrderBookMessage]]:
+        """
+        Records the update id of a snapshot of the trading pair about to be applied, which ends the resynchronization of
+        its order book if there is one.
+
+        :return: the buffered diffs newer than the snapshot to replay after it, None if the order book was not
+        resynchronized
+        """
+        resync_buffer: Optional[Deque[OrderBookMessage]] = self._resync_buffers.pop(trading_pair, None)
+        if resync_buffer is None:
+            self._last_update_ids[trading_pair] = max(
+                snapshot.update_id, self._last_update_ids.get(trading_pair, snapshot.update_id))
+            return None
+        resync_task: Optional[asyncio.Task] = self._resync_tasks.pop(trading_pair, None)
+        if resync_task is not None and not resync_task.done():
+            # Another snapshot arrived before the one requested
+            resync_task.cancel()
+        self._last_update_ids[trading_pair] = snapshot.update_id
+        replayed_diffs: List[OrderBookMessage] = [
+            message for message in resync_buffer if message.update_id > snapshot.update_id
+        ]
+        self._resync_stats[trading_pair]["resyncs_completed"] += 1
+        self._resync_stats[trading_pair]["replayed_diffs"] += len(replayed_diffs)
+        self.logger().info(f"Resynchronized the order book of {trading_pair}.")
+        return replayed_diffs
+
+    async def _resync_order_book(self, trading_pair: str):
+        """
+        Requests a new snapshot of the order book of the trading pair, at most once every RESYNC_MIN_INTERVAL seconds,
+        and queues it for the task tracking the order book.
+        """
+        while True:
+            delay: float = (self._last_resync_timestamps.get(trading_pair, float("-inf"))
+                            + self.RESYNC_MIN_INTERVAL - time.perf_counter())
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._last_resync_timestamps[trading_pair] = time.perf_counter()
+            try:
+                order_book: OrderBook = await self._initial_order_book_for_trading_pair(trading_pair)
+                break
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self._resync_stats[trading_pair]["snapshot_failures"] += 1
+                self.logger().network(
+                    f"Unexpected error fetching the order book snapshot of {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg=f"Could not resynchronize the order book of {trading_pair}. "
+                                    f"Retrying after {self.RESYNC_MIN_INTERVAL} seconds."
+                )
+        bids, asks = order_book.to_numpy()
+        snapshot: OrderBookMessage = OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {
+                "trading_pair": trading_pair,
+                "update_id": order_book.snapshot_uid,
+                "bids": [OrderBookRow(*level) for level in bids.tolist()],
+                "asks": [OrderBookRow(*level) for level in asks.tolist()],
+            },
+            timestamp=time.time())
+        await self._tracking_message_queues[trading_pair].put(snapshot)
+
     async def _track_single_book(self, trading_pair: str):
+        if trading_pair in self._order_book_workers:
+            await self._track_single_book_in_worker(trading_pair)
+            return
         past_diffs_window = self._past_diffs_windows[trading_pair]
 
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
         order_book: OrderBook = self._order_books[trading_pair]
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
+        next_message: Optional[OrderBookMessage] = None
 
         while True:
             try:
-                saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
-
-                # Process saved messages first if there are any
-                if len(saved_messages) > 0:
-                    message = saved_messages.popleft()
-                else:
-                    message = await message_queue.get()
+                # Process the message left by the previous diffs and the saved messages first if there are any
+                message = next_message or self._next_queued_message(trading_pair) or await message_queue.get()
+                next_message = None
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    diff_messages_accepted += 1
+                    # Apply all the diffs already queued at once, catching up with a backlog in a single update
+                    diff_messages: List[OrderBookMessage] = [message]
+                    next_message = self._next_queued_message(trading_pair)
+                    while next_message is not None and next_message.type is OrderBookMessageType.DIFF:
+                        diff_messages.append(next_message)
+                        next_message = self._next_queued_message(trading_pair)
+                    diff_messages_accepted += self._apply_sequenced_diff_messages(
+                        trading_pair, order_book, diff_messages)
 
                     # Output some statistics periodically.
                     now: float = time.time()
@@ -280,8 +535,17 @@ class OrderBookTracker:
                         diff_messages_accepted = 0
                     last_message_timestamp = now
                 elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[OrderBookMessage] = list(past_diffs_window)
-                    order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                    replayed_diffs: Optional[List[OrderBookMessage]] = self._end_resync(trading_pair, message)
+                    if replayed_diffs is None:
+                        past_diffs: List[OrderBookMessage] = list(past_diffs_window)
+                        order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                    else:
+                        # The diffs received since the gap were buffered, the ones before it are older than the snapshot
+                        order_book.apply_snapshot(message.bids, message.asks, message.update_id)
+                        past_diffs_window.clear()
+                    self._notify_message_listeners(message)
+                    if replayed_diffs:
+                        self._apply_sequenced_diff_messages(trading_pair, order_book, replayed_diffs)
                     self.logger().debug(f"Processed order book snapshot for {trading_pair}.")
             except asyncio.CancelledError:
                 raise
@@ -293,6 +557,49 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    async def _track_single_book_in_worker(self, trading_pair: str):
+        """
+        Sends the snapshots and diffs of the trading pair to the worker process maintaining its order book.
+        """
+        message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
+        worker: OrderBookTrackerWorker = self._order_book_workers[trading_pair]
+
+        while True:
+            try:
+                message = self._next_queued_message(trading_pair) or await message_queue.get()
+                if message.type is OrderBookMessageType.SNAPSHOT:
+                    messages = [message] + self._sequenced_diff_messages(
+                        trading_pair, self._end_resync(trading_pair, message) or [])
+                else:
+                    messages = self._sequenced_diff_messages(trading_pair, [message])
+                for message in messages:
+                    worker.send(message)
+                    self._notify_message_listeners(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error sending order book messages of {trading_pair} to its worker.",
+                    exc_info=True,
+                    app_warning_msg="Unexpected error tracking order book. Retrying after 5 seconds."
+                )
+                await asyncio.sleep(5.0)
+
+    async def _sync_worker_order_books_loop(self):
+        """
+        Mirrors the order books maintained by the worker processes in the order books of the tracker.
+        """
+        while True:
+            try:
+                for trading_pair, worker in self._order_book_workers.items():
+                    worker.sync_order_book(trading_pair, self._order_books[trading_pair])
+                await asyncio.sleep(self.WORKER_ORDER_BOOK_SYNC_INTERVAL)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error syncing the order books of the workers.", exc_info=True)
+                await asyncio.sleep(5.0)
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
@@ -316,6 +623,7 @@ class OrderBookTracker:
                     type=TradeType.SELL if
                     trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
                 ))
+                self._notify_message_listeners(trade_message)
 
                 messages_accepted += 1
 
@@ -13,6 +13,12 @@ from hummingbot.logger import HummingbotLogger
 
 class OrderBookTrackerDataSource(metaclass=ABCMeta):
     FULL_ORDER_BOOK_RESET_DELTA_SECONDS = 60 * 60
+    # True if the first_update_id of each diff message follows the update_id of the previous diff of its trading pair,
+    # for the order book tracker to detect the missed diffs
+    CONTIGUOUS_DIFF_UPDATE_IDS = False
+    # True if a diff message crossing the bids and asks of its order book means diffs were missed or misapplied, for
+    # the order book tracker to resynchronize the order book
+    RESYNC_CROSSED_ORDER_BOOKS = False
 
     _logger: Optional[HummingbotLogger] = None
 
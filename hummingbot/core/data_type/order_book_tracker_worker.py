@@ -0,0 +1,214 @@
+import logging
+import multiprocessing
+import queue
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.shared_order_book_ladder import SharedOrderBookLadder
+from hummingbot.logger import HummingbotLogger
+
+# Commands sent to the worker processes: (ADD_ORDER_BOOK, trading_pair, ladder_name, depth) to start maintaining an
+# order book, (SNAPSHOT or DIFF, trading_pair, update_id, bids, asks) to update it, None to stop the process
+ADD_ORDER_BOOK = 0
+SNAPSHOT = OrderBookMessageType.SNAPSHOT.value
+DIFF = OrderBookMessageType.DIFF.value
+
+
+def entries_to_rows(entries: List[Any], update_id: int) -> np.ndarray:
+    """
+    Converts the [price, amount, ...] entries of an order book message content to a [price, amount, update_id] array,
+    the same way OrderBookMessage does.
+    """
+    rows = [
+        (entry.price, entry.amount, entry.update_id) if isinstance(entry, OrderBookRow)
+        else (float(entry[0]), float(entry[1]), update_id)
+        for entry in entries
+    ]
+    return np.array(rows, dtype=np.float64).reshape((len(rows), 3))
+
+
+def order_book_command(message: OrderBookMessage) -> Tuple:
+    """
+    The command updating the order book of a worker with a snapshot or diff message. The entries of the plain
+    OrderBookMessage contents are converted in the worker, the rows of the other messages in this process.
+    """
+    if type(message) is OrderBookMessage:
+        bids, asks = message.content["bids"], message.content["asks"]
+    else:
+        bids, asks = [tuple(row) for row in message.bids], [tuple(row) for row in message.asks]
+    return message.type.value, message.trading_pair, message.update_id, bids, asks
+
+
+class OrderBookWorkerProcessor:
+    """
+    Maintains the order books of a worker process from the commands it receives, and publishes the top levels of each
+    order book updated by a batch of commands to its SharedOrderBookLadder.
+    """
+
+    PAST_DIFF_WINDOW_SIZE: int = 32
+
+    def __init__(self):
+        self._order_books: Dict[str, OrderBook] = {}
+        self._ladders: Dict[str, SharedOrderBookLadder] = {}
+        self._past_diffs_windows: Dict[str, Deque[Tuple]] = defaultdict(
+            lambda: deque(maxlen=self.PAST_DIFF_WINDOW_SIZE))
+
+    @property
+    def order_books(self) -> Dict[str, OrderBook]:
+        return self._order_books
+
+    def process(self, commands: List[Tuple]):
+        updated_trading_pairs: Set[str] = set()
+        for command in commands:
+            kind, trading_pair = command[0], command[1]
+            if kind == ADD_ORDER_BOOK:
+                _, _, ladder_name, depth = command
+                self._order_books[trading_pair] = OrderBook()
+                self._ladders[trading_pair] = SharedOrderBookLadder(depth=depth, name=ladder_name)
+            elif trading_pair in self._order_books:
+                self._apply(command)
+                updated_trading_pairs.add(trading_pair)
+        for trading_pair in updated_trading_pairs:
+            self._publish(trading_pair)
+
+    def close(self):
+        for ladder in self._ladders.values():
+            ladder.close()
+        self._ladders.clear()
+
+    def _apply(self, command: Tuple):
+        kind, trading_pair, update_id, bids, asks = command
+        order_book = self._order_books[trading_pair]
+        past_diffs_window = self._past_diffs_windows[trading_pair]
+        if kind == SNAPSHOT:
+            order_book.apply_numpy_snapshot(entries_to_rows(bids, update_id), entries_to_rows(asks, update_id))
+            # Replay the diffs received before the snapshot that are newer than it
+            for diff_update_id, diff_bids, diff_asks in past_diffs_window:
+                if diff_update_id > update_id:
+                    order_book.apply_numpy_diffs(diff_bids, diff_asks, diff_update_id)
+        elif update_id >= order_book.snapshot_uid:
+            bids_rows = entries_to_rows(bids, update_id)
+            asks_rows = entries_to_rows(asks, update_id)
+            order_book.apply_numpy_diffs(bids_rows, asks_rows, update_id)
+            past_diffs_window.append((update_id, bids_rows, asks_rows))
+
+    def _publish(self, trading_pair: str):
+        order_book = self._order_books[trading_pair]
+        ladder = self._ladders[trading_pair]
+        bids, asks = order_book.to_numpy(depth=ladder.depth)
+        ladder.publish(
+            np.column_stack((bids["price"], bids["amount"], bids["update_id"])),
+            np.column_stack((asks["price"], asks["amount"], asks["update_id"])),
+            max(order_book.snapshot_uid, order_book.last_diff_uid))
+
+
+def run_order_book_worker(commands_queue: multiprocessing.Queue, max_batch_size: int):
+    """
+    Main function of the worker processes: processes the commands in batches of the ones already queued.
+    """
+    processor = OrderBookWorkerProcessor()
+    try:
+        while True:
+            commands = [commands_queue.get()]
+            while commands[-1] is not None and len(commands) < max_batch_size:
+                try:
+                    commands.append(commands_queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = commands[-1] is None
+            try:
+                processor.process(commands[:-1] if stop else commands)
+            except Exception:
+                logging.getLogger(__name__).exception("Unexpected error processing order book messages.")
+            if stop:
+                return
+    finally:
+        processor.close()
+
+
+class OrderBookTrackerWorker:
+    """
+    A worker process maintaining order books for an OrderBookTracker: the tracker sends it the snapshots and diffs of
+    its trading pairs, and reads the top levels of their order books back from their SharedOrderBookLadder.
+    """
+
+    MAX_BATCH_SIZE: int = 1000
+    STOP_TIMEOUT: float = 5.0
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, name: str):
+        context = multiprocessing.get_context("spawn")
+        self._commands_queue: multiprocessing.Queue = context.Queue()
+        self._process = context.Process(
+            target=run_order_book_worker,
+            args=(self._commands_queue, self.MAX_BATCH_SIZE),
+            name=name,
+            daemon=True)
+        self._ladders: Dict[str, SharedOrderBookLadder] = {}
+        self._sequences: Dict[str, int] = {}
+
+    @property
+    def trading_pairs(self) -> List[str]:
+        return list(self._ladders.keys())
+
+    def start(self):
+        self._process.start()
+
+    def stop(self):
+        if self._process.is_alive():
+            self._commands_queue.put(None)
+            self._process.join(self.STOP_TIMEOUT)
+            if self._process.is_alive():
+                self.logger().warning(f"Order book worker {self._process.name} did not stop, terminating it.")
+                self._process.terminate()
+        for ladder in self._ladders.values():
+            ladder.close()
+        self._ladders.clear()
+        self._sequences.clear()
+
+    def add_order_book(self, trading_pair: str, order_book: OrderBook, depth: int):
+        """
+        Starts maintaining the order book of a trading pair in the worker, from its current state.
+        :param depth: the number of levels of each side published back by the worker
+        """
+        ladder = SharedOrderBookLadder(depth=depth)
+        self._ladders[trading_pair] = ladder
+        self._sequences[trading_pair] = 0
+        self._commands_queue.put((ADD_ORDER_BOOK, trading_pair, ladder.name, depth))
+        bids, asks = order_book.to_numpy()
+        self._commands_queue.put((
+            SNAPSHOT,
+            trading_pair,
+            order_book.snapshot_uid,
+            [OrderBookRow(*level) for level in bids.tolist()],
+            [OrderBookRow(*level) for level in asks.tolist()]))
+
+    def send(self, message: OrderBookMessage):
+        self._commands_queue.put(order_book_command(message))
+
+    def sync_order_book(self, trading_pair: str, order_book: OrderBook) -> bool:
+        """
+        Replaces the content of the order book by the last levels published by the worker, if they changed. The order
+        book only holds the depth levels of each side published by the worker, and its snapshot update id becomes the
+        update id of the order book of the worker.
+
+        :return: True if the order book was updated
+        """
+        ladder = self._ladders.get(trading_pair)
+        result = ladder and ladder.read(self._sequences[trading_pair])
+        if not result:
+            return False
+        self._sequences[trading_pair], update_id, bids, asks = result
+        order_book.apply_numpy_snapshot(bids, asks, update_id)
+        return True
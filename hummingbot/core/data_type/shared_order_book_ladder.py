@@ -0,0 +1,111 @@
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional, Tuple
+
+import numpy as np
+
+# Number of ladders of the ring: a reader copying a ladder is only overwritten after SLOTS more publications
+SLOTS = 4
+READ_ATTEMPTS = 3
+# Sequence number of the last ladder published
+HEADER_DTYPE = np.dtype([("sequence", "<i8")])
+
+
+def ladder_dtype(depth: int) -> np.dtype:
+    """
+    A ladder of the ring, with depth [price, amount, update_id] levels of each side. The sequence number of a ladder
+    is -1 while it is written.
+    """
+    return np.dtype([
+        ("sequence", "<i8"),
+        ("update_id", "<i8"),
+        ("bid_count", "<i8"),
+        ("ask_count", "<i8"),
+        ("bids", "<f8", (depth, 3)),
+        ("asks", "<f8", (depth, 3)),
+    ])
+
+
+class SharedOrderBookLadder:
+    """
+    The top levels of an order book, published by the process maintaining the book to the processes reading it
+    through a ring of ladders in shared memory.
+    There is a single writer: it writes the next ladder of the ring, then publishes its sequence number in the header.
+    Readers copy the ladder of the last published sequence number, and check that it has not been overwritten meanwhile
+    (seqlock), so that neither side ever waits for the other.
+    """
+
+    def __init__(self, depth: int, name: Optional[str] = None):
+        """
+        :param depth: the maximum number of levels of each side
+        :param name: the name of the shared memory to attach to, a new shared memory is created if None
+        """
+        self._depth = depth
+        self._ladder_dtype = ladder_dtype(depth)
+        size = HEADER_DTYPE.itemsize + SLOTS * self._ladder_dtype.itemsize
+        self._shared_memory = SharedMemory(name=name, create=name is None, size=size if name is None else 0)
+        self._owner = name is None
+        self._header = np.ndarray((1,), dtype=HEADER_DTYPE, buffer=self._shared_memory.buf)
+        self._ladders = np.ndarray(
+            (SLOTS,), dtype=self._ladder_dtype, buffer=self._shared_memory.buf, offset=HEADER_DTYPE.itemsize)
+        if self._owner:
+            self._header["sequence"] = 0
+            self._ladders["sequence"] = 0
+
+    @property
+    def name(self) -> str:
+        return self._shared_memory.name
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    @property
+    def sequence(self) -> int:
+        return int(self._header[0]["sequence"])
+
+    def publish(self, bids: np.ndarray, asks: np.ndarray, update_id: int):
+        """
+        :param bids: the [price, amount, update_id] bid levels from the best one, only the first depth ones are kept
+        :param asks: the [price, amount, update_id] ask levels from the best one, only the first depth ones are kept
+        :param update_id: the update id of the order book
+        """
+        sequence = self.sequence + 1
+        ladder = self._ladders[sequence % SLOTS]
+        bid_count = min(len(bids), self._depth)
+        ask_count = min(len(asks), self._depth)
+        ladder["sequence"] = -1
+        ladder["bids"][:bid_count] = bids[:bid_count]
+        ladder["asks"][:ask_count] = asks[:ask_count]
+        ladder["bid_count"] = bid_count
+        ladder["ask_count"] = ask_count
+        ladder["update_id"] = update_id
+        ladder["sequence"] = sequence
+        self._header["sequence"] = sequence
+
+    def read(self, since_sequence: int = 0) -> Optional[Tuple[int, int, np.ndarray, np.ndarray]]:
+        """
+        :param since_sequence: the sequence number of the last ladder read
+
+        :return: the sequence number, update id, bid levels and ask levels of the last ladder published, None if there
+        is none after since_sequence (or if it kept being overwritten while copied)
+        """
+        for _ in range(READ_ATTEMPTS):
+            sequence = self.sequence
+            if sequence <= since_sequence:
+                return None
+            ladder = self._ladders[sequence % SLOTS]
+            update_id = int(ladder["update_id"])
+            bids = ladder["bids"][:ladder["bid_count"]].copy()
+            asks = ladder["asks"][:ladder["ask_count"]].copy()
+            if ladder["sequence"] == sequence:
+                return sequence, update_id, bids, asks
+        return None
+
+    def close(self):
+        """
+        Detaches from the shared memory, and releases it if it was created by this ladder.
+        """
+        self._header = self._ladders = None
+        self._shared_memory.close()
+        if self._owner:
+            self._shared_memory.unlink()
@@ -1,10 +1,12 @@
 import asyncio
 import logging
+import time
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Optional, Set, Tuple
 
 import hummingbot.client.settings  # noqa
 from hummingbot.connector.utils import combine_to_hb_trading_pair
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.network_base import NetworkBase
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.rate_oracle.sources.ascend_ex_rate_source import AscendExRateSource
@@ -13,10 +15,15 @@ from hummingbot.core.rate_oracle.sources.coin_gecko_rate_source import CoinGecko
 from hummingbot.core.rate_oracle.sources.gate_io_rate_source import GateIoRateSource
 from hummingbot.core.rate_oracle.sources.kucoin_rate_source import KucoinRateSource
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.streamed_prices import StreamedPrice, StreamedPrices
+from hummingbot.core.rate_oracle.utils import RateGraph, find_rate
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 
+if TYPE_CHECKING:
+    from hummingbot.connector.connector_base import ConnectorBase
+    from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
 RATE_ORACLE_SOURCES = {
     "binance": BinanceRateSource,
     "coin_gecko": CoinGeckoRateSource,
@@ -24,13 +31,21 @@ RATE_ORACLE_SOURCES = {
     "ascend_ex": AscendExRateSource,
     "gate_io": GateIoRateSource,
 }
+# Name under which the prices polled from the rate source are merged with the streamed ones
+REST_SOURCE = "rest"
 
 
 class RateOracle(NetworkBase):
     """
     RateOracle provides conversion rates for any given pair token symbols in both async and sync fashions.
     It achieves this by query URL on a given source for prices and store them, either in cache or as an object member.
-    The find_rate is then used on these prices to find a rate on a given pair.
+    The find_rate is then used on these prices to find a rate on a given pair. The stored prices are indexed by a
+    RateGraph, updated as they are refreshed, so that stored rates are looked up without scanning them. Streamed
+    prices only update the pairs they change, so that a stream of order book diffs keeps the other cached rates.
+    Prices can also be streamed: the mid prices of the order books of running connectors (see add_connector) and
+    prices pushed by ticker streams (see update_price) are merged with the polled ones, the most recent fresh price of
+    each pair winning. Once streams are running, the source is only polled while some requested pair cannot be
+    converted from the streamed prices alone.
     """
     _logger: Optional[HummingbotLogger] = None
     _shared_instance: "RateOracle" = None
@@ -47,10 +62,19 @@ class RateOracle(NetworkBase):
             cls._logger = logging.getLogger(__name__)
         return cls._logger
 
-    def __init__(self, source: Optional[RateSourceBase] = None, quote_token: Optional[str] = None):
+    def __init__(self,
+                 source: Optional[RateSourceBase] = None,
+                 quote_token: Optional[str] = None,
+                 staleness_limit: float = 30.0):
         super().__init__()
         self._source: RateSourceBase = source if source is not None else BinanceRateSource()
         self._prices: Dict[str, Decimal] = {}
+        self._rate_graph = RateGraph()
+        self._streamed_prices = StreamedPrices(staleness_limit)
+        # graph of the streamed prices only, to find the requested pairs nobody streams
+        self._streamed_rate_graph = RateGraph()
+        self._requested_pairs: Set[str] = set()
+        self._connector_listeners: Dict[str, Tuple["OrderBookTracker", Callable[[OrderBookMessage], None]]] = {}
         self._fetch_price_task: Optional[asyncio.Task] = None
         self._ready_event = asyncio.Event()
         self._quote_token = quote_token if quote_token is not None else "USD"
@@ -91,6 +115,8 @@ class RateOracle(NetworkBase):
     def quote_token(self, new_token: str):
         if new_token != self._quote_token:
             self._quote_token = new_token
+            # streamed prices are of given pairs, polled ones are quoted in the quote token
+            self._streamed_prices.remove_source(REST_SOURCE)
             self._prices = {}
 
     @property
@@ -100,6 +126,68 @@ class RateOracle(NetworkBase):
         """
         return self._prices.copy()
 
+    @property
+    def staleness_limit(self) -> float:
+        """
+        Age in seconds from which a price is no longer used, unless overridden for its pair
+        """
+        return self._streamed_prices.staleness_limit
+
+    @staleness_limit.setter
+    def staleness_limit(self, staleness_limit: float):
+        self._streamed_prices.staleness_limit = staleness_limit
+
+    def set_staleness_limit(self, pair: str, staleness_limit: Optional[float]):
+        """
+        Overrides the staleness limit of a trading pair, or restores the default one if None
+        """
+        self._streamed_prices.set_staleness_limit(pair, staleness_limit)
+
+    def streamed_price(self, pair: str) -> Optional[StreamedPrice]:
+        """
+        :param pair: A trading pair, e.g. BTC-USDT
+        :return The most recent fresh price of the pair with its timestamp and source, None if it has none
+        """
+        return self._streamed_prices.get(pair, time.time())
+
+    def update_price(self, pair: str, price: Decimal, source: str, timestamp: Optional[float] = None):
+        """
+        Pushes a price from a streaming source, e.g. a websocket ticker stream.
+
+        :param pair: A trading pair, e.g. BTC-USDT
+        :param price: The price of the pair
+        :param source: The name of the streaming source
+        :param timestamp: The time of the price, now if not specified
+        """
+        self._streamed_prices.update(pair, price, time.time() if timestamp is None else timestamp, source)
+
+    def add_connector(self, connector: "ConnectorBase"):
+        """
+        Streams the mid prices of the order books of a connector, updated with every snapshot and diff it applies.
+        """
+        tracker: Optional["OrderBookTracker"] = getattr(connector, "order_book_tracker", None)
+        if tracker is None:
+            self.logger().warning(f"{connector.name} has no order books to stream prices from.")
+            return
+        self.remove_connector(connector)
+        source = connector.name
+
+        def listener(message: OrderBookMessage):
+            if message.type is not OrderBookMessageType.TRADE:
+                self._update_order_book_price(source, tracker, message.trading_pair)
+
+        tracker.add_message_listener(listener)
+        self._connector_listeners[source] = (tracker, listener)
+        for trading_pair in list(tracker.order_books.keys()):
+            self._update_order_book_price(source, tracker, trading_pair)
+
+    def remove_connector(self, connector: "ConnectorBase"):
+        self._remove_connector_source(connector.name)
+
+    def remove_connectors(self):
+        for source in list(self._connector_listeners.keys()):
+            self._remove_connector_source(source)
+
     async def start_network(self):
         await self.stop_network()
         self._fetch_price_task = safe_ensure_future(self._fetch_price_loop())
@@ -109,9 +197,12 @@ class RateOracle(NetworkBase):
             self._fetch_price_task.cancel()
             self._fetch_price_task = None
         # Reset stored prices so that they are not used if they are not being updated
+        self._streamed_prices.remove_source(REST_SOURCE)
         self._prices = {}
 
     async def check_network(self) -> NetworkStatus:
+        if len(self._streamed_prices.fresh_prices(time.time(), excluded_source=REST_SOURCE)) > 0:
+            return NetworkStatus.CONNECTED
         try:
             prices = await self._source.get_prices(quote_token=self._quote_token)
             if not prices:
@@ -153,7 +244,19 @@ class RateOracle(NetworkBase):
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        return find_rate(self._prices, pair)
+        self._requested_pairs.add(pair)
+        return self._stored_rate_graph().find_rate(pair)
+
+    def get_pair_rates(self, pairs: Iterable[str]) -> Dict[str, Optional[Decimal]]:
+        """
+        Finds the conversion rates of several trading pairs from the local prices, see get_pair_rate.
+
+        :param pairs: Trading pairs, e.g. [BTC-USDT, ETH-BTC]
+        :return A conversion rate by trading pair, None for pairs with no route
+        """
+        pairs = list(pairs)
+        self._requested_pairs.update(pairs)
+        return self._stored_rate_graph().find_rates(pairs)
 
     async def stored_or_live_rate(self, pair: str) -> Decimal:
         """
@@ -181,10 +284,51 @@ class RateOracle(NetworkBase):
         prices = await self._source.get_prices(quote_token=self._quote_token)
         return find_rate(prices, pair)
 
+    def _stored_rate_graph(self) -> RateGraph:
+        if self._rate_graph.prices is not self._prices:
+            self._rate_graph.update(self._prices)
+        if self._streamed_prices.updated:
+            # only the pairs streamed since the last lookup, stale prices are dropped by the fetch price loop
+            self._rate_graph.update_prices(self._streamed_prices.merge_changes(time.time()))
+        return self._rate_graph
+
+    def _refresh_prices(self):
+        self._prices = self._streamed_prices.fresh_prices(time.time())
+        self._rate_graph.update(self._prices)
+
+    def _update_order_book_price(self, source: str, tracker: "OrderBookTracker", trading_pair: str):
+        order_book = tracker.order_books.get(trading_pair)
+        if order_book is None:
+            return
+        try:
+            mid_price = (order_book.get_price(True) + order_book.get_price(False)) / 2
+        except EnvironmentError:
+            return  # one side of the book is empty
+        self._streamed_prices.update(trading_pair, Decimal(str(mid_price)), time.time(), source)
+
+    def _remove_connector_source(self, source: str):
+        tracker, listener = self._connector_listeners.pop(source, (None, None))
+        if tracker is not None:
+            tracker.remove_message_listener(listener)
+            self._streamed_prices.remove_source(source)
+
+    def _polling_required(self) -> bool:
+        """
+        The source is polled unless the fresh streamed prices convert every pair requested so far.
+        """
+        streamed_prices = self._streamed_prices.fresh_prices(time.time(), excluded_source=REST_SOURCE)
+        if len(streamed_prices) == 0:
+            return True
+        self._streamed_rate_graph.update(streamed_prices)
+        return any(rate is None for rate in self._streamed_rate_graph.find_rates(self._requested_pairs).values())
+
     async def _fetch_price_loop(self):
         while True:
             try:
-                self._prices = await self._source.get_prices(quote_token=self._quote_token)
+                if self._polling_required():
+                    prices = await self._source.get_prices(quote_token=self._quote_token)
+                    self._streamed_prices.update_many(prices, time.time(), REST_SOURCE)
+                self._refresh_prices()
                 if self._prices:
                     self._ready_event.set()
             except asyncio.CancelledError:
@@ -55,11 +55,11 @@ class BinanceRateSource(RateSourceBase):
         :return: A dictionary of trading pairs and prices
         """
         pairs_prices = await exchange.get_all_pairs_prices()
+        symbol_map = await exchange.trading_pair_symbol_map()
         results = {}
         for pair_price in pairs_prices:
-            try:
-                trading_pair = await exchange.trading_pair_associated_to_exchange_symbol(symbol=pair_price["symbol"])
-            except KeyError:
+            trading_pair = symbol_map.get(pair_price["symbol"])
+            if trading_pair is None:
                 continue  # skip pairs that we don't track
             if quote_token is not None:
                 base, quote = split_hb_trading_pair(trading_pair=trading_pair)
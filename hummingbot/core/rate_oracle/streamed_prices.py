@@ -0,0 +1,120 @@
+from decimal import Decimal
+from typing import Dict, NamedTuple, Optional, Set
+
+
+class StreamedPrice(NamedTuple):
+    price: Decimal
+    timestamp: float
+    source: str
+
+
+class StreamedPrices:
+    """
+    Latest prices pushed by several sources, e.g. connector order books, ticker streams or REST polls, with the time
+    each pair was last updated by each source.
+    A price is stale once older than the staleness limit of its pair: the fresh prices of a pair are merged by taking
+    the most recent one, whatever its source.
+    """
+
+    def __init__(self, staleness_limit: float):
+        self._staleness_limit: float = staleness_limit
+        self._staleness_limits: Dict[str, float] = {}
+        # latest price by source, by trading pair
+        self._prices: Dict[str, Dict[str, StreamedPrice]] = {}
+        # pairs pushed or removed since the fresh prices were last merged
+        self._changed_pairs: Set[str] = set()
+
+    @property
+    def staleness_limit(self) -> float:
+        return self._staleness_limit
+
+    @staleness_limit.setter
+    def staleness_limit(self, staleness_limit: float):
+        self._staleness_limit = staleness_limit
+
+    @property
+    def updated(self) -> bool:
+        """
+        True if a price was pushed or removed since the fresh prices were last merged.
+        """
+        return len(self._changed_pairs) > 0
+
+    @property
+    def sources(self) -> Set[str]:
+        return {source for prices in self._prices.values() for source in prices}
+
+    def set_staleness_limit(self, pair: str, staleness_limit: Optional[float]):
+        """
+        Overrides the staleness limit of a pair, or restores the default one if None.
+        """
+        if staleness_limit is None:
+            self._staleness_limits.pop(pair, None)
+        else:
+            self._staleness_limits[pair] = staleness_limit
+
+    def staleness_limit_of(self, pair: str) -> float:
+        return self._staleness_limits.get(pair, self._staleness_limit)
+
+    def update(self, pair: str, price: Decimal, timestamp: float, source: str):
+        self._prices.setdefault(pair, {})[source] = StreamedPrice(price, timestamp, source)
+        self._changed_pairs.add(pair)
+
+    def update_many(self, prices: Dict[str, Decimal], timestamp: float, source: str):
+        for pair, price in prices.items():
+            self._prices.setdefault(pair, {})[source] = StreamedPrice(price, timestamp, source)
+        self._changed_pairs.update(prices)
+
+    def get(self, pair: str, now: float) -> Optional[StreamedPrice]:
+        """
+        :return: The most recent fresh price of the pair, None if it has none.
+        """
+        freshest = None
+        for streamed_price in self._prices.get(pair, {}).values():
+            if (now - streamed_price.timestamp <= self.staleness_limit_of(pair)
+                    and (freshest is None or streamed_price.timestamp > freshest.timestamp)):
+                freshest = streamed_price
+        return freshest
+
+    def fresh_prices(self, now: float, excluded_source: Optional[str] = None) -> Dict[str, Decimal]:
+        """
+        Merges the fresh prices of every pair, dropping the stale ones.
+        :param excluded_source: A source whose prices are left out, in which case the prices are not marked as merged.
+        """
+        merged = {}
+        for pair, prices in list(self._prices.items()):
+            staleness_limit = self.staleness_limit_of(pair)
+            freshest = None
+            for source, streamed_price in list(prices.items()):
+                if now - streamed_price.timestamp > staleness_limit:
+                    del prices[source]
+                elif source != excluded_source and (freshest is None or streamed_price.timestamp > freshest.timestamp):
+                    freshest = streamed_price
+            if len(prices) == 0:
+                del self._prices[pair]
+            if freshest is not None:
+                merged[pair] = freshest.price
+        if excluded_source is None:
+            self._changed_pairs.clear()
+        return merged
+
+    def merge_changes(self, now: float) -> Dict[str, Optional[Decimal]]:
+        """
+        Merges the fresh prices of the pairs pushed or removed since the fresh prices were last merged, so that they
+        are updated without merging every pair.
+        :return: The most recent fresh price of each of these pairs, None for those left without any.
+        """
+        changes = {}
+        for pair in self._changed_pairs:
+            freshest = self.get(pair, now)
+            changes[pair] = None if freshest is None else freshest.price
+        self._changed_pairs.clear()
+        return changes
+
+    def remove_source(self, source: str):
+        for pair, prices in self._prices.items():
+            if prices.pop(source, None) is not None:
+                self._changed_pairs.add(pair)
+
+    def clear(self):
+        self._changed_pairs.update(self._prices)
+        self._prices.clear()
@@ -1,5 +1,6 @@
+from collections import deque
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, Iterable, List, Optional, Set
 
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.gateway.utils import unwrap_token_symbol
@@ -13,6 +14,7 @@ def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
     A rate for HBOT-AAVE will be 100 / 50
     A rate for AAVE-HBOT will be 50 / 100
     A rate for HBOT-GBP will be 100 * 0.75
+    Pairs with no direct or reverse price are converted through the fewest intermediate tokens, see RateGraph.
     :param prices: The dictionary of trading pairs and their prices
     :param pair: The trading pair
     '''
@@ -26,12 +28,149 @@ def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
     reverse_pair = combine_to_hb_trading_pair(base=quote, quote=base)
     if reverse_pair in prices:
         return Decimal("1") / prices[reverse_pair]
-    base_prices = {k: v for k, v in prices.items() if k.startswith(f"{base}-")}
-    for base_pair, proxy_price in base_prices.items():
-        link_quote = split_hb_trading_pair(base_pair)[1]
-        link_pair = combine_to_hb_trading_pair(base=link_quote, quote=quote)
-        if link_pair in prices:
-            return proxy_price * prices[link_pair]
-        common_denom_pair = combine_to_hb_trading_pair(base=quote, quote=link_quote)
-        if common_denom_pair in prices:
-            return proxy_price / prices[common_denom_pair]
+    return RateGraph(prices).find_rate(pair)
+
+
+class RateGraph:
+    '''
+    Index of a dictionary of prices as a graph of tokens, with an edge between the base and quote of every priced pair.
+    The rate of a pair is the product of the rates along the path with the fewest conversions between its tokens, so
+    that it is found however many intermediate tokens it takes. Neighbours are visited in alphabetical order, so
+    that ties between paths with as many conversions always resolve to the same path whatever the order of the prices.
+    Paths are cached until the pairs priced change, and rates until the prices they are converted with are updated.
+    '''
+
+    def __init__(self, prices: Optional[Dict[str, Decimal]] = None):
+        self._prices: Dict[str, Decimal] = {}
+        self._neighbours: Dict[str, Set[str]] = {}
+        self._paths: Dict[str, Optional[List[str]]] = {}
+        self._rates: Dict[str, Optional[Decimal]] = {}
+        # cached rates converted with the price of each pair
+        self._dependent_rates: Dict[str, Set[str]] = {}
+        if prices is not None:
+            self.update(prices)
+
+    @property
+    def prices(self) -> Dict[str, Decimal]:
+        return self._prices
+
+    def update(self, prices: Dict[str, Decimal]):
+        '''
+        Index new prices: only the pairs added or removed since the last update change the graph.
+        '''
+        added = prices.keys() - self._prices.keys()
+        removed = self._prices.keys() - prices.keys()
+        self._prices = prices
+        self._update_neighbours(added, removed)
+        self._rates.clear()
+        self._dependent_rates.clear()
+
+    def update_prices(self, prices: Dict[str, Optional[Decimal]]):
+        '''
+        Index the new prices of some pairs, in place, None removing a pair: unless pairs are added or removed, only
+        the cached rates converted with these prices are dropped.
+        '''
+        added = {pair for pair, price in prices.items() if price is not None and pair not in self._prices}
+        removed = {pair for pair, price in prices.items() if price is None and pair in self._prices}
+        for pair, price in prices.items():
+            if price is None:
+                self._prices.pop(pair, None)
+            else:
+                self._prices[pair] = price
+        if len(added) > 0 or len(removed) > 0:
+            self._update_neighbours(added, removed)
+            self._rates.clear()
+            self._dependent_rates.clear()
+        else:
+            for pair in prices:
+                for rate_pair in self._dependent_rates.pop(pair, ()):
+                    self._rates.pop(rate_pair, None)
+
+    def find_rate(self, pair: str) -> Optional[Decimal]:
+        '''
+        :return: The rate of the pair, None if its tokens are not connected by the prices.
+        '''
+        if pair in self._rates:
+            return self._rates[pair]
+        if pair in self._prices:
+            rate = self._prices[pair]
+            self._dependent_rates.setdefault(pair, set()).add(pair)
+        else:
+            base, quote = split_hb_trading_pair(trading_pair=pair)
+            base = unwrap_token_symbol(base)
+            quote = unwrap_token_symbol(quote)
+            path = self.find_path(base, quote)
+            rate = None
+            if path is not None:
+                rate = self._path_rate(path)
+                for token, next_token in zip(path[:-1], path[1:]):
+                    for priced_pair in (combine_to_hb_trading_pair(base=token, quote=next_token),
+                                        combine_to_hb_trading_pair(base=next_token, quote=token)):
+                        self._dependent_rates.setdefault(priced_pair, set()).add(pair)
+        self._rates[pair] = rate
+        return rate
+
+    def find_rates(self, pairs: Iterable[str]) -> Dict[str, Optional[Decimal]]:
+        return {pair: self.find_rate(pair) for pair in pairs}
+
+    def find_path(self, base: str, quote: str) -> Optional[List[str]]:
+        '''
+        :return: The tokens from base to quote with the fewest conversions, None if there is no such path.
+        '''
+        if base == quote:
+            return [base]
+        key = combine_to_hb_trading_pair(base=base, quote=quote)
+        if key in self._paths:
+            return self._paths[key]
+        path = None
+        if base in self._neighbours and quote in self._neighbours:
+            previous: Dict[str, Optional[str]] = {base: None}
+            queue = deque([base])
+            while len(queue) > 0 and quote not in previous:
+                token = queue.popleft()
+                for neighbour in sorted(self._neighbours[token]):
+                    if neighbour not in previous:
+                        previous[neighbour] = token
+                        queue.append(neighbour)
+            if quote in previous:
+                path = [quote]
+                while previous[path[-1]] is not None:
+                    path.append(previous[path[-1]])
+                path.reverse()
+        self._paths[key] = path
+        return path
+
+    def _update_neighbours(self, added: Set[str], removed: Set[str]):
+        for pair in removed:
+            tokens = self._tokens(pair)
+            if tokens is not None:
+                base, quote = tokens
+                if combine_to_hb_trading_pair(base=quote, quote=base) not in self._prices:
+                    self._neighbours[base].discard(quote)
+                    self._neighbours[quote].discard(base)
+        for pair in added:
+            tokens = self._tokens(pair)
+            if tokens is not None:
+                base, quote = tokens
+                self._neighbours.setdefault(base, set()).add(quote)
+                self._neighbours.setdefault(quote, set()).add(base)
+        if len(added) > 0 or len(removed) > 0:
+            self._paths.clear()
+
+    def _path_rate(self, path: List[str]) -> Optional[Decimal]:
+        rate = Decimal("1")
+        for base, quote in zip(path[:-1], path[1:]):
+            pair = combine_to_hb_trading_pair(base=base, quote=quote)
+            if pair in self._prices:
+                rate *= self._prices[pair]
+                continue
+            reverse_price = self._prices[combine_to_hb_trading_pair(base=quote, quote=base)]
+            if reverse_price == 0:
+                return None
+            rate /= reverse_price
+        return rate
+
+    @staticmethod
+    def _tokens(pair: str):
+        tokens = pair.split("-")
+        return tuple(tokens) if len(tokens) == 2 else None
@@ -0,0 +1,90 @@
+import json
+from decimal import Decimal
+from typing import Any, Callable, Dict, NamedTuple, Union
+
+
+class JSONCodec(NamedTuple):
+    """
+    A JSON implementation used to decode the REST responses and websocket messages and to encode the request bodies.
+    All of them encode like ujson: Decimal values as numbers and non-str keys as strings.
+    """
+    name: str
+    loads: Callable[[Union[str, bytes]], Any]
+    dumps: Callable[[Any], str]
+
+
+def _default(obj: Any) -> Any:
+    """
+    Encodes the values the JSON implementations don't support natively the way ujson does.
+    """
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _orjson_codec() -> JSONCodec:
+    import orjson
+
+    return JSONCodec(
+        name="orjson",
+        loads=orjson.loads,
+        dumps=lambda obj: orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS).decode(),
+    )
+
+
+def _ujson_codec() -> JSONCodec:
+    import ujson
+
+    return JSONCodec(name="ujson", loads=ujson.loads, dumps=ujson.dumps)
+
+
+def _stdlib_codec() -> JSONCodec:
+    return JSONCodec(
+        name="json",
+        loads=json.loads,
+        dumps=lambda obj: json.dumps(obj, separators=(",", ":"), default=_default),
+    )
+
+
+# From the fastest to the slowest, the first one installed is used by default
+CODEC_FACTORIES: Dict[str, Callable[[], JSONCodec]] = {
+    "orjson": _orjson_codec,
+    "ujson": _ujson_codec,
+    "json": _stdlib_codec,
+}
+
+
+def _fastest_codec() -> JSONCodec:
+    for codec_factory in CODEC_FACTORIES.values():
+        try:
+            return codec_factory()
+        except ImportError:
+            continue
+    return _stdlib_codec()
+
+
+_codec: JSONCodec = _fastest_codec()
+
+
+def get_json_codec() -> JSONCodec:
+    return _codec
+
+
+def set_json_codec(name: str):
+    """
+    Selects the JSON implementation used by the web assistants.
+    :param name: one of CODEC_FACTORIES, raises ImportError if it is not installed
+    """
+    global _codec
+    _codec = CODEC_FACTORIES[name]()
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Decodes a JSON document, raising a ValueError if it is not valid JSON.
+    """
+    return _codec.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    return _codec.dumps(obj)
@@ -1,11 +1,18 @@
 import numpy as np
 import logging
+from libc.math cimport isnan, sqrt
 cimport numpy as np
 
 
 pmm_logger = None
 
 cdef class RingBuffer:
+    """
+    Fixed-length buffer of the last values added, in double precision.
+    Values are stored twice, at their position and one length further, so that the window of values in the buffer is
+    always a contiguous slice that can be viewed without copying. The mean and variance of the window are maintained
+    incrementally with Welford's algorithm, and recomputed exactly once every length values to bound rounding errors.
+    """
     @classmethod
     def logger(cls):
         global pmm_logger
@@ -15,25 +22,66 @@ cdef class RingBuffer:
 
     def __cinit__(self, int length):
         self._length = length
-        self._buffer = np.zeros(length, dtype=np.float64)
+        self._buffer = np.zeros(2 * length, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self._mean = 0
+        self._m2 = 0
 
     def __dealloc__(self):
         self._buffer = None
 
-    cdef void c_add_value(self, float val):
+    cdef void c_add_value(self, double val):
+        cdef:
+            int64_t size = self.c_size()
+            double previous_mean = self._mean
+            double removed
+        if self._is_full:
+            removed = self._buffer[self._delimiter]
+            self._mean += (val - removed) / size
+            self._m2 += (val - removed) * (val - self._mean + removed - previous_mean)
+        else:
+            self._mean += (val - previous_mean) / (size + 1)
+            self._m2 += (val - previous_mean) * (val - self._mean)
         self._buffer[self._delimiter] = val
+        self._buffer[self._delimiter + self._length] = val
         self.c_increment_delimiter()
+        if self._delimiter == 0 or isnan(self._m2):
+            self.c_refresh_statistics()
 
     cdef void c_increment_delimiter(self):
         self._delimiter = (self._delimiter + 1) % self._length
         if not self._is_full and self._delimiter == 0:
             self._is_full = True
 
+    cdef void c_refresh_statistics(self):
+        cdef object window = self.c_get_window()
+        if window.size == 0:
+            self._mean = 0
+            self._m2 = 0
+        else:
+            self._mean = np.mean(window)
+            self._m2 = np.sum(np.square(window - self._mean))
+
     cdef bint c_is_empty(self):
         return (not self._is_full) and (0==self._delimiter)
 
+    cdef int64_t c_size(self):
+        return self._length if self._is_full else self._delimiter
+
+    cdef double c_sum(self):
+        return self._mean * self.c_size()
+
+    cdef double c_window_mean(self):
+        if self.c_is_empty():
+            return np.nan
+        return self._mean
+
+    cdef double c_window_variance(self):
+        if self.c_is_empty():
+            return np.nan
+        return max(self._m2, 0) / self.c_size()
+
     cdef double c_get_last_value(self):
         if self.c_is_empty():
             return np.nan
@@ -45,36 +93,37 @@ cdef class RingBuffer:
     cdef double c_mean_value(self):
         result = np.nan
         if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
+            result = self._mean
         return result
 
     cdef double c_variance(self):
         result = np.nan
         if self._is_full:
-            result = np.var(self.c_get_as_numpy_array())
+            result = self.c_window_variance()
         return result
 
     cdef double c_std_dev(self):
         result = np.nan
         if self._is_full:
-            result = np.std(self.c_get_as_numpy_array())
+            result = sqrt(self.c_window_variance())
         return result
 
-    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
-        cdef np.ndarray[np.int16_t, ndim=1] indexes
+    cdef np.ndarray[np.double_t, ndim=1] c_get_window(self):
+        cdef int64_t start = self._delimiter if self._is_full else 0
+        window = np.asarray(self._buffer)[start:start + self.c_size()]
+        window.flags.writeable = False
+        return window
 
-        if not self._is_full:
-            indexes = np.arange(0, stop=self._delimiter, dtype=np.int16)
-        else:
-            indexes = np.arange(self._delimiter, stop=self._delimiter + self._length,
-                                dtype=np.int16) % self._length
-        return np.asarray(self._buffer)[indexes]
+    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
+        return self.c_get_window().copy()
 
     def __init__(self, length):
         self._length = length
-        self._buffer = np.zeros(length, dtype=np.double)
+        self._buffer = np.zeros(2 * length, dtype=np.double)
         self._delimiter = 0
         self._is_full = False
+        self._mean = 0
+        self._m2 = 0
 
     def add_value(self, val):
         self.c_add_value(val)
@@ -82,6 +131,12 @@ cdef class RingBuffer:
     def get_as_numpy_array(self):
         return self.c_get_as_numpy_array()
 
+    def get_window(self):
+        """
+        Read-only view of the values in the buffer, oldest first, valid until the next value is added.
+        """
+        return self.c_get_window()
+
     def get_last_value(self):
         return self.c_get_last_value()
 
@@ -89,6 +144,28 @@ cdef class RingBuffer:
     def is_full(self):
         return self.c_is_full()
 
+    @property
+    def size(self) -> int:
+        return self.c_size()
+
+    @property
+    def sum(self) -> float:
+        return self.c_sum()
+
+    @property
+    def window_mean(self) -> float:
+        """
+        Mean of the values in the buffer, even if it is not full yet.
+        """
+        return self.c_window_mean()
+
+    @property
+    def window_variance(self) -> float:
+        """
+        Variance of the values in the buffer, even if it is not full yet.
+        """
+        return self.c_window_variance()
+
     @property
     def mean_value(self):
         return self.c_mean_value()
@@ -110,9 +187,11 @@ cdef class RingBuffer:
         data = self.get_as_numpy_array()
 
         self._length = value
-        self._buffer = np.zeros(value, dtype=np.float64)
+        self._buffer = np.zeros(2 * value, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self._mean = 0
+        self._m2 = 0
 
         for val in data[-value:]:
             self.add_value(val)
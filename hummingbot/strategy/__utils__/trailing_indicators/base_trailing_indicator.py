@@ -1,8 +1,6 @@
 import logging
 from abc import ABC, abstractmethod
 
-import numpy as np
-
 from ..ring_buffer import RingBuffer
 
 pmm_logger = None
@@ -35,7 +33,7 @@ class BaseTrailingIndicator(ABC):
         Processing of the processing buffer to return final value.
         Default behavior is buffer average
         """
-        return np.mean(self._processing_buffer.get_as_numpy_array())
+        return self._processing_buffer.window_mean
 
     @property
     def current_value(self) -> float:
@@ -51,7 +49,7 @@ class BaseTrailingIndicator(ABC):
 
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        buffer_len = len(self._sampling_buffer.get_as_numpy_array())
+        buffer_len = self._sampling_buffer.size
         is_changed = self._samples_length != buffer_len
         self._samples_length = buffer_len
         return is_changed
@@ -1,17 +1,47 @@
-from base_trailing_indicator import BaseTrailingIndicator
-import pandas as pd
+from .base_trailing_indicator import BaseTrailingIndicator
 
 
 class ExponentialMovingAverageIndicator(BaseTrailingIndicator):
+    """
+    Exponential moving average of the sampling buffer with span of the sampling length, as computed by
+    pandas.Series.ewm(span=sampling_length, adjust=True).mean() over the buffer.
+    The weighted sum of the samples is updated as they are added and leave the buffer, in O(1) per sample.
+    """
     def __init__(self, sampling_length: int = 30, processing_length: int = 1):
         if processing_length != 1:
             raise Exception("Exponential moving average processing_length should be 1")
         super().__init__(sampling_length, processing_length)
+        self._weighted_sum = 0.
+
+    @property
+    def _decay(self) -> float:
+        return 1 - 2 / (self.sampling_length + 1)
+
+    def add_sample(self, value: float):
+        decay = self._decay
+        if self._sampling_buffer.is_full:
+            # the oldest sample, weighted decay ** (sampling_length - 1), leaves the buffer
+            self._weighted_sum -= decay ** (self.sampling_length - 1) * self._sampling_buffer.get_window()[0]
+        self._weighted_sum = decay * self._weighted_sum + float(value)
+        super().add_sample(value)
 
     def _indicator_calculation(self) -> float:
-        ema = pd.Series(self._sampling_buffer.get_as_numpy_array())\
-            .ewm(span=self._sampling_length, adjust=True).mean()
-        return ema[-1]
+        decay = self._decay
+        size = self._sampling_buffer.size
+        weights_sum = (1 - decay ** size) / (1 - decay) if decay != 0 else 1.
+        return self._weighted_sum / weights_sum
 
     def _processing_calculation(self) -> float:
         return self._processing_buffer.get_last_value()
+
+    @property
+    def sampling_length(self) -> int:
+        return self._sampling_buffer.length
+
+    @sampling_length.setter
+    def sampling_length(self, value):
+        self._sampling_buffer.length = value
+        decay = self._decay
+        self._weighted_sum = 0.
+        for sample in self._sampling_buffer.get_window():
+            self._weighted_sum = decay * self._weighted_sum + sample
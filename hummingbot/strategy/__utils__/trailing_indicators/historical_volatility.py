@@ -1,18 +1,37 @@
-from .base_trailing_indicator import BaseTrailingIndicator
 import numpy as np
 
+from ..ring_buffer import RingBuffer
+from .base_trailing_indicator import BaseTrailingIndicator
+
 
 class HistoricalVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        # Log returns between the consecutive samples of the sampling buffer, whose running variance makes each
+        # calculation O(1) whatever the sampling length
+        self._log_returns = RingBuffer(max(sampling_length - 1, 1))
+
+    def add_sample(self, value: float):
+        if self._sampling_buffer.size > 0:
+            self._log_returns.add_value(np.log(float(value) / self._sampling_buffer.get_last_value()))
+        super().add_sample(value)
 
     def _indicator_calculation(self) -> float:
-        prices = self._sampling_buffer.get_as_numpy_array()
-        if prices.size > 0:
-            log_returns = np.diff(np.log(prices))
-            return np.var(log_returns)
+        if self._sampling_buffer.size > 1:
+            return self._log_returns.window_variance
+        # no return yet, as np.var of an empty diff
+        return np.nan
 
     def _processing_calculation(self) -> float:
         processing_array = self._processing_buffer.get_as_numpy_array()
         if processing_array.size > 0:
             return np.sqrt(np.mean(np.nan_to_num(processing_array)))
+
+    @property
+    def sampling_length(self) -> int:
+        return self._sampling_buffer.length
+
+    @sampling_length.setter
+    def sampling_length(self, value):
+        self._sampling_buffer.length = value
+        self._log_returns.length = max(value - 1, 1)
@@ -20,9 +20,14 @@ cdef class TradingIntensityIndicator:
         list _last_quotes
         int _sampling_length
         int _samples_length
+        object _price_levels
+        object _level_amounts
+        object _level_trades
+        bint _samples_changed
 
     cdef c_calculate(self, timestamp)
     cdef c_register_trade(self, object trade)
+    cdef c_add_trades(self, object price_levels, object amounts, int sign)
     cdef c_estimate_intensity(self)
 
 cdef class TradesForwarder(EventListener):
@@ -17,6 +17,9 @@ from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import OrderBookEvent
 from hummingbot.strategy.asset_price_delegate import AssetPriceDelegate
 
+# Coefficient of determination in log space from which the closed-form log-linear fit is used instead of curve_fit
+LOG_LINEAR_FIT_MIN_R2 = 0.99
+
 cdef class TradesForwarder(EventListener):
     def __init__(self, indicator: 'TradingIntensityIndicator'):
         self._indicator = indicator
@@ -39,6 +42,11 @@ cdef class TradingIntensityIndicator:
         self._sampling_length = sampling_length
         self._samples_length = 0
         self._last_quotes = []
+        # Amounts and number of trades by price level over the samples, sorted by price level
+        self._price_levels = np.empty(0, dtype=np.float64)
+        self._level_amounts = np.empty(0, dtype=np.float64)
+        self._level_trades = np.empty(0, dtype=np.int64)
+        self._samples_changed = False
 
         warnings.simplefilter("ignore", OptimizeWarning)
 
@@ -83,37 +91,53 @@ cdef class TradingIntensityIndicator:
         # Descending order of price-timestamp quotes
         self._last_quotes = [{'timestamp': timestamp, 'price': price}] + self._last_quotes
 
-        latest_processed_quote_idx = None
-        for trade in self._current_trade_sample:
-            for i, quote in enumerate(self._last_quotes):
-                if quote["timestamp"] < trade.timestamp:
-                    if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
-                        latest_processed_quote_idx = i
-                    trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
-
-                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
-                        self._trade_samples[quote["timestamp"] + 1] = []
-
-                    self._trade_samples[quote["timestamp"] + 1] += [trade]
-                    break
+        if len(self._current_trade_sample) > 0:
+            # Match every trade to the latest quote before it, quotes in ascending order
+            quotes_count = len(self._last_quotes)
+            quote_timestamps = np.fromiter((quote["timestamp"] for quote in reversed(self._last_quotes)),
+                                           dtype=np.float64, count=quotes_count)
+            quote_prices = np.fromiter((float(quote["price"]) for quote in reversed(self._last_quotes)),
+                                       dtype=np.float64, count=quotes_count)
+            trades_count = len(self._current_trade_sample)
+            trade_timestamps = np.fromiter((trade.timestamp for trade in self._current_trade_sample),
+                                           dtype=np.float64, count=trades_count)
+            trade_prices = np.fromiter((trade.price for trade in self._current_trade_sample),
+                                       dtype=np.float64, count=trades_count)
+            trade_amounts = np.fromiter((trade.amount for trade in self._current_trade_sample),
+                                        dtype=np.float64, count=trades_count)
+            quote_indexes = np.searchsorted(quote_timestamps, trade_timestamps, side="left") - 1
+            # Trades with no quote before them are dropped
+            matched = quote_indexes >= 0
+            if matched.any():
+                quote_indexes = quote_indexes[matched]
+                price_levels = np.abs(trade_prices[matched] - quote_prices[quote_indexes])
+                amounts = trade_amounts[matched]
+                sample_timestamps = quote_timestamps[quote_indexes] + 1
+                for sample_timestamp in np.unique(sample_timestamps):
+                    in_sample = sample_timestamps == sample_timestamp
+                    self.c_add_trades(price_levels[in_sample], amounts[in_sample], 1)
+                    sample_timestamp = float(sample_timestamp)
+                    if sample_timestamp in self._trade_samples:
+                        sample_levels, sample_amounts = self._trade_samples[sample_timestamp]
+                        self._trade_samples[sample_timestamp] = (
+                            np.concatenate([sample_levels, price_levels[in_sample]]),
+                            np.concatenate([sample_amounts, amounts[in_sample]]))
+                    else:
+                        self._trade_samples[sample_timestamp] = (price_levels[in_sample], amounts[in_sample])
+                # Store quotes that happened after the latest trade + one before
+                self._last_quotes = self._last_quotes[0:quotes_count - int(quote_indexes.max())]
 
         # THere are no trades left to process
         self._current_trade_sample = []
-        # Store quotes that happened after the latest trade + one before
-        if latest_processed_quote_idx is not None:
-            self._last_quotes = self._last_quotes[0:latest_processed_quote_idx + 1]
 
-        if len(self._trade_samples.keys()) > self._sampling_length:
-            timestamps = list(self._trade_samples.keys())
-            timestamps.sort()
-            timestamps = timestamps[-self._sampling_length:]
+        if len(self._trade_samples) > self._sampling_length:
+            timestamps = sorted(self._trade_samples.keys())
+            for sample_timestamp in timestamps[:-self._sampling_length]:
+                price_levels, amounts = self._trade_samples.pop(sample_timestamp)
+                self.c_add_trades(price_levels, amounts, -1)
 
-            trade_samples = {}
-            for timestamp in timestamps:
-                trade_samples[timestamp] = self._trade_samples[timestamp]
-            self._trade_samples = trade_samples
-
-        if self.is_sampling_buffer_full:
+        # Only re-fit when the sample changed since the last estimate
+        if self.is_sampling_buffer_full and self._samples_changed:
             self.c_estimate_intensity()
 
     def register_trade(self, trade):
@@ -123,33 +147,70 @@ cdef class TradingIntensityIndicator:
     cdef c_register_trade(self, object trade):
         self._current_trade_sample.append(trade)
 
+    cdef c_add_trades(self, object price_levels, object amounts, int sign):
+        """
+        Add (sign 1) or remove (sign -1) trades to the amounts traded by price level, kept sorted by price level.
+        """
+        levels, inverse = np.unique(price_levels, return_inverse=True)
+        amounts_by_level = np.bincount(inverse, weights=amounts, minlength=len(levels))
+        trades_by_level = np.bincount(inverse, minlength=len(levels))
+        if sign > 0:
+            all_levels = np.union1d(self._price_levels, levels)
+            level_amounts = np.zeros(len(all_levels), dtype=np.float64)
+            level_trades = np.zeros(len(all_levels), dtype=np.int64)
+            previous_indexes = np.searchsorted(all_levels, self._price_levels)
+            level_amounts[previous_indexes] = self._level_amounts
+            level_trades[previous_indexes] = self._level_trades
+            indexes = np.searchsorted(all_levels, levels)
+            level_amounts[indexes] += amounts_by_level
+            level_trades[indexes] += trades_by_level
+        else:
+            indexes = np.searchsorted(self._price_levels, levels)
+            level_amounts = self._level_amounts.copy()
+            level_trades = self._level_trades.copy()
+            level_amounts[indexes] -= amounts_by_level
+            level_trades[indexes] -= trades_by_level
+            # Levels left without trades are dropped rather than kept with a rounding residue
+            kept = level_trades > 0
+            all_levels = self._price_levels[kept]
+            level_amounts = level_amounts[kept]
+            level_trades = level_trades[kept]
+        self._price_levels = all_levels
+        self._level_amounts = level_amounts
+        self._level_trades = level_trades
+        self._samples_changed = True
+
     cdef c_estimate_intensity(self):
         cdef:
-            dict trades_consolidated
-            list lambdas
-            list price_levels
-
-        # Calculate lambdas / trading intensities
-        lambdas = []
-
-        trades_consolidated = {}
-        price_levels = []
-        for timestamp in self._trade_samples.keys():
-            tick = self._trade_samples[timestamp]
-            for trade in tick:
-                if trade['price_level'] not in trades_consolidated.keys():
-                    trades_consolidated[trade['price_level']] = 0
-                    price_levels += [trade['price_level']]
-
-                trades_consolidated[trade['price_level']] += trade['amount']
-
-        price_levels = sorted(price_levels, reverse=True)
+            int64_t levels_count = len(self._price_levels)
+            double weights_sum, x_mean, y_mean, sxx, slope, intercept, ss_tot, ss_res
 
-        for price_level in price_levels:
-            lambdas += [trades_consolidated[price_level]]
+        self._samples_changed = False
+        # Calculate lambdas / trading intensities, by descending price level
+        price_levels = self._price_levels[::-1]
+        lambdas = self._level_amounts[::-1]
 
         # Adjust to be able to calculate log
-        lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
+        lambdas_adj = np.where(lambdas == 0, 10**-10, lambdas)
+
+        # Closed-form fit of log(lambda) = log(alpha) - kappa * price_level, weighted by lambda ** 2 so that it
+        # approximates the least squares fit of lambda itself, kept if the sample is close enough to an exponential decay
+        if levels_count >= 2 and np.all(lambdas_adj > 0):
+            log_lambdas = np.log(lambdas_adj)
+            weights = np.square(lambdas_adj)
+            weights_sum = np.sum(weights)
+            x_mean = np.sum(weights * price_levels) / weights_sum
+            y_mean = np.sum(weights * log_lambdas) / weights_sum
+            sxx = np.sum(weights * np.square(price_levels - x_mean))
+            if sxx > 0:
+                slope = np.sum(weights * (price_levels - x_mean) * (log_lambdas - y_mean)) / sxx
+                intercept = y_mean - slope * x_mean
+                ss_tot = np.sum(weights * np.square(log_lambdas - y_mean))
+                ss_res = np.sum(weights * np.square(log_lambdas - intercept - slope * price_levels))
+                if slope <= 0 and (ss_tot == 0 or 1 - ss_res / ss_tot >= LOG_LINEAR_FIT_MIN_R2):
+                    self._alpha = np.exp(intercept)
+                    self._kappa = -slope
+                    return
 
         # Fit the probability density function; reuse previously calculated parameters as initial values
         try:
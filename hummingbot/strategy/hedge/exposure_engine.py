@@ -0,0 +1,94 @@
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+
+AMOUNT = 0
+OFFSET = 1
+PRICE = 2
+
+
+class ExposureEngine:
+    """
+    Keeps the amount, offset and mid price of every market pair of the hedge strategy in one Decimal matrix,
+    so that the net exposure of all hedge groups is evaluated in a single vectorized pass without losing precision.
+    A hedge group is a hedge market pair together with the market pairs trading the same pair, as in
+    HedgeStrategy.get_market_pair_by_asset: hedge pairs trading the same pair on different connectors each get the
+    exposure of all these market pairs. The caller feeds the current values of every market pair, update only writes
+    the columns that changed and reports which did.
+    """
+
+    def __init__(self, hedge_market_pairs: List[MarketTradingPairTuple], market_pairs: List[MarketTradingPairTuple]):
+        self._hedge_pairs = list(hedge_market_pairs)
+        self._pairs = self._hedge_pairs + list(market_pairs)
+        self._row_by_pair: Dict[MarketTradingPairTuple, int] = {pair: row for row, pair in enumerate(self._pairs)}
+        self._is_hedge = np.zeros(len(self._pairs), dtype=bool)
+        self._is_hedge[:len(self._hedge_pairs)] = True
+        # membership[group, row]: 1 if the market pair of the row is exposed in the hedge group
+        self._membership = np.array(
+            [[int(not is_hedge and pair.trading_pair == hedge_pair.trading_pair)
+              for pair, is_hedge in zip(self._pairs, self._is_hedge)]
+             for hedge_pair in self._hedge_pairs],
+            dtype=object,
+        ).reshape((len(self._hedge_pairs), len(self._pairs)))
+        self._data = np.full((len(self._pairs), 3), Decimal("0"), dtype=object)
+        self._data[:, PRICE] = Decimal("NaN")
+        # exposure that replaces the sum of a group's market pairs, e.g. GMX deltas; None when not set
+        self._external: List[Optional[Decimal]] = [None] * len(self._hedge_pairs)
+
+    @property
+    def hedge_pairs(self) -> List[MarketTradingPairTuple]:
+        return self._hedge_pairs
+
+    def update(self,
+               market_pair: MarketTradingPairTuple,
+               amount: Optional[Decimal] = None,
+               offset: Optional[Decimal] = None,
+               price: Optional[Decimal] = None) -> Tuple[bool, bool]:
+        """
+        Update the row of a market pair, None leaves a column untouched.
+        :return: whether the amount (offset included) changed, and whether the price changed.
+        """
+        row = self._data[self._row_by_pair[market_pair]]
+        amount_changed = price_changed = False
+        if amount is not None and row[AMOUNT] != amount:
+            row[AMOUNT] = amount
+            amount_changed = True
+        if offset is not None and row[OFFSET] != offset:
+            row[OFFSET] = offset
+            amount_changed = True
+        if price is not None and not (row[PRICE] == price or (row[PRICE].is_nan() and price.is_nan())):
+            row[PRICE] = price
+            price_changed = True
+        return amount_changed, price_changed
+
+    def set_external_amount(self, hedge_pair: MarketTradingPairTuple, amount: Optional[Decimal]) -> None:
+        """
+        Override the exposure of a hedge group, None reverts to the sum of its market pairs.
+        """
+        self._external[self._row_by_pair[hedge_pair]] = amount
+
+    def base_amounts(self) -> np.ndarray:
+        return self._data[:, AMOUNT] + self._data[:, OFFSET]
+
+    def base_values(self) -> np.ndarray:
+        return self.base_amounts() * self._data[:, PRICE]
+
+    def net_amounts(self, hedge_ratio: Decimal) -> np.ndarray:
+        """
+        Net amount to hedge of every hedge group: exposure * hedge_ratio + hedge amount, in hedge_pairs order.
+        """
+        amounts = self.base_amounts()
+        exposure = self._membership @ amounts
+        exposure = np.array([exposure[group] if external is None else external
+                             for group, external in enumerate(self._external)], dtype=object)
+        return exposure * hedge_ratio + amounts[self._is_hedge]
+
+    def total_and_hedge_value(self) -> Tuple[Decimal, Decimal]:
+        """
+        Value mode: total value of all market pairs, and value of the first hedge pair.
+        """
+        values = self.base_values()
+        return Decimal(values[~self._is_hedge].sum()), values[0]
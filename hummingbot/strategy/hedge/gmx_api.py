@@ -1,13 +1,17 @@
 import asyncio
-import itertools
+import collections
 import json
 import urllib
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 import pandas as pd
 from eth_typing import Address
 from web3 import Web3
 
-from hummingbot.strategy.hedge.gmx_hedge_utils import async_wrap, myUtcNow, reform_dict, semaphore_safe_gather
+from hummingbot.strategy.hedge.gmx_hedge_utils import myUtcNow, reform_dict, semaphore_safe_gather
+from hummingbot.strategy.hedge.gmx_multicall import GmxMulticall, MulticallRead
+from hummingbot.strategy.hedge.gmx_rpc import GmxRpcClient
+from hummingbot.strategy.hedge.gmx_state_stream import GmxStateStream
 
 
 class GmxAPI:
@@ -28,13 +32,19 @@ class GmxAPI:
     vGLPAdd = Address('0x62331A7Bd1dfB3A7642B7db50B5509E57CA3154A')
     vGLPABI = """[{"inputs": [{"internalType": "string", "name": "_name", "type": "string"}, {"internalType": "string", "name": "_symbol", "type": "string"}, {"internalType": "uint256", "name": "_vestingDuration", "type": "uint256"}, {"internalType": "address", "name": "_esToken", "type": "address"}, {"internalType": "address", "name": "_pairToken", "type": "address"}, {"internalType": "address", "name": "_claimableToken", "type": "address"}, {"internalType": "address", "name": "_rewardTracker", "type": "address"}], "stateMutability": "nonpayable", "type": "constructor"}, {"anonymous": false, "inputs": [{"indexed": true, "internalType": "address", "name": "owner", "type": "address"}, {"indexed": true, "internalType": "address", "name": "spender", "type": "address"}, {"indexed": false, "internalType": "uint256", "name": "value", "type": "uint256"}], "name": "Approval", "type": "event"}, {"anonymous": false, "inputs": [{"indexed": false, "internalType": "address", "name": "receiver", "type": "address"}, {"indexed": false, "internalType": "uint256", "name": "amount", "type": "uint256"}], "name": "Claim", "type": "event"}, {"anonymous": false, "inputs": [{"indexed": false, "internalType": "address", "name": "account", "type": "address"}, {"indexed": false, "internalType": "uint256", "name": "amount", "type": "uint256"}], "name": "Deposit", "type": "event"}, {"anonymous": false, "inputs": [{"indexed": true, "internalType": "address", "name": "from", "type": "address"}, {"indexed": true, "internalType": "address", "name": "to", "type": "address"}, {"indexed": false, "internalType": "uint256", "name": "value", "type": "uint256"}], "name": "PairTransfer", "type": "event"}, {"anonymous": false, "inputs": [{"indexed": true, "internalType": "address", "name": "from", "type": "address"}, {"indexed": true, "internalType": "address", "name": "to", "type": "address"}, {"indexed": false, "internalType": "uint256", "name": "value", "type": "uint256"}], "name": "Transfer", "type": "event"}, {"anonymous": false, "inputs": [{"indexed": false, "internalType": "address", "name": "account", "type": "address"}, {"indexed": false, "internalType": "uint256", "name": "claimedAmount", "type": "uint256"}, {"indexed": false, "internalType": "uint256", "name": "balance", "type": "uint256"}], "name": "Withdraw", "type": "event"}, {"inputs": [{"internalType": "address", "name": "", "type": "address"}, {"internalType": "address", "name": "", "type": "address"}], "name": "allowance", "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}], "stateMutability": "view", "type": "function"}, {"inputs": [{"internalType": "address", "name": "", "type": "address"}, {"internalType": "uint256", "name": "", "type": "uint256"}], "name": "approve", "outputs": [{"internalType": "bool", "name": "", "type": "bool"}], "stateMutability": "nonpayable", "type": "function"}, {"inputs": [{"internalType": "address", "name": "_account", "type": "address"}], "name": "balanceOf", "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}], "stateMutability": "view", "type": "function"}, {"inputs": [{"internalType": "address", "name": "", "type": "address"}], "name": "balances", "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}], "stateMutability": "view", "type": "function"}, {"inputs": [{"internalType": "address", "name": "", "type": "address"}], "name": "bonusRewards", "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}], "stateMutability": "view", "type": "function"}, {"inputs": [], "name": "claim", "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}], "stateMutability": "nonpayable", "type": "function"}, {"inputs": [{"internalType": "address", "name": "_account", "type": "address"}, {"internalType": "address", "name": "_receiver", "type": "address"}], "name": "claimForAccount", "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}], "stateMutability": "nonpayable", "type": "function"}, {"inputs": [{"internalType": "address", "name": "_account", "type": "address"}], "name": "claimable", "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}], "stateMutability": "view", "type": "function"}, {"inputs": [], "name": "claimableToken", "outputs": [{"internalType": "address", "name": "", "type": "address"}], "stateMutability": "view", "type": "function"}, {"inputs": [{"internalType": "address", "name": "", "type": "address"}], "name": "claimedAmounts", "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}], "stateMutability": "view", "type": "function"}, {"inputs": [{"internalType": "address", "name": "", "type": "address"}], "name": "cumulativeClaimAmounts", "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}], "stateMutability": "view", "type": "function"}, {"inputs": [{"internalType": "address", "name": "", "type": "address"}], "name": "cumulativeRewardDeductions", "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}], "stateMutability": "view", "type": "function"}, {"inputs": [], "name": "decimals", "outputs": [{"internalType": "uint8", "name": "", "type": "uint8"}], "stateMutability": "view", "type": "function"}, {"inputs": [{"internalType": "uint256", "name": "_amount", "type": "uint256"}], "name": "deposit", "outputs": [], "stateMutability": "nonpayable", "type": "function"}, {"inputs": [{"internalType": "address", "name": "_account", "type": "address"}, {"internalType": "uint256", "name": "_amount", "type": "uint256"}], "name": "depositForAccount", "outputs": [], "stateMutability": "nonpayable", "type": "function"}, {"inputs": [], "name": "esToken", "outputs": [{"internalType": "address", "name": "", "type": "address"}], "stateMutability": "view", "type": "function"}, {"inputs": [{"internalType": "address", "name": "_account", "type": "address"}], "name": "getCombinedAverageStakedAmount", "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}], "stateMutability": "view", "type": "function"}, {"inputs": [{"internalType": "address", "name": "_account", "type": "address"}], "name": "getMaxVestableAmount", "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}], "stateMutability": "view", "type": "function"}, {"inputs": [{"internalType": "address", "name": "_account", "type": "address"}, {"internalType": "uint256", "name": "_esAmount", "type": "uint256"}], "name": "getPairAmount", "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}], "stateMutability": "view", "type": "function"}, {"inputs": [{"internalType": "address", "name": "_account", "type": "address"}], "name": "getTotalVested", "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}], "stateMutability": "view", "type": "function"}, {"inputs": [{"internalType": "address", "name": "_account", "type": "address"}], "name": "getVestedAmount", "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}], "stateMutability": "view", "type": "function"}, {"inputs": [], "name": "gov", "outputs": [{"internalType": "address", "name": "", "type": "address"}], "stateMutability": "view", "type": "function"}, {"inputs": [], "name": "hasMaxVestableAmount", "outputs": [{"internalType": "bool", "name": "", "type": "bool"}], "stateMutability": "view", "type": "function"}, {"inputs": [], "name": "hasPairToken", "outputs": [{"internalType": "bool", "name": "", "type": "bool"}], "stateMutability": "view", "type": "function"}, {"inputs": [], "name": "hasRewardTracker", "outputs": [{"internalType": "bool", "name": "", "type": "bool"}], "stateMutability": "view", "type": "function"}, {"inputs": [{"internalType": "address", "name": "", "type": "address"}], "name": "isHandler", "outputs": [{"internalType": "bool", "name": "", "type": "bool"}], "stateMutability": "view", "type": "function"}, {"inputs": [{"internalType": "address", "name": "", "type": "address"}], "name": "lastVestingTimes", "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}], "stateMutability": "view", "type": "function"}, {"inputs": [], "name": "name", "outputs": [{"internalType": "string", "name": "", "type": "string"}], "stateMutability": "view", "type": "function"}, {"inputs": [{"internalType": "address", "name": "", "type": "address"}], "name": "pairAmounts", "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}], "stateMutability": "view", "type": "function"}, {"inputs": [], "name": "pairSupply", "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}], "stateMutability": "view", "type": "function"}, {"inputs": [], "name": "pairToken", "outputs": [{"internalType": "address", "name": "", "type": "address"}], "stateMutability": "view", "type": "function"}, {"inputs": [], "name": "rewardTracker", "outputs": [{"internalType": "address", "name": "", "type": "address"}], "stateMutability": "view", "type": "function"}, {"inputs": [{"internalType": "address", "name": "_account", "type": "address"}, {"internalType": "uint256", "name": "_amount", "type": "uint256"}], "name": "setBonusRewards", "outputs": [], "stateMutability": "nonpayable", "type": "function"}, {"inputs": [{"internalType": "address", "name": "_account", "type": "address"}, {"internalType": "uint256", "name": "_amount", "type": "uint256"}], "name": "setCumulativeRewardDeductions", "outputs": [], "stateMutability": "nonpayable", "type": "function"}, {"inputs": [{"internalType": "address", "name": "_gov", "type": "address"}], "name": "setGov", "outputs": [], "stateMutability": "nonpayable", "type": "function"}, {"inputs": [{"internalType": "address", "name": "_handler", "type": "address"}, {"internalType": "bool", "name": "_isActive", "type": "bool"}], "name": "setHandler", "outputs": [], "stateMutability": "nonpayable", "type": "function"}, {"inputs": [{"internalType": "bool", "name": "_hasMaxVestableAmount", "type": "bool"}], "name": "setHasMaxVestableAmount", "outputs": [], "stateMutability": "nonpayable", "type": "function"}, {"inputs": [{"internalType": "address", "name": "_account", "type": "address"}, {"internalType": "uint256", "name": "_amount", "type": "uint256"}], "name": "setTransferredAverageStakedAmounts", "outputs": [], "stateMutability": "nonpayable", "type": "function"}, {"inputs": [{"internalType": "address", "name": "_account", "type": "address"}, {"internalType": "uint256", "name": "_amount", "type": "uint256"}], "name": "setTransferredCumulativeRewards", "outputs": [], "stateMutability": "nonpayable", "type": "function"}, {"inputs": [], "name": "symbol", "outputs": [{"internalType": "string", "name": "", "type": "string"}], "stateMutability": "view", "type": "function"}, {"inputs": [], "name": "totalSupply", "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}], "stateMutability": "view", "type": "function"}, {"inputs": [{"internalType": "address", "name": "", "type": "address"}, {"internalType": "uint256", "name": "", "type": "uint256"}], "name": "transfer", "outputs": [{"internalType": "bool", "name": "", "type": "bool"}], "stateMutability": "nonpayable", "type": "function"}, {"inputs": [{"internalType": "address", "name": "", "type": "address"}, {"internalType": "address", "name": "", "type": "address"}, {"internalType": "uint256", "name": "", "type": "uint256"}], "name": "transferFrom", "outputs": [{"internalType": "bool", "name": "", "type": "bool"}], "stateMutability": "nonpayable", "type": "function"}, {"inputs": [{"internalType": "address", "name": "_sender", "type": "address"}, {"internalType": "address", "name": "_receiver", "type": "address"}], "name": "transferStakeValues", "outputs": [], "stateMutability": "nonpayable", "type": "function"}, {"inputs": [{"internalType": "address", "name": "", "type": "address"}], "name": "transferredAverageStakedAmounts", "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}], "stateMutability": "view", "type": "function"}, {"inputs": [{"internalType": "address", "name": "", "type": "address"}], "name": "transferredCumulativeRewards", "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}], "stateMutability": "view", "type": "function"}, {"inputs": [], "name": "vestingDuration", "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}], "stateMutability": "view", "type": "function"}, {"inputs": [], "name": "withdraw", "outputs": [], "stateMutability": "nonpayable", "type": "function"}, {"inputs": [{"internalType": "address", "name": "_token", "type": "address"}, {"internalType": "address", "name": "_account", "type": "address"}, {"internalType": "uint256", "name": "_amount", "type": "uint256"}], "name": "withdrawToken", "outputs": [], "stateMutability": "nonpayable", "type": "function"}]"""
 
-    w3 = Web3(Web3.HTTPProvider("https://api.avax.network/ext/bc/C/rpc", request_kwargs={'timeout': 5}))
-
-    vault = w3.eth.contract(abi=VaultABI, address=VaultAdd).functions
-    glp = w3.eth.contract(abi=GLPABI, address=GLPAdd).functions
-    glp_manager = w3.eth.contract(abi=GLPManagerABI, address=GLPManagerAdd).functions
-    reward_tracker = w3.eth.contract(abi=RewardTrackerABI, address=RewardTrackerAdd).functions
-    esGMXReward = w3.eth.contract(abi=esGMXRewardABI, address=esGMXRewardAdd).functions
+    # only used to encode calls and decode results: all I/O goes through the asyncio GmxRpcClient
+    w3 = Web3()
+
+    vault_contract = w3.eth.contract(abi=VaultABI, address=VaultAdd)
+    glp_contract = w3.eth.contract(abi=GLPABI, address=GLPAdd)
+    glp_manager_contract = w3.eth.contract(abi=GLPManagerABI, address=GLPManagerAdd)
+    reward_tracker_contract = w3.eth.contract(abi=RewardTrackerABI, address=RewardTrackerAdd)
+    esGMXReward_contract = w3.eth.contract(abi=esGMXRewardABI, address=esGMXRewardAdd)
+    vault = vault_contract.functions
+    glp = glp_contract.functions
+    glp_manager = glp_manager_contract.functions
+    reward_tracker = reward_tracker_contract.functions
+    esGMXReward = esGMXReward_contract.functions
     reward_router = w3.eth.contract(abi=RewardRouterABI, address=RewardRouterAdd).functions
     vGMX = w3.eth.contract(abi=vGMXABI, address=vGMXAdd).functions
     vGLP = w3.eth.contract(abi=vGLPABI, address=vGLPAdd).functions
@@ -59,9 +69,11 @@ class GmxAPI:
     #         self.lastIncreasedTime = lastIncreasedTime
 
     class State:
-        def __init__(self, parameters, logger=None):
+        def __init__(self, parameters, rpc: GmxRpcClient = None, logger=None):
             self.gmx_wallet = parameters.gmx_wallet
             self.logger = logger
+            self.rpc = rpc if rpc is not None else GmxRpcClient(getattr(parameters, 'gmx_rpc_endpoints', None), logger=logger)
+            self.multicall = GmxMulticall(GmxAPI.w3, self.rpc, logger=logger)
 
             self.poolAmounts = {key: 0 for key in GmxAPI.static}
             self.tokenBalances = {key: 0 for key in GmxAPI.static}
@@ -77,8 +89,13 @@ class GmxAPI:
 
             self.totalSupply: dict[str, float] = {'total': 0}
             self.actualAum: dict[str, float] = {'total': 0}
+            self.aumInUsdg: dict[str, float] = {'total': 0}
             self.rewards: dict[str, float] = {'total': 0}
+            self.stakedAmounts: dict[str, float] = {'GLP': 0}
             self.check = {key: dict() for key in GmxAPI.static}
+            self.timestamp = None
+            self.block_number = None
+            self.version = 0
 
         def valuation(self, key=None) -> float:
             if key is None:
@@ -144,75 +161,83 @@ class GmxAPI:
         def sanity_check(self):
             return abs(self.valuation() * self.totalSupply['total'] / self.actualAum['total'] - 1) < GmxAPI.check_tolerance
 
-        async def reconcile(self) -> None:
-            def read_contracts(address, decimal, volatile):
-                coros = []
-                coros.append(
-                    async_wrap(lambda x: float(GmxAPI.vault.tokenBalances(address).call()) / decimal)(
-                        None))
-                coros.append(
-                    async_wrap(lambda x: float(GmxAPI.vault.poolAmounts(address).call()) / decimal)(
-                        None))
-                coros.append(
-                    async_wrap(lambda x: float(GmxAPI.vault.usdgAmounts(address).call()) / decimal)(
-                        None))
-                coros.append(
-                    async_wrap(lambda x: float(GmxAPI.vault.getMaxPrice(address).call() / 1e30))(None))
-                coros.append(
-                    async_wrap(lambda x: float(GmxAPI.vault.getMinPrice(address).call() / 1e30))(None))
-                coros.append(async_wrap(
-                    lambda x: (
-                        float(GmxAPI.vault.guaranteedUsd(address).call()) / 1e30 if volatile else None))(
-                    None))
-                coros.append(async_wrap(lambda x: (
-                    float(
-                        GmxAPI.vault.reservedAmounts(address).call()) / decimal if volatile else None))(
-                    None))
-                coros.append(async_wrap(
-                    lambda x: (
-                        float(GmxAPI.vault.globalShortSizes(
-                            address).call()) / 1e30 if volatile else None))(
-                    None))
-                coros.append(async_wrap(lambda x: (
-                    float(GmxAPI.vault.globalShortAveragePrices(
-                        address).call()) / 1e30 if volatile else None))(
-                    None))
-                coros.append(async_wrap(
-                    lambda x: (
-                        float(
-                            GmxAPI.vault.feeReserves(address).call()) / decimal if volatile else None))(
-                    None))
-                return coros
-
-            coros = []
-            for key, data in GmxAPI.static.items():
-                coros += read_contracts(data['address'], data['decimal'], data['volatile'])
-
-            # result.positions = GLPState.contract_vault.functions.positions().call()
-            coros.append(async_wrap(lambda x: GmxAPI.glp.totalSupply().call() / 1e18)(None))
-            coros.append(async_wrap(lambda x: GmxAPI.glp_manager.getAumInUsdg(
-                False).call() / GmxAPI.glp.totalSupply().call())(None))
+        functions_list = ['tokenBalances', 'poolAmounts', 'usdgAmounts', 'pricesUp', 'pricesDown', 'guaranteedUsd',
+                          'reservedAmounts', 'globalShortSizes', 'globalShortAveragePrices', 'feeReserves']
+
+        def price_reads(self, key: str) -> List[MulticallRead]:
+            address = GmxAPI.static[key]['address']
+            return [MulticallRead('pricesUp', key, GmxAPI.vault_contract, 'getMaxPrice', (address,), lambda x: float(x / 1e30)),
+                    MulticallRead('pricesDown', key, GmxAPI.vault_contract, 'getMinPrice', (address,), lambda x: float(x / 1e30))]
+
+        def token_reads(self, key: str) -> List[MulticallRead]:
+            '''all vault getters of a token, prices included'''
+            vault = GmxAPI.vault_contract
+            address, decimal, volatile = GmxAPI.static[key]['address'], GmxAPI.static[key]['decimal'], GmxAPI.static[key]['volatile']
+            reads = [MulticallRead('tokenBalances', key, vault, 'tokenBalances', (address,), lambda x, d=decimal: float(x) / d),
+                     MulticallRead('poolAmounts', key, vault, 'poolAmounts', (address,), lambda x, d=decimal: float(x) / d),
+                     MulticallRead('usdgAmounts', key, vault, 'usdgAmounts', (address,), lambda x, d=decimal: float(x) / d)]
+            reads += self.price_reads(key)
+            if volatile:
+                reads += [MulticallRead('guaranteedUsd', key, vault, 'guaranteedUsd', (address,), lambda x: float(x) / 1e30),
+                          MulticallRead('reservedAmounts', key, vault, 'reservedAmounts', (address,), lambda x, d=decimal: float(x) / d),
+                          MulticallRead('globalShortSizes', key, vault, 'globalShortSizes', (address,), lambda x: float(x) / 1e30),
+                          MulticallRead('globalShortAveragePrices', key, vault, 'globalShortAveragePrices', (address,), lambda x: float(x) / 1e30),
+                          MulticallRead('feeReserves', key, vault, 'feeReserves', (address,), lambda x, d=decimal: float(x) / d)]
+            return reads
+
+        def global_reads(self) -> List[MulticallRead]:
+            '''GLP supply and AUM, and the wallet's rewards and stake'''
+            return [MulticallRead('totalSupply', 'total', GmxAPI.glp_contract, 'totalSupply', (), lambda x: x / 1e18),
+                    MulticallRead('aumInUsdg', 'total', GmxAPI.glp_manager_contract, 'getAumInUsdg', (False,), lambda x: x / 1e18),
+                    MulticallRead('rewards', 'WAVAX', GmxAPI.reward_tracker_contract, 'claimable', (self.gmx_wallet,), lambda x: x / 1e18),
+                    MulticallRead('rewards', 'esGMX', GmxAPI.esGMXReward_contract, 'claimableReward', (self.gmx_wallet,), lambda x: x / 1e18),
+                    MulticallRead('stakedAmounts', 'GLP', GmxAPI.reward_tracker_contract, 'stakedAmounts', (self.gmx_wallet,), lambda x: x / 1e18)]
+
+        def contract_reads(self) -> List[MulticallRead]:
+            '''every read making up a snapshot, shared by the multicall and the per-call paths'''
+            reads = []
+            for key in GmxAPI.static:
+                reads += self.token_reads(key)
+            return reads + self.global_reads()
+
+        async def read_per_call(self, reads: List[MulticallRead]) -> Dict[Tuple[str, str], Any]:
+            '''fallback: one eth_call per read, throttled by semaphore_safe_gather_limit'''
+            coros = [self.multicall.call(read) for read in reads]
+            results_values = await semaphore_safe_gather(coros, semaphore=asyncio.Semaphore(GmxAPI.semaphore_safe_gather_limit))
+            return {(read.attribute, read.key): value for read, value in zip(reads, results_values)}
+
+        async def read(self, reads: List[MulticallRead], block_number: Optional[int] = None) -> Tuple[Dict[Tuple[str, str], Any], Optional[int]]:
+            '''
+            multicall at block_number (latest if None), falling back to per-call reads.
+            returns results and the block they were read at, None for the fallback.
+            '''
+            try:
+                if block_number is None:
+                    block_number = await self.multicall.block_number()
+                return await self.multicall.aggregate(reads, block_identifier=block_number), block_number
+            except Exception as e:
+                self.logger.warning(f"multicall reconcile failed, falling back to per-call reads: {str(e)}")
+                return await self.read_per_call(reads), None
+
+        def apply(self, results: Dict[Tuple[str, str], Any], timestamp: float, block_number: Optional[int]) -> None:
+            '''
+            merges (possibly partial) read results into the state and bumps its version.
+            attributes are replaced, never mutated, so shallow copies of a State are consistent snapshots.
+            '''
+            for function in GmxAPI.State.functions_list + ['totalSupply', 'aumInUsdg', 'rewards', 'stakedAmounts']:
+                updates = {key: value for (attribute, key), value in results.items() if attribute == function}
+                if updates:
+                    setattr(self, function, {**getattr(self, function), **updates})
+            if self.totalSupply['total']:
+                self.actualAum = {'total': self.aumInUsdg['total'] / self.totalSupply['total']}
+            self.timestamp = timestamp
+            self.block_number = block_number
+            self.version += 1
 
+        async def reconcile(self) -> None:
             time0 = myUtcNow()
-            results_values = await semaphore_safe_gather(coros, semaphore=asyncio.Semaphore(GmxAPI.semaphore_safe_gather_limit))  # IT'S CRUCIAL TO MAINTAIN ORDER....
-            self.timestamp = 0.5 * (myUtcNow() + time0)
-
-            functions_list = ['tokenBalances', 'poolAmounts', 'usdgAmounts', 'pricesUp', 'pricesDown', 'guaranteedUsd',
-                              'reservedAmounts', 'globalShortSizes', 'globalShortAveragePrices', 'feeReserves']
-
-            results = {(function, token): results_values[i] for i, (token, function) in
-                       enumerate(itertools.product(GmxAPI.static.keys(), functions_list))}
-            results = {**results, **{('totalSupply', 'total'): results_values[-2],
-                                     ('actualAum', 'total'): results_values[-1],
-                                     ('rewards', 'WAVAX'): GmxAPI.reward_tracker.claimable(self.gmx_wallet).call() / 1e18,
-                                     ('rewards', 'esGMX'): GmxAPI.esGMXReward.claimableReward(self.gmx_wallet).call() / 1e18}}
-
-            for function in functions_list:
-                setattr(self, function, {key: results[(function, key)] for key in GmxAPI.static})
-            self.totalSupply = {'total': results[('totalSupply', 'total')]}
-            self.actualAum = {'total': results[('actualAum', 'total')]}
-            self.rewards = {'WAVAX': results[('rewards', 'WAVAX')],
-                            'esGMX': results[('rewards', 'esGMX')]}
+            results, block_number = await self.read(self.contract_reads())
+            self.apply(results, 0.5 * (myUtcNow() + time0), block_number)
             if False:
                 self.add_weights()
                 pd.DataFrame(index=[self.state.timestamp],
@@ -228,7 +253,8 @@ class GmxAPI:
             return result
 
         def depositBalances(self):
-            feeGlp = GmxAPI.reward_tracker.stakedAmounts(self.gmx_wallet).call() / 1e18
+            '''as of the last reconcile, so that it can be called from the clock thread'''
+            feeGlp = self.stakedAmounts['GLP']
             # feeGmx = GmxAPI.reward_tracker.depositBalances(self.gmx_wallet,GmxAPI.feeGmxTracker).call() / 1e18
             return feeGlp
 
@@ -237,8 +263,10 @@ class GmxAPI:
         self.parameters = parameters
         self.logger = logger
         self.timestamp = None
-        self.state = GmxAPI.State(parameters, logger=logger)
-        self.pnlexplain: list[dict] = []  # collections.deque(maxlen=GmxAPI.cache_size)
+        self.rpc = GmxRpcClient(getattr(parameters, 'gmx_rpc_endpoints', None), logger=logger)
+        self.state = GmxAPI.State(parameters, rpc=self.rpc, logger=logger)
+        self.stream = GmxStateStream(self, logger=logger)
+        self.pnlexplain: Deque[dict] = collections.deque(maxlen=GmxAPI.cache_size)  # only the last row is needed for the diff
         try:
             self.stake_vault = None  # TODO: VaultEthereumWallet(wallet_id='gmx_hedged')
         except Exception:
@@ -252,10 +280,20 @@ class GmxAPI:
         self.timestamp = self.state.timestamp
         myUtcNow(return_type='datetime')
 
+    def publish(self, state: 'GmxAPI.State') -> None:
+        '''swaps in a new snapshot, consumers read gmx_api.state'''
+        self.state = state
+        self.timestamp = state.timestamp
+
+    async def close(self) -> None:
+        self.stream.stop()
+        await self.rpc.close()
+
     def serialize(self) -> dict:
         return self.state.serialize()
 
-    def compile_pnlexplain(self, do_calcs=True, flatten_dict=False):  # -> list[dict[str, typing.Any]]:
+    def compile_pnlexplain(self, do_calcs=True, flatten_dict=False) -> Dict[str, Dict[str, Any]]:
+        '''computes the new pnl explain row against the previous one, keeps it in the bounded window and returns it'''
         # venue_api already reconciled by reconcile()
         current = self.serialize()
 
@@ -310,4 +348,4 @@ class GmxAPI:
                 current['tx_cost']['total'] = sum(current['tx_cost'].values()) - 2 * float(self.parameters.hedge_tx_cost) * current['actualAum']['total']
 
         self.pnlexplain.append(current)
-        return self.pnlexplain
+        return current
@@ -0,0 +1,75 @@
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from eth_typing import Address
+from web3 import Web3
+from web3.contract import Contract
+
+from hummingbot.strategy.hedge.gmx_rpc import GmxRpcClient
+
+
+class MulticallRead(NamedTuple):
+    """
+    One contract read to be batched: the result ends up in State.<attribute>[key] after transform.
+    """
+    attribute: str
+    key: str
+    contract: Contract
+    fn_name: str
+    args: Tuple
+    transform: Callable[[Any], Any]
+
+
+class GmxMulticall:
+    """
+    Packs many view calls into Multicall3 tryAggregate calls, all pinned to the same block number,
+    so that a State snapshot costs a handful of eth_call instead of one per getter.
+    """
+    # Multicall3 is deployed at the same address on every EVM chain, Avalanche C-chain included.
+    MulticallAdd = Address('0xcA11bde05977b3631167028862bE2a173976CA11')
+    MulticallABI = """[{"inputs": [{"internalType": "bool", "name": "requireSuccess", "type": "bool"}, {"components": [{"internalType": "address", "name": "target", "type": "address"}, {"internalType": "bytes", "name": "callData", "type": "bytes"}], "internalType": "struct Multicall3.Call[]", "name": "calls", "type": "tuple[]"}], "name": "tryAggregate", "outputs": [{"components": [{"internalType": "bool", "name": "success", "type": "bool"}, {"internalType": "bytes", "name": "returnData", "type": "bytes"}], "internalType": "struct Multicall3.Result[]", "name": "returnData", "type": "tuple[]"}], "stateMutability": "payable", "type": "function"}, {"inputs": [], "name": "getBlockNumber", "outputs": [{"internalType": "uint256", "name": "blockNumber", "type": "uint256"}], "stateMutability": "view", "type": "function"}]"""
+    max_calls_per_batch = 100
+
+    def __init__(self, w3: Web3, rpc: GmxRpcClient, logger=None):
+        self.w3 = w3
+        self.rpc = rpc
+        self.logger = logger
+        self.multicall = w3.eth.contract(abi=GmxMulticall.MulticallABI, address=GmxMulticall.MulticallAdd)
+
+    @staticmethod
+    def encode(read: MulticallRead) -> Tuple[str, str]:
+        return read.contract.address, read.contract.encodeABI(fn_name=read.fn_name, args=list(read.args))
+
+    def decode(self, read: MulticallRead, return_data: bytes) -> Any:
+        fn_abi = read.contract.get_function_by_name(read.fn_name).abi
+        output_types = [output['type'] for output in fn_abi['outputs']]
+        decoded = self.w3.codec.decode_abi(output_types, return_data)
+        return read.transform(decoded[0] if len(decoded) == 1 else decoded)
+
+    async def block_number(self) -> int:
+        return await self.rpc.block_number()
+
+    async def call(self, read: MulticallRead, block_identifier: Union[int, str] = "latest") -> Any:
+        '''single read, used by the per-call fallback'''
+        to, data = self.encode(read)
+        return self.decode(read, await self.rpc.eth_call(to, data, block_identifier))
+
+    async def aggregate(self, reads: List[MulticallRead], block_identifier: Optional[int] = None) -> Dict[Tuple[str, str], Any]:
+        '''
+        runs all reads in ceil(len(reads) / max_calls_per_batch) eth_call, all at block_identifier.
+        raises ValueError if any individual read reverted, so the caller can fall back to plain calls.
+        '''
+        if block_identifier is None:
+            block_identifier = await self.block_number()
+        results = {}
+        for start in range(0, len(reads), GmxMulticall.max_calls_per_batch):
+            batch = reads[start:start + GmxMulticall.max_calls_per_batch]
+            calls = [self.encode(read) for read in batch]
+            data = self.multicall.encodeABI(fn_name='tryAggregate', args=[False, calls])
+            raw = await self.rpc.eth_call(self.multicall.address, data, block_identifier)
+            return_data = self.w3.codec.decode_abi(['(bool,bytes)[]'], raw)[0]
+            failed = [(read.fn_name, read.key) for read, (success, _) in zip(batch, return_data) if not success]
+            if failed:
+                raise ValueError(f"multicall reads reverted at block {block_identifier}: {failed}")
+            for read, (_, data) in zip(batch, return_data):
+                results[(read.attribute, read.key)] = self.decode(read, data)
+        return results
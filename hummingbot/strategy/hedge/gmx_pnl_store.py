@@ -0,0 +1,68 @@
+import asyncio
+import csv
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+
+
+class GmxPnlExplainStore:
+    """
+    Append-only sink for GmxAPI.compile_pnlexplain rows.
+    Rows are stored in long format (timestamp, metric, key, value) so that the header never changes and each
+    hedge interval only appends the new row instead of rewriting the whole history.
+    The wide gmx_pnl.csv the hedge strategy used to rewrite can't be appended to, so the rows go to their own
+    file (see file_name); a file with another header is refused rather than mixed with long rows.
+    File I/O happens on a dedicated writer thread; rows queued while a write is in flight are written by the same
+    task, so the file stays in timestamp order.
+    """
+    file_name = "gmx_pnl_explain.csv"
+    header = ["timestamp", "metric", "key", "value"]
+
+    def __init__(self, path: str):
+        self._path = path
+        self._pending: List[Tuple[Any, str, str, Any]] = []
+        self._write_task: Optional[asyncio.Task] = None
+        self._writer: Optional[ThreadPoolExecutor] = None
+        if os.path.exists(path):
+            with open(path, newline="") as f:
+                file_header = next(csv.reader(f), GmxPnlExplainStore.header)
+            if file_header != GmxPnlExplainStore.header:
+                raise ValueError(f"{path} is not a long format PnL explain file, its header is {file_header}.")
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @staticmethod
+    def to_records(timestamp: float, row: Dict[str, Dict[str, Any]]) -> List[Tuple[Any, str, str, Any]]:
+        return [(timestamp, metric, key, value)
+                for metric, values in row.items()
+                for key, value in values.items()]
+
+    def append(self, timestamp: float, row: Dict[str, Dict[str, Any]]) -> None:
+        self._pending.extend(self.to_records(timestamp, row))
+        if self._write_task is None or self._write_task.done():
+            self._write_task = safe_ensure_future(self._flush())
+
+    async def _flush(self) -> None:
+        loop = asyncio.get_event_loop()
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gmx_pnl_store")
+        while len(self._pending) > 0:
+            records, self._pending = self._pending, []
+            await loop.run_in_executor(self._writer, self._write, records)
+
+    async def wait_written(self) -> None:
+        if self._write_task is not None:
+            await self._write_task
+
+    def _write(self, records: List[Tuple[Any, str, str, Any]]) -> None:
+        os.makedirs(os.path.dirname(self._path) or ".", exist_ok=True)
+        new_file = not os.path.exists(self._path) or os.path.getsize(self._path) == 0
+        with open(self._path, "a", newline="") as f:
+            writer = csv.writer(f)
+            if new_file:
+                writer.writerow(GmxPnlExplainStore.header)
+            writer.writerows(records)
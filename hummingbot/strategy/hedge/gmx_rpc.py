@@ -0,0 +1,83 @@
+import asyncio
+import itertools
+from typing import Any, Dict, List, Optional, Union
+
+import aiohttp
+
+
+class GmxRpcError(Exception):
+    """
+    The node answered but returned a JSON-RPC error (e.g. execution reverted): retrying elsewhere won't help.
+    """
+    pass
+
+
+class GmxRpcClient:
+    """
+    Minimal asyncio JSON-RPC client for the GMX reader.
+    One keep-alive aiohttp session is shared by all requests; on transport errors (timeouts, connection resets,
+    5xx) the request is retried on the next endpoint of the list, and the working endpoint becomes the default.
+    """
+    default_endpoints = ["https://api.avax.network/ext/bc/C/rpc"]
+    timeout = 5
+    pool_size = 16
+    keepalive_timeout = 30
+
+    def __init__(self, endpoints: Optional[List[str]] = None, logger=None):
+        self.endpoints = list(endpoints) if endpoints else list(GmxRpcClient.default_endpoints)
+        self.logger = logger
+        self._endpoint_index = 0
+        self._request_id = itertools.count(1)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def endpoint(self) -> str:
+        return self.endpoints[self._endpoint_index]
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=GmxRpcClient.pool_size,
+                                             keepalive_timeout=GmxRpcClient.keepalive_timeout)
+            self._session = aiohttp.ClientSession(connector=connector,
+                                                  timeout=aiohttp.ClientTimeout(total=GmxRpcClient.timeout))
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _post(self, endpoint: str, payload: dict) -> Any:
+        async with self._get_session().post(endpoint, json=payload) as response:
+            response.raise_for_status()
+            return await response.json(content_type=None)
+
+    async def request(self, method: str, params: List[Any]) -> Any:
+        payload = {"jsonrpc": "2.0", "id": next(self._request_id), "method": method, "params": params}
+        last_exception = None
+        for attempt in range(len(self.endpoints)):
+            endpoint = self.endpoint
+            try:
+                result = await self._post(endpoint, payload)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                last_exception = e
+                self._endpoint_index = (self._endpoint_index + 1) % len(self.endpoints)
+                if self.logger is not None:
+                    self.logger.warning(f"{method} failed on {endpoint} ({str(e) or type(e).__name__}), failing over to {self.endpoint}")
+                continue
+            if "error" in result:
+                raise GmxRpcError(f"{method} on {endpoint}: {result['error']}")
+            return result["result"]
+        raise ConnectionError(f"{method} failed on all endpoints {self.endpoints}") from last_exception
+
+    async def block_number(self) -> int:
+        return int(await self.request("eth_blockNumber", []), 16)
+
+    async def get_logs(self, address: str, topics: List[Any], from_block: int, to_block: int) -> List[Dict[str, Any]]:
+        return await self.request("eth_getLogs", [{"address": address, "topics": topics,
+                                                   "fromBlock": hex(from_block), "toBlock": hex(to_block)}])
+
+    async def eth_call(self, to: str, data: str, block_identifier: Union[int, str] = "latest") -> bytes:
+        block = hex(block_identifier) if isinstance(block_identifier, int) else block_identifier
+        result = await self.request("eth_call", [{"to": to, "data": data}, block])
+        return bytes.fromhex(result[2:] if result.startswith("0x") else result)
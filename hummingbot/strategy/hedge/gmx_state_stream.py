@@ -0,0 +1,123 @@
+import asyncio
+import copy
+from typing import Dict, Optional, Set
+
+from eth_utils import event_abi_to_log_topic
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.strategy.hedge.gmx_hedge_utils import myUtcNow
+
+
+class GmxStateStream:
+    """
+    Follows new blocks and publishes a new versioned GmxAPI.State snapshot whenever the chain moved.
+    Vault event logs since the previous block tell which tokens' pool/reserve/short/fee storage changed:
+    only those tokens get their vault getters re-read, the others only get their prices refreshed.
+    Snapshots are shallow copies with replaced attributes, so a consumer holding gmx_api.state is never
+    looking at a half-updated state.
+    Failed polls are retried with an exponential backoff, and the first snapshot falls back to per-call reads if the
+    multicall fails, since the strategy can't hedge before it.
+    """
+    poll_interval = 1.0
+    max_retry_interval = 30.0
+    max_log_range = 2048
+    # vault events carrying the token whose storage they change, in 'token' or 'indexToken'
+    vault_events = ['IncreasePoolAmount', 'DecreasePoolAmount', 'DirectPoolDeposit',
+                    'IncreaseReservedAmount', 'DecreaseReservedAmount',
+                    'IncreaseGuaranteedUsd', 'DecreaseGuaranteedUsd',
+                    'IncreaseUsdgAmount', 'DecreaseUsdgAmount',
+                    'CollectSwapFees', 'CollectMarginFees',
+                    'IncreasePosition', 'DecreasePosition', 'LiquidatePosition']
+
+    def __init__(self, gmx_api, logger=None):
+        self.gmx_api = gmx_api
+        self.logger = logger
+        self.last_block: Optional[int] = None
+        self._stream_task: Optional[asyncio.Task] = None
+        self._token_by_address = {data['address'].lower(): key for key, data in gmx_api.static.items()}
+        self._event_abi_by_topic: Dict[str, dict] = {}
+        for event_name in GmxStateStream.vault_events:
+            event_abi = getattr(gmx_api.vault_contract.events, event_name)().abi
+            self._event_abi_by_topic['0x' + event_abi_to_log_topic(event_abi).hex()] = event_abi
+
+    @property
+    def is_running(self) -> bool:
+        return self._stream_task is not None and not self._stream_task.done()
+
+    def start(self) -> None:
+        if not self.is_running:
+            self._stream_task = safe_ensure_future(self._stream_loop())
+
+    def stop(self) -> None:
+        if self._stream_task is not None:
+            self._stream_task.cancel()
+            self._stream_task = None
+
+    @staticmethod
+    def retry_interval(failures: int) -> float:
+        '''delay before the next poll after the given number of consecutive failed polls'''
+        if failures == 0:
+            return GmxStateStream.poll_interval
+        return min(GmxStateStream.poll_interval * 2 ** failures, GmxStateStream.max_retry_interval)
+
+    async def _stream_loop(self) -> None:
+        failures = 0
+        while True:
+            try:
+                await self.poll()
+                failures = 0
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                failures += 1
+                self.logger.warning(f"GMX state streaming failed at block {self.last_block}, retrying in "
+                                    f"{GmxStateStream.retry_interval(failures)}s: {str(e)}")
+            await asyncio.sleep(GmxStateStream.retry_interval(failures))
+
+    async def changed_tokens(self, from_block: int, to_block: int) -> Set[str]:
+        '''tokens named by vault events in [from_block, to_block]'''
+        state = self.gmx_api.state
+        logs = await state.rpc.get_logs(self.gmx_api.VaultAdd, [list(self._event_abi_by_topic.keys())], from_block, to_block)
+        tokens = set()
+        for log in logs:
+            event_abi = self._event_abi_by_topic.get(log['topics'][0])
+            if event_abi is None:
+                continue
+            names = [event_input['name'] for event_input in event_abi['inputs']]
+            values = self.gmx_api.w3.codec.decode_abi([event_input['type'] for event_input in event_abi['inputs']],
+                                                      bytes.fromhex(log['data'][2:]))
+            arguments = dict(zip(names, values))
+            address = arguments.get('token', arguments.get('indexToken'))
+            if address is not None and address.lower() in self._token_by_address:
+                tokens.add(self._token_by_address[address.lower()])
+        return tokens
+
+    async def poll(self) -> bool:
+        '''
+        publishes a new snapshot if a new block was produced since the last one.
+        :return: True if a new snapshot was published
+        '''
+        state = self.gmx_api.state
+        block_number = await state.rpc.block_number()
+        if self.last_block is not None and block_number <= self.last_block:
+            return False
+        if self.last_block is None or block_number - self.last_block > GmxStateStream.max_log_range:
+            reads = state.contract_reads()
+        else:
+            changed = await self.changed_tokens(self.last_block + 1, block_number)
+            reads = state.global_reads()
+            for key in self.gmx_api.static:
+                reads += state.token_reads(key) if key in changed else state.price_reads(key)
+        try:
+            results = await state.multicall.aggregate(reads, block_identifier=block_number)
+        except Exception as e:
+            if self.last_block is not None:
+                raise
+            self.logger.warning(f"multicall of the first GMX state failed, falling back to per-call reads: {str(e)}")
+            results = await state.read_per_call(reads)
+
+        snapshot = copy.copy(state)
+        snapshot.apply(results, myUtcNow(), block_number)
+        self.gmx_api.publish(snapshot)
+        self.last_block = block_number
+        return True
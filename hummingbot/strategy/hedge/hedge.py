@@ -1,23 +1,35 @@
-import asyncio
 import logging
 import os.path
+from collections import defaultdict
 from decimal import Decimal
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 import pandas as pd
 
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.derivative.position import Position
+from hummingbot.connector.utils import split_hb_trading_pair
 from hummingbot.core.clock import Clock
 from hummingbot.core.data_type.common import OrderType, PositionAction, PositionMode, PositionSide, TradeType
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_candidate import OrderCandidate, PerpetualOrderCandidate
+from hummingbot.core.event.events import (
+    BuyOrderCompletedEvent,
+    FundingPaymentCompletedEvent,
+    MarketOrderFailureEvent,
+    OrderCancelledEvent,
+    OrderFilledEvent,
+    SellOrderCompletedEvent,
+)
 from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
+from hummingbot.strategy.hedge.exposure_engine import ExposureEngine
 from hummingbot.strategy.hedge.gmx_api import GmxAPI
-from hummingbot.strategy.hedge.gmx_hedge_utils import reform_dict
+from hummingbot.strategy.hedge.gmx_pnl_store import GmxPnlExplainStore
 from hummingbot.strategy.hedge.hedge_config_map_pydantic import HedgeConfigMap
+from hummingbot.strategy.hedge.hedge_execution import HedgeExecutionScheduler
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.strategy_py_base import StrategyPyBase
 from hummingbot.strategy.utils import order_age
@@ -89,15 +101,37 @@ class HedgeStrategy(StrategyPyBase):
         self._hedge_interval = config_map.hedge_interval
         self._value_mode = config_map.value_mode
         self._offsets = offsets
+        self._event_driven = config_map.event_driven
+        self._hedge_delta_threshold = config_map.hedge_delta_threshold
+        self._dirty_assets: Set[str] = set()
+        # exposure of every asset when the event driven mode last compared it, and GMX exposure of the hedged assets
+        self._asset_exposures: Optional[Dict[str, Decimal]] = None
+        self._gmx_exposures: Dict[str, Decimal] = {}
+        self._exposure = ExposureEngine(hedge_market_pairs, market_pairs)
+        self._gmx_state_version = 0
+        self._pnlexplain_version = 0
+        self._scheduler = None
+        if config_map.hedge_slices > 1:
+            self._scheduler = HedgeExecutionScheduler(
+                self,
+                slice_count=config_map.hedge_slices,
+                slice_interval=float(config_map.slice_interval),
+                max_slice_impact=config_map.max_slice_impact,
+                reprice_threshold=config_map.slice_reprice_threshold,
+                min_trade_size=config_map.min_trade_size,
+            )
 
         # TODO: hacky: if wallet is present then we are hedging gmx and not the connector0
         if hasattr(config_map, 'gmx_wallet'):
             self.logger().info("gmx_wallet")
             self.gmx_api = GmxAPI(config_map, logger=self.logger())
+            self.pnlexplain_store = GmxPnlExplainStore(
+                os.path.join(Path.home(), 'StakeCap', 'hummingbot', 'data', GmxPnlExplainStore.file_name))
             self._all_markets = self._hedge_market_pairs
         else:
             self.logger().info("not gmx_wallet")
             self.gmx_api = None
+            self.pnlexplain_store = None
             self._all_markets = self._hedge_market_pairs + self._market_pairs
 
         self._status_report_interval = status_report_interval
@@ -225,10 +259,14 @@ class HedgeStrategy(StrategyPyBase):
             lines.extend(["", "  Active orders:"] + ["    " + line for line in df_lines])
         else:
             lines.extend(["", "  No active maker orders."])
+        if self._scheduler is not None:
+            for execution in self._scheduler.executions.values():
+                lines.extend(["", f"  Sliced hedge: {'buy' if execution.is_buy else 'sell'} {execution.amount:.6g} "
+                                  f"{execution.market_pair.trading_pair}, filled {execution.filled:.6g} "
+                                  f"in {len(execution.slices)} slices"])
         if self._value_mode:
-            total_value = sum(self.get_base_value(market_pair) for market_pair in self._market_pairs)
-            hedge_value = self.get_base_value(self._hedge_market_pair)
             is_buy, value_to_hedge = self.get_hedge_direction_and_value()
+            total_value, hedge_value = self._exposure.total_and_hedge_value()
             price, amount = self.calculate_hedge_price_and_amount(is_buy, value_to_hedge)
             lines.extend(["", f"   Value Mode: {self._value_mode} Total value: {total_value:.6g}, Hedge value: {hedge_value:.6g}"])
             if amount > 0:
@@ -248,6 +286,16 @@ class HedgeStrategy(StrategyPyBase):
         """
         self._last_timestamp = timestamp
         self.apply_initial_setting()
+        if self.gmx_api is not None:
+            self.gmx_api.stream.start()
+
+    def stop(self, clock: Clock) -> None:
+        """
+        Stop the strategy.
+        :param clock: Clock to use.
+        """
+        if self.gmx_api is not None:
+            safe_ensure_future(self.gmx_api.close())
 
     def apply_initial_setting(self) -> None:
         """
@@ -274,7 +322,16 @@ class HedgeStrategy(StrategyPyBase):
         :param timestamp: clock timestamp
         """
         self.logger().debug("tick...")
-        if timestamp - self._last_timestamp < self._hedge_interval:
+        if self._scheduler is not None:
+            self._scheduler.tick(timestamp)
+        interval_elapsed = timestamp - self._last_timestamp >= self._hedge_interval
+        if self._event_driven and not interval_elapsed:
+            self.detect_exposure_changes()
+            if self._dirty_assets and self.markets_ready_to_hedge():
+                assets, self._dirty_assets = self._dirty_assets, set()
+                self.hedge_assets(assets)
+            return
+        if not interval_elapsed:
             return
         self._last_timestamp = timestamp
         self._all_markets_ready = all([market.ready for market in self.active_markets])
@@ -294,19 +351,23 @@ class HedgeStrategy(StrategyPyBase):
                 self._hedge_interval,
             )
             return
+        if self._scheduler is not None and self._scheduler.is_busy:
+            self.logger().info("Sliced hedge in progress.")
+            return
         if self.check_and_cancel_active_orders():
             self.logger().info("Active orders present.")
             return
         self.logger().debug("Checking hedge conditions...")
+        self._dirty_assets.clear()
         if self.gmx_api is not None:
-            asyncio.ensure_future(self.gmx_api.reconcile())
+            state = self.gmx_api.state
+            if state.version == 0:
+                self.logger().warning("GMX state has not been streamed yet. No hedge trades are permitted.")
+                return
             self.hedge()
-            # TODO not a proper database format
-            pnlexplain_path = os.path.join(Path.home(), 'StakeCap', 'hummingbot', 'data', 'gmx_pnl.csv')
-            pnlexplain = pd.DataFrame([{self.gmx_api.state.timestamp: reform_dict(x)} for x in self.gmx_api.compile_pnlexplain()])
-            pnlexplain.to_csv(pnlexplain_path,
-                              index_label='timestamp',
-                              mode='w')
+            if state.version != self._pnlexplain_version:
+                self._pnlexplain_version = state.version
+                self.pnlexplain_store.append(state.timestamp, self.gmx_api.compile_pnlexplain())
         else:
             self.hedge()
 
@@ -314,6 +375,137 @@ class HedgeStrategy(StrategyPyBase):
         # global kafka_consumer
         # event_buffer = kafka_consumer.read_buffer()
 
+    def did_fill_order(self, order_filled_event: OrderFilledEvent) -> None:
+        """
+        A fill changes the exposure of its base asset: flag it for the next event driven hedge.
+        """
+        base, _ = split_hb_trading_pair(order_filled_event.trading_pair)
+        self._dirty_assets.add(base)
+        if self._scheduler is not None:
+            self._scheduler.did_fill_order(order_filled_event.order_id, order_filled_event.amount)
+
+    def did_complete_funding_payment(self, funding_payment_completed_event: FundingPaymentCompletedEvent) -> None:
+        """
+        A funding payment changes the balances of its market: flag its base asset for the next event driven hedge.
+        """
+        base, _ = split_hb_trading_pair(funding_payment_completed_event.trading_pair)
+        self._dirty_assets.add(base)
+
+    def did_complete_buy_order(self, order_completed_event: BuyOrderCompletedEvent) -> None:
+        if self._scheduler is not None:
+            self._scheduler.did_close_order(order_completed_event.order_id, self.current_timestamp)
+
+    def did_complete_sell_order(self, order_completed_event: SellOrderCompletedEvent) -> None:
+        if self._scheduler is not None:
+            self._scheduler.did_close_order(order_completed_event.order_id, self.current_timestamp)
+
+    def did_cancel_order(self, cancelled_event: OrderCancelledEvent) -> None:
+        if self._scheduler is not None:
+            self._scheduler.did_close_order(cancelled_event.order_id, self.current_timestamp)
+
+    def did_fail_order(self, order_failed_event: MarketOrderFailureEvent) -> None:
+        if self._scheduler is not None:
+            self._scheduler.did_close_order(order_failed_event.order_id, self.current_timestamp)
+
+    def get_position_amounts(self, market: Any) -> Dict[str, Decimal]:
+        """
+        Net position amount of every trading pair of a derivative market, in one scan of its positions.
+        :param market: The derivative connector.
+        :return: The net position amount by trading pair.
+        """
+        amounts: Dict[str, Decimal] = {}
+        for position in market.account_positions.values():
+            if isinstance(position, PositionMode):
+                continue
+            amount = -abs(position.amount) if position.position_side == PositionSide.SHORT else position.amount
+            amounts[position.trading_pair] = amounts.get(position.trading_pair, Decimal("0")) + amount
+        return amounts
+
+    def get_market_pair_amounts(self) -> Dict[MarketTradingPairTuple, Decimal]:
+        """
+        Base balance, or net position amount for derivatives, of every market pair, offsets excluded.
+        """
+        position_amounts: Dict[Any, Dict[str, Decimal]] = {}
+        amounts: Dict[MarketTradingPairTuple, Decimal] = {}
+        for market_pair in self._all_markets:
+            if self.is_derivative(market_pair):
+                if market_pair.market not in position_amounts:
+                    position_amounts[market_pair.market] = self.get_position_amounts(market_pair.market)
+                amounts[market_pair] = position_amounts[market_pair.market].get(market_pair.trading_pair, Decimal("0"))
+            else:
+                amounts[market_pair] = market_pair.base_balance
+        return amounts
+
+    def refresh_exposure(self) -> None:
+        """
+        Update the exposure engine with the current balances, positions, offsets and mid prices.
+        """
+        for market_pair, amount in self.get_market_pair_amounts().items():
+            self._exposure.update(
+                market_pair, amount=amount, offset=self._offsets[market_pair], price=market_pair.get_mid_price()
+            )
+
+    def get_asset_exposures(self) -> Dict[str, Decimal]:
+        """
+        Exposure of every base asset: its balances and positions on all markets, offsets included, plus its exposure
+        on GMX as of the last GMX state compared.
+        """
+        exposures: Dict[str, Decimal] = dict(self._gmx_exposures)
+        for market_pair, amount in self.get_market_pair_amounts().items():
+            exposures[market_pair.base_asset] = (exposures.get(market_pair.base_asset, Decimal("0"))
+                                                 + amount + self._offsets[market_pair])
+        return exposures
+
+    def markets_ready_to_hedge(self) -> bool:
+        """
+        Silent version of the checks done every hedge interval, for event driven hedges.
+        :return: True if all markets are ready and connected and no hedge order is still active.
+        """
+        if not all([market.ready and market.network_status is NetworkStatus.CONNECTED for market in self.active_markets]):
+            return False
+        if self._scheduler is not None and self._scheduler.is_busy:
+            return False
+        return not self.check_and_cancel_active_orders()
+
+    def detect_exposure_changes(self) -> None:
+        """
+        Flag the assets whose exposure moved since the last tick: balance and position updates of the connectors,
+        e.g. funding, liquidations, deposits and withdrawals, and the GMX deltas of a new GMX state. Fills and funding
+        payments flag their base asset as soon as they happen, price changes are caught by the hedge every hedge
+        interval.
+        """
+        state = self.gmx_api.state if self.gmx_api is not None else None
+        if state is not None and state.version != 0 and state.version != self._gmx_state_version:
+            self._gmx_state_version = state.version
+            glp_position = state.depositBalances()
+            self._gmx_exposures = {
+                market_pair.base_asset: Decimal(glp_position * state.partial_delta(market_pair.trading_pair, normalized=True))
+                for market_pair in self._hedge_market_pairs
+            }
+        exposures = self.get_asset_exposures()
+        if self._asset_exposures is not None:
+            self._dirty_assets.update(
+                asset for asset, exposure in exposures.items() if self._asset_exposures.get(asset) != exposure
+            )
+        self._asset_exposures = exposures
+
+    def hedge_assets(self, assets: Set[str]) -> None:
+        """
+        Event driven hedge: only recompute the exposure of the flagged assets,
+        and only hedge it if it is worth more than hedge_delta_threshold.
+        :param assets: base assets whose exposure may have changed.
+        """
+        if not assets:
+            return
+        if self._value_mode:
+            _, value_to_hedge = self.get_hedge_direction_and_value()
+            if value_to_hedge >= self._hedge_delta_threshold:
+                self.hedge_by_value()
+            return
+        for hedge_market, market_list in self._market_pair_by_asset.items():
+            if hedge_market.base_asset in assets:
+                self.hedge_asset_by_amount(hedge_market, market_list, threshold=self._hedge_delta_threshold)
+
     def get_positions(self, market_pair: MarketTradingPairTuple, position_side: PositionSide = None) -> List[Position]:
         """
         Get the active positions of a market.
@@ -373,8 +565,8 @@ class HedgeStrategy(StrategyPyBase):
         Calculate the value that is required to be hedged.
         :returns: A tuple of the hedge direction (buy/sell) and the value to be hedged.
         """
-        total_value = sum(self.get_base_value(market_pair) for market_pair in self._market_pairs)
-        hedge_value = self.get_base_value(self._hedge_market_pair)
+        self.refresh_exposure()
+        total_value, hedge_value = self._exposure.total_and_hedge_value()
         net_value = total_value * self._hedge_ratio + hedge_value
         is_buy = net_value < 0
         value_to_hedge = abs(net_value)
@@ -416,6 +608,9 @@ class HedgeStrategy(StrategyPyBase):
             f"Hedging by value. Hedge direction: {'buy' if is_buy else 'sell'}. "
             f"Hedge price: {price}. Hedge amount: {amount}."
         )
+        if self._scheduler is not None:
+            self._scheduler.submit(self._hedge_market_pair, is_buy, amount, self.current_timestamp)
+            return
         order_candidates = self.get_order_candidates(self._hedge_market_pair, is_buy, amount, price)
         if not order_candidates:
             self.logger().info("No order candidates.")
@@ -447,18 +642,59 @@ class HedgeStrategy(StrategyPyBase):
         """
         The main process of the strategy for value mode = False.
         """
-        for hedge_market, market_list in self._market_pair_by_asset.items():
-            is_buy, amount_to_hedge = self.get_hedge_direction_and_amount_by_asset(hedge_market, market_list)
-            self.logger().debug("Hedge by amount: %s %s", amount_to_hedge, hedge_market.trading_pair)
-            if amount_to_hedge == 0:
-                continue
-            price = hedge_market.get_vwap_for_volume(is_buy, amount_to_hedge).result_price * self.get_slippage_ratio(
-                is_buy
-            )
-            order_candidates = self.get_order_candidates(hedge_market, is_buy, amount_to_hedge, price)
-            if not order_candidates:
+        self.refresh_exposure()
+        if self.gmx_api is not None:
+            glp_position = self.gmx_api.state.depositBalances()
+            for hedge_market in self._exposure.hedge_pairs:
+                self._exposure.set_external_amount(
+                    hedge_market,
+                    Decimal(glp_position * self.gmx_api.state.partial_delta(hedge_market.trading_pair, normalized=True))
+                )
+        net_amounts = self._exposure.net_amounts(self._hedge_ratio)
+        for hedge_market, net_amount in zip(self._exposure.hedge_pairs, net_amounts):
+            self.logger().debug("Hedge by amount: %s %s", net_amount, hedge_market.trading_pair)
+            if net_amount == 0:
                 continue
-            self.place_orders(hedge_market, order_candidates)
+            self.place_hedge_order(hedge_market, net_amount < 0, abs(net_amount))
+
+    def hedge_asset_by_amount(
+        self, hedge_market: MarketTradingPairTuple, market_list: List[MarketTradingPairTuple], threshold: Decimal = Decimal("0")
+    ) -> None:
+        """
+        Hedge the amount of a single asset.
+        :params hedge_market: The market pair to hedge.
+        :params market_list: The list of markets holding the same base asset.
+        :params threshold: The minimum value in quote asset of the net exposure to hedge.
+        """
+        is_buy, amount_to_hedge = self.get_hedge_direction_and_amount_by_asset(hedge_market, market_list)
+        self.logger().debug("Hedge by amount: %s %s", amount_to_hedge, hedge_market.trading_pair)
+        if amount_to_hedge == 0:
+            return
+        if threshold > 0 and amount_to_hedge * hedge_market.get_mid_price() < threshold:
+            self.logger().debug("Exposure of %s %s is below the hedge threshold.", amount_to_hedge, hedge_market.trading_pair)
+            return
+        self.place_hedge_order(hedge_market, is_buy, amount_to_hedge)
+
+    def place_hedge_order(self, hedge_market: MarketTradingPairTuple, is_buy: bool, amount_to_hedge: Decimal) -> None:
+        """
+        Price the hedge at the vwap of its amount with slippage and place it.
+        :params hedge_market: The market pair to hedge.
+        :params is_buy: The direction of the hedge.
+        :params amount_to_hedge: The amount of base asset to hedge.
+        """
+        amount_to_hedge = hedge_market.market.quantize_order_amount(hedge_market.trading_pair, amount_to_hedge)
+        if amount_to_hedge == 0:
+            return
+        if self._scheduler is not None:
+            self._scheduler.submit(hedge_market, is_buy, amount_to_hedge, self.current_timestamp)
+            return
+        price = hedge_market.get_vwap_for_volume(is_buy, amount_to_hedge).result_price * self.get_slippage_ratio(
+            is_buy
+        )
+        order_candidates = self.get_order_candidates(hedge_market, is_buy, amount_to_hedge, price)
+        if not order_candidates:
+            return
+        self.place_orders(hedge_market, order_candidates)
 
     def get_perpetual_order_candidates(
         self, market_pair: MarketTradingPairTuple, is_buy: bool, amount: Decimal, price: Decimal
@@ -547,23 +783,17 @@ class HedgeStrategy(StrategyPyBase):
 
     def place_orders(
         self, market_pair: MarketTradingPairTuple, orders: List[Union[OrderCandidate, PerpetualOrderCandidate]]
-    ) -> None:
+    ) -> List[str]:
         """
-        Place an order refering the order candidates.
+        Place the orders of the order candidates as one batch, the candidates closing a position close it.
         :params market_pair: The market pair to place the order.
         :params orders: The list of orders to place.
+        :returns: The client order ids of the placed orders.
         """
         self.logger().info("Placing %s orders", len(orders))
         for order in orders:
             self.logger().info(f"Create {order.order_side} {order.amount} {order.trading_pair} at {order.price}")
-            is_buy = order.order_side == TradeType.BUY
-            amount = order.amount
-            price = order.price
-            position_action = PositionAction.OPEN
-            if isinstance(order, PerpetualOrderCandidate) and order.position_close:
-                position_action = PositionAction.CLOSE
-            trade = self.buy_with_specific_market if is_buy else self.sell_with_specific_market
-            trade(market_pair, amount, order_type=OrderType.LIMIT, price=price, position_action=position_action)
+        return self.batch_order_create_with_specific_market(market_pair, orders, position_action=PositionAction.OPEN)
 
     def check_and_cancel_active_orders(self) -> bool:
         """
@@ -572,11 +802,15 @@ class HedgeStrategy(StrategyPyBase):
         """
         if not self.active_orders:
             return False
-        for market_pair, order in self.active_orders:
+        orders_to_cancel: Dict[Any, List[LimitOrder]] = defaultdict(list)
+        for market, order in self.active_orders:
             if order_age(order, self.current_timestamp) < self._max_order_age:
                 continue
             self.logger().info(
                 f"Cancel {'buy' if order.is_buy else 'sell'} {order.quantity} {order.trading_pair} at {order.price}"
             )
-            market_pair.cancel(order.trading_pair, order.client_order_id)
+            orders_to_cancel[market].append(order)
+        # the stale orders of a market are cancelled as one batch
+        for market, orders in orders_to_cancel.items():
+            market.batch_order_cancel(orders)
         return True
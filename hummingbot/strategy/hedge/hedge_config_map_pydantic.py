@@ -142,6 +142,24 @@ class HedgeConfigMap(BaseStrategyConfigMap):
             prompt_on_new=True,
         ),
     )
+    event_driven: bool = Field(
+        default=False,
+        description="Whether to also hedge as soon as fills, funding payments, balance and position updates or the GMX "
+                    "state change the exposure of an asset, instead of only every hedge interval.",
+        client_data=ClientFieldData(
+            prompt=lambda mi: "Do you want to hedge as soon as the exposure changes, between hedge intervals? (y/n)",
+            prompt_on_new=False,
+        ),
+    )
+    hedge_delta_threshold: Decimal = Field(
+        default=Decimal("10"),
+        description="The net exposure in quote asset that triggers an event driven hedge.",
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda mi: "Enter the net exposure in quote asset above which an exposure change triggers a hedge",
+            prompt_on_new=False,
+        ),
+    )
     min_trade_size: Decimal = Field(
         default=Decimal("0.0"),
         description="The minimum trade size in quote asset.",
@@ -159,6 +177,42 @@ class HedgeConfigMap(BaseStrategyConfigMap):
             prompt_on_new=True,
         ),
     )
+    hedge_slices: int = Field(
+        default=1,
+        description="The number of child orders a hedge is split into, 1 to send it as a single order.",
+        ge=1,
+        client_data=ClientFieldData(
+            prompt=lambda mi: "Enter the number of child orders to split a hedge into",
+            prompt_on_new=False,
+        ),
+    )
+    slice_interval: Decimal = Field(
+        default=Decimal("10"),
+        description="The interval in seconds between two child orders of a hedge.",
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda mi: "Enter the interval in seconds between two child orders of a hedge",
+            prompt_on_new=False,
+        ),
+    )
+    max_slice_impact: Decimal = Field(
+        default=Decimal("0.002"),
+        description="The maximum distance from the best price a child order may take liquidity at.",
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda mi: "Enter the maximum distance from the best price a child order may take liquidity at",
+            prompt_on_new=False,
+        ),
+    )
+    slice_reprice_threshold: Decimal = Field(
+        default=Decimal("0.002"),
+        description="The price move that makes a working child order be cancelled and sent again at the new price.",
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda mi: "Enter the price move above which a working child order is re-priced",
+            prompt_on_new=False,
+        ),
+    )
     hedge_tx_cost: Decimal = Field(
         default=Decimal("0.0004"),
         description="Temporary parameter for estimating backtest.",
@@ -175,6 +229,14 @@ class HedgeConfigMap(BaseStrategyConfigMap):
             prompt_on_new=True,
         ),
     )
+    gmx_rpc_endpoints: List[str] = Field(
+        default=["https://api.avax.network/ext/bc/C/rpc"],
+        description="The Avalanche RPC endpoints used to read GMX state, in failover order.",
+        client_data=ClientFieldData(
+            prompt=lambda mi: "Enter the Avalanche RPC endpoints to read GMX state from, comma seperated",
+            prompt_on_new=False,
+        ),
+    )
     hedge_connector: ExchangeEnum = Field(
         default=...,
         description="The name of the hedge exchange connector.",
@@ -231,6 +293,15 @@ class HedgeConfigMap(BaseStrategyConfigMap):
             return MarketConfigMap.construct()
         return EmptyMarketConfigMap.construct()
 
+    @validator("gmx_rpc_endpoints", pre=True)
+    def validate_rpc_endpoints(cls, endpoints: Union[str, List[str]]):
+        """splits comma seperated endpoints"""
+        if isinstance(endpoints, str):
+            endpoints = [endpoint.strip() for endpoint in endpoints.split(",") if endpoint.strip()]
+        if len(endpoints) == 0:
+            raise ValueError("No RPC endpoint entered")
+        return endpoints
+
     @validator("hedge_offsets", pre=True)
     def validate_offsets(cls, offsets: Union[str, List[Decimal]], values: Dict):
         """checks and ensure offsets are of decimal type"""
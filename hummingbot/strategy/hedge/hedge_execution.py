@@ -0,0 +1,216 @@
+from decimal import ROUND_UP, Decimal
+from typing import Dict, List, Optional
+
+from hummingbot.core.data_type.order_candidate import OrderCandidate
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+
+
+class HedgeSlice:
+    """
+    One child order of a HedgeExecution.
+    """
+
+    def __init__(self, order_id: str, amount: Decimal, price: Decimal, timestamp: float):
+        self.order_id = order_id
+        self.amount = amount
+        self.price = price
+        self.timestamp = timestamp
+        self.filled = Decimal("0")
+        self.cancelling = False
+
+    @property
+    def remaining(self) -> Decimal:
+        return self.amount - self.filled
+
+
+class HedgeExecution:
+    """
+    A hedge of amount on one hedge market, executed as a sequence of child orders.
+    filled is the sum of the fills of all its slices, whatever the slice they came from.
+    """
+
+    def __init__(self, market_pair: MarketTradingPairTuple, is_buy: bool, amount: Decimal, timestamp: float, deadline: float):
+        self.market_pair = market_pair
+        self.is_buy = is_buy
+        self.amount = amount
+        self.timestamp = timestamp
+        self.deadline = deadline
+        self.filled = Decimal("0")
+        self.slices: List[HedgeSlice] = []
+        self.working: Dict[str, HedgeSlice] = {}
+        self.next_slice_timestamp = timestamp
+        # unfilled amount of a child cancelled for re-pricing, sent again before the next paced child
+        self.reprice_amount = Decimal("0")
+
+    @property
+    def remaining(self) -> Decimal:
+        return max(self.amount - self.filled, Decimal("0"))
+
+
+class HedgeExecutionScheduler:
+    """
+    Splits hedge orders into child orders paced every slice_interval seconds instead of one aggressive order.
+    Each child is the smallest of an even share of the hedge (amount / slice_count), the remaining amount and
+    the depth available within max_slice_impact of the best price, so that a child never walks the book further
+    than that. A child is raised to min_trade_size though, and takes the whole remaining amount when what it would
+    leave is worth less than that, so that hedges smaller than slice_count * min_trade_size are still executed.
+    Children are priced at the vwap of their amount with the strategy slippage.
+    A working child whose price is off the current price by more than reprice_threshold is cancelled, and its
+    unfilled amount is sent again at the new price as soon as the cancel is confirmed.
+    Executions that are not done at their deadline stop sending children: the next hedge recomputes the residual
+    exposure from the actual positions.
+    """
+
+    def __init__(self,
+                 strategy,
+                 slice_count: int,
+                 slice_interval: float,
+                 max_slice_impact: Decimal,
+                 reprice_threshold: Decimal,
+                 min_trade_size: Decimal = Decimal("0")):
+        self._strategy = strategy
+        self._slice_count = slice_count
+        self._slice_interval = slice_interval
+        self._max_slice_impact = max_slice_impact
+        self._reprice_threshold = reprice_threshold
+        self._min_trade_size = min_trade_size
+        self._executions: Dict[MarketTradingPairTuple, HedgeExecution] = {}
+        self._execution_by_order_id: Dict[str, HedgeExecution] = {}
+
+    @property
+    def executions(self) -> Dict[MarketTradingPairTuple, HedgeExecution]:
+        return self._executions
+
+    @property
+    def is_busy(self) -> bool:
+        return len(self._executions) > 0
+
+    def is_executing(self, market_pair: MarketTradingPairTuple) -> bool:
+        return market_pair in self._executions
+
+    def submit(self, market_pair: MarketTradingPairTuple, is_buy: bool, amount: Decimal, timestamp: float) -> None:
+        """
+        Start executing a hedge, sending its first child right away.
+        The whole execution lasts at most slice_count slice intervals.
+        """
+        if self.is_executing(market_pair):
+            return
+        deadline = timestamp + self._slice_count * self._slice_interval
+        execution = HedgeExecution(market_pair, is_buy, amount, timestamp, deadline)
+        self._executions[market_pair] = execution
+        self.process(execution, timestamp)
+
+    def child_amount(self, execution: HedgeExecution) -> Decimal:
+        """
+        Size the next child from the live order book.
+        :return: the quantized amount of the next child, 0 if there is nothing left to send.
+        """
+        market_pair = execution.market_pair
+        share = execution.reprice_amount if execution.reprice_amount > 0 else execution.amount / self._slice_count
+        amount = min(execution.remaining, share)
+        best_price = market_pair.get_price(execution.is_buy)
+        impact = 1 + self._max_slice_impact if execution.is_buy else 1 - self._max_slice_impact
+        depth = market_pair.order_book.get_volume_for_price(execution.is_buy, float(best_price * impact)).result_volume
+        if depth > 0:
+            amount = min(amount, Decimal(str(depth)))
+        if self._min_trade_size > 0 and best_price.is_finite() and best_price > 0:
+            min_amount = self._min_trade_size / (best_price * self._strategy.get_slippage_ratio(execution.is_buy))
+            # Rounded up to the order size quantum, as quantizing the child rounds it down
+            quantum = market_pair.market.get_order_size_quantum(market_pair.trading_pair, min_amount)
+            min_amount = (min_amount / quantum).to_integral_value(rounding=ROUND_UP) * quantum
+            amount = max(amount, min_amount)
+            if execution.remaining - amount < min_amount:
+                amount = execution.remaining
+        return market_pair.market.quantize_order_amount(market_pair.trading_pair, min(amount, execution.remaining))
+
+    def child_price(self, execution: HedgeExecution, amount: Decimal) -> Decimal:
+        return execution.market_pair.get_vwap_for_volume(execution.is_buy, amount).result_price * \
+            self._strategy.get_slippage_ratio(execution.is_buy)
+
+    def process(self, execution: HedgeExecution, timestamp: float) -> None:
+        """
+        Re-price working children, send the next one when its time has come, and retire the execution once done.
+        """
+        for hedge_slice in list(execution.working.values()):
+            if hedge_slice.cancelling:
+                continue
+            if timestamp >= execution.deadline or self.is_stale(execution, hedge_slice):
+                hedge_slice.cancelling = True
+                self._strategy.cancel_order(execution.market_pair, hedge_slice.order_id)
+        if execution.working:
+            return
+        if timestamp >= execution.deadline or execution.remaining == 0:
+            self.finish(execution)
+            return
+        is_reprice = execution.reprice_amount > 0
+        if not is_reprice and timestamp < execution.next_slice_timestamp:
+            return
+        amount = self.child_amount(execution)
+        if amount == 0:
+            self.finish(execution)
+            return
+        price = self.child_price(execution, amount)
+        order_candidates: List[OrderCandidate] = self._strategy.get_order_candidates(
+            execution.market_pair, execution.is_buy, amount, price
+        )
+        if not order_candidates:
+            self.finish(execution)
+            return
+        for order_candidate, order_id in zip(order_candidates,
+                                             self._strategy.place_orders(execution.market_pair, order_candidates)):
+            hedge_slice = HedgeSlice(order_id, order_candidate.amount, order_candidate.price, timestamp)
+            execution.slices.append(hedge_slice)
+            execution.working[order_id] = hedge_slice
+            self._execution_by_order_id[order_id] = execution
+        if is_reprice:
+            execution.reprice_amount = Decimal("0")
+        else:
+            execution.next_slice_timestamp = timestamp + self._slice_interval
+
+    def is_stale(self, execution: HedgeExecution, hedge_slice: HedgeSlice) -> bool:
+        """
+        :return: True if the price of the working child moved away from the current price by more than
+        reprice_threshold.
+        """
+        if self._reprice_threshold <= 0 or hedge_slice.remaining <= 0:
+            return False
+        price = self.child_price(execution, hedge_slice.remaining)
+        if price.is_nan():
+            return False
+        return abs(price - hedge_slice.price) > self._reprice_threshold * hedge_slice.price
+
+    def tick(self, timestamp: float) -> None:
+        for execution in list(self._executions.values()):
+            self.process(execution, timestamp)
+
+    def finish(self, execution: HedgeExecution) -> None:
+        self._executions.pop(execution.market_pair, None)
+        for hedge_slice in execution.slices:
+            self._execution_by_order_id.pop(hedge_slice.order_id, None)
+
+    def find_slice(self, order_id: str) -> Optional[HedgeSlice]:
+        execution = self._execution_by_order_id.get(order_id)
+        if execution is None:
+            return None
+        return next((hedge_slice for hedge_slice in execution.slices if hedge_slice.order_id == order_id), None)
+
+    def did_fill_order(self, order_id: str, amount: Decimal) -> None:
+        execution = self._execution_by_order_id.get(order_id)
+        hedge_slice = self.find_slice(order_id)
+        if hedge_slice is None:
+            return
+        hedge_slice.filled += amount
+        execution.filled += amount
+
+    def did_close_order(self, order_id: str, timestamp: float) -> None:
+        """
+        A child was completed, cancelled or failed: the unfilled amount of a child cancelled for re-pricing is
+        sent again on the next tick, without delaying the paced children.
+        """
+        execution = self._execution_by_order_id.get(order_id)
+        if execution is None:
+            return
+        hedge_slice = execution.working.pop(order_id, None)
+        if hedge_slice is not None and hedge_slice.cancelling and hedge_slice.remaining > 0:
+            execution.reprice_amount += hedge_slice.remaining
+        self.process(execution, timestamp)
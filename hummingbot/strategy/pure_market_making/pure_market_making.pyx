@@ -12,6 +12,7 @@ from hummingbot.core.clock cimport Clock
 from hummingbot.core.data_type.common import OrderType, PriceType, TradeType
 from hummingbot.core.data_type.limit_order cimport LimitOrder
 from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.order_candidate import OrderCandidate
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils import map_df_to_str
 from hummingbot.strategy.asset_price_delegate cimport AssetPriceDelegate
@@ -1189,8 +1190,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             list active_orders = self.active_non_hanging_orders
 
         if active_orders and any(order_age(o, self._current_timestamp) > self._max_order_age for o in active_orders):
-            for order in active_orders:
-                self.c_cancel_order(self._market_info, order.client_order_id)
+            self.batch_order_cancel_with_specific_market(self._market_info, active_orders)
 
     cdef c_cancel_active_orders(self, object proposal):
         """
@@ -1220,10 +1220,11 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
         if not to_defer_canceling:
             self._hanging_orders_tracker.update_strategy_orders_with_equivalent_orders()
-            for order in self.active_non_hanging_orders:
-                # If is about to be added to hanging_orders then don't cancel
-                if not self._hanging_orders_tracker.is_potential_hanging_order(order):
-                    self.c_cancel_order(self._market_info, order.client_order_id)
+            # If is about to be added to hanging_orders then don't cancel
+            self.batch_order_cancel_with_specific_market(
+                self._market_info,
+                [order for order in self.active_non_hanging_orders
+                 if not self._hanging_orders_tracker.is_potential_hanging_order(order)])
         # else:
         #     self.set_timers()
 
@@ -1234,13 +1235,16 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             object price = self.get_price()
         active_orders = [order for order in active_orders
                          if order.client_order_id not in self.hanging_order_ids]
+        orders_to_cancel = []
         for order in active_orders:
             negation = -1 if order.is_buy else 1
             if (negation * (order.price - price) / price) < self._minimum_spread:
                 self.logger().info(f"Order is below minimum spread ({self._minimum_spread})."
                                    f" Canceling Order: ({'Buy' if order.is_buy else 'Sell'}) "
                                    f"ID - {order.client_order_id}")
-                self.c_cancel_order(self._market_info, order.client_order_id)
+                orders_to_cancel.append(order)
+        if len(orders_to_cancel) > 0:
+            self.batch_order_cancel_with_specific_market(self._market_info, orders_to_cancel)
 
     cdef bint c_to_create_orders(self, object proposal):
         non_hanging_orders_non_cancelled = [o for o in self.active_non_hanging_orders if not
@@ -1254,7 +1258,8 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     cdef c_execute_orders_proposal(self, object proposal):
         cdef:
             double expiration_seconds = NaN
-            str bid_order_id, ask_order_id
+            list orders_to_create = []
+            list order_ids
             bint orders_created = False
         # Number of pair of orders to track for hanging orders
         number_of_pairs = min((len(proposal.buys), len(proposal.sells))) if self._hanging_orders_enabled else 0
@@ -1268,20 +1273,6 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     f"({self.trading_pair}) Creating {len(proposal.buys)} bid orders "
                     f"at (Size, Price): {price_quote_str}"
                 )
-            for idx, buy in enumerate(proposal.buys):
-                bid_order_id = self.c_buy_with_specific_market(
-                    self._market_info,
-                    buy.size,
-                    order_type=self._limit_order_type,
-                    price=buy.price,
-                    expiration_seconds=expiration_seconds
-                )
-                orders_created = True
-                if idx < number_of_pairs:
-                    order = next((o for o in self.active_orders if o.client_order_id == bid_order_id))
-                    if order:
-                        self._hanging_orders_tracker.add_current_pairs_of_proposal_orders_executed_by_strategy(
-                            CreatedPairOfOrders(order, None))
         if len(proposal.sells) > 0:
             if self._logging_options & self.OPTION_LOG_CREATE_ORDER:
                 price_quote_str = [f"{sell.size.normalize()} {self.base_asset}, "
@@ -1291,19 +1282,36 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     f"({self.trading_pair}) Creating {len(proposal.sells)} ask "
                     f"orders at (Size, Price): {price_quote_str}"
                 )
-            for idx, sell in enumerate(proposal.sells):
-                ask_order_id = self.c_sell_with_specific_market(
-                    self._market_info,
-                    sell.size,
+
+        # The whole proposal is sent at once, in batches for the markets supporting them
+        for side, price_sizes in ((TradeType.BUY, proposal.buys), (TradeType.SELL, proposal.sells)):
+            for price_size in price_sizes:
+                orders_to_create.append(OrderCandidate(
+                    trading_pair=self.trading_pair,
+                    is_maker=True,
                     order_type=self._limit_order_type,
-                    price=sell.price,
-                    expiration_seconds=expiration_seconds
-                )
-                orders_created = True
-                if idx < number_of_pairs:
-                    order = next((o for o in self.active_orders if o.client_order_id == ask_order_id))
-                    if order:
-                        self._hanging_orders_tracker.current_created_pairs_of_orders[idx].sell_order = order
+                    order_side=side,
+                    amount=price_size.size,
+                    price=price_size.price,
+                ))
+        if len(orders_to_create) > 0:
+            order_ids = self.batch_order_create_with_specific_market(
+                self._market_info,
+                orders_to_create,
+                expiration_seconds=expiration_seconds
+            )
+            orders_created = True
+            bid_order_ids = order_ids[:len(proposal.buys)]
+            ask_order_ids = order_ids[len(proposal.buys):]
+            for idx in range(number_of_pairs):
+                order = next((o for o in self.active_orders if o.client_order_id == bid_order_ids[idx]))
+                if order:
+                    self._hanging_orders_tracker.add_current_pairs_of_proposal_orders_executed_by_strategy(
+                        CreatedPairOfOrders(order, None))
+            for idx in range(number_of_pairs):
+                order = next((o for o in self.active_orders if o.client_order_id == ask_order_ids[idx]))
+                if order:
+                    self._hanging_orders_tracker.current_created_pairs_of_orders[idx].sell_order = order
         if orders_created:
             self.set_timers()
 
@@ -13,7 +13,7 @@ from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.connector.connector_base cimport ConnectorBase
 from hummingbot.core.data_type.trade import Trade
 from hummingbot.core.event.events import OrderFilledEvent
-from hummingbot.core.data_type.common import OrderType, PositionAction
+from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
 from hummingbot.strategy.order_tracker import OrderTracker
 from hummingbot.connector.derivative_base import DerivativeBase
 
@@ -597,6 +597,62 @@ cdef class StrategyBase(TimeIterator):
 
     def cancel_order(self, market_trading_pair_tuple: MarketTradingPairTuple, order_id: str):
         self.c_cancel_order(market_trading_pair_tuple, order_id)
+
+    def batch_order_create_with_specific_market(self, market_trading_pair_tuple, orders_to_create,
+                                                expiration_seconds=NaN,
+                                                position_action=PositionAction.OPEN):
+        """
+        Creates a list of orders (e.g. the whole proposal of the tick) with a single call to the market, which sends
+        them in batches if the exchange supports it.
+        :param orders_to_create: The OrderCandidate of the orders to create
+        :returns The ids of the created orders, in the order of orders_to_create
+        """
+        if self._sb_delegate_lock:
+            raise RuntimeError("Delegates are not allowed to execute orders directly.")
+
+        if not all(isinstance(order.amount, Decimal) and isinstance(order.price, Decimal) for order in orders_to_create):
+            raise TypeError("price and amount must be Decimal objects.")
+
+        cdef:
+            ConnectorBase market = market_trading_pair_tuple.market
+
+        if market not in self._sb_markets:
+            raise ValueError(f"Market object for batch order is not in the whitelisted markets set.")
+
+        order_ids = market.batch_order_create(orders_to_create,
+                                              expiration_ts=self._current_timestamp + expiration_seconds,
+                                              position_action=position_action)
+
+        # Start order tracking
+        for order, order_id in zip(orders_to_create, order_ids):
+            if order.order_type.is_limit_type():
+                self.c_start_tracking_limit_order(market_trading_pair_tuple, order_id,
+                                                  order.order_side == TradeType.BUY, order.price, order.amount)
+            elif order.order_type == OrderType.MARKET:
+                self.c_start_tracking_market_order(market_trading_pair_tuple, order_id,
+                                                   order.order_side == TradeType.BUY, order.amount)
+
+        return order_ids
+
+    def batch_order_cancel_with_specific_market(self, market_trading_pair_tuple, orders_to_cancel):
+        """
+        Cancels a list of orders with a single call to the market, which sends them in batches if the exchange
+        supports it.
+        :param orders_to_cancel: The LimitOrder of the orders to cancel
+        """
+        cdef:
+            ConnectorBase market = market_trading_pair_tuple.market
+            list cancels = []
+
+        for order in orders_to_cancel:
+            if self._sb_order_tracker.c_check_and_track_cancel(order.client_order_id):
+                self.log_with_clock(
+                    logging.INFO,
+                    f"({market_trading_pair_tuple.trading_pair}) Canceling the limit order {order.client_order_id}."
+                )
+                cancels.append(order)
+        if len(cancels) > 0:
+            market.batch_order_cancel(cancels)
     # ----------------------------------------------------------------------------------------------------------
     # </editor-fold>
 
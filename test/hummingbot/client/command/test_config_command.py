@@ -72,10 +72,13 @@ class ConfigCommandTest(unittest.TestCase):
                            "    | ∟ gateway_api_host       | localhost            |\n"
                            "    | ∟ gateway_api_port       | 15888                |\n"
                            "    | rate_oracle_source       | binance              |\n"
+                           "    | rate_oracle_streaming    | False                |\n"
                            "    | global_token             |                      |\n"
                            "    | ∟ global_token_name      | USD                  |\n"
                            "    | ∟ global_token_symbol    | $                    |\n"
                            "    | rate_limits_share_pct    | 100                  |\n"
+                           "    | rate_limits_sharing      | False                |\n"
+                           "    | order_book_workers       | 0                    |\n"
                            "    | commands_timeout         |                      |\n"
                            "    | ∟ create_command_timeout | 10                   |\n"
                            "    | ∟ other_commands_timeout | 30                   |\n"
@@ -24,6 +24,7 @@ from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.common import OrderType, PositionAction, PositionMode, PositionSide, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
 from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.order_candidate import OrderCandidate
 from hummingbot.core.data_type.trade_fee import TokenAmount
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
@@ -1645,6 +1646,84 @@ class BinancePerpetualDerivativeUnitTest(unittest.TestCase):
             f"1010."
         ))
 
+    @aioresponses()
+    def test_batch_order_create_places_orders_in_one_request(self, req_mock):
+        url = web_utils.rest_url(
+            CONSTANTS.BATCH_ORDERS_URL, domain=self.domain, api_version=CONSTANTS.API_VERSION
+        )
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+
+        create_response = [{"updateTime": int(self.start_timestamp),
+                            "status": "NEW",
+                            "orderId": "8886774"},
+                           {"code": -2019,
+                            "msg": "Margin is insufficient."}]
+        req_mock.post(regex_url, body=json.dumps(create_response))
+
+        margin_asset = self.quote_asset
+        mocked_response = self._get_exchange_info_mock_response(margin_asset)
+        trading_rules = self.exchange._format_trading_rules(mocked_response)
+        self.exchange._trading_rules[self.trading_pair] = trading_rules[0]
+
+        orders = [
+            ("OID1", OrderCandidate(trading_pair=self.trading_pair,
+                                    is_maker=True,
+                                    order_type=OrderType.LIMIT,
+                                    order_side=TradeType.BUY,
+                                    amount=Decimal("10000"),
+                                    price=Decimal("10000"))),
+            ("OID2", OrderCandidate(trading_pair=self.trading_pair,
+                                    is_maker=True,
+                                    order_type=OrderType.LIMIT,
+                                    order_side=TradeType.SELL,
+                                    amount=Decimal("10000"),
+                                    price=Decimal("10100"))),
+        ]
+        self.async_run_with_timeout(self.exchange._execute_batch_order_create(orders=orders,
+                                                                              position_action=PositionAction.OPEN))
+
+        batch_request = next(iter(req_mock.requests.values()))[0]
+        batch_orders = json.loads(batch_request.kwargs["data"]["batchOrders"])
+        self.assertEqual(["OID1", "OID2"], [order["newClientOrderId"] for order in batch_orders])
+        self.assertTrue("OID1" in self.exchange._client_order_tracker._in_flight_orders)
+        self.assertEqual("8886774", self.exchange._client_order_tracker.fetch_order("OID1").exchange_order_id)
+        self.assertTrue("OID2" not in self.exchange._client_order_tracker._in_flight_orders)
+
+    @aioresponses()
+    def test_batch_order_cancel_cancels_orders_in_one_request(self, req_mock):
+        url = web_utils.rest_url(
+            CONSTANTS.BATCH_ORDERS_URL, domain=self.domain, api_version=CONSTANTS.API_VERSION
+        )
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+
+        cancel_response = [{"updateTime": int(self.start_timestamp) * 1e3,
+                            "status": "CANCELED",
+                            "orderId": "8886774"},
+                           {"code": -2011,
+                            "msg": "Unknown order sent."}]
+        req_mock.delete(regex_url, body=json.dumps(cancel_response))
+
+        for order_id, exchange_order_id in (("OID1", "8886774"), ("OID2", "8886775")):
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=self.trading_pair,
+                trading_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+                order_type=OrderType.LIMIT,
+                leverage=1,
+                position=PositionAction.OPEN,
+            )
+            self.exchange._client_order_tracker.fetch_order(order_id).current_state = OrderState.OPEN
+
+        cancelled_order_ids = self.async_run_with_timeout(self.exchange._execute_batch_order_cancel(
+            trading_pair=self.trading_pair, client_order_ids=["OID1", "OID2"]))
+
+        self.assertEqual(["OID1"], cancelled_order_ids)
+        self.assertEqual(1, len(req_mock.requests))
+        self.assertTrue("OID2" in self.exchange._client_order_tracker._order_not_found_records)
+
     def test_create_order_position_action_failure(self):
         margin_asset = self.quote_asset
         mocked_response = self._get_exchange_info_mock_response(margin_asset)
@@ -19,6 +19,7 @@ from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.order_candidate import OrderCandidate
 from hummingbot.core.data_type.trade_fee import TokenAmount
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import (
@@ -477,6 +478,50 @@ class TestGateIoExchange(unittest.TestCase):
         self.assertEqual(order_id, create_event.order_id)
         self.assertEqual(resp["id"], create_event.exchange_order_id)
 
+    @aioresponses()
+    def test_batch_order_create_with_one_rejected_order(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.BATCH_ORDER_CREATE_PATH_URL}"
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+
+        buy_order_id, sell_order_id = "OID1", "OID2"
+        buy_order_resp = self.get_order_create_response_mock()
+        buy_order_resp.update({"text": buy_order_id, "succeeded": True})
+        sell_order_resp = {"text": sell_order_id,
+                           "succeeded": False,
+                           "label": "BALANCE_NOT_ENOUGH",
+                           "message": "Not enough balance"}
+        mock_api.post(regex_url, body=json.dumps([buy_order_resp, sell_order_resp]), status=201)
+
+        orders = [
+            (buy_order_id, OrderCandidate(trading_pair=self.trading_pair,
+                                          is_maker=True,
+                                          order_type=OrderType.LIMIT,
+                                          order_side=TradeType.BUY,
+                                          amount=Decimal("1"),
+                                          price=Decimal("5.1"))),
+            (sell_order_id, OrderCandidate(trading_pair=self.trading_pair,
+                                           is_maker=True,
+                                           order_type=OrderType.LIMIT,
+                                           order_side=TradeType.SELL,
+                                           amount=Decimal("1"),
+                                           price=Decimal("5.3"))),
+        ]
+        self.async_run_with_timeout(coroutine=self.exchange._execute_batch_order_create(orders=orders))
+
+        order_request = next(((key, value) for key, value in mock_api.requests.items()
+                              if key[1].human_repr().startswith(url)))
+        request_data = json.loads(order_request[1][0].kwargs["data"])
+        self.assertEqual([buy_order_id, sell_order_id], [order_data["text"] for order_data in request_data])
+        self.assertEqual(["buy", "sell"], [order_data["side"] for order_data in request_data])
+        self.assertEqual(Decimal("5.3"), Decimal(request_data[1]["price"]))
+
+        self.assertIn(buy_order_id, self.exchange.in_flight_orders)
+        self.assertEqual(buy_order_resp["id"], self.exchange.in_flight_orders[buy_order_id].exchange_order_id)
+        self.assertNotIn(sell_order_id, self.exchange.in_flight_orders)
+        self.assertEqual(sell_order_id, self.order_failure_logger.event_log[0].order_id)
+
     @aioresponses()
     def test_create_order_when_order_is_instantly_closed(self, mock_api):
         self._simulate_trading_rules_initialized()
@@ -763,20 +808,36 @@ class TestGateIoExchange(unittest.TestCase):
         self.assertIn("OID2", self.exchange.in_flight_orders)
         order2 = self.exchange.in_flight_orders["OID2"]
 
-        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.ORDER_DELETE_PATH_URL.format(order_id=order1.exchange_order_id)}"
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.BATCH_ORDER_CANCEL_PATH_URL}"
         regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
 
-        response = self.get_order_create_response_mock(cancelled=True, exchange_order_id=order1.exchange_order_id)
-
-        mock_api.delete(regex_url, body=json.dumps(response))
-
-        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.ORDER_DELETE_PATH_URL.format(order_id=order2.exchange_order_id)}"
-        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        response = [
+            {
+                "currency_pair": self.ex_trading_pair,
+                "id": order1.exchange_order_id,
+                "succeeded": True,
+                "label": "",
+                "message": "",
+            },
+            {
+                "currency_pair": self.ex_trading_pair,
+                "id": order2.exchange_order_id,
+                "succeeded": False,
+                "label": "ORDER_NOT_FOUND",
+                "message": "Order not found",
+            },
+        ]
 
-        mock_api.delete(regex_url, status=400)
+        mock_api.post(regex_url, body=json.dumps(response))
 
         cancellation_results = self.async_run_with_timeout(self.exchange.cancel_all(10))
 
+        cancel_request = next(((key, value) for key, value in mock_api.requests.items()
+                               if key[1].human_repr().startswith(url)))
+        request_data = json.loads(cancel_request[1][0].kwargs["data"])
+        self.assertEqual([order1.exchange_order_id, order2.exchange_order_id],
+                         [cancel_data["id"] for cancel_data in request_data])
+
         self.assertEqual(2, len(cancellation_results))
         self.assertEqual(CancellationResult(order1.client_order_id, True), cancellation_results[0])
         self.assertEqual(CancellationResult(order2.client_order_id, False), cancellation_results[1])
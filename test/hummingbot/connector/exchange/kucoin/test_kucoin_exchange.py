@@ -19,6 +19,7 @@ from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, TradeUpdate
+from hummingbot.core.data_type.order_candidate import OrderCandidate
 from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeBase, TradeFeeSchema
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import (
@@ -718,6 +719,53 @@ class KucoinExchangeTests(unittest.TestCase):
             )
         )
 
+    @aioresponses()
+    def test_batch_order_create_with_one_rejected_order(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        url = web_utils.private_rest_url(CONSTANTS.BATCH_ORDERS_PATH_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+
+        creation_response = {
+            "code": "200000",
+            "data": {
+                "data": [
+                    {"clientOid": "OID1", "id": "5bd6e9286d99522a52e458de", "status": "success", "failMsg": None},
+                    {"clientOid": "OID2", "id": None, "status": "fail", "failMsg": "Balance insufficient!"},
+                ]
+            }}
+        mock_api.post(regex_url, body=json.dumps(creation_response))
+
+        orders = [
+            ("OID1", OrderCandidate(trading_pair=self.trading_pair,
+                                    is_maker=True,
+                                    order_type=OrderType.LIMIT,
+                                    order_side=TradeType.BUY,
+                                    amount=Decimal("100"),
+                                    price=Decimal("10000"))),
+            ("OID2", OrderCandidate(trading_pair=self.trading_pair,
+                                    is_maker=True,
+                                    order_type=OrderType.LIMIT_MAKER,
+                                    order_side=TradeType.SELL,
+                                    amount=Decimal("100"),
+                                    price=Decimal("11000"))),
+        ]
+        self.async_run_with_timeout(self.exchange._execute_batch_order_create(orders=orders))
+
+        order_request = next(((key, value) for key, value in mock_api.requests.items()
+                              if key[1].human_repr().startswith(url)))
+        self._validate_auth_credentials_present(order_request[1][0])
+        request_data = json.loads(order_request[1][0].kwargs["data"])
+        self.assertEqual(self.exchange_trading_pair, request_data["symbol"])
+        self.assertEqual(["OID1", "OID2"], [order_data["clientOid"] for order_data in request_data["orderList"]])
+        self.assertEqual(["buy", "sell"], [order_data["side"] for order_data in request_data["orderList"]])
+        self.assertTrue(request_data["orderList"][1]["postOnly"])
+
+        self.assertIn("OID1", self.exchange.in_flight_orders)
+        self.assertEqual(creation_response["data"]["data"][0]["id"], self.exchange.in_flight_orders["OID1"].exchange_order_id)
+        self.assertNotIn("OID2", self.exchange.in_flight_orders)
+        self.assertEqual("OID2", self.order_failure_logger.event_log[0].order_id)
+
     @aioresponses()
     def test_create_order_fails_when_trading_rule_error_and_raises_failure_event(self, mock_api):
         self._simulate_trading_rules_initialized()
@@ -15,7 +15,8 @@ from hummingbot.connector.exchange.okx.okx_exchange import OkxExchange
 from hummingbot.connector.test_support.exchange_connector_test import AbstractExchangeConnectorTests
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
-from hummingbot.core.data_type.in_flight_order import InFlightOrder
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.order_candidate import OrderCandidate
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.event.events import OrderCancelledEvent, OrderType, TradeType
 
@@ -546,12 +547,27 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
         """
         :return: a list of all configured URLs for the cancelations
         """
-        all_urls = []
-        url = self.configure_successful_cancelation_response(order=successful_order, mock_api=mock_api)
-        all_urls.append(url)
-        url = self.configure_erroneous_cancelation_response(order=erroneous_order, mock_api=mock_api)
-        all_urls.append(url)
-        return all_urls
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH)
+        response = {
+            "code": "2",
+            "msg": "",
+            "data": [
+                {
+                    "clOrdId": successful_order.client_order_id,
+                    "ordId": successful_order.exchange_order_id,
+                    "sCode": "0",
+                    "sMsg": ""
+                },
+                {
+                    "clOrdId": erroneous_order.client_order_id,
+                    "ordId": erroneous_order.exchange_order_id,
+                    "sCode": "1",
+                    "sMsg": "Error"
+                }
+            ]
+        }
+        mock_api.post(url, body=json.dumps(response))
+        return [url]
 
     def configure_completely_filled_order_status_response(
             self,
@@ -1159,3 +1175,65 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
             else:
                 self.assertIn(order.client_order_id, self.exchange.in_flight_orders)
                 self.assertTrue(order.is_pending_cancel_confirmation)
+
+    @aioresponses()
+    def test_batch_order_create_with_one_rejected_order(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        request_sent_event = asyncio.Event()
+        self.exchange._set_current_timestamp(1640780000)
+
+        buy_order_candidate = OrderCandidate(
+            trading_pair=self.trading_pair,
+            is_maker=True,
+            order_type=OrderType.LIMIT,
+            order_side=TradeType.BUY,
+            amount=Decimal("100"),
+            price=Decimal("10000"),
+        )
+        sell_order_candidate = OrderCandidate(
+            trading_pair=self.trading_pair,
+            is_maker=True,
+            order_type=OrderType.LIMIT,
+            order_side=TradeType.SELL,
+            amount=Decimal("100"),
+            price=Decimal("11000"),
+        )
+
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_ORDERS_PATH)
+        buy_order_id, sell_order_id = self.exchange.batch_order_create(
+            orders_to_create=[buy_order_candidate, sell_order_candidate])
+        response = {
+            "code": "2",
+            "msg": "",
+            "data": [
+                {
+                    "clOrdId": buy_order_id,
+                    "ordId": self.expected_exchange_order_id,
+                    "tag": "",
+                    "sCode": "0",
+                    "sMsg": ""
+                },
+                {
+                    "clOrdId": sell_order_id,
+                    "ordId": "",
+                    "tag": "",
+                    "sCode": "51008",
+                    "sMsg": "Order placement failed due to insufficient balance"
+                }
+            ]
+        }
+        mock_api.post(url, body=json.dumps(response), callback=lambda *args, **kwargs: request_sent_event.set())
+        self.async_run_with_timeout(request_sent_event.wait())
+
+        order_request = self._all_executed_requests(mock_api, url)[0]
+        self.validate_auth_credentials_present(order_request)
+        request_data = json.loads(order_request.kwargs["data"])
+        self.assertEqual([buy_order_id, sell_order_id], [order_data["clOrdId"] for order_data in request_data])
+        self.assertEqual(["buy", "sell"], [order_data["side"] for order_data in request_data])
+        self.assertEqual(Decimal("11000"), Decimal(request_data[1]["px"]))
+
+        buy_order = self.exchange.in_flight_orders[buy_order_id]
+        self.assertEqual(OrderState.OPEN, buy_order.current_state)
+        self.assertEqual(str(self.expected_exchange_order_id), buy_order.exchange_order_id)
+        self.assertNotIn(sell_order_id, self.exchange.in_flight_orders)
+        self.assertEqual(sell_order_id, self.order_failure_logger.event_log[0].order_id)
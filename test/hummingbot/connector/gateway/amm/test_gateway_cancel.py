@@ -80,7 +80,8 @@ class GatewayCancelUnitTest(unittest.TestCase):
         cls._patch_stack.close()
 
     def tearDown(self) -> None:
-        self._connector._order_tracker.all_orders.clear()
+        for client_order_id in list(self._connector._order_tracker.active_orders):
+            self._connector._order_tracker.stop_tracking_order(client_order_id)
 
     @classmethod
     async def wait_til_ready(cls):
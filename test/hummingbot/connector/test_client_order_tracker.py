@@ -267,6 +267,104 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
 
         self.assertIsNone(fetched_order)
 
+    def test_fetch_order_by_exchange_order_id_assigned_after_tracking(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+
+        order.update_exchange_order_id("someExchangeOrderId")
+        self.assertIs(order, self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+
+        self.tracker.stop_tracking_order(order.client_order_id)
+        self.assertIs(order, self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+
+        self.tracker._cached_orders.clear()
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+
+    def test_orders_are_exposed_as_read_only_views(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        active_orders = self.tracker.active_orders
+        all_fillable_orders = self.tracker.all_fillable_orders
+        self.tracker.start_tracking_order(order)
+
+        # the views reflect later changes of the tracker
+        self.assertIn(order.client_order_id, active_orders)
+        self.assertIs(order, all_fillable_orders[order.client_order_id])
+        with self.assertRaises(TypeError):
+            active_orders["anotherClientOrderId"] = order
+
+        self.tracker.stop_tracking_order(order.client_order_id)
+
+        self.assertNotIn(order.client_order_id, active_orders)
+        self.assertIs(order, all_fillable_orders[order.client_order_id])
+        self.assertIs(order, self.tracker.all_orders[order.client_order_id])
+        self.assertNotIn(order.client_order_id, self.tracker.all_updatable_orders)
+
+    def test_active_orders_indexed_by_trading_pair_and_state(self):
+        orders = [
+            InFlightOrder(
+                client_order_id=f"someClientOrderId_{i}",
+                trading_pair=trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                amount=Decimal("1000.0"),
+                creation_timestamp=1640001112.0,
+                price=Decimal("1.0"),
+            )
+            for i, trading_pair in enumerate([self.trading_pair, self.trading_pair, "BTC-USDT"])
+        ]
+        for order in orders:
+            self.tracker.start_tracking_order(order)
+        pending_orders = self.tracker.active_orders_in_state(OrderState.PENDING_CREATE)
+        open_orders = self.tracker.active_orders_in_state(OrderState.OPEN)
+
+        self.assertEqual(["someClientOrderId_0", "someClientOrderId_1"],
+                         list(self.tracker.active_orders_for_trading_pair(self.trading_pair)))
+        self.assertEqual(3, len(pending_orders))
+
+        order_update: OrderUpdate = OrderUpdate(
+            client_order_id="someClientOrderId_0",
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.OPEN,
+        )
+        self.async_run_with_timeout(self.tracker.process_order_update(order_update))
+        # states changed by the connectors themselves are indexed as well
+        orders[2].current_state = OrderState.OPEN
+
+        self.assertEqual(["someClientOrderId_1"], list(pending_orders))
+        self.assertEqual(["someClientOrderId_0", "someClientOrderId_2"], sorted(open_orders))
+        self.assertIs(orders[0], self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+
+        order_update: OrderUpdate = OrderUpdate(
+            client_order_id="someClientOrderId_0",
+            trading_pair=self.trading_pair,
+            update_timestamp=2,
+            new_state=OrderState.CANCELED,
+        )
+        self.async_run_with_timeout(self.tracker.process_order_update(order_update))
+
+        self.assertEqual(["someClientOrderId_2"], list(open_orders))
+        self.assertEqual(0, len(self.tracker.active_orders_in_state(OrderState.CANCELED)))
+        self.assertEqual(["someClientOrderId_1"], list(self.tracker.active_orders_for_trading_pair(self.trading_pair)))
+
     def test_process_order_update_invalid_order_update(self):
 
         order_creation_update: OrderUpdate = OrderUpdate(
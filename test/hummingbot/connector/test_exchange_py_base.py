@@ -0,0 +1,332 @@
+import asyncio
+import time
+from decimal import Decimal
+from test.hummingbot.connector.test_ws_order_entry import QueueWSAssistant
+from typing import Any, Awaitable, Dict, List, Optional, Set, Tuple, Union
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.connector.ws_order_entry import WSOrderEntry
+from hummingbot.core.data_type.cancellation_result import CancellationResult
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.order_candidate import OrderCandidate
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
+
+
+class MockExchange(ExchangePyBase):
+    """
+    Exchange placing and cancelling its orders with in memory REST and websocket order entry requests
+    """
+
+    def __init__(self, client_config_map: ClientConfigAdapter, trading_pair: str):
+        self._trading_pair = trading_pair
+        self.placed_orders: List[str] = []
+        self.cancelled_orders: List[str] = []
+        self.batch_orders: List[List[str]] = []
+        self.batch_cancels: List[List[str]] = []
+        self.rejected_orders: Set[str] = set()
+        super().__init__(client_config_map)
+        self._trading_rules[trading_pair] = TradingRule(
+            trading_pair=trading_pair,
+            min_order_size=Decimal("0.01"),
+            min_price_increment=Decimal("0.01"),
+            min_base_amount_increment=Decimal("0.01"))
+
+    @property
+    def name(self) -> str:
+        return "mock_exchange"
+
+    @property
+    def authenticator(self):
+        return None
+
+    @property
+    def rate_limits_rules(self):
+        return []
+
+    @property
+    def domain(self):
+        return ""
+
+    @property
+    def client_order_id_max_length(self):
+        return None
+
+    @property
+    def client_order_id_prefix(self):
+        return ""
+
+    @property
+    def trading_rules_request_path(self):
+        return ""
+
+    @property
+    def trading_pairs_request_path(self):
+        return ""
+
+    @property
+    def check_network_request_path(self):
+        return ""
+
+    @property
+    def trading_pairs(self):
+        return [self._trading_pair]
+
+    @property
+    def is_cancel_request_in_exchange_synchronous(self) -> bool:
+        return True
+
+    @property
+    def is_trading_required(self) -> bool:
+        return True
+
+    def supported_order_types(self):
+        return [OrderType.LIMIT]
+
+    def _is_request_exception_related_to_time_synchronizer(self, request_exception: Exception):
+        return False
+
+    async def _place_order(self, order_id: str, trading_pair: str, amount: Decimal, trade_type: TradeType,
+                           order_type: OrderType, price: Decimal, **kwargs) -> Tuple[str, float]:
+        self.placed_orders.append(order_id)
+        return f"EOID-{order_id}", time.time()
+
+    async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
+        self.cancelled_orders.append(order_id)
+        return True
+
+    async def _place_batch_order(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        self.batch_orders.append([order.client_order_id for order in orders])
+        return [
+            IOError(f"Order {order.client_order_id} rejected")
+            if order.client_order_id in self.rejected_orders
+            else (f"EOID-{order.client_order_id}", time.time())
+            for order in orders
+        ]
+
+    async def _place_batch_cancel(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        self.batch_cancels.append([order.client_order_id for order in orders])
+        return [
+            IOError(f"Cancel of order {order.client_order_id} rejected")
+            if order.client_order_id in self.rejected_orders
+            else True
+            for order in orders
+        ]
+
+    def _get_fee(self, base_currency: str, quote_currency: str, order_type: OrderType, order_side: TradeType,
+                 amount: Decimal, price: Decimal = Decimal("nan"), is_maker: Optional[bool] = None):
+        return AddedToCostTradeFee()
+
+    async def _update_trading_fees(self):
+        pass
+
+    async def _user_stream_event_listener(self):
+        pass
+
+    async def _format_trading_rules(self, exchange_info_dict: Dict[str, Any]) -> List[TradingRule]:
+        return []
+
+    async def _update_balances(self):
+        pass
+
+    async def _all_trade_updates_for_order(self, order: InFlightOrder):
+        return []
+
+    async def _request_order_status(self, tracked_order: InFlightOrder):
+        raise NotImplementedError
+
+    def _create_web_assistants_factory(self):
+        return MagicMock()
+
+    def _create_order_book_data_source(self):
+        return MagicMock()
+
+    def _create_user_stream_data_source(self):
+        return MagicMock()
+
+    def _initialize_trading_pair_symbols_from_exchange_info(self, exchange_info: Dict[str, Any]):
+        pass
+
+    def _ws_order_entry_request_id(self, message: Any) -> Optional[str]:
+        return message.get("id")
+
+    def _ws_place_order_request(self, request_id: str, order: InFlightOrder, **kwargs) -> WSJSONRequest:
+        return WSJSONRequest(
+            payload={"id": request_id, "method": "order.place", "clientOrderId": order.client_order_id})
+
+    def _ws_place_order_response(self, order: InFlightOrder, response: Any) -> Tuple[str, float]:
+        return str(response["result"]["orderId"]), time.time()
+
+    def _ws_cancel_order_request(self, request_id: str, order: InFlightOrder) -> WSJSONRequest:
+        return WSJSONRequest(
+            payload={"id": request_id, "method": "order.cancel", "clientOrderId": order.client_order_id})
+
+    def _ws_cancel_order_response(self, order: InFlightOrder, response: Any) -> bool:
+        return response["result"]["status"] == "CANCELED"
+
+
+class ExchangePyBaseTests(TestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.exchange = MockExchange(ClientConfigAdapter(ClientConfigMap()), self.trading_pair)
+        self.ws_assistant = QueueWSAssistant()
+
+    def tearDown(self) -> None:
+        if self.exchange._ws_order_entry is not None:
+            self.exchange._ws_order_entry.stop()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    async def get_ws_assistant(self) -> QueueWSAssistant:
+        return self.ws_assistant
+
+    def start_ws_order_entry(self):
+        self.exchange._ws_order_entry = WSOrderEntry(
+            ws_url="wss://test.url/ws-api",
+            ws_assistant_factory=self.get_ws_assistant,
+            response_request_id=self.exchange._ws_order_entry_request_id,
+            request_timeout=0.1)
+        self.exchange._ws_order_entry.start()
+
+        async def wait_until_ready():
+            while not self.exchange._ws_order_entry.ready:
+                await asyncio.sleep(0)
+
+        self.async_run_with_timeout(wait_until_ready())
+
+    def create_order(self, order_id: str = "OID1") -> InFlightOrder:
+        self.async_run_with_timeout(self.exchange._create_order(
+            trade_type=TradeType.BUY,
+            order_id=order_id,
+            trading_pair=self.trading_pair,
+            amount=Decimal("1"),
+            order_type=OrderType.LIMIT,
+            price=Decimal("10")))
+        return self.exchange._order_tracker.fetch_order(order_id)
+
+    def order_candidate(self, trade_type: TradeType = TradeType.BUY) -> OrderCandidate:
+        return OrderCandidate(
+            trading_pair=self.trading_pair,
+            is_maker=True,
+            order_type=OrderType.LIMIT,
+            order_side=trade_type,
+            amount=Decimal("1"),
+            price=Decimal("10"))
+
+    def test_ws_order_without_response_stays_pending_create(self):
+        self.start_ws_order_entry()
+
+        order = self.create_order()
+
+        self.assertEqual(1, len(self.ws_assistant.sent_requests))
+        self.assertEqual([], self.exchange.placed_orders)
+        self.assertEqual(OrderState.PENDING_CREATE, order.current_state)
+        self.assertIn(order.client_order_id, self.exchange.in_flight_orders)
+
+    def test_ws_order_not_sent_is_placed_with_rest(self):
+        self.start_ws_order_entry()
+
+        async def failing_send(request: WSJSONRequest):
+            raise ConnectionError("Connection closed")
+
+        self.ws_assistant.send = failing_send
+
+        order = self.create_order()
+
+        self.assertEqual(["OID1"], self.exchange.placed_orders)
+        self.assertEqual(OrderState.OPEN, order.current_state)
+        self.assertEqual("EOID-OID1", order.exchange_order_id)
+
+    def test_ws_cancel_without_response_is_not_sent_with_rest(self):
+        order = self.create_order()
+        self.start_ws_order_entry()
+
+        result = self.async_run_with_timeout(self.exchange._execute_order_cancel(order))
+
+        self.assertIsNone(result)
+        self.assertEqual(1, len(self.ws_assistant.sent_requests))
+        self.assertEqual([], self.exchange.cancelled_orders)
+        self.assertEqual(OrderState.OPEN, order.current_state)
+        self.assertEqual(0, self.exchange._order_tracker._order_not_found_records.get(order.client_order_id, 0))
+
+    def test_ws_cancel_not_sent_is_sent_with_rest(self):
+        order = self.create_order()
+        self.start_ws_order_entry()
+
+        async def failing_send(request: WSJSONRequest):
+            raise ConnectionError("Connection closed")
+
+        self.ws_assistant.send = failing_send
+
+        result = self.async_run_with_timeout(self.exchange._execute_order_cancel(order))
+
+        self.assertEqual(order.client_order_id, result)
+        self.assertEqual([order.client_order_id], self.exchange.cancelled_orders)
+        self.assertEqual(OrderState.CANCELED, order.current_state)
+
+    def test_batch_order_create_in_chunks_with_one_rejected_order(self):
+        self.exchange.BATCH_ORDER_MAX_SIZE = 2
+        self.exchange.rejected_orders.add("OID2")
+        order_ids = iter(["OID1", "OID2", "OID3"])
+
+        with patch("hummingbot.connector.exchange_py_base.get_new_client_order_id",
+                   side_effect=lambda **kwargs: next(order_ids)):
+            result = self.exchange.batch_order_create(
+                [self.order_candidate(), self.order_candidate(TradeType.SELL), self.order_candidate()])
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual(["OID1", "OID2", "OID3"], result)
+        self.assertEqual([["OID1", "OID2"], ["OID3"]], self.exchange.batch_orders)
+        self.assertEqual([], self.exchange.placed_orders)
+        fetch_order = self.exchange._order_tracker.fetch_order
+        self.assertEqual(OrderState.OPEN, fetch_order("OID1").current_state)
+        self.assertEqual("EOID-OID1", fetch_order("OID1").exchange_order_id)
+        self.assertEqual(OrderState.FAILED, fetch_order("OID2").current_state)
+        self.assertEqual(TradeType.SELL, fetch_order("OID2").trade_type)
+        self.assertEqual(OrderState.OPEN, fetch_order("OID3").current_state)
+
+    def test_batch_order_create_one_by_one_without_batch_endpoint(self):
+        result = self.exchange.batch_order_create([self.order_candidate(), self.order_candidate(TradeType.SELL)])
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual(result, self.exchange.placed_orders)
+        self.assertEqual([], self.exchange.batch_orders)
+        for order_id in result:
+            self.assertEqual(OrderState.OPEN, self.exchange._order_tracker.fetch_order(order_id).current_state)
+
+    def test_cancel_all_in_chunks_with_one_rejected_cancel(self):
+        orders = [self.create_order(order_id) for order_id in ("OID1", "OID2", "OID3")]
+        self.exchange.BATCH_ORDER_MAX_SIZE = 2
+        self.exchange.rejected_orders.add("OID2")
+
+        result = self.async_run_with_timeout(self.exchange.cancel_all(timeout_seconds=1))
+
+        self.assertEqual([["OID1", "OID2"], ["OID3"]], self.exchange.batch_cancels)
+        self.assertEqual([], self.exchange.cancelled_orders)
+        self.assertEqual(
+            {CancellationResult("OID1", True), CancellationResult("OID2", False), CancellationResult("OID3", True)},
+            set(result))
+        self.assertEqual(
+            [OrderState.CANCELED, OrderState.OPEN, OrderState.CANCELED],
+            [order.current_state for order in orders])
+
+    def test_cancel_all_one_by_one_without_batch_endpoint(self):
+        orders = [self.create_order(order_id) for order_id in ("OID1", "OID2")]
+
+        result = self.async_run_with_timeout(self.exchange.cancel_all(timeout_seconds=1))
+
+        self.assertEqual(["OID1", "OID2"], sorted(self.exchange.cancelled_orders))
+        self.assertEqual([], self.exchange.batch_cancels)
+        self.assertEqual({CancellationResult("OID1", True), CancellationResult("OID2", True)}, set(result))
+        self.assertTrue(all(order.current_state == OrderState.CANCELED for order in orders))
@@ -4,6 +4,7 @@ from unittest import TestCase
 from unittest.mock import patch
 
 from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
@@ -18,6 +19,7 @@ from hummingbot.core.event.events import (
     SellOrderCreatedEvent,
 )
 from hummingbot.model.order import Order
+from hummingbot.model.order_status import OrderStatus
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
 
@@ -36,7 +38,9 @@ class MarketsRecorderTests(TestCase):
         self.quote = "HBOT"
         self.trading_pair = f"{self.base}-{self.quote}"
 
-        engine_mock.return_value = create_engine("sqlite:///:memory:")
+        # one connection shared with the recorder writer thread
+        engine_mock.return_value = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False},
+                                                 poolclass=StaticPool)
         self.manager = SQLConnectionManager(
             ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
         )
@@ -49,6 +53,12 @@ class MarketsRecorderTests(TestCase):
     def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
         pass
 
+    def add_listener(self, event_tag, listener):
+        pass
+
+    def remove_listener(self, event_tag, listener):
+        pass
+
     def test_properties(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -266,3 +276,110 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(MarketEvent.BuyOrderCreated.name, order_status[0].status)
         self.assertEqual(MarketEvent.BuyOrderCompleted.name, order_status[1].status)
         self.assertEqual(0, len(trade_fills))
+
+    def test_started_recorder_writes_batches_behind(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name
+        )
+        recorder.start()
+
+        create_event = BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id="OID1-1642010000000000",
+            creation_timestamp=1640001112.223,
+            exchange_order_id="EOID1",
+        )
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id=create_event.order_id,
+            trading_pair=create_event.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=create_event.type,
+            price=Decimal(1010),
+            amount=create_event.amount,
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TradeId1"
+        )
+        complete_event = BuyOrderCompletedEvent(
+            timestamp=1642020000,
+            order_id=create_event.order_id,
+            base_asset=self.base,
+            quote_asset=self.quote,
+            base_asset_amount=create_event.amount,
+            quote_asset_amount=create_event.amount * create_event.price,
+            order_type=create_event.type)
+
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+        recorder._did_complete_order(MarketEvent.BuyOrderCompleted.value, self, complete_event)
+        self.assertEqual(5, recorder.pending_records)
+        with self.manager.get_new_session() as session:
+            self.assertEqual(0, session.query(Order).count())
+
+        with patch.object(recorder, "save_market_states") as save_mock, \
+                patch.object(recorder, "append_trades_to_csv") as csv_mock:
+            recorder.flush().result()
+        recorder.stop()
+
+        self.assertEqual(0, recorder.pending_records)
+        # one state save and one csv append for the whole batch
+        save_mock.assert_called_once()
+        csv_mock.assert_called_once()
+        self.assertEqual(1, len(csv_mock.call_args[0][0]))
+        with self.manager.get_new_session() as session:
+            orders = session.query(Order).all()
+            order_status = orders[0].status
+            trade_fills = orders[0].trade_fills
+
+            self.assertEqual(1, len(orders))
+            self.assertEqual(MarketEvent.BuyOrderCompleted.name, orders[0].last_status)
+            self.assertEqual([MarketEvent.BuyOrderCreated.name, MarketEvent.OrderFilled.name,
+                              MarketEvent.BuyOrderCompleted.name], [status.status for status in order_status])
+            self.assertEqual(1, len(trade_fills))
+
+    def test_stop_writes_queued_records(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name
+        )
+        recorder.flush_size = 4
+        recorder.start()
+
+        for i in range(3):
+            recorder._did_create_order(MarketEvent.SellOrderCreated.value, self, SellOrderCreatedEvent(
+                timestamp=1642010000,
+                type=OrderType.LIMIT,
+                trading_pair=self.trading_pair,
+                amount=Decimal(1),
+                price=Decimal(1000),
+                order_id=f"OID{i}",
+                creation_timestamp=1640001112.223,
+                exchange_order_id=f"EOID{i}",
+            ))
+        # the first two orders reached the flush size and were handed to the writer
+        self.assertEqual(2, recorder.pending_records)
+        recorder.stop()
+
+        # an unknown order is not updated, nor is its status recorded
+        complete_event = BuyOrderCompletedEvent(
+            timestamp=1642020000,
+            order_id="OID9",
+            base_asset=self.base,
+            quote_asset=self.quote,
+            base_asset_amount=Decimal(1),
+            quote_asset_amount=Decimal(1000),
+            order_type=OrderType.LIMIT)
+        recorder._did_complete_order(MarketEvent.BuyOrderCompleted.value, self, complete_event)
+
+        with self.manager.get_new_session() as session:
+            self.assertEqual(3, session.query(Order).count())
+            self.assertEqual(3, session.query(OrderStatus).count())
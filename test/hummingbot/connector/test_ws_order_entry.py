@@ -0,0 +1,108 @@
+import asyncio
+from typing import Any, Awaitable, List, Optional
+from unittest import TestCase
+
+from hummingbot.connector.ws_order_entry import WSOrderEntry
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest, WSResponse
+
+
+class QueueWSAssistant:
+    """
+    Websocket assistant answering the requests through a queue of messages
+    """
+
+    def __init__(self):
+        self.sent_requests: List[WSJSONRequest] = []
+        self.messages: asyncio.Queue = asyncio.Queue()
+        self.disconnected = False
+
+    async def connect(self, ws_url: str, **kwargs):
+        pass
+
+    async def disconnect(self):
+        self.disconnected = True
+
+    async def send(self, request: WSJSONRequest):
+        self.sent_requests.append(request)
+
+    async def iter_messages(self):
+        while True:
+            message = await self.messages.get()
+            if message is None:
+                return
+            yield WSResponse(data=message)
+
+
+class WSOrderEntryTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ws_assistant = QueueWSAssistant()
+        self.order_entry = WSOrderEntry(
+            ws_url="wss://test.url/ws-api",
+            ws_assistant_factory=self.get_ws_assistant,
+            response_request_id=self.response_request_id,
+            request_timeout=0.1)
+
+    def tearDown(self) -> None:
+        self.order_entry.stop()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    async def get_ws_assistant(self) -> QueueWSAssistant:
+        return self.ws_assistant
+
+    @staticmethod
+    def response_request_id(message: Any) -> Optional[str]:
+        return message.get("id")
+
+    async def wait_until_ready(self):
+        while not self.order_entry.ready:
+            await asyncio.sleep(0)
+
+    def test_request_is_answered_by_the_response_with_its_id(self):
+        self.order_entry.start()
+        self.async_run_with_timeout(self.wait_until_ready())
+
+        request_id = self.order_entry.new_request_id()
+        request = WSJSONRequest(payload={"id": request_id, "method": "order.place"}, is_auth_required=True)
+        response_task = asyncio.get_event_loop().create_task(self.order_entry.request(request_id, request))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        self.ws_assistant.messages.put_nowait({"e": "executionReport"})
+        self.ws_assistant.messages.put_nowait({"id": "other", "result": {}})
+        self.ws_assistant.messages.put_nowait({"id": request_id, "result": {"orderId": 1}})
+
+        response = self.async_run_with_timeout(response_task)
+
+        self.assertEqual([request], self.ws_assistant.sent_requests)
+        self.assertEqual({"id": request_id, "result": {"orderId": 1}}, response)
+
+    def test_request_without_response_times_out(self):
+        self.order_entry.start()
+        self.async_run_with_timeout(self.wait_until_ready())
+
+        request = WSJSONRequest(payload={"id": "1"})
+        with self.assertRaises(asyncio.TimeoutError):
+            self.async_run_with_timeout(self.order_entry.request("1", request))
+
+    def test_request_fails_when_not_connected(self):
+        request = WSJSONRequest(payload={"id": "1"})
+        with self.assertRaises(ConnectionError):
+            self.async_run_with_timeout(self.order_entry.request("1", request))
+
+    def test_pending_requests_fail_when_connection_closes(self):
+        self.order_entry.start()
+        self.async_run_with_timeout(self.wait_until_ready())
+
+        request = WSJSONRequest(payload={"id": "1"})
+        response_task = asyncio.get_event_loop().create_task(self.order_entry.request("1", request))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        self.ws_assistant.messages.put_nowait(None)
+
+        with self.assertRaises(ConnectionError):
+            self.async_run_with_timeout(response_task)
+        self.assertFalse(self.order_entry.ready)
+        self.assertTrue(self.ws_assistant.disconnected)
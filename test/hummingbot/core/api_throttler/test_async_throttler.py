@@ -5,13 +5,14 @@ import sys
 import time
 import unittest
 from decimal import Decimal
-from typing import Dict, List
+from typing import Dict, List, Optional
 from unittest.mock import patch
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.core.api_throttler.async_throttler import AsyncRequestContext, AsyncThrottler
 from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, TaskLog
+from hummingbot.core.api_throttler.rate_limit_scheduler import RateLimitScheduler
 from hummingbot.logger.struct_logger import METRICS_LOG_LEVEL
 
 TEST_PATH_URL = "/hummingbot"
@@ -50,6 +51,10 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         self._req_counters: Dict[str, int] = {limit.limit_id: 0 for limit in self.rate_limits}
         self.client_config_map = ClientConfigAdapter(ClientConfigMap())
 
+    def log_task(self, task_log: TaskLog, scheduler: Optional[RateLimitScheduler] = None):
+        scheduler = scheduler or self.throttler._scheduler
+        scheduler.window(task_log.rate_limit).log(task_log)
+
     async def execute_requests(self, no_request: int, limit_id: str, throttler: AsyncThrottler):
         for _ in range(no_request):
             async with throttler.execute_task(limit_id=limit_id):
@@ -93,77 +98,60 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
 
     def test_flush_empty_task_logs(self):
         # Test: No entries in task_logs to flush
-        lock = asyncio.Lock()
-
         rate_limit = self.rate_limits[0]
-        self.assertEqual(0, len(self.throttler._task_logs))
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+        self.assertEqual(0, len(self.throttler._scheduler.task_logs))
+        context = AsyncRequestContext(scheduler=self.throttler._scheduler,
                                       rate_limit=rate_limit,
-                                      related_limits=[(rate_limit, rate_limit.weight)],
-                                      lock=lock,
-                                      safety_margin_pct=self.throttler._safety_margin_pct)
+                                      related_limits=[(rate_limit, rate_limit.weight)])
         context.flush()
-        self.assertEqual(0, len(self.throttler._task_logs))
+        self.assertEqual(0, len(self.throttler._scheduler.task_logs))
 
     def test_flush_only_elapsed_tasks_are_flushed(self):
-        lock = asyncio.Lock()
         rate_limit = self.rate_limits[0]
-        self.throttler._task_logs = [
-            TaskLog(timestamp=1.0, rate_limit=rate_limit, weight=rate_limit.weight),
-            TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight)
-        ]
+        self.log_task(TaskLog(timestamp=1.0, rate_limit=rate_limit, weight=rate_limit.weight))
+        self.log_task(TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight))
 
-        self.assertEqual(2, len(self.throttler._task_logs))
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+        self.assertEqual(2, len(self.throttler._scheduler.task_logs))
+        context = AsyncRequestContext(scheduler=self.throttler._scheduler,
                                       rate_limit=rate_limit,
-                                      related_limits=[(rate_limit, rate_limit.weight)],
-                                      lock=lock,
-                                      safety_margin_pct=self.throttler._safety_margin_pct)
+                                      related_limits=[(rate_limit, rate_limit.weight)])
         context.flush()
-        self.assertEqual(1, len(self.throttler._task_logs))
+        self.assertEqual(1, len(self.throttler._scheduler.task_logs))
 
     def test_within_capacity_singular_non_weighted_task_returns_false(self):
         rate_limit, _ = self.throttler.get_related_limits(limit_id=TEST_POOL_ID)
-        self.throttler._task_logs.append(
+        self.log_task(
             TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight))
 
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+        context = AsyncRequestContext(scheduler=self.throttler._scheduler,
                                       rate_limit=rate_limit,
-                                      related_limits=[(rate_limit, rate_limit.weight)],
-                                      lock=asyncio.Lock(),
-                                      safety_margin_pct=self.throttler._safety_margin_pct)
+                                      related_limits=[(rate_limit, rate_limit.weight)])
         self.assertFalse(context.within_capacity())
 
     def test_within_capacity_singular_non_weighted_task_returns_true(self):
         rate_limit, _ = self.throttler.get_related_limits(limit_id=TEST_POOL_ID)
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+        context = AsyncRequestContext(scheduler=self.throttler._scheduler,
                                       rate_limit=rate_limit,
-                                      related_limits=[(rate_limit, rate_limit.weight)],
-                                      lock=asyncio.Lock(),
-                                      safety_margin_pct=self.throttler._safety_margin_pct)
+                                      related_limits=[(rate_limit, rate_limit.weight)])
         self.assertTrue(context.within_capacity())
 
     def test_within_capacity_pool_non_weighted_task_returns_false(self):
         rate_limit, related_limits = self.throttler.get_related_limits(limit_id=TEST_PATH_URL)
 
         for linked_limit, weight in related_limits:
-            self.throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
+            self.log_task(TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
 
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+        context = AsyncRequestContext(scheduler=self.throttler._scheduler,
                                       rate_limit=rate_limit,
-                                      related_limits=related_limits,
-                                      lock=asyncio.Lock(),
-                                      safety_margin_pct=self.throttler._safety_margin_pct)
+                                      related_limits=related_limits)
         self.assertFalse(context.within_capacity())
 
     def test_within_capacity_pool_non_weighted_task_returns_true(self):
         rate_limit, related_limits = self.throttler.get_related_limits(limit_id=TEST_PATH_URL)
 
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+        context = AsyncRequestContext(scheduler=self.throttler._scheduler,
                                       rate_limit=rate_limit,
-                                      related_limits=related_limits,
-                                      lock=asyncio.Lock(),
-                                      safety_margin_pct=self.throttler._safety_margin_pct)
+                                      related_limits=related_limits)
         self.assertTrue(context.within_capacity())
 
     def test_within_capacity_pool_weighted_tasks(self):
@@ -171,58 +159,47 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
 
         # Simulate Weighted Task 1 and Task 2 already in task logs, resulting in a used capacity of 6/10
         for linked_limit, weight in task_1_related_limits:
-            self.throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
+            self.log_task(TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
         task_2, task_2_related_limits = self.throttler.get_related_limits(limit_id=TEST_WEIGHTED_TASK_2_ID)
         for linked_limit, weight in task_2_related_limits:
-            self.throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
+            self.log_task(TaskLog(timestamp=time.time(), rate_limit=linked_limit, weight=weight))
 
         # Another Task 1(weight=5) will exceed the capacity(11/10)
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+        context = AsyncRequestContext(scheduler=self.throttler._scheduler,
                                       rate_limit=task_1,
-                                      related_limits=task_1_related_limits,
-                                      lock=asyncio.Lock(),
-                                      safety_margin_pct=self.throttler._safety_margin_pct)
+                                      related_limits=task_1_related_limits)
         self.assertFalse(context.within_capacity())
 
         # However Task 2(weight=1) will not exceed the capacity(7/10)
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+        context = AsyncRequestContext(scheduler=self.throttler._scheduler,
                                       rate_limit=task_2,
-                                      related_limits=task_2_related_limits,
-                                      lock=asyncio.Lock(),
-                                      safety_margin_pct=self.throttler._safety_margin_pct)
+                                      related_limits=task_2_related_limits)
         self.assertTrue(context.within_capacity())
 
     def test_within_capacity_returns_true(self):
-        lock = asyncio.Lock()
         rate_limit = self.rate_limits[0]
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+        context = AsyncRequestContext(scheduler=self.throttler._scheduler,
                                       rate_limit=rate_limit,
-                                      related_limits=[(rate_limit, rate_limit.weight)],
-                                      lock=lock,
-                                      safety_margin_pct=self.throttler._safety_margin_pct)
+                                      related_limits=[(rate_limit, rate_limit.weight)])
         self.assertTrue(context.within_capacity())
 
     def test_acquire_appends_to_task_logs(self):
         rate_limit = self.rate_limits[0]
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+        context = AsyncRequestContext(scheduler=self.throttler._scheduler,
                                       rate_limit=rate_limit,
-                                      related_limits=[],
-                                      lock=asyncio.Lock(),
-                                      safety_margin_pct=self.throttler._safety_margin_pct)
+                                      related_limits=[])
         self.ev_loop.run_until_complete(context.acquire())
 
         # We acquire()'d just one rate_limit, task log should have only one entry
-        self.assertEqual(1, len(self.throttler._task_logs))
+        self.assertEqual(1, len(self.throttler._scheduler.task_logs))
 
     def test_acquire_awaits_when_exceed_capacity(self):
         rate_limit = self.rate_limits[0]
-        self.throttler._task_logs.append(
+        self.log_task(
             TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight))
-        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+        context = AsyncRequestContext(scheduler=self.throttler._scheduler,
                                       rate_limit=rate_limit,
-                                      related_limits=[(rate_limit, rate_limit.weight)],
-                                      lock=asyncio.Lock(),
-                                      safety_margin_pct=self.throttler._safety_margin_pct)
+                                      related_limits=[(rate_limit, rate_limit.weight)])
         with self.assertRaises(asyncio.exceptions.TimeoutError):
             self.ev_loop.run_until_complete(
                 asyncio.wait_for(context.acquire(), 1.0)
@@ -243,16 +220,14 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         ])
 
         # Scenario where one specific task was executed at 0 milliseconds
-        tasks_log = []
-        tasks_log.append(TaskLog(timestamp=1640000000.0000, rate_limit=per_millisecond_limit, weight=1))
-        tasks_log.append(TaskLog(timestamp=1640000000.0000, rate_limit=per_second_limit, weight=1))
+        scheduler = RateLimitScheduler(safety_margin_pct=0)
+        self.log_task(TaskLog(timestamp=1640000000.0000, rate_limit=per_millisecond_limit, weight=1), scheduler)
+        self.log_task(TaskLog(timestamp=1640000000.0000, rate_limit=per_second_limit, weight=1), scheduler)
 
         context = AsyncRequestContext(
-            task_logs=tasks_log,
+            scheduler=scheduler,
             rate_limit=specific_limit,
             related_limits=[(per_millisecond_limit, 1), (per_second_limit, 1), (specific_limit, 1)],
-            lock=asyncio.Lock(),
-            safety_margin_pct=0,
         )
 
         time_mock.return_value = 1640000000.0100
@@ -260,8 +235,8 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         self.assertTrue(result)
 
         # Add one more occurrence of the same task but at millisecond 1
-        tasks_log.append(TaskLog(timestamp=1640000000.1000, rate_limit=per_millisecond_limit, weight=1))
-        tasks_log.append(TaskLog(timestamp=1640000000.1000, rate_limit=per_second_limit, weight=1))
+        self.log_task(TaskLog(timestamp=1640000000.1000, rate_limit=per_millisecond_limit, weight=1), scheduler)
+        self.log_task(TaskLog(timestamp=1640000000.1000, rate_limit=per_second_limit, weight=1), scheduler)
 
         time_mock.return_value = 1640000000.1000
         result = context.within_capacity()
@@ -278,3 +253,80 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         time_mock.return_value = 1640000000.2100
         result = context.within_capacity()
         self.assertTrue(result)
+
+    def test_waiting_task_is_woken_when_capacity_frees_up(self):
+        rate_limit = RateLimit(limit_id="fast", limit=1, time_interval=0.3)
+        throttler = AsyncThrottler(rate_limits=[rate_limit], safety_margin_pct=0)
+
+        async def acquire_twice():
+            async with throttler.execute_task("fast"):
+                start = time.time()
+            async with throttler.execute_task("fast"):
+                return time.time() - start
+
+        elapsed = self.ev_loop.run_until_complete(asyncio.wait_for(acquire_twice(), 1))
+        self.assertGreaterEqual(elapsed, 0.3)
+        # woken once the first task log expires, not on a polling interval
+        self.assertLess(elapsed, 0.35)
+        self.assertEqual(0, throttler._scheduler.waiting_tasks)
+
+    def test_waiting_tasks_go_in_arrival_order(self):
+        pool = RateLimit(limit_id="pool", limit=6, time_interval=0.2)
+        heavy = RateLimit(limit_id="heavy", limit=100, time_interval=0.2, linked_limits=[LinkedLimitWeightPair("pool", 5)])
+        light = RateLimit(limit_id="light", limit=100, time_interval=0.2, linked_limits=[LinkedLimitWeightPair("pool", 1)])
+        other = RateLimit(limit_id="other", limit=100, time_interval=0.2)
+        throttler = AsyncThrottler(rate_limits=[pool, heavy, light, other], safety_margin_pct=0)
+        order = []
+
+        async def request(limit_id: str):
+            async with throttler.execute_task(limit_id):
+                order.append(limit_id)
+
+        async def run():
+            await request("heavy")
+            # the light task would fit in the pool right away but arrived after the heavy one
+            await asyncio.gather(request("heavy"), request("light"), request("other"))
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(run(), 1))
+        self.assertEqual(["heavy", "other", "heavy", "light"], order)
+
+    def test_cancelled_waiting_task_lets_next_ones_go(self):
+        rate_limit = RateLimit(limit_id="slow", limit=1, time_interval=0.3)
+        throttler = AsyncThrottler(rate_limits=[rate_limit], safety_margin_pct=0)
+
+        async def run():
+            async with throttler.execute_task("slow"):
+                pass
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(throttler.execute_task("slow").acquire(), 0.1)
+            self.assertEqual(0, throttler._scheduler.waiting_tasks)
+            async with throttler.execute_task("slow"):
+                pass
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(run(), 1))
+        # the cancelled task was never logged, and the first one expired before the last one went
+        self.assertEqual(1, len(throttler._scheduler.task_logs))
+
+    def test_task_heavier_than_its_limit_goes_alone_once_the_window_is_empty(self):
+        pool = RateLimit(limit_id="pool", limit=2, time_interval=0.2)
+        heavy = RateLimit(limit_id="heavy", limit=100, time_interval=0.2, linked_limits=[LinkedLimitWeightPair("pool", 5)])
+        light = RateLimit(limit_id="light", limit=100, time_interval=0.2, linked_limits=[LinkedLimitWeightPair("pool", 1)])
+        throttler = AsyncThrottler(rate_limits=[pool, heavy, light], safety_margin_pct=0)
+        order = []
+
+        async def request(limit_id: str):
+            async with throttler.execute_task(limit_id):
+                order.append((limit_id, time.time()))
+
+        async def run():
+            await request("light")
+            await asyncio.gather(request("heavy"), request("light"))
+
+        start = time.time()
+        self.ev_loop.run_until_complete(asyncio.wait_for(run(), 1))
+
+        self.assertEqual(["light", "heavy", "light"], [limit_id for limit_id, _ in order])
+        # the heavy task waited for the first light one to expire, and the last one for the heavy one to expire
+        self.assertGreaterEqual(order[1][1] - start, 0.2)
+        self.assertGreaterEqual(order[2][1] - order[1][1], 0.2)
+        self.assertEqual(0, throttler._scheduler.waiting_tasks)
@@ -0,0 +1,143 @@
+import asyncio
+import shutil
+import tempfile
+import time
+import unittest
+from decimal import Decimal
+from unittest.mock import patch
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+from hummingbot.core.api_throttler.shared_rate_limit_scheduler import SharedRateLimitScheduler, log_capacity
+
+
+class SharedRateLimitSchedulerTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.shared_dir = tempfile.mkdtemp()
+        self.rate_limits = [
+            RateLimit(limit_id="pool", limit=2, time_interval=0.3),
+            RateLimit(limit_id="/orders", limit=100, time_interval=0.3, linked_limits=[LinkedLimitWeightPair("pool")]),
+        ]
+        AsyncThrottlerBase.share_rate_limits(self.shared_dir)
+
+    def tearDown(self) -> None:
+        AsyncThrottlerBase.share_rate_limits(None)
+        SharedRateLimitScheduler._instances.clear()
+        shutil.rmtree(self.shared_dir)
+        super().tearDown()
+
+    def test_throttlers_with_the_same_limits_share_them(self):
+        first = AsyncThrottler(rate_limits=self.rate_limits, safety_margin_pct=0, limits_share_percentage=Decimal(100))
+        second = AsyncThrottler(rate_limits=self.rate_limits, safety_margin_pct=0, limits_share_percentage=Decimal(100))
+        other = AsyncThrottler(rate_limits=[RateLimit(limit_id="pool", limit=2, time_interval=1)], safety_margin_pct=0, limits_share_percentage=Decimal(100))
+        self.assertIsInstance(first._scheduler, SharedRateLimitScheduler)
+        self.assertIs(first._scheduler, second._scheduler)
+        self.assertIsNot(first._scheduler, other._scheduler)
+
+        async def run():
+            start = time.time()
+            async with first.execute_task("/orders"):
+                pass
+            async with second.execute_task("/orders"):
+                pass
+            # the pool is used up by the two throttlers together
+            async with second.execute_task("pool"):
+                return time.time() - start
+
+        elapsed = self.ev_loop.run_until_complete(asyncio.wait_for(run(), 1))
+        self.assertGreaterEqual(elapsed, 0.3)
+        self.assertLess(elapsed, 0.4)
+
+    def test_throttlers_with_different_limits_or_margins_do_not_share_them(self):
+        throttler = AsyncThrottler(rate_limits=self.rate_limits, safety_margin_pct=0, limits_share_percentage=Decimal(100))
+        other_share = AsyncThrottler(rate_limits=self.rate_limits, safety_margin_pct=0, limits_share_percentage=Decimal(50))
+        other_limit = AsyncThrottler(
+            rate_limits=[RateLimit(limit_id="pool", limit=3, time_interval=0.3), self.rate_limits[1]],
+            safety_margin_pct=0,
+            limits_share_percentage=Decimal(100),
+        )
+        other_margin = AsyncThrottler(rate_limits=self.rate_limits, safety_margin_pct=0.1, limits_share_percentage=Decimal(100))
+        schedulers = [throttler._scheduler, other_share._scheduler, other_limit._scheduler, other_margin._scheduler]
+        self.assertEqual(4, len({id(scheduler) for scheduler in schedulers}))
+        self.assertEqual(4, len({scheduler.path for scheduler in schedulers}))
+        self.assertEqual(0.1, other_margin._scheduler._safety_margin_pct)
+
+    def test_task_logs_are_shared_across_processes(self):
+        throttler = AsyncThrottler(rate_limits=self.rate_limits, safety_margin_pct=0, limits_share_percentage=Decimal(100))
+        # what another process maps from the same file
+        other_process = SharedRateLimitScheduler(throttler._scheduler.path, self.rate_limits, safety_margin_pct=0)
+        pool, orders = self.rate_limits[0], self.rate_limits[1]
+
+        now = time.time()
+        self.assertEqual(now, other_process.log_if_available([(orders, 1), (pool, 1)], now))
+        self.assertEqual(now, other_process.log_if_available([(pool, 1)], now))
+        self.assertEqual(2, throttler._scheduler.used(throttler._id_to_limit_map["pool"], now))
+        self.assertEqual(3, len(throttler._scheduler.task_logs))
+        self.assertFalse(throttler.execute_task("/orders").within_capacity())
+
+        available_at = throttler._scheduler.available_at([(pool, 1)], now)
+        self.assertAlmostEqual(now + 0.3, available_at, places=4)
+        self.assertEqual(now + 0.31, other_process.log_if_available([(pool, 1)], now + 0.31))
+
+    def test_telemetry(self):
+        throttler = AsyncThrottler(rate_limits=self.rate_limits, safety_margin_pct=0, limits_share_percentage=Decimal(100))
+
+        async def run():
+            for _ in range(3):
+                async with throttler.execute_task("/orders"):
+                    pass
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(run(), 1))
+        telemetry = {limit.limit_id: limit for limit in throttler.telemetry()}
+        self.assertEqual(1, telemetry["pool"].used)
+        self.assertEqual(0.5, telemetry["pool"].utilisation)
+        self.assertEqual(0, telemetry["pool"].waiting)
+        # two tasks went right away, the third one waited for the pool
+        self.assertEqual(3, sum(telemetry["pool"].wait_time_histogram.values()))
+        self.assertEqual(2, telemetry["pool"].wait_time_histogram[0.001])
+        self.assertEqual(1, telemetry["pool"].wait_time_histogram[1.0])
+
+    def test_each_limit_keeps_all_the_task_logs_of_its_period(self):
+        daily = RateLimit(limit_id="daily", limit=5, time_interval=24 * 60 * 60)
+        busy = RateLimit(limit_id="busy", limit=1000, time_interval=0.001)
+        scheduler = SharedRateLimitScheduler.for_rate_limits(self.shared_dir, [daily, busy], safety_margin_pct=0)
+        self.assertEqual(5, log_capacity(daily))
+
+        now = time.time()
+        for i in range(4):
+            self.assertEqual(now + i, scheduler.log_if_available([(daily, 1)], now + i))
+        # the busy limit wraps around its own ring many times without overwriting the task logs of the daily one
+        for i in range(5000):
+            scheduler.log([(busy, 1)], now + 4 + i * 0.01)
+        self.assertEqual(4, scheduler.used(daily, now + 60))
+        self.assertEqual(now + 60, scheduler.log_if_available([(daily, 1)], now + 60))
+        self.assertAlmostEqual(now + 24 * 60 * 60, scheduler.available_at([(daily, 1)], now + 61), places=4)
+
+    def test_task_heavier_than_its_limit_goes_alone_once_the_window_is_empty(self):
+        pool, orders = self.rate_limits
+        scheduler = SharedRateLimitScheduler.for_rate_limits(self.shared_dir, self.rate_limits, safety_margin_pct=0)
+
+        now = time.time()
+        self.assertEqual(now, scheduler.log_if_available([(pool, 1)], now))
+        self.assertAlmostEqual(now + 0.3, scheduler.available_at([(orders, 1), (pool, 5)], now), places=4)
+        self.assertEqual(now + 0.31, scheduler.log_if_available([(orders, 1), (pool, 5)], now + 0.31))
+        self.assertEqual(5, scheduler.used(pool, now + 0.31))
+
+    @patch("hummingbot.core.api_throttler.shared_rate_limit_scheduler.MAX_LOG_CAPACITY", 10)
+    def test_overwriting_task_logs_within_their_period_is_warned(self):
+        huge = RateLimit(limit_id="huge", limit=10 ** 9, time_interval=60)
+        scheduler = SharedRateLimitScheduler.for_rate_limits(self.shared_dir, [huge], safety_margin_pct=0)
+        self.assertEqual(10, log_capacity(huge))
+        now = time.time()
+
+        with self.assertLogs("hummingbot.core.api_throttler.shared_rate_limit_scheduler", "WARNING") as logs:
+            for _ in range(12):
+                scheduler.log([(huge, 1)], now)
+
+        self.assertEqual(1, len(logs.output))
+        self.assertIn("The shared task logs of the rate limit huge are full", logs.output[0])
+        self.assertEqual(10, scheduler.used(huge, now))
@@ -0,0 +1,106 @@
+import shutil
+import tempfile
+import unittest
+from decimal import Decimal
+
+import numpy as np
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock
+from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.data_type.common import OrderType
+from hummingbot.core.data_type.market_data_format import (
+    BUY,
+    DIFF,
+    SELL,
+    SNAPSHOT,
+    read_segment,
+    segment_path,
+    to_records,
+    trade_record,
+    write_segment,
+)
+from hummingbot.core.data_type.market_data_replay import MarketDataReplay
+from hummingbot.core.data_type.order_book import OrderBook
+
+
+class MarketDataReplayTest(unittest.TestCase):
+    trading_pair = "BTC-USDT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.data_dir = tempfile.mkdtemp()
+        write_segment(segment_path(self.data_dir, self.trading_pair, 0), np.concatenate([
+            to_records(SNAPSHOT, 10, 1, [[99, 1], [98, 2]], [[101, 1], [102, 2]]),
+            to_records(DIFF, 11, 2, [[100, 3]], []),
+            to_records(DIFF, 11, 3, [], [[101, 0]]),
+            trade_record(12, 4, SELL, 99, 0.5),
+        ]))
+        write_segment(segment_path(self.data_dir, self.trading_pair, 1), np.concatenate([
+            to_records(SNAPSHOT, 20, 5, [[109, 1]], [[111, 1]]),
+            to_records(DIFF, 21, 6, [[110, 1]], []),
+        ]))
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.data_dir)
+        super().tearDown()
+
+    def test_segment_round_trip(self):
+        records = read_segment(segment_path(self.data_dir, self.trading_pair, 0))
+        self.assertEqual(7, len(records))
+        self.assertEqual([SNAPSHOT] * 4 + [DIFF] * 2, records["kind"][:6].tolist())
+        self.assertEqual([BUY, BUY, SELL, SELL], records["side"][:4].tolist())
+        self.assertEqual(0.5, records["amount"][-1])
+        with open(segment_path(self.data_dir, self.trading_pair, 1), "ab") as f:
+            f.write(b"\x00" * 5)
+        self.assertEqual(3, len(read_segment(segment_path(self.data_dir, self.trading_pair, 1))))
+
+    def test_replay_follows_clock(self):
+        order_book = OrderBook()
+        replay = MarketDataReplay(self.data_dir, {self.trading_pair: order_book})
+        self.assertEqual((10, 21), replay.time_range())
+        clock = Clock(ClockMode.BACKTEST, 1, 9, float("nan"))
+        clock.add_iterator(replay)
+
+        clock.backtest_til(10)
+        self.assertEqual(99, order_book.get_price(False))
+        self.assertEqual(101, order_book.get_price(True))
+        clock.backtest_til(11)
+        self.assertEqual(100, order_book.get_price(False))
+        self.assertEqual(102, order_book.get_price(True))
+        clock.backtest_til(12)
+        self.assertEqual(99, order_book.last_trade_price)
+        clock.backtest_til(21)
+        self.assertEqual(110, order_book.get_price(False))
+        self.assertEqual(111, order_book.get_price(True))
+        self.assertEqual(10, replay.records_applied)
+
+        clock.backtest()
+        self.assertEqual(22, clock.current_timestamp)
+
+    def test_replay_starts_from_last_snapshot(self):
+        order_book = OrderBook()
+        replay = MarketDataReplay(self.data_dir, {self.trading_pair: order_book})
+        clock = Clock(ClockMode.BACKTEST, 1, 20, float("nan"))
+        clock.add_iterator(replay)
+        clock.backtest_til(21)
+        self.assertEqual(110, order_book.get_price(False))
+        self.assertEqual(3, replay.records_applied)
+
+    def test_replay_fills_paper_trade_orders(self):
+        market = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        market.new_empty_order_book(self.trading_pair)
+        market.set_balance("BTC", 10)
+        market.set_balance("USDT", 10000)
+        replay = MarketDataReplay.from_market(self.data_dir, market)
+        self.assertIs(market.order_books[self.trading_pair], replay.order_books[self.trading_pair])
+        clock = Clock(ClockMode.BACKTEST, 1, 9, float("nan"))
+        clock.add_iterator(replay)
+        clock.add_iterator(market)
+
+        clock.backtest_til(11)
+        market.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("99.5"))
+        clock.backtest_til(12)
+        self.assertEqual(Decimal("11"), market.get_balance("BTC"))
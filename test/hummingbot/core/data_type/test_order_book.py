@@ -40,16 +40,99 @@ class OrderBookUnitTest(unittest.TestCase):
         best_ask = asks.iloc[0].tolist()
         self.assertEqual(best_bid, [3., 1., 3.])
         self.assertEqual(best_ask, [4., 1., 1.])
+        self.assertFalse(self.order_book_cex.last_diff_crossed)
 
         new_ask = np.array([[2, 0.1, 5]])
         new_bid = np.array([[50, 0.01, 6]])
         self.order_book_cex.apply_numpy_diffs(new_bid, new_ask)
+        self.assertTrue(self.order_book_cex.last_diff_crossed)
         bids, asks = self.order_book_cex.snapshot
         best_bid = len(bids) and bids.iloc[0].tolist()
         best_ask = len(asks) and asks.iloc[0].tolist()
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_to_numpy(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [1.5, 2, 4], [2, 1, 2], [3, 1, 3]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [4.5, 2, 5], [5, 1, 2], [6, 1, 3]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        bids, asks = order_book.to_numpy()
+        self.assertEqual([3, 2, 1.5, 1], bids["price"].tolist())
+        self.assertEqual([1, 1, 2, 1], bids["amount"].tolist())
+        self.assertEqual([3, 2, 4, 1], bids["update_id"].tolist())
+        self.assertEqual([4, 4.5, 5, 6], asks["price"].tolist())
+
+        bids, asks = order_book.to_numpy(depth=2)
+        self.assertEqual([3, 2], bids["price"].tolist())
+        self.assertEqual([4, 4.5], asks["price"].tolist())
+
+        bids, asks = order_book.to_numpy(depth=2, bucket_size=1)
+        self.assertEqual([3, 2], bids["price"].tolist())
+        self.assertEqual([1, 1], bids["amount"].tolist())
+        self.assertEqual([4, 5], asks["price"].tolist())
+        self.assertEqual([1, 3], asks["amount"].tolist())
+        self.assertEqual([1, 5], asks["update_id"].tolist())
+
+        bids, asks = order_book.to_numpy(bucket_size=2)
+        self.assertEqual([2, 0], bids["price"].tolist())
+        self.assertEqual([2, 3], bids["amount"].tolist())
+        self.assertEqual([4, 6], asks["price"].tolist())
+        self.assertEqual([1, 4], asks["amount"].tolist())
+
+    def assert_same_query_results(self, indexed_order_book: OrderBook, order_book: OrderBook):
+        for is_buy in [True, False]:
+            for volume in [0.5, 1, 2.5, 4, 100]:
+                for method_name in ["get_price_for_volume", "get_vwap_for_volume", "get_price_for_quote_volume",
+                                    "get_quote_volume_for_base_amount"]:
+                    indexed_result = getattr(indexed_order_book, method_name)(is_buy, volume)
+                    result = getattr(order_book, method_name)(is_buy, volume)
+                    self.assertEqual(str(result.result_price), str(indexed_result.result_price))
+                    self.assertAlmostEqual(result.result_volume, indexed_result.result_volume)
+            for price in [0.5, 1.5, 3, 4, 6.5, 10]:
+                for method_name in ["get_volume_for_price", "get_quote_volume_for_price"]:
+                    indexed_result = getattr(indexed_order_book, method_name)(is_buy, price)
+                    result = getattr(order_book, method_name)(is_buy, price)
+                    self.assertEqual(str(result.result_price), str(indexed_result.result_price))
+                    self.assertAlmostEqual(result.result_volume, indexed_result.result_volume)
+
+    def test_depth_index_queries_match_iterating_over_the_entries(self):
+        indexed_order_book = OrderBook()
+        order_book = OrderBook()
+        order_book.depth_index_enabled = False
+        bids_array = np.array([[1, 1, 1], [2, 1, 2], [3, 1, 3]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 2, 2], [6, 1, 3], [7, 1, 4]], dtype=np.float64)
+        diffs = [
+            (np.array([[2.5, 3, 5]], dtype=np.float64), np.array([[5, 0, 5]], dtype=np.float64)),
+            (np.array([[3, 0, 6]], dtype=np.float64), np.array([[3.5, 0.5, 6], [8, 2, 6]], dtype=np.float64)),
+            (np.array([[1, 2, 7]], dtype=np.float64), np.array([[7, 0.25, 7]], dtype=np.float64)),
+        ]
+
+        for book in [indexed_order_book, order_book]:
+            book.apply_numpy_snapshot(bids_array, asks_array)
+        self.assert_same_query_results(indexed_order_book, order_book)
+        for bids_diff, asks_diff in diffs:
+            for book in [indexed_order_book, order_book]:
+                book.apply_numpy_diffs(bids_diff, asks_diff)
+            self.assert_same_query_results(indexed_order_book, order_book)
+
+    def test_batch_queries(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 1, 2], [3, 1, 3]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 2, 2], [6, 1, 3]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        prices = order_book.get_prices_for_volumes(True, [1, 2, 4, 5])
+        vwaps = order_book.get_vwaps_for_volumes(False, [1, 2])
+        volumes = order_book.get_volumes_for_prices(True, [3, 5])
+
+        self.assertEqual([4, 5, 6], [result.result_price for result in prices[:3]])
+        self.assertTrue(np.isnan(prices[3].result_price))
+        self.assertEqual(4, prices[3].result_volume)
+        self.assertEqual([3, 2.5], [result.result_price for result in vwaps])
+        self.assertEqual([0, 3], [result.result_volume for result in volumes])
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -119,6 +119,25 @@ class OrderBookMessageTest(unittest.TestCase):
         self.assertEqual(6, bids[0].amount)
         self.assertEqual(update_id, bids[0].update_id)
 
+    def test_bids_and_asks_are_converted_once(self):
+        update_id = "someId"
+        pre_parsed_ask = OrderBookRow(3.0, 4.0, update_id)
+        msg = OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={
+                "update_id": update_id,
+                "asks": [("1", "2"), pre_parsed_ask],
+                "bids": [["5", "6", "ignored"]],
+            },
+            timestamp=time.time(),
+        )
+
+        self.assertIs(msg.asks, msg.asks)
+        self.assertIs(msg.bids, msg.bids)
+        self.assertEqual([OrderBookRow(1.0, 2.0, update_id), pre_parsed_ask], msg.asks)
+        self.assertIs(pre_parsed_ask, msg.asks[1])
+        self.assertEqual([OrderBookRow(5.0, 6.0, update_id)], msg.bids)
+
     def test_has_update_id(self):
         update_id = "someId"
 
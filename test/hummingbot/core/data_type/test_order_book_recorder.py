@@ -0,0 +1,107 @@
+import asyncio
+import shutil
+import tempfile
+import unittest
+from typing import Awaitable
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.market_data_format import DIFF, SNAPSHOT, TRADE, read_index, read_segment, segment_paths
+from hummingbot.core.data_type.market_data_replay import MarketDataReplay
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+
+class OrderBookRecorderTest(unittest.TestCase):
+    trading_pair = "BTC-USDT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.data_dir = tempfile.mkdtemp()
+        self.tracker = OrderBookTracker(data_source=MagicMock(), trading_pairs=[self.trading_pair])
+        self.order_book = OrderBook()
+        self.order_book.apply_numpy_snapshot(np.array([[99, 1, 1], [98, 2, 1]], dtype=np.float64),
+                                             np.array([[101, 1, 1]], dtype=np.float64))
+        self.tracker._order_books[self.trading_pair] = self.order_book
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.data_dir)
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        return asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def diff(self, timestamp: float, update_id: int, bids, asks) -> OrderBookMessage:
+        message = OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pair, "update_id": update_id, "bids": bids, "asks": asks}, timestamp)
+        # as done by the tracker before notifying its listeners
+        self.order_book.apply_diffs(message.bids, message.asks, message.update_id)
+        return message
+
+    def trade(self, timestamp: float, trade_id: int, price: float) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.TRADE, {
+            "trading_pair": self.trading_pair, "trade_id": trade_id, "trade_type": float(TradeType.SELL.value),
+            "price": price, "amount": 0.5}, timestamp)
+
+    def test_records_and_replays(self):
+        recorder = OrderBookRecorder(self.tracker, self.data_dir)
+        recorder.start()
+        self.tracker._notify_message_listeners(self.diff(10, 2, [["100", "3"]], []))
+        self.tracker._notify_message_listeners(self.trade(11, 3, 99))
+        self.tracker._notify_message_listeners(self.diff(12, 4, [], [["101", "0"], ["102", "2"]]))
+        self.assertEqual(8, recorder.pending_records)
+        self.async_run_with_timeout(recorder.stop())
+        self.tracker._notify_message_listeners(self.diff(13, 5, [["97", "1"]], []))
+
+        paths = segment_paths(self.data_dir, self.trading_pair)
+        self.assertEqual(1, len(paths))
+        records = read_segment(paths[0])
+        # snapshot of the book before the first diff was recorded, then the messages
+        self.assertEqual([SNAPSHOT] * 4 + [DIFF, TRADE, DIFF, DIFF], records["kind"].tolist())
+        index = read_index(self.data_dir, self.trading_pair)
+        self.assertEqual([(0, 10.0, 12.0, 8)], index.tolist())
+
+        replayed = OrderBook()
+        replay = MarketDataReplay(self.data_dir, {self.trading_pair: replayed})
+        replay.tick(12)
+        self.assertEqual(100, replayed.get_price(False))
+        self.assertEqual(102, replayed.get_price(True))
+        self.assertEqual(99, replayed.last_trade_price)
+
+    def test_rotation_starts_segments_with_snapshot(self):
+        recorder = OrderBookRecorder(self.tracker, self.data_dir, segment_max_records=6)
+        recorder.start()
+        self.tracker._notify_message_listeners(self.diff(10, 2, [["100", "3"]], []))
+        self.tracker._notify_message_listeners(self.diff(11, 3, [["100", "4"]], []))
+        self.tracker._notify_message_listeners(self.trade(12, 4, 99))
+        self.async_run_with_timeout(recorder.stop())
+
+        paths = segment_paths(self.data_dir, self.trading_pair)
+        self.assertEqual(2, len(paths))
+        self.assertEqual([SNAPSHOT] * 4 + [DIFF, DIFF], read_segment(paths[0])["kind"].tolist())
+        self.assertEqual([SNAPSHOT] * 4 + [TRADE], read_segment(paths[1])["kind"].tolist())
+        self.assertEqual([0, 1], read_index(self.data_dir, self.trading_pair)["segment"].tolist())
+
+        recorder = OrderBookRecorder(self.tracker, self.data_dir)
+        recorder.start()
+        self.tracker._notify_message_listeners(self.trade(13, 5, 98))
+        self.async_run_with_timeout(recorder.stop())
+        self.assertEqual(3, len(segment_paths(self.data_dir, self.trading_pair)))
+
+    def test_bounded_buffer_drops_and_resnapshots(self):
+        recorder = OrderBookRecorder(self.tracker, self.data_dir, max_buffered_records=5)
+        recorder.start()
+        self.tracker._notify_message_listeners(self.diff(10, 2, [["100", "3"]], []))
+        self.tracker._notify_message_listeners(self.diff(11, 3, [["100", "4"]], []))
+        self.assertEqual(1, recorder.dropped_messages)
+        self.async_run_with_timeout(recorder.flush())
+        self.tracker._notify_message_listeners(self.diff(12, 4, [["100", "5"]], []))
+        self.async_run_with_timeout(recorder.stop())
+
+        records = read_segment(segment_paths(self.data_dir, self.trading_pair)[0])
+        self.assertEqual([SNAPSHOT] * 4 + [DIFF] + [SNAPSHOT] * 4 + [DIFF], records["kind"].tolist())
+        self.assertEqual(5, records["amount"][-5])
@@ -0,0 +1,183 @@
+import asyncio
+import time
+import unittest
+from typing import Awaitable, List, Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+
+class OrderBookTrackerTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.data_source = MagicMock()
+        self.data_source.CONTIGUOUS_DIFF_UPDATE_IDS = True
+        self.data_source.RESYNC_CROSSED_ORDER_BOOKS = False
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=[self.trading_pair])
+        self.order_book = OrderBook()
+        self.order_book.apply_snapshot([], [], 1)
+        self.tracker._order_books[self.trading_pair] = self.order_book
+        self.tracker._last_update_ids[self.trading_pair] = 1
+        self.tracker._tracking_message_queues[self.trading_pair] = asyncio.Queue()
+        self.tracking_task = None
+        self.received_messages: List[OrderBookMessage] = []
+        self.tracker.add_message_listener(self.received_messages.append)
+
+    def tearDown(self) -> None:
+        self.tracking_task and self.tracking_task.cancel()
+        self.tracker.stop()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def diff_message(
+            self, update_id: int, bids: List, asks: List, first_update_id: Optional[int] = None) -> OrderBookMessage:
+        return OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {
+                "trading_pair": self.trading_pair,
+                "first_update_id": update_id if first_update_id is None else first_update_id,
+                "update_id": update_id,
+                "bids": bids,
+                "asks": asks,
+            },
+            timestamp=update_id)
+
+    @staticmethod
+    def exchange_order_book(update_id: int, bids: List, asks: List) -> OrderBook:
+        order_book = OrderBook()
+        order_book.apply_snapshot(
+            [OrderBookRow(price, amount, update_id) for price, amount in bids],
+            [OrderBookRow(price, amount, update_id) for price, amount in asks],
+            update_id)
+        return order_book
+
+    def queue_messages(self, messages: List[OrderBookMessage]):
+        for message in messages:
+            self.tracker._tracking_message_queues[self.trading_pair].put_nowait(message)
+
+    def run_tracking(self):
+        self.tracking_task = self.ev_loop.create_task(self.tracker._track_single_book(self.trading_pair))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+    def test_queued_diffs_are_coalesced_and_applied_at_once(self):
+        messages = [
+            self.diff_message(2, bids=[["10", "1"], ["9", "2"]], asks=[["11", "1"]]),
+            self.diff_message(3, bids=[["10", "0"]], asks=[["11", "3"], ["12", "1"]]),
+            self.diff_message(4, bids=[["9", "5"]], asks=[]),
+        ]
+        self.queue_messages(messages)
+
+        with patch.object(self.tracker, "_apply_diff_messages", wraps=self.tracker._apply_diff_messages) as apply_mock:
+            self.run_tracking()
+
+        apply_mock.assert_called_once_with(self.order_book, messages)
+        bids, asks = self.order_book.to_numpy()
+        self.assertEqual([(9, 5, 4)], bids.tolist())
+        self.assertEqual([(11, 3, 3), (12, 1, 3)], asks.tolist())
+        self.assertEqual(4, self.order_book.last_diff_uid)
+        self.assertEqual(messages, self.received_messages)
+        self.assertEqual(messages, list(self.tracker._past_diffs_windows[self.trading_pair]))
+
+    def test_snapshot_ends_the_batch_of_diffs(self):
+        snapshot = OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": self.trading_pair, "update_id": 3, "bids": [["8", "1"]], "asks": [["11", "1"]]},
+            timestamp=3)
+        messages = [
+            self.diff_message(2, bids=[["10", "1"]], asks=[]),
+            snapshot,
+            self.diff_message(4, bids=[], asks=[["12", "2"]]),
+        ]
+        self.queue_messages(messages)
+
+        with patch.object(self.tracker, "_apply_diff_messages", wraps=self.tracker._apply_diff_messages) as apply_mock:
+            self.run_tracking()
+
+        self.assertEqual(2, apply_mock.call_count)
+        self.assertEqual([messages[0]], apply_mock.call_args_list[0].args[1])
+        self.assertEqual([messages[2]], apply_mock.call_args_list[1].args[1])
+        _, asks = self.order_book.to_numpy()
+        self.assertEqual([(11, 1, 3), (12, 2, 4)], asks.tolist())
+        self.assertEqual(3, self.order_book.snapshot_uid)
+        self.assertEqual(messages, self.received_messages)
+
+    @patch.object(OrderBookTracker, "_initial_order_book_for_trading_pair", new_callable=AsyncMock)
+    def test_gap_in_diff_update_ids_resyncs_the_order_book(self, initial_order_book_mock: AsyncMock):
+        initial_order_book_mock.return_value = self.exchange_order_book(6, bids=[(9, 4)], asks=[(11, 1)])
+        diff = self.diff_message(2, bids=[["10", "1"]], asks=[])
+        gap_diffs = [
+            self.diff_message(6, bids=[["9", "2"]], asks=[], first_update_id=5),
+            self.diff_message(7, bids=[], asks=[["12", "3"]]),
+        ]
+        self.queue_messages([diff] + gap_diffs)
+
+        self.run_tracking()
+
+        initial_order_book_mock.assert_awaited_once_with(self.trading_pair)
+        bids, asks = self.order_book.to_numpy()
+        self.assertEqual([(9, 4, 6)], bids.tolist())
+        self.assertEqual([(11, 1, 6), (12, 3, 7)], asks.tolist())
+        self.assertEqual(6, self.order_book.snapshot_uid)
+        self.assertEqual(
+            [diff, OrderBookMessageType.SNAPSHOT, gap_diffs[1]],
+            [self.received_messages[0], self.received_messages[1].type, self.received_messages[2]])
+        self.assertEqual(
+            {"gaps": 1, "crossed_books": 0, "resyncs": 1, "resyncs_completed": 1, "snapshot_failures": 0,
+             "replayed_diffs": 1},
+            self.tracker.resync_stats[self.trading_pair])
+
+    @patch.object(OrderBookTracker, "_initial_order_book_for_trading_pair", new_callable=AsyncMock)
+    def test_crossed_book_resyncs_the_order_book(self, initial_order_book_mock: AsyncMock):
+        self.data_source.CONTIGUOUS_DIFF_UPDATE_IDS = False
+        self.data_source.RESYNC_CROSSED_ORDER_BOOKS = True
+        initial_order_book_mock.return_value = self.exchange_order_book(3, bids=[(10, 1)], asks=[(11, 1)])
+        self.queue_messages([self.diff_message(2, bids=[["12", "1"]], asks=[["11", "1"]])])
+
+        self.run_tracking()
+
+        self.assertFalse(self.order_book.last_diff_crossed)
+        self.assertEqual(10, self.order_book.get_price(False))
+        self.assertEqual(11, self.order_book.get_price(True))
+        self.assertEqual(1, self.tracker.resync_stats[self.trading_pair]["crossed_books"])
+        self.assertEqual(1, self.tracker.resync_stats[self.trading_pair]["resyncs_completed"])
+
+    @patch.object(OrderBookTracker, "_initial_order_book_for_trading_pair", new_callable=AsyncMock)
+    def test_crossed_book_is_not_resynced_unless_enabled(self, initial_order_book_mock: AsyncMock):
+        self.queue_messages([self.diff_message(2, bids=[["12", "1"]], asks=[["11", "1"]])])
+
+        self.run_tracking()
+
+        initial_order_book_mock.assert_not_awaited()
+        self.assertTrue(self.order_book.last_diff_crossed)
+        self.assertNotIn(self.trading_pair, self.tracker.resync_stats)
+
+    @patch.object(OrderBookTracker, "_initial_order_book_for_trading_pair", new_callable=AsyncMock)
+    def test_resyncs_are_throttled_and_deduplicated(self, initial_order_book_mock: AsyncMock):
+        self.tracker.RESYNC_MIN_INTERVAL = 10
+        self.tracker._last_resync_timestamps[self.trading_pair] = time.perf_counter()
+        self.queue_messages([
+            self.diff_message(4, bids=[["10", "1"]], asks=[], first_update_id=3),
+            self.diff_message(8, bids=[["9", "1"]], asks=[], first_update_id=7),
+        ])
+
+        self.run_tracking()
+
+        initial_order_book_mock.assert_not_awaited()
+        self.assertEqual(0, len(self.order_book.to_numpy()[0]))
+        self.assertEqual(2, len(self.tracker._resync_buffers[self.trading_pair]))
+        self.assertEqual(1, self.tracker.resync_stats[self.trading_pair]["gaps"])
+        self.assertEqual(1, self.tracker.resync_stats[self.trading_pair]["resyncs"])
+        self.assertEqual([], self.received_messages)
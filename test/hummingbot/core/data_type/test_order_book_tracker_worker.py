@@ -0,0 +1,140 @@
+import asyncio
+import unittest
+from typing import List
+from unittest.mock import AsyncMock, MagicMock
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_worker import (
+    ADD_ORDER_BOOK,
+    OrderBookWorkerProcessor,
+    order_book_command,
+)
+from hummingbot.core.data_type.shared_order_book_ladder import SharedOrderBookLadder
+
+
+class OrderBookWorkerProcessorTests(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ladder = SharedOrderBookLadder(depth=2)
+        self.processor = OrderBookWorkerProcessor()
+        self.processor.process([(ADD_ORDER_BOOK, self.trading_pair, self.ladder.name, 2)])
+
+    def tearDown(self) -> None:
+        self.processor.close()
+        self.ladder.close()
+        super().tearDown()
+
+    def message(self, message_type: OrderBookMessageType, update_id: int, bids, asks) -> OrderBookMessage:
+        return OrderBookMessage(
+            message_type,
+            {"trading_pair": self.trading_pair, "update_id": update_id, "bids": bids, "asks": asks},
+            timestamp=update_id)
+
+    def test_publishes_the_top_levels_of_the_updated_order_books(self):
+        self.processor.process([
+            order_book_command(self.message(
+                OrderBookMessageType.SNAPSHOT, 10, [["10", "1"], ["9", "1"], ["8", "1"]], [["11", "1"]])),
+            order_book_command(self.message(OrderBookMessageType.DIFF, 11, [["10", "0"]], [["12", "2"]])),
+        ])
+
+        sequence, update_id, bids, asks = self.ladder.read()
+
+        self.assertEqual(1, sequence)
+        self.assertEqual(11, update_id)
+        self.assertEqual([[9, 1, 10], [8, 1, 10]], bids.tolist())
+        self.assertEqual([[11, 1, 10], [12, 2, 11]], asks.tolist())
+
+    def test_snapshot_replays_newer_diffs_and_older_diffs_are_ignored(self):
+        self.processor.process([
+            order_book_command(self.message(OrderBookMessageType.DIFF, 11, [["10", "2"]], [])),
+            order_book_command(self.message(OrderBookMessageType.DIFF, 13, [["9", "3"]], [])),
+            order_book_command(self.message(OrderBookMessageType.SNAPSHOT, 12, [["10", "1"]], [["11", "1"]])),
+            order_book_command(self.message(OrderBookMessageType.DIFF, 11, [["8", "4"]], [])),
+        ])
+
+        _, _, bids, asks = self.ladder.read()
+
+        self.assertEqual([[10, 1, 12], [9, 3, 13]], bids.tolist())
+        self.assertEqual([[11, 1, 12]], asks.tolist())
+
+
+class OrderBookTrackerWithWorkersTests(unittest.TestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        OrderBookTracker.process_order_books_in_workers(1)
+        self.data_source = MagicMock()
+        self.data_source.CONTIGUOUS_DIFF_UPDATE_IDS = True
+        self.data_source.RESYNC_CROSSED_ORDER_BOOKS = False
+        self.data_source.get_new_order_book = AsyncMock(side_effect=self.new_order_book)
+        self.data_source.get_last_traded_prices = AsyncMock(return_value={self.trading_pair: 10.0})
+        self.data_source.listen_for_order_book_diffs = self.listen_for_order_book_diffs
+        self.data_source.listen_for_trades = self.listen_forever
+        self.data_source.listen_for_order_book_snapshots = self.listen_forever
+        self.data_source.listen_for_subscriptions = self.listen_forever
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=[self.trading_pair])
+        self.tracker.WORKER_ORDER_BOOK_DEPTH = 2
+        self.received_messages: List[OrderBookMessage] = []
+        self.tracker.add_message_listener(self.received_messages.append)
+
+    def tearDown(self) -> None:
+        self.tracker.stop()
+        OrderBookTracker.process_order_books_in_workers(0)
+        super().tearDown()
+
+    async def new_order_book(self, trading_pair: str) -> OrderBook:
+        order_book = OrderBook()
+        order_book.apply_snapshot(
+            [OrderBookRow(10, 1, 10), OrderBookRow(9, 1, 10), OrderBookRow(8, 1, 10)], [OrderBookRow(11, 1, 10)], 10)
+        return order_book
+
+    def diff_message(self, update_id: int, bids, asks) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pair,
+            "first_update_id": update_id,
+            "update_id": update_id,
+            "bids": bids,
+            "asks": asks,
+        }, timestamp=update_id)
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.AbstractEventLoop, output: asyncio.Queue):
+        output.put_nowait(self.diff_message(11, [["10", "0"]], [["12", "2"]]))
+        output.put_nowait(self.diff_message(12, [["7", "1"]], []))
+        await self.listen_forever()
+
+    async def listen_forever(self, *args):
+        await asyncio.Event().wait()
+
+    async def wait_for_order_book_update(self, update_id: int) -> OrderBook:
+        while True:
+            order_book = self.tracker.order_books.get(self.trading_pair)
+            if order_book is not None and order_book.snapshot_uid >= update_id:
+                return order_book
+            await asyncio.sleep(0.05)
+
+    def test_order_books_are_maintained_in_a_worker_process(self):
+        self.tracker.start()
+
+        order_book = self.ev_loop.run_until_complete(asyncio.wait_for(self.wait_for_order_book_update(12), 30))
+
+        self.assertEqual(1, len(self.tracker._workers))
+        self.assertEqual([self.trading_pair], self.tracker._workers[0].trading_pairs)
+        bids, asks = order_book.to_numpy()
+        # Only the top WORKER_ORDER_BOOK_DEPTH levels are mirrored
+        self.assertEqual([(9, 1, 10), (8, 1, 10)], bids.tolist())
+        self.assertEqual([(11, 1, 10), (12, 2, 11)], asks.tolist())
+        # The snapshot update id is the one of the order book of the worker, not the highest of the mirrored levels
+        self.assertEqual(12, order_book.snapshot_uid)
+        self.assertEqual([11, 12], [message.update_id for message in self.received_messages])
+
+        self.tracker.stop()
+
+        self.assertEqual([], self.tracker._workers)
+        self.assertEqual({}, self.tracker._order_book_workers)
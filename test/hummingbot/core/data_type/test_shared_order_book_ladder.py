@@ -0,0 +1,54 @@
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.shared_order_book_ladder import SLOTS, SharedOrderBookLadder
+
+
+class SharedOrderBookLadderTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ladder = SharedOrderBookLadder(depth=2)
+        self.reader = SharedOrderBookLadder(depth=2, name=self.ladder.name)
+
+    def tearDown(self) -> None:
+        self.reader.close()
+        self.ladder.close()
+        super().tearDown()
+
+    def test_read_nothing_before_first_publication(self):
+        self.assertIsNone(self.reader.read())
+
+    def test_read_last_published_ladder(self):
+        bids = np.array([[10, 1, 5], [9, 2, 4], [8, 3, 3]], dtype=np.float64)
+        asks = np.array([[11, 1, 5]], dtype=np.float64)
+        self.ladder.publish(bids, asks, 5)
+        self.ladder.publish(bids[1:], asks, 6)
+
+        sequence, update_id, read_bids, read_asks = self.reader.read()
+
+        self.assertEqual(2, sequence)
+        self.assertEqual(6, update_id)
+        self.assertEqual([[9, 2, 4], [8, 3, 3]], read_bids.tolist())
+        self.assertEqual([[11, 1, 5]], read_asks.tolist())
+        self.assertIsNone(self.reader.read(since_sequence=sequence))
+
+    def test_depth_is_limited(self):
+        bids = np.array([[10, 1, 5], [9, 2, 4], [8, 3, 3]], dtype=np.float64)
+        self.ladder.publish(bids, np.empty((0, 3)), 5)
+
+        _, _, read_bids, read_asks = self.reader.read()
+
+        self.assertEqual([[10, 1, 5], [9, 2, 4]], read_bids.tolist())
+        self.assertEqual(0, len(read_asks))
+
+    def test_ladders_are_reused_around_the_ring(self):
+        for update_id in range(1, 2 * SLOTS + 2):
+            self.ladder.publish(np.array([[update_id, 1, update_id]], dtype=np.float64), np.empty((0, 3)), update_id)
+
+        sequence, update_id, read_bids, _ = self.reader.read()
+
+        self.assertEqual(2 * SLOTS + 1, sequence)
+        self.assertEqual(2 * SLOTS + 1, update_id)
+        self.assertEqual([[update_id, 1, update_id]], read_bids.tolist())
@@ -1,27 +1,36 @@
 import asyncio
+import time
 import unittest
 from copy import deepcopy
 from decimal import Decimal
 from typing import Awaitable, Dict, Optional
+from unittest.mock import MagicMock
+
+import numpy as np
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.utils import combine_to_hb_trading_pair
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.rate_oracle.sources.coin_gecko_rate_source import CoinGeckoRateSource
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import RateGraph, find_rate
 
 
 class DummyRateSource(RateSourceBase):
     def __init__(self, price_dict: Dict[str, Decimal]):
         self._price_dict = price_dict
+        self.get_prices_calls = 0
 
     @property
     def name(self):
         return "dummy_rate_source"
 
     async def get_prices(self, quote_token: Optional[str] = None) -> Dict[str, Decimal]:
+        self.get_prices_calls += 1
         return deepcopy(self._price_dict)
 
 
@@ -82,6 +91,67 @@ class RateOracleTest(unittest.TestCase):
         rate = find_rate(prices, "HBOT-GBP")
         self.assertEqual(rate, Decimal("75"))
 
+    def test_find_rate_through_several_tokens(self):
+        prices = {"HBOT-USDT": Decimal("100"), "USDT-GBP": Decimal("0.75"), "EUR-GBP": Decimal("0.5")}
+        self.assertEqual(Decimal("150"), find_rate(prices, "HBOT-EUR"))
+        self.assertEqual(Decimal("1") / Decimal("150"), find_rate(prices, "EUR-HBOT"))
+        self.assertIsNone(find_rate(prices, "HBOT-ZBOT"))
+
+    def test_rate_graph_breaks_ties_in_token_order(self):
+        prices = {"HBOT-USDT": Decimal("100"), "GBP-USDT": Decimal("1.25"),
+                  "HBOT-BTC": Decimal("0.005"), "GBP-BTC": Decimal("0.0000625")}
+        for ordered_prices in (prices, dict(reversed(prices.items()))):
+            graph = RateGraph(ordered_prices)
+            self.assertEqual(["HBOT", "BTC", "GBP"], graph.find_path("HBOT", "GBP"))
+            self.assertEqual(["GBP", "BTC", "HBOT"], graph.find_path("GBP", "HBOT"))
+            self.assertEqual(Decimal("80"), graph.find_rate("HBOT-GBP"))
+
+    def test_rate_graph_updates_cached_rates(self):
+        graph = RateGraph({"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50")})
+        self.assertEqual(["HBOT", "USDT", "AAVE"], graph.find_path("HBOT", "AAVE"))
+        self.assertEqual(Decimal("2"), graph.find_rate("HBOT-AAVE"))
+
+        graph.update({"HBOT-USDT": Decimal("200"), "AAVE-USDT": Decimal("50")})
+        self.assertEqual(Decimal("4"), graph.find_rate("HBOT-AAVE"))
+
+        graph.update({"HBOT-USDT": Decimal("200"), "HBOT-AAVE": Decimal("3")})
+        self.assertEqual(["HBOT", "AAVE"], graph.find_path("HBOT", "AAVE"))
+        self.assertEqual(Decimal("3"), graph.find_rate("HBOT-AAVE"))
+        self.assertEqual(Decimal("1") / Decimal("3") * Decimal("200"), graph.find_rate("AAVE-USDT"))
+
+        graph.update({"HBOT-USDT": Decimal("200")})
+        self.assertIsNone(graph.find_rate("HBOT-AAVE"))
+
+    def test_rate_graph_updates_prices_of_some_pairs(self):
+        graph = RateGraph({"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50"), "ETH-BTC": Decimal("0.05")})
+        self.assertEqual(Decimal("2"), graph.find_rate("HBOT-AAVE"))
+        self.assertEqual(Decimal("20"), graph.find_rate("BTC-ETH"))
+
+        graph.update_prices({"HBOT-USDT": Decimal("200")})
+        self.assertEqual({"BTC-ETH"}, graph._rates.keys())
+        self.assertEqual(Decimal("4"), graph.find_rate("HBOT-AAVE"))
+        self.assertEqual(Decimal("200"), graph.prices["HBOT-USDT"])
+
+        graph.update_prices({"AAVE-USDT": None})
+        self.assertIsNone(graph.find_rate("HBOT-AAVE"))
+        self.assertNotIn("AAVE-USDT", graph.prices)
+
+        graph.update_prices({"AAVE-HBOT": Decimal("0.25")})
+        self.assertEqual(Decimal("4"), graph.find_rate("HBOT-AAVE"))
+
+    def test_get_pair_rates(self):
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict={}))
+        rate_oracle._prices = {"HBOT-USDT": Decimal("100"), "USDT-GBP": Decimal("0.75"), "EUR-GBP": Decimal("0.5")}
+
+        rates = rate_oracle.get_pair_rates(["HBOT-EUR", "GBP-USDT", "ZBOT-USDT"])
+
+        self.assertEqual({"HBOT-EUR": Decimal("150"), "GBP-USDT": Decimal("1") / Decimal("0.75"), "ZBOT-USDT": None},
+                         rates)
+
+        rate_oracle._prices = {"HBOT-USDT": Decimal("50")}
+        self.assertEqual(Decimal("50"), rate_oracle.get_pair_rate("HBOT-USDT"))
+        self.assertIsNone(rate_oracle.get_pair_rate("HBOT-EUR"))
+
     def test_rate_oracle_single_instance_rate_source_reset_after_configuration_change(self):
         config_map = ClientConfigAdapter(ClientConfigMap())
         config_map.rate_oracle_source = "binance"
@@ -101,3 +171,78 @@ class RateOracleTest(unittest.TestCase):
         config_map.global_token.global_token_name = "EUR"
 
         self.assertEqual(0, len(rate_oracle.prices))
+
+    def test_streams_connector_order_book_prices(self):
+        tracker = OrderBookTracker(data_source=MagicMock(), trading_pairs=["HBOT-USDT"])
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[99, 1, 1]], dtype=np.float64),
+                                        np.array([[101, 1, 1]], dtype=np.float64))
+        tracker._order_books["HBOT-USDT"] = order_book
+        connector = MagicMock()
+        connector.name = "binance"
+        connector.order_book_tracker = tracker
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict={}))
+
+        rate_oracle.add_connector(connector)
+
+        self.assertEqual(Decimal("100"), rate_oracle.get_pair_rate("HBOT-USDT"))
+        self.assertEqual("binance", rate_oracle.streamed_price("HBOT-USDT").source)
+
+        order_book.apply_numpy_diffs(np.array([[100, 1, 2]], dtype=np.float64), np.empty((0, 3), dtype=np.float64))
+        tracker._notify_message_listeners(OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "HBOT-USDT", "update_id": 2, "bids": [], "asks": []}, time.time()))
+
+        self.assertEqual(Decimal("100.5"), rate_oracle.get_pair_rate("HBOT-USDT"))
+
+        rate_oracle.remove_connectors()
+
+        self.assertIsNone(rate_oracle.get_pair_rate("HBOT-USDT"))
+        self.assertEqual(0, len(tracker._message_listeners))
+
+    def test_streamed_prices_only_update_the_pairs_they_change(self):
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict={}))
+        rate_oracle.update_price("HBOT-USDT", Decimal("100"), "ticker")
+        rate_oracle.update_price("ETH-USDT", Decimal("1000"), "ticker")
+        self.assertEqual(Decimal("10"), rate_oracle.get_pair_rate("ETH-HBOT"))
+        graph = rate_oracle._rate_graph
+        prices = rate_oracle._prices
+
+        rate_oracle.update_price("HBOT-USDT", Decimal("200"), "ticker")
+        self.assertEqual(Decimal("5"), rate_oracle.get_pair_rate("ETH-HBOT"))
+        self.assertEqual(Decimal("1000"), rate_oracle.get_pair_rate("ETH-USDT"))
+        rate_oracle.update_price("HBOT-USDT", Decimal("250"), "ticker")
+        self.assertEqual(Decimal("250"), rate_oracle.get_pair_rate("HBOT-USDT"))
+        self.assertIn("ETH-USDT", graph._rates)
+        self.assertIs(prices, rate_oracle._prices)
+        self.assertEqual(Decimal("250"), rate_oracle.prices["HBOT-USDT"])
+
+    def test_stale_prices_are_not_used(self):
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict={}), staleness_limit=10)
+        rate_oracle.update_price("HBOT-USDT", Decimal("100"), "ticker", timestamp=time.time() - 30)
+        rate_oracle.update_price("HBOT-USDT", Decimal("90"), "other_ticker", timestamp=time.time() - 5)
+
+        self.assertEqual(Decimal("90"), rate_oracle.get_pair_rate("HBOT-USDT"))
+
+        rate_oracle.update_price("AAVE-USDT", Decimal("50"), "ticker", timestamp=time.time() - 30)
+        self.assertIsNone(rate_oracle.get_pair_rate("AAVE-USDT"))
+
+        rate_oracle.set_staleness_limit("AAVE-USDT", 60)
+        rate_oracle.update_price("AAVE-USDT", Decimal("50"), "ticker", timestamp=time.time() - 30)
+        self.assertEqual(Decimal("50"), rate_oracle.get_pair_rate("AAVE-USDT"))
+
+    def test_source_only_polled_for_pairs_not_streamed(self):
+        source = DummyRateSource(price_dict={"ETH-HBOT": Decimal("5")})
+        rate_oracle = RateOracle(source=source)
+        rate_oracle.update_price(self.trading_pair, Decimal("10"), "ticker")
+
+        rate_oracle.start()
+        self.async_run_with_timeout(rate_oracle.get_ready())
+
+        self.assertEqual(0, source.get_prices_calls)
+        self.assertEqual(Decimal("10"), rate_oracle.get_pair_rate(self.trading_pair))
+        self.assertFalse(rate_oracle._polling_required())
+
+        self.assertIsNone(rate_oracle.get_pair_rate("ETH-HBOT"))
+        self.assertTrue(rate_oracle._polling_required())
+
+        self.async_run_with_timeout(rate_oracle.stop_network())
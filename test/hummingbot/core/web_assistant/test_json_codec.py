@@ -0,0 +1,50 @@
+import unittest
+from decimal import Decimal
+
+from hummingbot.core.web_assistant import json_codec
+from hummingbot.core.web_assistant.json_codec import get_json_codec, json_dumps, json_loads, set_json_codec
+
+
+class JSONCodecTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.default_codec = get_json_codec()
+
+    def tearDown(self) -> None:
+        json_codec._codec = self.default_codec
+        super().tearDown()
+
+    def test_default_codec_round_trip(self):
+        document = {"asks": [["0.1", "2"]], "id": 1, "ok": True, "none": None}
+
+        self.assertEqual(document, json_loads(json_dumps(document)))
+        self.assertEqual(document, json_loads(json_dumps(document).encode()))
+
+    def test_stdlib_codec_is_compact(self):
+        set_json_codec("json")
+
+        self.assertEqual("json", get_json_codec().name)
+        self.assertEqual('{"one":1,"two":[2]}', json_dumps({"one": 1, "two": [2]}))
+
+    def test_invalid_document_raises_value_error(self):
+        for name in json_codec.CODEC_FACTORIES:
+            try:
+                set_json_codec(name)
+            except ImportError:
+                continue
+            with self.assertRaises(ValueError):
+                json_loads("not json")
+
+    def test_unknown_codec_raises_key_error(self):
+        with self.assertRaises(KeyError):
+            set_json_codec("unknown")
+
+    def test_every_codec_encodes_decimals_and_non_str_keys(self):
+        for name in json_codec.CODEC_FACTORIES:
+            try:
+                set_json_codec(name)
+            except ImportError:
+                continue
+            with self.subTest(codec=name):
+                self.assertEqual({"price": 1.5, "1": 2}, json_loads(json_dumps({"price": Decimal("1.5"), 1: 2})))
@@ -0,0 +1,79 @@
+import unittest
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from hummingbot.strategy.hedge.exposure_engine import ExposureEngine
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+
+
+class ExposureEngineTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        perp, spot_a, spot_b = MagicMock(), MagicMock(), MagicMock()
+        self.hedge_btc = MarketTradingPairTuple(perp, "BTC-USDT", "BTC", "USDT")
+        self.hedge_eth = MarketTradingPairTuple(perp, "ETH-USDT", "ETH", "USDT")
+        self.spot_btc_a = MarketTradingPairTuple(spot_a, "BTC-USDT", "BTC", "USDT")
+        self.spot_btc_b = MarketTradingPairTuple(spot_b, "BTC-USDT", "BTC", "USDT")
+        self.spot_eth = MarketTradingPairTuple(spot_a, "ETH-USDT", "ETH", "USDT")
+        self.spot_ltc = MarketTradingPairTuple(spot_a, "LTC-USDT", "LTC", "USDT")
+        self.engine = ExposureEngine(
+            [self.hedge_btc, self.hedge_eth],
+            [self.spot_btc_a, self.spot_btc_b, self.spot_eth, self.spot_ltc],
+        )
+
+    def test_net_amounts_by_group(self):
+        self.engine.update(self.hedge_btc, amount=Decimal("-1.0"))
+        self.engine.update(self.spot_btc_a, amount=Decimal("1.0"), offset=Decimal("0.5"))
+        self.engine.update(self.spot_btc_b, amount=Decimal("0.5"))
+        self.engine.update(self.spot_eth, amount=Decimal("10.0"))
+        self.engine.update(self.spot_ltc, amount=Decimal("100.0"))
+
+        self.assertEqual([Decimal("0.0"), Decimal("5.0")], list(self.engine.net_amounts(Decimal("0.5"))))
+        self.assertEqual([Decimal("1.0"), Decimal("10.0")], list(self.engine.net_amounts(Decimal("1.0"))))
+
+    def test_hedge_pairs_of_the_same_trading_pair_on_different_connectors(self):
+        other_perp = MagicMock()
+        other_hedge_btc = MarketTradingPairTuple(other_perp, "BTC-USDT", "BTC", "USDT")
+        engine = ExposureEngine([self.hedge_btc, other_hedge_btc], [self.spot_btc_a, self.spot_btc_b])
+        engine.update(self.spot_btc_a, amount=Decimal("1.0"))
+        engine.update(self.spot_btc_b, amount=Decimal("0.5"))
+        engine.update(self.hedge_btc, amount=Decimal("-1.0"))
+        engine.update(other_hedge_btc, amount=Decimal("-0.5"))
+
+        self.assertEqual([Decimal("0.5"), Decimal("1.0")], list(engine.net_amounts(Decimal("1.0"))))
+
+    def test_external_amount_replaces_market_pairs(self):
+        self.engine.update(self.spot_btc_a, amount=Decimal("1.0"))
+        self.engine.update(self.hedge_btc, amount=Decimal("-0.5"))
+        self.engine.set_external_amount(self.hedge_btc, Decimal("3.0"))
+
+        self.assertEqual([Decimal("2.5"), Decimal("0.0")], list(self.engine.net_amounts(Decimal("1.0"))))
+        self.engine.set_external_amount(self.hedge_btc, None)
+        self.assertEqual([Decimal("0.5"), Decimal("0.0")], list(self.engine.net_amounts(Decimal("1.0"))))
+
+    def test_update_reports_changes(self):
+        self.assertEqual(
+            (True, True), self.engine.update(self.spot_eth, amount=Decimal("1"), offset=Decimal("0"), price=Decimal("100")))
+        self.assertEqual(
+            (False, False), self.engine.update(self.spot_eth, amount=Decimal("1"), offset=Decimal("0"), price=Decimal("100")))
+        self.assertEqual((False, True), self.engine.update(self.spot_eth, amount=Decimal("1.0"), price=Decimal("101.0")))
+        self.assertEqual((True, False), self.engine.update(self.spot_eth, offset=Decimal("1.0")))
+        self.assertEqual((False, False), self.engine.update(self.spot_ltc, price=Decimal("NaN")))
+
+    def test_total_and_hedge_value(self):
+        self.engine.update(self.hedge_btc, amount=Decimal("-1.0"), price=Decimal("100.0"))
+        self.engine.update(self.spot_btc_a, amount=Decimal("1.0"), price=Decimal("100.0"))
+        self.engine.update(self.spot_btc_b, amount=Decimal("0.5"), price=Decimal("100.0"))
+        self.engine.update(self.spot_eth, amount=Decimal("2.0"), offset=Decimal("1.0"), price=Decimal("10.0"))
+        self.engine.update(self.spot_ltc, amount=Decimal("0.0"), price=Decimal("50.0"))
+        self.engine.update(self.hedge_eth, amount=Decimal("0.0"), price=Decimal("10.0"))
+
+        self.assertEqual((Decimal("180.0"), Decimal("-100.0")), self.engine.total_and_hedge_value())
+
+    def test_amounts_keep_decimal_precision(self):
+        self.engine.update(self.hedge_btc, amount=Decimal("-0.3"))
+        self.engine.update(self.spot_btc_a, amount=Decimal("0.1"))
+        self.engine.update(self.spot_btc_b, amount=Decimal("0.2"))
+
+        self.assertEqual([Decimal("0"), Decimal("0")], list(self.engine.net_amounts(Decimal("1"))))
+        self.assertEqual(Decimal("3E-19"), self.engine.net_amounts(Decimal("1.000000000000000001"))[0])
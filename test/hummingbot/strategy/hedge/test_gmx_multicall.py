@@ -0,0 +1,67 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from eth_abi import encode_abi
+
+from hummingbot.strategy.hedge.gmx_api import GmxAPI
+from hummingbot.strategy.hedge.gmx_multicall import GmxMulticall
+
+
+class GmxMulticallTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        parameters = MagicMock()
+        parameters.gmx_wallet = "0xa0271056e55269877a2060449D2baC552c46052A"
+        parameters.gmx_rpc_endpoints = ["http://localhost:9650/ext/bc/C/rpc"]
+        self.state = GmxAPI.State(parameters, logger=MagicMock())
+        self.reads = self.state.contract_reads()
+
+    def fake_rpc(self, multicall: GmxMulticall, success: bool = True) -> MagicMock:
+        rpc = MagicMock()
+
+        async def eth_call(to, data, block_identifier):
+            _, args = multicall.multicall.decode_function_input(data)
+            return encode_abi(["(bool,bytes)[]"], [[(success, encode_abi(["uint256"], [10 ** 30])) for _ in args["calls"]]])
+        rpc.eth_call = AsyncMock(side_effect=eth_call)
+        return rpc
+
+    def test_contract_reads_cover_state(self):
+        attributes = {(read.attribute, read.key) for read in self.reads}
+        for key, data in GmxAPI.static.items():
+            self.assertIn(("poolAmounts", key), attributes)
+            self.assertEqual(data["volatile"], ("globalShortSizes", key) in attributes)
+        self.assertIn(("rewards", "WAVAX"), attributes)
+
+    def test_aggregate_batches_calls_at_one_block(self):
+        multicall = GmxMulticall(GmxAPI.w3, rpc=None)
+        multicall.rpc = self.fake_rpc(multicall)
+        with patch.object(GmxMulticall, "max_calls_per_batch", 10):
+            results = self.ev_loop.run_until_complete(multicall.aggregate(self.reads, block_identifier=123))
+
+        self.assertEqual(len(self.reads), len(results))
+        self.assertEqual(6, multicall.rpc.eth_call.call_count)
+        self.assertTrue(all(call.args[2] == 123 for call in multicall.rpc.eth_call.call_args_list))
+        self.assertEqual(1.0, results[("pricesDown", "WETH")])
+        self.assertEqual(1e12, results[("poolAmounts", "WETH")])
+
+    def test_aggregate_raises_on_reverted_read(self):
+        multicall = GmxMulticall(GmxAPI.w3, rpc=None)
+        multicall.rpc = self.fake_rpc(multicall, success=False)
+        with self.assertRaises(ValueError):
+            self.ev_loop.run_until_complete(multicall.aggregate(self.reads, block_identifier=123))
+
+    def test_reconcile_falls_back_to_per_call(self):
+        per_call_results = {(read.attribute, read.key): 2.0 for read in self.reads}
+        with patch.object(GmxMulticall, "block_number", side_effect=ConnectionError("rpc down")), \
+                patch.object(GmxAPI.State, "read_per_call", return_value=per_call_results) as read_per_call:
+            self.ev_loop.run_until_complete(self.state.reconcile())
+
+        read_per_call.assert_called_once()
+        self.assertIsNone(self.state.block_number)
+        self.assertEqual(2.0, self.state.poolAmounts["WETH"])
+        self.assertNotIn("USDC", self.state.globalShortSizes)
+        self.assertEqual(1, self.state.version)
+        self.assertEqual(1.0, self.state.actualAum["total"])
+        self.assertEqual(2.0, self.state.depositBalances())
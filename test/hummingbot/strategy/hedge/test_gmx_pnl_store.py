@@ -0,0 +1,78 @@
+import asyncio
+import csv
+import os
+import tempfile
+import unittest
+from typing import Awaitable
+
+from hummingbot.strategy.hedge.gmx_pnl_store import GmxPnlExplainStore
+
+
+class GmxPnlExplainStoreTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "data", GmxPnlExplainStore.file_name)
+        self.store = GmxPnlExplainStore(self.path)
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def read_rows(self):
+        with open(self.path, newline="") as f:
+            return list(csv.reader(f))
+
+    def test_rows_are_appended_in_long_format(self):
+        async def append_rows():
+            self.store.append(1.0, {"delta": {"WETH": 0.5, "total": 0.5}})
+            self.store.append(2.0, {"delta": {"WETH": 0.7, "total": 0.7}, "tx_cost": {"total": -0.1}})
+            await self.store.wait_written()
+
+        self.async_run_with_timeout(append_rows())
+
+        rows = self.read_rows()
+        self.assertEqual(GmxPnlExplainStore.header, rows[0])
+        self.assertEqual(["1.0", "delta", "WETH", "0.5"], rows[1])
+        self.assertEqual(["2.0", "tx_cost", "total", "-0.1"], rows[-1])
+        self.assertEqual(6, len(rows))
+
+    def test_existing_file_is_not_rewritten(self):
+        async def append_row(timestamp):
+            self.store.append(timestamp, {"valuation": {"total": 1.0}})
+            await self.store.wait_written()
+
+        self.async_run_with_timeout(append_row(1.0))
+        self.store = GmxPnlExplainStore(self.path)
+        self.async_run_with_timeout(append_row(2.0))
+
+        rows = self.read_rows()
+        self.assertEqual(1, rows.count(GmxPnlExplainStore.header))
+        self.assertEqual(["1.0", "2.0"], [row[0] for row in rows[1:]])
+
+    def test_file_in_another_layout_is_refused(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "w", newline="") as f:
+            csv.writer(f).writerows([["timestamp", "1.0"], ["0", "{('delta', 'WETH'): 0.5}"]])
+
+        with self.assertRaises(ValueError):
+            GmxPnlExplainStore(self.path)
+        self.assertEqual([["timestamp", "1.0"], ["0", "{('delta', 'WETH'): 0.5}"]], self.read_rows())
+
+    def test_header_is_written_to_an_empty_file(self):
+        os.makedirs(os.path.dirname(self.path))
+        open(self.path, "w").close()
+        self.store = GmxPnlExplainStore(self.path)
+
+        self.store.append(1.0, {"valuation": {"total": 1.0}})
+        self.async_run_with_timeout(self.store.wait_written())
+
+        self.assertEqual([GmxPnlExplainStore.header, ["1.0", "valuation", "total", "1.0"]], self.read_rows())
@@ -0,0 +1,67 @@
+import asyncio
+import unittest
+from typing import Awaitable
+
+from aioresponses import aioresponses
+
+from hummingbot.strategy.hedge.gmx_rpc import GmxRpcClient, GmxRpcError
+
+
+class GmxRpcClientTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.primary = "https://primary.test/rpc"
+        cls.backup = "https://backup.test/rpc"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.client = GmxRpcClient([self.primary, self.backup])
+
+    def tearDown(self) -> None:
+        self.async_run_with_timeout(self.client.close())
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    @aioresponses()
+    def test_block_number(self, mocked_api):
+        mocked_api.post(self.primary, payload={"jsonrpc": "2.0", "id": 1, "result": "0x10"})
+
+        self.assertEqual(16, self.async_run_with_timeout(self.client.block_number()))
+
+    @aioresponses()
+    def test_eth_call_pins_block_and_decodes_bytes(self, mocked_api):
+        mocked_api.post(self.primary, payload={"jsonrpc": "2.0", "id": 1, "result": "0x0102"})
+
+        result = self.async_run_with_timeout(self.client.eth_call("0xabc", "0x18160ddd", 255))
+
+        self.assertEqual(b"\x01\x02", result)
+        request = list(mocked_api.requests.values())[0][0]
+        self.assertEqual([{"to": "0xabc", "data": "0x18160ddd"}, "0xff"], request.kwargs["json"]["params"])
+
+    @aioresponses()
+    def test_fails_over_to_next_endpoint(self, mocked_api):
+        mocked_api.post(self.primary, status=502)
+        mocked_api.post(self.backup, payload={"jsonrpc": "2.0", "id": 1, "result": "0x1"})
+
+        self.assertEqual(1, self.async_run_with_timeout(self.client.block_number()))
+        self.assertEqual(self.backup, self.client.endpoint)
+
+    @aioresponses()
+    def test_raises_when_all_endpoints_fail(self, mocked_api):
+        mocked_api.post(self.primary, status=502)
+        mocked_api.post(self.backup, status=503)
+
+        with self.assertRaises(ConnectionError):
+            self.async_run_with_timeout(self.client.block_number())
+
+    @aioresponses()
+    def test_node_error_does_not_fail_over(self, mocked_api):
+        mocked_api.post(self.primary, payload={"jsonrpc": "2.0", "id": 1, "error": {"code": 3, "message": "execution reverted"}})
+
+        with self.assertRaises(GmxRpcError):
+            self.async_run_with_timeout(self.client.eth_call("0xabc", "0x"))
+        self.assertEqual(self.primary, self.client.endpoint)
@@ -0,0 +1,140 @@
+import asyncio
+import unittest
+from typing import Awaitable
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from eth_abi import encode_abi
+from eth_utils import event_abi_to_log_topic
+
+from hummingbot.strategy.hedge.gmx_api import GmxAPI
+from hummingbot.strategy.hedge.gmx_state_stream import GmxStateStream
+
+
+class GmxStateStreamTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        parameters = MagicMock()
+        parameters.gmx_wallet = "0xa0271056e55269877a2060449D2baC552c46052A"
+        parameters.gmx_rpc_endpoints = ["http://localhost:9650/ext/bc/C/rpc"]
+        self.gmx_api = GmxAPI(parameters, logger=MagicMock())
+        self.rpc = MagicMock()
+        self.rpc.block_number = AsyncMock()
+        self.rpc.get_logs = AsyncMock(return_value=[])
+        self.gmx_api.state.rpc = self.rpc
+        self.aggregated_reads = []
+
+        async def aggregate(reads, block_identifier):
+            self.aggregated_reads.append(reads)
+            return {(read.attribute, read.key): float(block_identifier) for read in reads}
+        self.gmx_api.state.multicall = MagicMock()
+        self.gmx_api.state.multicall.aggregate = AsyncMock(side_effect=aggregate)
+        self.stream = self.gmx_api.stream
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def vault_log(self, event_name: str, token: str) -> dict:
+        event_abi = getattr(GmxAPI.vault_contract.events, event_name)().abi
+        return {"topics": ["0x" + event_abi_to_log_topic(event_abi).hex()],
+                "data": "0x" + encode_abi(["address", "uint256"], [GmxAPI.static[token]["address"], 1]).hex()}
+
+    def test_first_poll_reads_everything(self):
+        self.rpc.block_number.return_value = 100
+        initial_state = self.gmx_api.state
+
+        self.assertTrue(self.async_run_with_timeout(self.stream.poll()))
+
+        self.assertEqual(len(initial_state.contract_reads()), len(self.aggregated_reads[0]))
+        self.assertIsNot(initial_state, self.gmx_api.state)
+        self.assertEqual(0, initial_state.version)
+        self.assertEqual(1, self.gmx_api.state.version)
+        self.assertEqual(100, self.gmx_api.state.block_number)
+        self.assertEqual(100.0, self.gmx_api.state.poolAmounts["WETH"])
+        self.rpc.get_logs.assert_not_called()
+
+    def test_no_new_block_publishes_nothing(self):
+        self.rpc.block_number.return_value = 100
+        self.async_run_with_timeout(self.stream.poll())
+
+        self.assertFalse(self.async_run_with_timeout(self.stream.poll()))
+        self.assertEqual(1, self.gmx_api.state.version)
+
+    def test_only_tokens_with_vault_events_are_reread(self):
+        self.rpc.block_number.return_value = 100
+        self.async_run_with_timeout(self.stream.poll())
+        self.rpc.block_number.return_value = 105
+        self.rpc.get_logs.return_value = [self.vault_log("IncreasePoolAmount", "WETH")]
+
+        self.assertTrue(self.async_run_with_timeout(self.stream.poll()))
+
+        self.assertEqual(101, self.rpc.get_logs.call_args.args[2])
+        self.assertEqual(105, self.rpc.get_logs.call_args.args[3])
+        read_keys = {(read.attribute, read.key) for read in self.aggregated_reads[1]}
+        self.assertIn(("poolAmounts", "WETH"), read_keys)
+        self.assertNotIn(("poolAmounts", "WBTC"), read_keys)
+        self.assertIn(("pricesDown", "WBTC"), read_keys)
+        state = self.gmx_api.state
+        self.assertEqual(2, state.version)
+        self.assertEqual(105.0, state.poolAmounts["WETH"])
+        self.assertEqual(100.0, state.poolAmounts["WBTC"])
+        self.assertEqual(105.0, state.pricesDown["WBTC"])
+
+    def test_changed_tokens_uses_index_token_of_positions(self):
+        event_abi = GmxAPI.vault_contract.events.IncreasePosition().abi
+        data = encode_abi([event_input["type"] for event_input in event_abi["inputs"]],
+                          [b"\x00" * 32, "0xa0271056e55269877a2060449D2baC552c46052A", GmxAPI.static["USDC"]["address"],
+                           GmxAPI.static["WBTC"]["address"], 1, 1, False, 1, 1])
+        self.rpc.get_logs.return_value = [{"topics": ["0x" + event_abi_to_log_topic(event_abi).hex()], "data": "0x" + data.hex()}]
+
+        self.assertEqual({"WBTC"}, self.async_run_with_timeout(self.stream.changed_tokens(1, 2)))
+
+    def test_first_poll_falls_back_to_per_call_reads(self):
+        self.rpc.block_number.return_value = 100
+        self.gmx_api.state.multicall.aggregate.side_effect = IOError("multicall reverted")
+        self.gmx_api.state.multicall.call = AsyncMock(return_value=7.0)
+
+        self.assertTrue(self.async_run_with_timeout(self.stream.poll()))
+
+        self.assertEqual(1, self.gmx_api.state.version)
+        self.assertEqual(7.0, self.gmx_api.state.poolAmounts["WETH"])
+        self.assertEqual(100, self.stream.last_block)
+
+    def test_later_polls_do_not_fall_back_to_per_call_reads(self):
+        self.rpc.block_number.return_value = 100
+        self.async_run_with_timeout(self.stream.poll())
+        self.rpc.block_number.return_value = 101
+        self.gmx_api.state.multicall.aggregate.side_effect = IOError("multicall reverted")
+        self.gmx_api.state.multicall.call = AsyncMock(return_value=7.0)
+
+        with self.assertRaises(IOError):
+            self.async_run_with_timeout(self.stream.poll())
+        self.gmx_api.state.multicall.call.assert_not_called()
+        self.assertEqual(1, self.gmx_api.state.version)
+
+    def test_retry_interval_backs_off(self):
+        with patch.object(GmxStateStream, "poll_interval", 1.0), patch.object(GmxStateStream, "max_retry_interval", 30.0):
+            self.assertEqual([1.0, 2.0, 4.0, 8.0, 16.0, 30.0, 30.0],
+                             [GmxStateStream.retry_interval(failures) for failures in range(7)])
+
+    def test_stream_retries_a_failed_first_read(self):
+        self.rpc.block_number.side_effect = [ConnectionError("rpc unreachable"), ConnectionError("rpc unreachable"), 100]
+
+        async def wait_for_first_snapshot():
+            while self.gmx_api.state.version == 0:
+                await asyncio.sleep(0.001)
+
+        with patch.object(GmxStateStream, "poll_interval", 0.001):
+            self.stream.start()
+            try:
+                self.async_run_with_timeout(wait_for_first_snapshot())
+            finally:
+                self.stream.stop()
+
+        self.assertEqual(1, self.gmx_api.state.version)
+        self.assertEqual(100, self.gmx_api.state.block_number)
+        self.assertEqual(2, self.gmx_api.logger.warning.call_count)
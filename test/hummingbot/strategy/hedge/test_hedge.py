@@ -1,6 +1,7 @@
 import unittest
 from decimal import Decimal
 from test.mock.mock_perp_connector import MockPerpConnector
+from unittest.mock import MagicMock
 
 import pandas as pd
 
@@ -10,7 +11,9 @@ from hummingbot.connector.derivative.position import Position
 from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
 from hummingbot.core.clock import Clock
 from hummingbot.core.clock_mode import ClockMode
-from hummingbot.core.data_type.common import PositionMode, PositionSide
+from hummingbot.core.data_type.common import OrderType, PositionMode, PositionSide, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import FundingPaymentCompletedEvent, OrderFilledEvent
 from hummingbot.strategy.hedge.hedge import HedgeStrategy
 from hummingbot.strategy.hedge.hedge_config_map_pydantic import HedgeConfigMap
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
@@ -215,3 +218,166 @@ class HedgeConfigMapPydanticTest(unittest.TestCase):
             offsets = self.offsets,
         )
         self.assertIsNone(strategy.hedge_by_amount())
+
+    def test_detect_exposure_changes(self):
+        self.config_map.event_driven = True
+        strategy = HedgeStrategy(
+            config_map = self.config_map,
+            hedge_market_pairs = [self.market_trading_pairs["binance_perpetual"]],
+            market_pairs = [self.market_trading_pairs["kucoin"], self.market_trading_pairs["binance"]],
+            offsets = self.offsets,
+        )
+        strategy.gmx_api = None
+        strategy.detect_exposure_changes()
+        self.assertEqual(set(), strategy._dirty_assets)
+
+        # e.g. a withdrawal
+        self.markets["kucoin"].set_balance("BTC", 2)
+        strategy.detect_exposure_changes()
+        self.assertEqual({"BTC"}, strategy._dirty_assets)
+
+        strategy._dirty_assets.clear()
+        strategy.detect_exposure_changes()
+        self.assertEqual(set(), strategy._dirty_assets)
+
+        # e.g. a deposit on the hedge market
+        self.markets["binance_perpetual"].set_balance("BTC", 1)
+        strategy.detect_exposure_changes()
+        self.assertEqual({"BTC"}, strategy._dirty_assets)
+
+    def test_detect_gmx_exposure_changes(self):
+        self.config_map.event_driven = True
+        strategy = HedgeStrategy(
+            config_map = self.config_map,
+            hedge_market_pairs = [self.market_trading_pairs["binance_perpetual"]],
+            market_pairs = [self.market_trading_pairs["kucoin"], self.market_trading_pairs["binance"]],
+            offsets = self.offsets,
+        )
+        strategy.gmx_api = MagicMock()
+        strategy.gmx_api.state.version = 0
+        strategy.gmx_api.state.depositBalances.return_value = 2.0
+        strategy.gmx_api.state.partial_delta.return_value = 0.25
+        strategy.detect_exposure_changes()
+        self.assertEqual(set(), strategy._dirty_assets)
+        self.assertEqual({}, strategy._gmx_exposures)
+
+        strategy.gmx_api.state.version = 1
+        strategy.detect_exposure_changes()
+        self.assertEqual({"BTC"}, strategy._dirty_assets)
+        self.assertEqual({"BTC": Decimal("0.5")}, strategy._gmx_exposures)
+
+        # a new GMX state leaving the deltas unchanged does not flag the asset
+        strategy._dirty_assets.clear()
+        strategy.gmx_api.state.version = 2
+        strategy.detect_exposure_changes()
+        self.assertEqual(set(), strategy._dirty_assets)
+
+        strategy.gmx_api.state.version = 3
+        strategy.gmx_api.state.partial_delta.return_value = 0.5
+        strategy.detect_exposure_changes()
+        self.assertEqual({"BTC"}, strategy._dirty_assets)
+
+    def test_event_driven_tick_only_refreshes_exposure_on_events(self):
+        self.config_map.event_driven = True
+        strategy = HedgeStrategy(
+            config_map = self.config_map,
+            hedge_market_pairs = [self.market_trading_pairs["binance_perpetual"]],
+            market_pairs = [self.market_trading_pairs["kucoin"], self.market_trading_pairs["binance"]],
+            offsets = self.offsets,
+        )
+        strategy.gmx_api = None
+        strategy._last_timestamp = self.start_timestamp
+        strategy.refresh_exposure = MagicMock()
+        strategy.hedge_assets = MagicMock()
+
+        self.markets["kucoin"].set_balance("BTC", 2)
+        strategy.tick(self.start_timestamp + 1)
+        strategy.refresh_exposure.assert_not_called()
+        strategy.hedge_assets.assert_not_called()
+
+        strategy.did_fill_order(OrderFilledEvent(
+            timestamp=self.start_timestamp,
+            order_id="OID1",
+            trading_pair="BTC-USDT",
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal("100"),
+            amount=Decimal("1"),
+            trade_fee=AddedToCostTradeFee(),
+        ))
+        strategy.tick(self.start_timestamp + 2)
+        strategy.hedge_assets.assert_called_once_with({"BTC"})
+
+    def test_did_fill_order_flags_base_asset(self):
+        strategy = HedgeStrategy(
+            config_map = self.config_map,
+            hedge_market_pairs = [self.market_trading_pairs["binance_perpetual"]],
+            market_pairs = [self.market_trading_pairs["kucoin"], self.market_trading_pairs["binance"]],
+            offsets = self.offsets,
+        )
+        strategy.did_fill_order(OrderFilledEvent(
+            timestamp=self.start_timestamp,
+            order_id="OID1",
+            trading_pair="ETH-USDT",
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal("100"),
+            amount=Decimal("1"),
+            trade_fee=AddedToCostTradeFee(),
+        ))
+        self.assertEqual({"ETH"}, strategy._dirty_assets)
+
+    def test_did_complete_funding_payment_flags_base_asset(self):
+        strategy = HedgeStrategy(
+            config_map = self.config_map,
+            hedge_market_pairs = [self.market_trading_pairs["binance_perpetual"]],
+            market_pairs = [self.market_trading_pairs["kucoin"], self.market_trading_pairs["binance"]],
+            offsets = self.offsets,
+        )
+        strategy.did_complete_funding_payment(FundingPaymentCompletedEvent(
+            timestamp=self.start_timestamp,
+            market="binance_perpetual",
+            trading_pair="BTC-USDT",
+            amount=Decimal("-1"),
+            funding_rate=Decimal("0.0001"),
+        ))
+        self.assertEqual({"BTC"}, strategy._dirty_assets)
+
+    def test_hedge_assets_respects_threshold(self):
+        self.config_map.event_driven = True
+        self.config_map.hedge_delta_threshold = Decimal("200")
+        strategy = HedgeStrategy(
+            config_map = self.config_map,
+            hedge_market_pairs = [self.market_trading_pairs["binance_perpetual"]],
+            market_pairs = [self.market_trading_pairs["kucoin"], self.market_trading_pairs["binance"]],
+            offsets = self.offsets,
+        )
+        strategy.hedge_by_value = MagicMock()
+
+        strategy.hedge_assets({"BTC"})
+        strategy.hedge_by_value.assert_not_called()
+        self.markets["kucoin"].set_balance("BTC", 2)
+        strategy.hedge_assets({"BTC"})
+        strategy.hedge_by_value.assert_called_once()
+
+    def test_sliced_hedge_by_value(self):
+        self.config_map.slippage = Decimal("-0.2")
+        self.config_map.hedge_slices = 3
+        self.offsets[self.market_trading_pairs["kucoin"]] = Decimal("-3")
+        strategy = HedgeStrategy(
+            config_map = self.config_map,
+            hedge_market_pairs = [self.market_trading_pairs["binance_perpetual"]],
+            market_pairs = [self.market_trading_pairs["kucoin"], self.market_trading_pairs["binance"]],
+            offsets = self.offsets,
+        )
+        self.clock.add_iterator(strategy)
+        self.clock.add_iterator(strategy.order_tracker)
+        strategy.order_tracker.start(self.clock)
+        strategy.start(self.clock, self.start_timestamp)
+
+        strategy.hedge_by_value()
+        self.assertTrue(strategy._scheduler.is_busy)
+        self.assertEqual(len(strategy.active_orders), 1)
+        self.assertEqual(strategy.active_orders[0][1].quantity, Decimal("0.5"))
+        self.assertTrue(strategy.active_orders[0][1].is_buy)
+        self.assertFalse(strategy.markets_ready_to_hedge())
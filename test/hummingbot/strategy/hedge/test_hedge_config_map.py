@@ -6,7 +6,7 @@ from unittest.mock import patch
 
 import yaml
 
-from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.client.config.config_helpers import ClientConfigAdapter, ConfigValidationError
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.settings import ConnectorSetting, ConnectorType
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
@@ -76,6 +76,15 @@ class HedgeConfigMapPydanticTest(unittest.TestCase):
         }
         return config_settings
 
+    def test_hedge_delta_threshold_must_be_positive(self):
+        self.assertGreater(self.config_map.hedge_delta_threshold, 0)
+        with self.assertRaises(ConfigValidationError):
+            self.config_map.hedge_delta_threshold = Decimal("0")
+
+    def test_slice_interval_must_be_positive(self):
+        with self.assertRaises(ConfigValidationError):
+            self.config_map.slice_interval = Decimal("0")
+
     def test_hedge_markets_prompt(self):
         self.config_map.hedge_connector = self.connector
         self.config_map.hedge_markets = self.trading_pair
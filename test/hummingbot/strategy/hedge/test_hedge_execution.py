@@ -0,0 +1,130 @@
+import unittest
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.order_candidate import OrderCandidate
+from hummingbot.strategy.hedge.hedge_execution import HedgeExecutionScheduler
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+
+
+class HedgeExecutionSchedulerTest(unittest.TestCase):
+    trading_pair = "BTC-USDT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.market = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        # asks: 100.5 x 1, 101.5 x 2, 102.5 x 3, ...
+        self.market.set_balanced_order_book(trading_pair=self.trading_pair, mid_price=100, min_price=1, max_price=200,
+                                            price_step_size=1, volume_step_size=1)
+        self.market_pair = MarketTradingPairTuple(self.market, self.trading_pair, "BTC", "USDT")
+        self.order_ids = iter(f"order_{i}" for i in range(100))
+        self.strategy = MagicMock()
+        self.strategy.get_slippage_ratio.side_effect = lambda is_buy: Decimal("1.01") if is_buy else Decimal("0.99")
+        self.strategy.get_order_candidates.side_effect = self.get_order_candidates
+        self.strategy.place_orders.side_effect = lambda market_pair, candidates: [next(self.order_ids) for _ in candidates]
+
+    def get_order_candidates(self, market_pair, is_buy, amount, price):
+        return [OrderCandidate(trading_pair=self.trading_pair, is_maker=False, order_type=OrderType.LIMIT,
+                               order_side=TradeType.BUY if is_buy else TradeType.SELL, amount=amount, price=price)]
+
+    def get_scheduler(self, max_slice_impact: Decimal = Decimal("0.02"), reprice_threshold: Decimal = Decimal("0"),
+                      min_trade_size: Decimal = Decimal("0")):
+        return HedgeExecutionScheduler(self.strategy, slice_count=4, slice_interval=10,
+                                       max_slice_impact=max_slice_impact, reprice_threshold=reprice_threshold,
+                                       min_trade_size=min_trade_size)
+
+    def test_child_amount_is_capped_by_share_and_depth(self):
+        scheduler = self.get_scheduler()
+        scheduler.submit(self.market_pair, True, Decimal("40"), 0)
+        execution = scheduler.executions[self.market_pair]
+        # 40 / 4 = 10 but only 1 + 2 + 3 is offered within 2% of the best ask
+        self.assertEqual(Decimal("6"), execution.slices[0].amount)
+        scheduler = self.get_scheduler()
+        scheduler.submit(self.market_pair, False, Decimal("8"), 0)
+        self.assertEqual(Decimal("2"), scheduler.executions[self.market_pair].slices[0].amount)
+
+    def test_slices_are_paced_and_tracked(self):
+        scheduler = self.get_scheduler()
+        scheduler.submit(self.market_pair, True, Decimal("8"), 0)
+        execution = scheduler.executions[self.market_pair]
+        self.assertEqual(1, len(execution.slices))
+        scheduler.did_fill_order("order_0", Decimal("2"))
+        scheduler.did_close_order("order_0", 1)
+        scheduler.tick(5)
+        self.assertEqual(1, len(execution.slices))
+        scheduler.tick(10)
+        self.assertEqual(2, len(execution.slices))
+        self.assertEqual(Decimal("2"), execution.slices[0].filled)
+        self.assertEqual(Decimal("6"), execution.remaining)
+
+        scheduler.did_fill_order("order_1", Decimal("2"))
+        scheduler.did_close_order("order_1", 11)
+        scheduler.did_fill_order("unknown", Decimal("2"))
+        self.assertEqual(Decimal("4"), execution.filled)
+        scheduler.tick(20)
+        scheduler.did_fill_order("order_2", Decimal("2"))
+        scheduler.did_close_order("order_2", 21)
+        scheduler.tick(30)
+        scheduler.did_fill_order("order_3", Decimal("2"))
+        scheduler.did_close_order("order_3", 31)
+        self.assertFalse(scheduler.is_busy)
+        self.assertEqual(4, self.strategy.place_orders.call_count)
+
+    def test_stale_slice_is_repriced(self):
+        scheduler = self.get_scheduler(reprice_threshold=Decimal("0.01"))
+        scheduler.submit(self.market_pair, True, Decimal("8"), 0)
+        execution = scheduler.executions[self.market_pair]
+        first_price = execution.slices[0].price
+        scheduler.tick(1)
+        self.strategy.cancel_order.assert_not_called()
+
+        self.market.set_balanced_order_book(trading_pair=self.trading_pair, mid_price=110, min_price=1, max_price=200,
+                                            price_step_size=1, volume_step_size=1)
+        scheduler.tick(2)
+        self.strategy.cancel_order.assert_called_once_with(self.market_pair, "order_0")
+        scheduler.tick(3)
+        self.strategy.cancel_order.assert_called_once()
+        scheduler.did_fill_order("order_0", Decimal("1"))
+        scheduler.did_close_order("order_0", 3)
+        scheduler.tick(4)
+        self.assertEqual(2, len(execution.slices))
+        self.assertEqual(Decimal("1"), execution.slices[1].amount)
+        self.assertGreater(execution.slices[1].price, first_price)
+
+    def test_deadline_cancels_and_finishes(self):
+        scheduler = self.get_scheduler()
+        scheduler.submit(self.market_pair, True, Decimal("8"), 0)
+        scheduler.tick(40)
+        self.strategy.cancel_order.assert_called_once_with(self.market_pair, "order_0")
+        self.assertTrue(scheduler.is_busy)
+        scheduler.did_close_order("order_0", 41)
+        scheduler.tick(41)
+        self.assertFalse(scheduler.is_busy)
+        self.assertEqual(1, self.strategy.place_orders.call_count)
+
+    def test_no_candidates_finishes(self):
+        self.strategy.get_order_candidates.side_effect = lambda *args: []
+        scheduler = self.get_scheduler()
+        scheduler.submit(self.market_pair, True, Decimal("8"), 0)
+        self.assertFalse(scheduler.is_busy)
+        self.strategy.place_orders.assert_not_called()
+
+    def test_child_amount_is_raised_to_min_trade_size(self):
+        # 3 / 4 = 0.75 is worth less than 150, a child needs 150 / (100.5 * 1.01) = 1.48
+        scheduler = self.get_scheduler(min_trade_size=Decimal("150"))
+        scheduler.submit(self.market_pair, True, Decimal("3"), 0)
+        execution = scheduler.executions[self.market_pair]
+        self.assertGreaterEqual(execution.slices[0].amount * Decimal("100.5") * Decimal("1.01"), Decimal("150"))
+        self.assertLess(execution.slices[0].amount, Decimal("3"))
+
+    def test_remainder_below_min_trade_size_is_sent_as_one_order(self):
+        # 2 / 4 = 0.5 is raised to 1.48, which would leave 0.52 worth less than 150
+        scheduler = self.get_scheduler(min_trade_size=Decimal("150"))
+        scheduler.submit(self.market_pair, True, Decimal("2"), 0)
+        execution = scheduler.executions[self.market_pair]
+        self.assertEqual(1, len(execution.slices))
+        self.assertEqual(Decimal("2"), execution.slices[0].amount)
@@ -16,6 +16,7 @@ from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExcha
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.market_order import MarketOrder
+from hummingbot.core.data_type.order_candidate import OrderCandidate
 from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.order_tracker import OrderTracker
@@ -283,6 +284,34 @@ class StrategyBaseUnitTests(unittest.TestCase):
         self.strategy.cancel_order(self.market_info, limit_order_id)
         self.assertEqual(0, len(self.strategy.order_tracker.in_flight_cancels))
 
+    def test_batch_order_create_and_cancel_with_specific_market(self):
+        orders_to_create = [
+            OrderCandidate(
+                trading_pair=self.trading_pair,
+                is_maker=True,
+                order_type=OrderType.LIMIT,
+                order_side=order_side,
+                amount=Decimal("50"),
+                price=price,
+            )
+            for order_side, price in [(TradeType.BUY, Decimal("99")), (TradeType.SELL, Decimal("101"))]
+        ]
+
+        order_ids: List[str] = self.strategy.batch_order_create_with_specific_market(
+            self.market_info, orders_to_create)
+
+        self.assertEqual(2, len(order_ids))
+        for order, order_id in zip(orders_to_create, order_ids):
+            tracked_limit_order: LimitOrder = self.strategy.order_tracker.get_limit_order(self.market_info, order_id)
+            self.assertEqual(order.order_side == TradeType.BUY, tracked_limit_order.is_buy)
+            self.assertEqual(order.price, tracked_limit_order.price)
+            self.assertEqual(order.amount, tracked_limit_order.quantity)
+
+        self.strategy.batch_order_cancel_with_specific_market(
+            self.market_info,
+            [self.strategy.order_tracker.get_limit_order(self.market_info, order_id) for order_id in order_ids])
+        self.assertEqual(0, len(self.strategy.order_tracker.in_flight_cancels))
+
     def test_start_tracking_limit_order(self):
         self.assertEqual(0, len(self.strategy.order_tracker.tracked_limit_orders))
 
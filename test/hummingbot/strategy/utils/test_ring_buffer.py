@@ -107,3 +107,30 @@ class RingBufferTest(unittest.TestCase):
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([0, 1, 2, 3])))
         buffer.add_value(4)
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([1, 2, 3, 4])))
+
+    def test_values_kept_in_double_precision(self):
+        value = 123456.789012345
+        self.buffer.add_value(value)
+        self.assertEqual(value, self.buffer.get_last_value())
+
+    def test_window_is_read_only_view_in_order(self):
+        buffer = RingBuffer(4)
+        for i in range(6):
+            buffer.add_value(i)
+
+        window = buffer.get_window()
+
+        self.assertTrue(np.array_equal(window, np.array([2, 3, 4, 5])))
+        self.assertFalse(window.flags.writeable)
+        self.assertFalse(window.flags.owndata)
+
+    def test_window_statistics(self):
+        self.assertTrue(np.isnan(self.buffer.window_mean))
+        samples = np.random.RandomState(42).normal(100, 10, self.BUFFER_LENGTH * 5 + 7)
+        for i, sample in enumerate(samples):
+            self.buffer.add_value(sample)
+            window = samples[max(0, i + 1 - self.BUFFER_LENGTH):i + 1]
+            self.assertEqual(len(window), self.buffer.size)
+            self.assertAlmostEqual(np.sum(window), self.buffer.sum, 8)
+            self.assertAlmostEqual(np.mean(window), self.buffer.window_mean, 10)
+            self.assertAlmostEqual(np.var(window), self.buffer.window_variance, 8)
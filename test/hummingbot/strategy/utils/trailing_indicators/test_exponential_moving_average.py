@@ -0,0 +1,42 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.strategy.__utils__.trailing_indicators.exponential_moving_average import (
+    ExponentialMovingAverageIndicator,
+)
+
+
+class ExponentialMovingAverageTest(unittest.TestCase):
+    INITIAL_RANDOM_SEED = 3141592653
+    BUFFER_LENGTH = 30
+
+    def setUp(self) -> None:
+        np.random.seed(self.INITIAL_RANDOM_SEED)
+
+    def expected_ema(self, samples: np.ndarray, sampling_length: int) -> float:
+        return pd.Series(samples[-sampling_length:]).ewm(span=sampling_length, adjust=True).mean().iloc[-1]
+
+    def test_calculate_ema(self):
+        samples = np.random.normal(100, 10, self.BUFFER_LENGTH * 4)
+        indicator = ExponentialMovingAverageIndicator(self.BUFFER_LENGTH)
+
+        for i, sample in enumerate(samples):
+            indicator.add_sample(sample)
+            self.assertAlmostEqual(self.expected_ema(samples[:i + 1], self.BUFFER_LENGTH), indicator.current_value, 8)
+
+    def test_change_sampling_length(self):
+        samples = np.random.normal(100, 10, self.BUFFER_LENGTH * 2)
+        indicator = ExponentialMovingAverageIndicator(self.BUFFER_LENGTH)
+        for sample in samples:
+            indicator.add_sample(sample)
+
+        indicator.sampling_length = 10
+        indicator.add_sample(105)
+
+        self.assertAlmostEqual(self.expected_ema(np.append(samples, 105), 10), indicator.current_value, 8)
+
+    def test_processing_length_must_be_one(self):
+        with self.assertRaises(Exception):
+            ExponentialMovingAverageIndicator(self.BUFFER_LENGTH, 2)
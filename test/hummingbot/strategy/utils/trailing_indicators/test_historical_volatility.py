@@ -66,3 +66,27 @@ class HistoricalVolatilityTest(unittest.TestCase):
         energy_smoothed = sum(x ** 2 for x in np.diff(output_smoothed))
 
         self.assertGreater(energy_normal, energy_smoothed)
+
+    def test_volatility_matches_whole_window_calculation(self):
+        samples = 100 * np.exp(np.cumsum(np.random.normal(0, 0.01, 300)))
+        indicator = HistoricalVolatilityIndicator(40, 1)
+
+        indicator.add_sample(samples[0])
+        for i, sample in enumerate(samples[1:], start=1):
+            indicator.add_sample(sample)
+            window = samples[max(0, i - 39):i + 1]
+            expected = np.sqrt(np.var(np.diff(np.log(window))))
+            self.assertAlmostEqual(expected, indicator.current_value, 10)
+
+    def test_volatility_before_the_first_return(self):
+        indicator = HistoricalVolatilityIndicator(10, 3)
+        self.assertIsNone(indicator.current_value)
+
+        indicator.add_sample(100)
+        self.assertTrue(np.isnan(indicator._indicator_calculation()))
+        self.assertEqual(0, indicator.current_value)
+
+        indicator.add_sample(101)
+        indicator.add_sample(99)
+        expected = np.sqrt(np.mean([0, 0, np.var(np.diff(np.log([100, 101, 99])))]))
+        self.assertAlmostEqual(expected, indicator.current_value, 10)
@@ -20,3 +20,18 @@ class InstantVolatilityTest(unittest.TestCase):
             self.indicator.add_sample(sample)
 
         self.assertAlmostEqual(self.indicator.current_value, 14.068197250366211, 4)
+
+    def test_volatility_matches_whole_window_calculation(self):
+        samples = np.random.normal(100, 10, 500)
+        indicator = InstantVolatilityIndicator(50, 1)
+
+        for i, sample in enumerate(samples):
+            indicator.add_sample(sample)
+            window = samples[max(0, i - 49):i + 1]
+            expected = np.sqrt(np.sum(np.square(np.diff(window))) / window.size)
+            self.assertAlmostEqual(expected, indicator.current_value, 8)
+
+        indicator.sampling_length = 20
+        indicator.add_sample(100)
+        window = np.append(samples[-19:], 100)
+        self.assertAlmostEqual(np.sqrt(np.sum(np.square(np.diff(window))) / window.size), indicator.current_value, 8)
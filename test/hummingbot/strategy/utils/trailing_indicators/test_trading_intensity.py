@@ -1,6 +1,7 @@
 import math
 import unittest
 from decimal import Decimal
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -9,7 +10,7 @@ from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
 from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
-from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.common import PriceType, TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 from hummingbot.core.event.events import OrderBookTradeEvent
@@ -259,3 +260,62 @@ class TradingIntensityTest(unittest.TestCase):
 
         self.assertAlmostEqual(a, alpha, 10)
         self.assertAlmostEqual(b, kappa, 10)
+
+    def make_sample_trades(self, timestamp, prices, amounts):
+        for price, amount in zip(prices, amounts):
+            self.indicator.register_trade(OrderBookTradeEvent(
+                trading_pair="COINALPHAHBOT",
+                timestamp=timestamp,
+                price=price,
+                amount=amount,
+                type=TradeType.SELL,
+            ))
+
+    @patch("hummingbot.strategy.__utils__.trailing_indicators.trading_intensity.curve_fit")
+    def test_exponential_decay_fitted_without_curve_fit(self, curve_fit_mock):
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1)
+        indicator.last_quotes = [{"timestamp": self.start_timestamp, "price": 100}]
+        price_levels = np.linspace(0.5, 10, 20)
+        for price_level in price_levels:
+            indicator.register_trade(OrderBookTradeEvent(
+                trading_pair="COINALPHAHBOT",
+                timestamp=self.start_timestamp + 1,
+                price=100 - price_level,
+                amount=5 * np.exp(-0.3 * price_level),
+                type=TradeType.SELL,
+            ))
+
+        indicator.calculate(self.start_timestamp + 1)
+
+        alpha, kappa = indicator.current_value
+        self.assertAlmostEqual(5, alpha, 8)
+        self.assertAlmostEqual(0.3, kappa, 8)
+        curve_fit_mock.assert_not_called()
+
+    @patch("hummingbot.strategy.__utils__.trailing_indicators.trading_intensity.curve_fit")
+    def test_refit_only_when_samples_change(self, curve_fit_mock):
+        curve_fit_mock.return_value = ((2, 0.5), None)
+        self.indicator.sampling_length = 2
+        mid_price = self.price_delegate.get_price_by_type(PriceType.MidPrice)
+        timestamp = self.start_timestamp
+        self.indicator.calculate(timestamp)
+        # amounts far from an exponential decay of the price level
+        self.make_sample_trades(timestamp + 1, [mid_price - 1, mid_price - 2, mid_price - 3], [1, 10, 1])
+        self.indicator.calculate(timestamp + 1)
+        self.make_sample_trades(timestamp + 2, [mid_price + 1, mid_price + 4], [3, 8])
+        self.indicator.calculate(timestamp + 2)
+
+        self.assertTrue(self.indicator.is_sampling_buffer_full)
+        self.assertEqual(1, curve_fit_mock.call_count)
+        self.assertEqual((2, 0.5), self.indicator.current_value)
+
+        self.indicator.calculate(timestamp + 3)
+        self.assertEqual(1, curve_fit_mock.call_count)
+
+        self.make_sample_trades(timestamp + 4, [mid_price - 2], [2])
+        self.indicator.calculate(timestamp + 4)
+        self.assertEqual(2, curve_fit_mock.call_count)
+        price_levels, lambdas = curve_fit_mock.call_args[0][1:3]
+        # the first sample left the buffer: levels 1 and 4 from the second sample, level 2 from the last one
+        self.assertEqual([4, 2, 1], list(price_levels))
+        self.assertEqual([8, 2, 3], list(lambdas))
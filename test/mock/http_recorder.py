@@ -196,7 +196,7 @@ class HttpPlayerResponse:
             raise EnvironmentError("No response text has been recorded for replaying.")
         return self._response_text
 
-    async def json(self) -> Any:
+    async def json(self, *args, **kwargs) -> Any:
         if self._response_json is None:
             raise EnvironmentError("No response json has been recorded for replaying.")
         return self._response_json